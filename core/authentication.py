@@ -0,0 +1,156 @@
+"""
+JWT authentication without the `SELECT ... FROM core_user` of every request.
+
+Access tokens are signed and carry user_id, is_staff, is_superuser and
+customer_id (look at core.serializers.TokenObtainPairSerializer), so
+StatelessJWTAuthentication builds a TokenUser from the claims instead of
+loading the user. Things that do need the row (permissions ...) go through
+TokenUser.full_user, a small process-local cache with a TTL.
+
+Because nothing is read from the database any more, revocation is a denylist
+in redis: single tokens by jti (logout) and every token of a user issued
+before a moment (password, is_active or is_staff changed). It lives in its
+own cache alias (AUTH_REVOCATION_CACHE), not in the default cache with the
+catalog responses: an entry evicted there would quietly make a revoked token
+valid again. That cache must not evict and must keep every entry for its
+whole timeout, at least ACCESS_TOKEN_LIFETIME (REFRESH_TOKEN_LIFETIME for the
+generations).
+
+That moment is a generation number (nanoseconds) and not compared with `iat`,
+iat only has seconds and a login right after a password change would be
+rejected. Tokens carry the generation they were issued in (GENERATION_CLAIM),
+the ones from an older generation are revoked.
+"""
+import time
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser as BaseTokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+DENIED_TOKEN_KEY = 'auth:denied:jti:{}'
+REVOKED_USER_KEY = 'auth:revoked:user:{}'
+GENERATION_CLAIM = 'gen'
+
+def get_revocation_cache():
+    return caches[getattr(settings, 'AUTH_REVOCATION_CACHE', 'default')]
+
+
+# user_id -> (user, expires_at)
+_users = {}
+
+
+def load_user(user_id):
+    entry = _users.get(user_id)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+
+    user = get_user_model().objects \
+        .filter(**{api_settings.USER_ID_FIELD: user_id}) \
+        .first()
+    if len(_users) >= getattr(settings, 'AUTH_USER_CACHE_MAX_SIZE', 10000):
+        _users.clear()
+    _users[user_id] = (user, time.monotonic() + getattr(settings, 'AUTH_USER_CACHE_TTL', 60))
+    return user
+
+
+def revoke_token(token):
+    # only until the token expires by itself
+    remaining = int(token['exp'] - time.time())
+    if remaining > 0:
+        key = DENIED_TOKEN_KEY.format(token[api_settings.JTI_CLAIM])
+        get_revocation_cache().set(key, True, remaining)
+
+
+def token_generation(user_id):
+    """what new tokens of the user carry in GENERATION_CLAIM, 0 until they are revoked once"""
+    return get_revocation_cache().get(REVOKED_USER_KEY.format(user_id), 0)
+
+
+def revoke_user_tokens(user_id):
+    # long enough to outlive every refresh token issued before now
+    timeout = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+    # always higher than the previous generation, even if this server's clock is behind
+    generation = max(time.time_ns(), token_generation(user_id) + 1)
+    get_revocation_cache().set(REVOKED_USER_KEY.format(user_id), generation, timeout)
+    _users.pop(user_id, None)
+
+
+def is_revoked(token):
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    denied_key = DENIED_TOKEN_KEY.format(token.get(api_settings.JTI_CLAIM))
+    revoked_key = REVOKED_USER_KEY.format(user_id)
+    # one round trip for both checks
+    values = get_revocation_cache().get_many([denied_key, revoked_key])
+    if denied_key in values:
+        return True
+    generation = values.get(revoked_key)
+    # tokens issued before the claim existed count as generation 0
+    return generation is not None and token.get(GENERATION_CLAIM, 0) < generation
+
+
+class TokenUser(BaseTokenUser):
+    """
+    The user as the access token describes it, request.user.id, is_staff,
+    is_superuser and customer_id cost nothing. Permissions load the real
+    user through full_user.
+    """
+
+    @cached_property
+    def customer_id(self):
+        return self.token.get('customer_id')
+
+    @cached_property
+    def full_user(self):
+        return load_user(self.id)
+
+    @property
+    def groups(self):
+        return self.full_user.groups
+
+    @property
+    def user_permissions(self):
+        return self.full_user.user_permissions
+
+    def get_group_permissions(self, obj=None):
+        return self.full_user.get_group_permissions(obj)
+
+    def get_all_permissions(self, obj=None):
+        return self.full_user.get_all_permissions(obj)
+
+    def has_perm(self, perm, obj=None):
+        return self.full_user is not None and self.full_user.has_perm(perm, obj)
+
+    def has_perms(self, perm_list, obj=None):
+        return self.full_user is not None and self.full_user.has_perms(perm_list, obj)
+
+    def has_module_perms(self, module):
+        return self.full_user is not None and self.full_user.has_module_perms(module)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if is_revoked(token):
+            raise InvalidToken('Token has been revoked')
+        return token
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken('Token contained no recognizable user identification')
+        if 'is_staff' not in validated_token:
+            # issued before we put the claims in, we can't trust it to say who is staff
+            return super().get_user(validated_token)
+        return TokenUser(validated_token)
+
+
+class StatelessAuthenticationMixin:
+    """
+    For the views that only need who the user is (the store endpoints).
+    DEFAULT_AUTHENTICATION_CLASSES stays JWTAuthentication for djoser's
+    user endpoints, they edit the user row.
+    """
+    authentication_classes = [StatelessJWTAuthentication]
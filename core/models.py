@@ -2,6 +2,19 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser
 # Create your models here.
 
+# access tokens carry is_staff/is_superuser, changing one of these ends the user's sessions
+REVOKING_FIELDS = ['password', 'is_active', 'is_staff', 'is_superuser']
+
 
 class User(AbstractUser):
     email = models.EmailField(unique=True)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        # what a save compares with to know if the tokens have to be revoked (look at core.signals.handlers)
+        user._revoking_values = user.revoking_values()
+        return user
+
+    def revoking_values(self):
+        return {field: self.__dict__.get(field) for field in REVOKING_FIELDS}
@@ -1,4 +1,9 @@
 from djoser.serializers import UserCreateSerializer as BaseUserCreateSerializer, UserSerializer as BaseUserSerializer
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer as BaseTokenObtainPairSerializer, TokenRefreshSerializer as BaseTokenRefreshSerializer
+from rest_framework_simplejwt.tokens import RefreshToken
+from .authentication import GENERATION_CLAIM, is_revoked, token_generation
+from store.customers import CLAIM, resolve_customer_id
 
 
 class UserCreateSerializer(BaseUserCreateSerializer):
@@ -11,3 +16,26 @@ class UserCreateSerializer(BaseUserCreateSerializer):
 class UserSerializer(BaseUserSerializer):
     class Meta(BaseUserSerializer.Meta):
         fields = ['id', 'username', 'email', 'first_name', 'last_name']
+
+
+class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
+    # the access token made from this refresh token copies the claims,
+    # so store views know the customer without a query (look at store.customers)
+    # and who the user is without loading it (look at core.authentication)
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token[CLAIM] = resolve_customer_id(user.id)
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        # tokens of an older generation are revoked (look at core.authentication)
+        token[GENERATION_CLAIM] = token_generation(user.id)
+        return token
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    # a revoked refresh token must not give out new access tokens
+    def validate(self, attrs):
+        if is_revoked(RefreshToken(attrs['refresh'])):
+            raise InvalidToken('Token has been revoked')
+        return super().validate(attrs)
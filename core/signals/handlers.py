@@ -1,5 +1,10 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from store.signals import order_created
+from ..authentication import revoke_user_tokens
+from ..models import REVOKING_FIELDS
 
 
 # here below  we apply customize signal handlers create by us so learn ore about signals and custom handlers signals
@@ -8,3 +13,32 @@ from store.signals import order_created
 def on_order_created(sender, **kwargs):
     print(
         f"==================================\n{kwargs['order']}\n================================")
+
+
+# access tokens carry is_staff/is_superuser and are trusted without loading the user,
+# so every change that should end a session revokes the user's tokens (look at core.authentication)
+
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def revoke_tokens_of_changed_user(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None:
+        return
+    # eg update_last_login() on every token obtain
+    if update_fields is not None and not set(update_fields) & set(REVOKING_FIELDS):
+        return
+    # compared with what was loaded (User.from_db) or last saved, no query.
+    # a user that was neither can't tell what changed, its tokens are revoked to be safe
+    old = getattr(instance, '_revoking_values', None)
+    if old is None or old != instance.revoking_values():
+        user_id = instance.pk
+        transaction.on_commit(lambda: revoke_user_tokens(user_id))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def remember_revoking_values(sender, instance, **kwargs):
+    instance._revoking_values = instance.revoking_values()
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def revoke_tokens_of_deleted_user(sender, instance, **kwargs):
+    user_id = instance.pk
+    transaction.on_commit(lambda: revoke_user_tokens(user_id))
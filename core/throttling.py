@@ -0,0 +1,123 @@
+"""
+Token bucket throttles kept in redis.
+
+Every client has a bucket per scope holding up to N tokens (the N of a
+'N/period' rate) that refills continuously at N per period, a request takes
+one token. Refill and take happen in one Lua script, so it is a single round
+trip and concurrent gunicorn workers can't race each other.
+
+- TieredRateThrottle: every request, with the 'anon', 'user' or 'staff' rate.
+- ScopedRateThrottle: views that set `throttle_scope` (cart items, orders,
+  auth) get their own, usually stricter, bucket on top.
+
+If redis isn't configured (eg the locmem cache of the tests) or is down,
+requests are allowed: throttling must never take the API down with it.
+"""
+import logging
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] bucket; ARGV capacity, refill rate (tokens/second)
+# returns {allowed, seconds to wait} (the wait as a string, lua numbers become integers)
+TOKEN_BUCKET_SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local time = redis.call('TIME')
+    local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'at')
+    local tokens = tonumber(bucket[1]) or capacity
+    local at = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - at) * rate)
+
+    local allowed, wait = 0, 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        allowed = 1
+    else
+        wait = (1 - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'at', tostring(now))
+    -- a full bucket is the same as no bucket
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return {allowed, tostring(wait)}
+"""
+
+_script = None
+
+
+def _get_script():
+    global _script
+    if _script is None:
+        from django_redis import get_redis_connection
+
+        redis = get_redis_connection(getattr(settings, 'THROTTLE_REDIS_ALIAS', 'default'))
+        _script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+    return _script
+
+
+def parse_rate(rate):
+    """'100/min' -> (100, 100 / 60) as (capacity, tokens per second)"""
+    if rate is None:
+        return None
+    num, period = rate.split('/')
+    duration = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[period[0]]
+    return int(num), int(num) / duration
+
+
+class TokenBucketThrottle(BaseThrottle):
+    key_prefix = 'throttle'
+
+    def get_scope(self, request, view):
+        raise NotImplementedError
+
+    def get_cache_key(self, request, view, scope):
+        if request.user and request.user.is_authenticated:
+            ident = f'user:{request.user.pk}'
+        else:
+            ident = f'ip:{self.get_ident(request)}'
+        return f'{self.key_prefix}:{scope}:{ident}'
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        scope = self.get_scope(request, view)
+        rate = parse_rate(api_settings.DEFAULT_THROTTLE_RATES.get(scope)) if scope else None
+        if rate is None:
+            return True
+        capacity, refill = rate
+
+        try:
+            allowed, wait = _get_script()(
+                keys=[self.get_cache_key(request, view, scope)], args=[capacity, refill])
+        except NotImplementedError:
+            # the cache isn't django_redis
+            return True
+        except Exception:
+            logger.warning('throttle unavailable, letting the request through', exc_info=True)
+            return True
+
+        if int(allowed):
+            return True
+        self.wait_seconds = float(wait)
+        return False
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class TieredRateThrottle(TokenBucketThrottle):
+    def get_scope(self, request, view):
+        user = request.user
+        if user and user.is_authenticated:
+            return 'staff' if user.is_staff else 'user'
+        return 'anon'
+
+
+class ScopedRateThrottle(TokenBucketThrottle):
+    scope_attr = 'throttle_scope'
+
+    def get_scope(self, request, view):
+        return getattr(view, self.scope_attr, None)
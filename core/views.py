@@ -1,7 +1,47 @@
 from django.shortcuts import render
 from django.views.generic import TemplateView
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.views import TokenObtainPairView as BaseTokenObtainPairView, TokenRefreshView as BaseTokenRefreshView
+from .authentication import StatelessAuthenticationMixin, revoke_token
 # Create your views here.
 
 
 class HomePageView(TemplateView):
     template_name = 'homepage.html'
+
+
+# the djoser jwt views with their own (strict) throttle scope
+
+class TokenObtainPairView(BaseTokenObtainPairView):
+    throttle_scope = 'auth'
+
+
+class TokenRefreshView(BaseTokenRefreshView):
+    throttle_scope = 'auth'
+
+
+class TokenRevokeView(StatelessAuthenticationMixin, APIView):
+    """
+    Logout: denylists the access token of the request and,
+    if it is posted as 'refresh', the refresh token too.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        revoke_token(request.auth)
+        if 'refresh' in request.data:
+            try:
+                refresh = RefreshToken(request.data['refresh'])
+            except TokenError as error:
+                raise ValidationError({'refresh': [str(error)]})
+            if refresh.get(api_settings.USER_ID_CLAIM) != request.user.id:
+                raise ValidationError({'refresh': ['Token belongs to another user']})
+            revoke_token(refresh)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -4,6 +4,7 @@ from django.db.models import Count, Value, F, CharField, ExpressionWrapper
 from django.utils.html import format_html, urlencode
 from django.urls import reverse
 
+from .caching import invalidate_catalog
 from .models import Promotion, Collection, Product, Customer, Address, Order, OrderItem, Cart, CartItem, ProductImage
 
 from tags.models import TaggedItem
@@ -63,6 +64,8 @@ class ProductAdmin(admin.ModelAdmin):
     @admin.action(description='Clear inventory')
     def clear_inventory(self, request, queryset):
         updated_count = queryset.update(inventory=0)
+        # queryset.update() doesn't send post_save so we invalidate ourselves
+        invalidate_catalog()
         self.message_user(
             request,
             f'{updated_count} products were successfully updated.',
@@ -127,10 +130,8 @@ class OrderAdmin(admin.ModelAdmin):
 
 class CollectionAdmin(admin.ModelAdmin):
     """ 
-     we dont 'product_count' in our Collection Model
-     it seen like error but we sepecify  get_queryset function for that , then we add @admin.display...
-     for make it sortable
-
+     'products_count' is a stored counter on Collection now (no more annotate in get_queryset),
+     we still define products_count below to render it as a link to the products
     """
     list_display = ['title', 'products_count']
     search_fields = ['title']
@@ -146,11 +147,6 @@ class CollectionAdmin(admin.ModelAdmin):
                )
         return format_html('<a href="{}">{}</a>', url, collection.products_count)
 
-    def get_queryset(self, request):
-        return super().get_queryset(request).annotate(
-            products_count=Count('product')
-        )
-
 
 class OrderItemAdmin(admin.ModelAdmin):
     pass
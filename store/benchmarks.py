@@ -0,0 +1,361 @@
+"""
+Endpoint benchmarks: every route of store/urls.py is requested against a
+synthetic dataset (look at store.synthetic) and its query count, SQL time
+and wall time are compared with the budgets in benchmark_budgets.json.
+
+- store/tests/test_benchmarks.py runs them for every size in SIZES, on the
+  SQLite test database, nothing else has to run:
+  `pytest --ds=storefront.settings.bench store/tests/test_benchmarks.py`
+  (BENCHMARK_REPORT=path.json also writes the measurements there)
+- `python manage.py bench_endpoints` prints the table for the configured
+  database (offline: migrate and run it with --settings=storefront.settings.bench),
+  everything it adds is rolled back, --write-budgets replaces the budgets
+  with what it measured
+
+The query budget of an endpoint is the same for every size, a count that
+grows with the dataset is an N+1. The time budgets are for the largest size
+and have a lot of headroom, machines differ, BENCHMARK_TIME_FACTOR scales
+them (eg 2 on a slow CI runner). bench_endpoints always checks them, the
+test suite only checks the query counts unless BENCHMARK_TIME_FACTOR is set,
+a busy CI runner must not fail the build on a slow request.
+
+Requests go through the test client with real JWT access tokens. Every
+endpoint runs once to warm up (search index, customer ids...) and `repeat`
+times after that, the run with the median wall time is reported. Endpoints
+that change data get fresh rows from their setup before every run.
+"""
+import json
+import math
+import os
+import time
+from uuid import uuid4
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.models import Min
+from django.urls import resolve
+from rest_framework.test import APIClient
+
+from core.serializers import TokenObtainPairSerializer
+from .carts import get_cart_store
+from .models import Collection, Customer, Order, OrderItem, Product, ProductImage, Review
+from .synthetic import generate, make_plan
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), 'benchmark_budgets.json')
+
+# products in the datasets of the test suite
+SIZES = [20, 400]
+
+# a 1x1 gif, small enough for the upload validators
+GIF = b'GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00' \
+      b',\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;'
+
+
+class Endpoint:
+    """
+    One request of the benchmark.
+    path and data are formatted with the dataset ids and what setup returned,
+    user is None (anonymous), 'customer' or 'staff'.
+    """
+
+    def __init__(self, name, method, path, user=None, data=None, format='json',
+                 content_type=None, setup=None, status=200):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.user = user
+        self.data = data
+        self.format = format
+        self.content_type = content_type
+        self.setup = setup
+        self.status = status
+
+    @property
+    def route(self):
+        """url name of the path, eg product-reviews-detail"""
+        return resolve(self.path.split('?')[0].format_map(_AnyId())).url_name
+
+    def request(self, client, ids):
+        path = self.path.format(**ids)
+        data = self.data(ids) if callable(self.data) else self.data
+        method = getattr(client, self.method.lower())
+        if self.content_type:
+            return method(path, data, content_type=self.content_type)
+        if data is None:
+            return method(path)
+        return method(path, data, format=self.format)
+
+
+class _AnyId(dict):
+    def __missing__(self, key):
+        return '1'
+
+
+def _new_product(ids):
+    product = Product.objects.create(
+        title='Bench product', slug=f'bench-{uuid4().hex}', unit_price=10, inventory=10,
+        collection_id=ids['collection'])
+    return {'new_product': product.id}
+
+
+def _new_cart(ids):
+    store = get_cart_store()
+    cart = store.create()
+    item = store.add_item(cart.id, ids['product'], 1)
+    return {'new_cart': cart.id, 'new_item': item.id}
+
+
+def _import_lines(ids):
+    return ''.join(
+        json.dumps({'slug': f'bench-import-{uuid4().hex}', 'title': 'Imported', 'unit_price': '9.99',
+                    'inventory': 5, 'collection': ids['collection']}) + '\n'
+        for _ in range(10))
+
+
+ENDPOINTS = [
+    # products
+    Endpoint('products-list', 'GET', '/store/products/'),
+    Endpoint('products-list-page', 'GET', '/store/products/?page=2&ordering=-effective_price'),
+    Endpoint('products-list-cursor', 'GET', '/store/products/?pagination=cursor'),
+    Endpoint('products-list-filter', 'GET', '/store/products/?collection_id={collection}&min_price=10'),
+    Endpoint('products-list-search', 'GET', '/store/products/?search=coffee'),
+    Endpoint('products-list-facets', 'GET', '/store/products/?facets=collection,price'),
+    Endpoint('products-list-fields', 'GET', '/store/products/?fields=id,title,unit_price'),
+    Endpoint('products-detail', 'GET', '/store/products/{product}/'),
+    Endpoint('products-create', 'POST', '/store/products/', user='staff', status=201,
+             data=lambda ids: {'title': 'Bench', 'slug': f'bench-{uuid4().hex}', 'unit_price': 10,
+                               'inventory': 10, 'description': 'Benchmarked', 'collection': ids['collection']}),
+    Endpoint('products-update', 'PATCH', '/store/products/{product}/', user='staff',
+             data={'unit_price': 12.5}),
+    Endpoint('products-delete', 'DELETE', '/store/products/{new_product}/', user='staff',
+             setup=_new_product, status=204),
+    Endpoint('products-export', 'GET', '/store/products/export/?output=ndjson', user='staff'),
+    Endpoint('products-import', 'POST', '/store/products/import/', user='staff',
+             data=_import_lines, content_type='application/x-ndjson'),
+    Endpoint('products-stock', 'PATCH', '/store/products/stock/', user='staff',
+             data=lambda ids: {'changes': [{'id': ids['product'], 'inventory_delta': 1}]}),
+    # reviews and images of a product
+    Endpoint('reviews-list', 'GET', '/store/products/{product}/reviews/'),
+    Endpoint('reviews-detail', 'GET', '/store/products/{product}/reviews/{review}/'),
+    Endpoint('reviews-create', 'POST', '/store/products/{product}/reviews/', status=201,
+             data=lambda ids: {'product': ids['product'], 'name': 'Bench', 'description': 'Fine'}),
+    Endpoint('reviews-update', 'PATCH', '/store/products/{product}/reviews/{review}/',
+             data={'description': 'Still fine'}),
+    Endpoint('reviews-delete', 'DELETE', '/store/products/{product}/reviews/{new_review}/', status=204,
+             setup=lambda ids: {'new_review': Review.objects.create(
+                 product_id=ids['product'], name='Bench', description='Gone').id}),
+    Endpoint('images-list', 'GET', '/store/products/{product}/images/'),
+    Endpoint('images-detail', 'GET', '/store/products/{product}/images/{image}/'),
+    Endpoint('images-create', 'POST', '/store/products/{product}/images/', user='staff', status=201,
+             format='multipart',
+             data=lambda ids: {'image': SimpleUploadedFile('bench.gif', GIF, content_type='image/gif')}),
+    Endpoint('images-delete', 'DELETE', '/store/products/{product}/images/{new_image}/', user='staff',
+             status=204,
+             setup=lambda ids: {'new_image': ProductImage.objects.create(
+                 product_id=ids['product'], image='store/images/bench.gif').id}),
+    # collections
+    Endpoint('collections-list', 'GET', '/store/collections/'),
+    Endpoint('collections-detail', 'GET', '/store/collections/{collection}/'),
+    Endpoint('collections-create', 'POST', '/store/collections/', user='staff', status=201,
+             data={'title': 'Bench'}),
+    Endpoint('collections-update', 'PATCH', '/store/collections/{collection}/', user='staff',
+             data={'title': 'Bench'}),
+    Endpoint('collections-delete', 'DELETE', '/store/collections/{new_collection}/', user='staff',
+             status=204,
+             setup=lambda ids: {'new_collection': Collection.objects.create(title='Bench').id}),
+    # carts and their items
+    Endpoint('carts-create', 'POST', '/store/carts/', status=201),
+    Endpoint('carts-detail', 'GET', '/store/carts/{cart}/'),
+    Endpoint('carts-delete', 'DELETE', '/store/carts/{new_cart}/', setup=_new_cart, status=204),
+    Endpoint('items-list', 'GET', '/store/carts/{cart}/items/'),
+    Endpoint('items-detail', 'GET', '/store/carts/{cart}/items/{item}/'),
+    Endpoint('items-create', 'POST', '/store/carts/{cart}/items/', status=201,
+             data=lambda ids: {'product_id': ids['product'], 'quantity': 1}),
+    Endpoint('items-update', 'PATCH', '/store/carts/{cart}/items/{item}/', data={'quantity': 3}),
+    Endpoint('items-delete', 'DELETE', '/store/carts/{new_cart}/items/{new_item}/', setup=_new_cart,
+             status=204),
+    # customers
+    Endpoint('customers-list', 'GET', '/store/customers/', user='staff'),
+    Endpoint('customers-detail', 'GET', '/store/customers/{customer}/', user='staff'),
+    Endpoint('customers-update', 'PATCH', '/store/customers/{customer}/', user='staff',
+             data={'membership': 'G'}),
+    Endpoint('customers-me', 'GET', '/store/customers/me/', user='customer'),
+    Endpoint('customers-history', 'GET', '/store/customers/{customer}/history/', user='staff'),
+    # orders
+    Endpoint('orders-list', 'GET', '/store/orders/', user='customer'),
+    Endpoint('orders-list-staff', 'GET', '/store/orders/', user='staff'),
+    Endpoint('orders-detail', 'GET', '/store/orders/{order}/', user='customer'),
+    Endpoint('orders-create', 'POST', '/store/orders/', user='customer', setup=_new_cart,
+             data=lambda ids: {'cart_id': str(ids['new_cart'])}),
+    Endpoint('orders-update', 'PATCH', '/store/orders/{order}/', user='staff',
+             data={'payment_status': 'C'}),
+    Endpoint('orders-delete', 'DELETE', '/store/orders/{new_order}/', user='staff', status=204,
+             setup=lambda ids: {'new_order': Order.objects.create(customer_id=ids['customer']).id}),
+    Endpoint('cache-stats', 'GET', '/store/cache-stats/', user='staff'),
+]
+
+
+def build_dataset(size, seed=0):
+    """
+    Adds a dataset of `size` products (and as many orders and reviews) on top
+    of what the database has, returns the ids the endpoints are formatted with.
+    """
+    plan = make_plan(
+        {'collections': max(2, size // 100), 'products': size,
+         'customers': max(2, size // 10), 'orders': size},
+        seed=seed)
+    generate(plan)
+    bases = plan['bases']
+    product_id = bases['products'] + 1
+    customer = Customer.objects.get(pk=bases['customers'] + 1)
+
+    # checkouts of the benchmark never run out of it
+    Product.objects.filter(pk=product_id).update(inventory=10 ** 6)
+    Review.objects.bulk_create([
+        Review(product_id=bases['products'] + 1 + number % size, name=f'Reviewer {number}',
+               description='synthetic review')
+        for number in range(size)
+    ])
+    review = Review.objects.filter(product_id=product_id).aggregate(id=Min('id'))['id']
+    image = ProductImage.objects.create(product_id=product_id, image='store/images/bench.gif')
+    order = Order.objects.create(customer=customer)
+    OrderItem.objects.create(order=order, product_id=product_id, quantity=1, unit_price=10)
+
+    store = get_cart_store()
+    cart = store.create()
+    items = [store.add_item(cart.id, product_id + offset, 1) for offset in range(min(size, 3))]
+
+    suffix = uuid4().hex[:12]
+    staff = get_user_model().objects.create_user(
+        username=f'bench-staff-{suffix}', email=f'bench-staff-{suffix}@example.com',
+        is_staff=True, is_superuser=True)
+    return {
+        'size': size,
+        'product': product_id,
+        'collection': bases['collections'] + 1,
+        'review': review,
+        'image': image.id,
+        'customer': customer.id,
+        'order': order.id,
+        'cart': cart.id,
+        'item': items[0].id,
+        'users': {'customer': customer.user, 'staff': staff},
+    }
+
+
+def _client(user):
+    client = APIClient()
+    if user is not None:
+        token = TokenObtainPairSerializer.get_token(user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f'JWT {token}')
+    return client
+
+
+class _QueryTimer:
+    """execute wrapper (look at connection.execute_wrapper) that counts and times the queries"""
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.seconds += time.perf_counter() - started
+
+
+def measure(endpoint, client, ids):
+    """(queries, sql ms, wall ms) of one request, setup and formatting excluded"""
+    if endpoint.setup:
+        ids = {**ids, **endpoint.setup(ids)}
+    timer = _QueryTimer()
+    with connection.execute_wrapper(timer):
+        started = time.perf_counter()
+        response = endpoint.request(client, ids)
+        if response.streaming:
+            # the rows are read while the body is consumed
+            b''.join(response.streaming_content)
+        wall = time.perf_counter() - started
+    if response.status_code != endpoint.status:
+        raise AssertionError(
+            f'{endpoint.name}: {endpoint.method} {endpoint.path} returned {response.status_code}, '
+            f'expected {endpoint.status}: {getattr(response, "data", "")}')
+    return timer.queries, timer.seconds * 1000, wall * 1000
+
+
+def run_benchmarks(ids, endpoints=None, repeat=5):
+    """{endpoint name: {'queries', 'sql_ms', 'wall_ms'}} for the dataset of build_dataset()"""
+    clients = {None: _client(None)}
+    clients.update({role: _client(user) for role, user in ids['users'].items()})
+
+    results = {}
+    for endpoint in endpoints or ENDPOINTS:
+        client = clients[endpoint.user]
+        measure(endpoint, client, ids)
+        runs = sorted((measure(endpoint, client, ids) for _ in range(repeat)), key=lambda run: run[2])
+        queries, sql_ms, wall_ms = runs[len(runs) // 2]
+        results[endpoint.name] = {
+            'queries': queries, 'sql_ms': round(sql_ms, 3), 'wall_ms': round(wall_ms, 3)}
+    return results
+
+
+def load_budgets(path=BUDGETS_PATH):
+    with open(path) as file:
+        return json.load(file)
+
+
+def write_budgets(results, path=BUDGETS_PATH, headroom=3, floor_ms=20):
+    """budgets from the results of the largest dataset, `headroom` times the measured times"""
+    budgets = {
+        name: {
+            'queries': result['queries'],
+            'sql_ms': max(floor_ms, math.ceil(result['sql_ms'] * headroom)),
+            'wall_ms': max(floor_ms, math.ceil(result['wall_ms'] * headroom)),
+        }
+        for name, result in results.items()
+    }
+    with open(path, 'w') as file:
+        json.dump(budgets, file, indent=2, sort_keys=True)
+        file.write('\n')
+    return budgets
+
+
+def check_budgets(results, budgets, times=True, time_factor=None):
+    """
+    The list of exceeded budgets, empty when everything is within them.
+    times: False only checks the query counts (the smaller datasets).
+    """
+    if time_factor is None:
+        time_factor = float(os.environ.get('BENCHMARK_TIME_FACTOR', 1))
+    failures = []
+    for name, result in results.items():
+        budget = budgets.get(name)
+        if budget is None:
+            failures.append(f'{name}: no budget in {os.path.basename(BUDGETS_PATH)}')
+            continue
+        if result['queries'] > budget['queries']:
+            failures.append(f"{name}: {result['queries']} queries, the budget is {budget['queries']}")
+        for key in ['sql_ms', 'wall_ms'] if times else []:
+            limit = budget[key] * time_factor
+            if result[key] > limit:
+                failures.append(f'{name}: {key} {result[key]:.1f}, the budget is {limit:.1f}')
+    return failures
+
+
+def format_table(results, budgets=None):
+    budgets = budgets or {}
+    lines = [f"{'endpoint':24} {'queries':>9} {'sql ms':>16} {'wall ms':>16}"]
+    for name, result in results.items():
+        budget = budgets.get(name, {})
+
+        def cell(key, width):
+            value = f'{result[key]:g}'
+            if key in budget:
+                value += f'/{budget[key]:g}'
+            return f'{value:>{width}}'
+
+        lines.append(f"{name:24} {cell('queries', 9)} {cell('sql_ms', 16)} {cell('wall_ms', 16)}")
+    return '\n'.join(lines)
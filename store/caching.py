@@ -0,0 +1,138 @@
+"""
+Response cache for the catalog read endpoints.
+
+Every cached response is stored under a key that contains the current version
+of the namespaces it depends on (eg 'products' for the product list or
+'product:12' + 'catalog' for a product detail). Invalidation never scans or
+deletes keys, it just bumps the versions so old entries are never read again
+and expire on their own.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+VERSION_KEY = 'catalog:ns:{}'
+RESPONSE_KEY = 'catalog:resp:{}'
+HITS_KEY = 'catalog:stats:hits'
+MISSES_KEY = 'catalog:stats:misses'
+
+
+def get_timeout():
+    return getattr(settings, 'CATALOG_CACHE_TIMEOUT', 60 * 5)
+
+
+def _new_version():
+    # we start from a timestamp (not 1) so a version key that was evicted
+    # can never come back with a value that old entries were stored under
+    return int(time.time() * 1000)
+
+
+def get_versions(namespaces):
+    keys = [VERSION_KEY.format(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _new_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump(*namespaces):
+    for namespace in namespaces:
+        key = VERSION_KEY.format(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, _new_version(), timeout=None)
+
+
+def invalidate(*namespaces):
+    # bump only after the transaction commits, otherwise a concurrent read
+    # could cache the old rows again under the new version
+    transaction.on_commit(lambda: bump(*namespaces))
+
+
+def invalidate_catalog():
+    """For bulk writes that don't send model signals (queryset.update, bulk_create ...)"""
+    invalidate('products', 'collections', 'catalog')
+
+
+def _count(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+
+
+def get_stats():
+    stats = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits, misses = stats.get(HITS_KEY, 0), stats.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else None,
+    }
+
+
+def sorted_query(request):
+    # the full (sorted) query string is part of cache keys and ETags:
+    # filters, search, ordering, page and cursor all change the response
+    return sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+    )
+
+
+class CachedReadMixin:
+    """
+    Caches list and retrieve responses of a viewset.
+    Views say what they depend on by overriding get_cache_namespaces().
+    """
+    cache_namespaces = ()
+
+    def get_cache_namespaces(self):
+        return self.cache_namespaces
+
+    def get_cache_key(self, request):
+        namespaces = self.get_cache_namespaces()
+        versions = get_versions(namespaces)
+        raw = '|'.join([
+            ','.join(f'{ns}={version}' for ns, version in zip(namespaces, versions)),
+            request.get_host(),
+            request.path,
+            repr(sorted_query(request)),
+        ])
+        return RESPONSE_KEY.format(hashlib.md5(raw.encode()).hexdigest())
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, handler, request, *args, **kwargs):
+        timeout = get_timeout()
+        if not timeout:
+            return handler(request, *args, **kwargs)
+
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            _count(HITS_KEY)
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        _count(MISSES_KEY)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, timeout)
+        response['X-Cache'] = 'MISS'
+        return response
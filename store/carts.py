@@ -0,0 +1,241 @@
+"""
+Cart stores behind CartViewSet, ItemViewSet and CreateOrderSerializer.
+
+- DatabaseCartStore keeps carts in store_cart/store_cartitem like always.
+- RedisCartStore keeps every cart as a redis hash with a TTL, carts only
+  become rows (an Order and its OrderItems) when they are checked out.
+
+Both return Cart/CartItem instances so the serializers and the wire format
+don't change. The store is picked with the CART_STORE setting.
+"""
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import Cart, CartItem, Product
+
+
+def _parse_cart_id(cart_id):
+    try:
+        return UUID(str(cart_id))
+    except ValueError:
+        return None
+
+
+def _parse_item_id(item_id):
+    try:
+        return int(item_id)
+    except (TypeError, ValueError):
+        return None
+
+
+class DatabaseCartStore:
+    def create(self):
+        return Cart.objects.create()
+
+    def get(self, cart_id):
+        if _parse_cart_id(cart_id) is None:
+            return None
+        return Cart.objects.prefetch_related('items__product').filter(pk=cart_id).first()
+
+    def delete(self, cart_id):
+        if _parse_cart_id(cart_id) is None:
+            return False
+        deleted, _ = Cart.objects.filter(pk=cart_id).delete()
+        return deleted > 0
+
+    def exists(self, cart_id):
+        if _parse_cart_id(cart_id) is None:
+            return False
+        return Cart.objects.filter(pk=cart_id).exists()
+
+    def get_items(self, cart_id):
+        if _parse_cart_id(cart_id) is None:
+            return []
+        return list(CartItem.objects
+                    .filter(cart_id=cart_id)
+                    .select_related('product'))
+
+    def get_item(self, cart_id, item_id):
+        if _parse_cart_id(cart_id) is None or _parse_item_id(item_id) is None:
+            return None
+        return CartItem.objects \
+            .filter(cart_id=cart_id, pk=item_id) \
+            .select_related('product') \
+            .first()
+
+    def add_item(self, cart_id, product_id, quantity):
+        if _parse_cart_id(cart_id) is None:
+            return None
+        return CartItem.objects.add_quantity(cart_id, product_id, quantity)
+
+    def update_item(self, cart_id, item_id, quantity):
+        if _parse_cart_id(cart_id) is None or _parse_item_id(item_id) is None:
+            return None
+        updated = CartItem.objects \
+            .filter(cart_id=cart_id, pk=item_id) \
+            .update(quantity=quantity)
+        if not updated:
+            return None
+        return CartItem(id=item_id, cart_id=cart_id, quantity=quantity)
+
+    def remove_item(self, cart_id, item_id):
+        if _parse_cart_id(cart_id) is None or _parse_item_id(item_id) is None:
+            return False
+        deleted, _ = CartItem.objects.filter(cart_id=cart_id, pk=item_id).delete()
+        return deleted > 0
+
+    def checked_out(self, cart_id):
+        # we are inside the checkout transaction, the cart goes with the order
+        Cart.objects.delete_with_items([cart_id])
+
+
+class RedisCartStore:
+    """
+    cart:<uuid> is a hash: 'created_at' plus one 'p:<product_id>' field per
+    item holding the quantity. The product id doubles as the item id.
+    Every write refreshes the TTL (CART_STORE_TTL) so only abandoned carts expire.
+    """
+    key_prefix = 'cart:'
+    item_prefix = 'p:'
+
+    # only touch carts that still exist, in a single round trip
+    add_script = """
+        if redis.call('EXISTS', KEYS[1]) == 0 then return nil end
+        local quantity = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+        redis.call('EXPIRE', KEYS[1], ARGV[3])
+        return quantity
+    """
+    update_script = """
+        if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then return nil end
+        redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+        redis.call('EXPIRE', KEYS[1], ARGV[3])
+        return 1
+    """
+
+    def __init__(self):
+        from django_redis import get_redis_connection
+
+        self.redis = get_redis_connection(getattr(settings, 'CART_STORE_REDIS_ALIAS', 'default'))
+        self.ttl = getattr(settings, 'CART_STORE_TTL', 60 * 60 * 24 * 7)
+        self.add = self.redis.register_script(self.add_script)
+        self.update = self.redis.register_script(self.update_script)
+
+    def _key(self, cart_id):
+        return f'{self.key_prefix}{cart_id}'
+
+    def _item_field(self, product_id):
+        return f'{self.item_prefix}{product_id}'
+
+    def _build_items(self, cart_id, fields):
+        quantities = {
+            int(field[len(self.item_prefix):]): int(quantity)
+            for field, quantity in fields.items()
+            if field.startswith(self.item_prefix)
+        }
+        products = Product.objects \
+            .only('id', 'title', 'unit_price') \
+            .in_bulk(list(quantities))
+        return [
+            CartItem(id=product_id, cart_id=cart_id,
+                     product=products[product_id], quantity=quantity)
+            for product_id, quantity in sorted(quantities.items())
+            if product_id in products
+        ]
+
+    def _hgetall(self, cart_id):
+        fields = self.redis.hgetall(self._key(cart_id))
+        return {field.decode(): value.decode() for field, value in fields.items()}
+
+    def create(self):
+        cart = Cart(id=uuid4(), created_at=timezone.now())
+        key = self._key(cart.id)
+        self.redis.pipeline() \
+            .hset(key, 'created_at', cart.created_at.isoformat()) \
+            .expire(key, self.ttl) \
+            .execute()
+        cart._prefetched_objects_cache = {'items': []}
+        return cart
+
+    def get(self, cart_id):
+        cart_id = _parse_cart_id(cart_id)
+        if cart_id is None:
+            return None
+        fields = self._hgetall(cart_id)
+        if not fields:
+            return None
+        cart = Cart(id=cart_id, created_at=datetime.fromisoformat(fields['created_at']))
+        # CartSerializer reads cart.items.all(), this is what prefetch_related would fill
+        cart._prefetched_objects_cache = {'items': self._build_items(cart_id, fields)}
+        return cart
+
+    def delete(self, cart_id):
+        cart_id = _parse_cart_id(cart_id)
+        return cart_id is not None and self.redis.delete(self._key(cart_id)) > 0
+
+    def exists(self, cart_id):
+        cart_id = _parse_cart_id(cart_id)
+        return cart_id is not None and self.redis.exists(self._key(cart_id)) > 0
+
+    def get_items(self, cart_id):
+        cart_id = _parse_cart_id(cart_id)
+        if cart_id is None:
+            return []
+        return self._build_items(cart_id, self._hgetall(cart_id))
+
+    def get_item(self, cart_id, item_id):
+        cart_id, item_id = _parse_cart_id(cart_id), _parse_item_id(item_id)
+        if cart_id is None or item_id is None:
+            return None
+        quantity = self.redis.hget(self._key(cart_id), self._item_field(item_id))
+        if quantity is None:
+            return None
+        product = Product.objects.only('id', 'title', 'unit_price').filter(pk=item_id).first()
+        if product is None:
+            return None
+        return CartItem(id=product.id, cart_id=cart_id, product=product, quantity=int(quantity))
+
+    def add_item(self, cart_id, product_id, quantity):
+        cart_id = _parse_cart_id(cart_id)
+        if cart_id is None or not Product.objects.filter(pk=product_id).exists():
+            return None
+        total = self.add(keys=[self._key(cart_id)],
+                         args=[self._item_field(product_id), quantity, self.ttl])
+        if total is None:
+            return None
+        return CartItem(id=product_id, cart_id=cart_id, product_id=product_id, quantity=total)
+
+    def update_item(self, cart_id, item_id, quantity):
+        cart_id, item_id = _parse_cart_id(cart_id), _parse_item_id(item_id)
+        if cart_id is None or item_id is None:
+            return None
+        updated = self.update(keys=[self._key(cart_id)],
+                              args=[self._item_field(item_id), quantity, self.ttl])
+        if updated is None:
+            return None
+        return CartItem(id=item_id, cart_id=cart_id, product_id=item_id, quantity=quantity)
+
+    def remove_item(self, cart_id, item_id):
+        cart_id, item_id = _parse_cart_id(cart_id), _parse_item_id(item_id)
+        if cart_id is None or item_id is None:
+            return False
+        return self.redis.hdel(self._key(cart_id), self._item_field(item_id)) > 0
+
+    def checked_out(self, cart_id):
+        # the order rows are not committed yet, drop the cart only once they are
+        transaction.on_commit(lambda: self.delete(cart_id))
+
+
+_store = None
+
+
+def get_cart_store():
+    global _store
+    if _store is None:
+        _store = import_string(getattr(
+            settings, 'CART_STORE', 'store.carts.DatabaseCartStore'))()
+    return _store
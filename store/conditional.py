@@ -0,0 +1,70 @@
+"""
+Conditional GET (ETag / Last-Modified) for the catalog viewsets.
+
+- retrieve: one query by primary key for the row's `last_modified_field`
+  (updated_at of products, last_update of collections), the ETag and
+  Last-Modified come from it.
+- list: no query at all, the ETag is made from the versions of the cache
+  namespaces the list depends on (look at store.caching), they change
+  whenever anything in the list may have changed.
+
+When the client's If-None-Match / If-Modified-Since still match we answer
+304 before the queryset is evaluated or anything is serialized.
+"""
+import hashlib
+from django.core.exceptions import ValidationError
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+
+from .caching import get_versions, sorted_query
+
+
+class ConditionalGetMixin:
+    last_modified_field = 'last_update'
+
+    def get_last_modified(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            return self.get_queryset() \
+                .prefetch_related(None) \
+                .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]}) \
+                .values_list(self.last_modified_field, flat=True) \
+                .first()
+        except (TypeError, ValueError, ValidationError):
+            # a malformed pk, retrieve() answers 404 like always
+            return None
+
+    def make_etag(self, request, *parts):
+        raw = '|'.join([str(part) for part in parts] + [
+            request.path,
+            repr(sorted_query(request)),
+            request.accepted_renderer.format,
+        ])
+        return '"%s"' % hashlib.md5(raw.encode()).hexdigest()
+
+    def retrieve(self, request, *args, **kwargs):
+        last_modified = self.get_last_modified()
+        if last_modified is None:
+            return super().retrieve(request, *args, **kwargs)
+        etag = self.make_etag(request, last_modified.isoformat())
+        return self._conditional(request, etag, int(last_modified.timestamp()),
+                                 super().retrieve, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        etag = self.make_etag(request, *get_versions(self.get_cache_namespaces()))
+        return self._conditional(request, etag, None, super().list, *args, **kwargs)
+
+    def _conditional(self, request, etag, last_modified, handler, *args, **kwargs):
+        not_modified = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            response = not_modified
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
@@ -0,0 +1,81 @@
+"""
+user id -> customer id, without a query on every request.
+
+Access tokens carry the customer id as a `customer_id` claim (look at
+core.serializers.TokenObtainPairSerializer), for other authentication
+(sessions, old tokens, tests) we look it up in a small process-local dict,
+then in the cache, and only then in the database.
+The signal handlers in store.signals.handlers keep the cache up to date.
+"""
+import time
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Customer
+
+CUSTOMER_ID_KEY = 'customer_id:user:{}'
+CLAIM = 'customer_id'
+
+# user_id -> (customer_id, expires_at)
+_local = {}
+
+
+def _local_ttl():
+    return getattr(settings, 'CUSTOMER_ID_LOCAL_TTL', 60)
+
+
+def _remember(user_id, customer_id):
+    if len(_local) >= getattr(settings, 'CUSTOMER_ID_LOCAL_MAX_SIZE', 10000):
+        _local.clear()
+    _local[user_id] = (customer_id, time.monotonic() + _local_ttl())
+
+
+def resolve_customer_id(user_id):
+    """Returns the id of the user's customer, None if it has none."""
+    entry = _local.get(user_id)
+    if entry is not None and entry[1] > time.monotonic():
+        return entry[0]
+
+    key = CUSTOMER_ID_KEY.format(user_id)
+    customer_id = cache.get(key)
+    if customer_id is None:
+        customer_id = Customer.objects \
+            .filter(user_id=user_id) \
+            .order_by() \
+            .values_list('id', flat=True) \
+            .first()
+        if customer_id is None:
+            return None
+        cache.set(key, customer_id, timeout=None)
+    _remember(user_id, customer_id)
+    return customer_id
+
+
+def customer_id_from_request(request):
+    if not request.user.is_authenticated:
+        return None
+    token = request.auth
+    if token is not None and hasattr(token, 'get'):
+        customer_id = token.get(CLAIM)
+        if customer_id is not None:
+            return customer_id
+    return resolve_customer_id(request.user.id)
+
+
+def customer_created(customer):
+    cache.set(CUSTOMER_ID_KEY.format(customer.user_id), customer.id, timeout=None)
+    _remember(customer.user_id, customer.id)
+
+
+def customer_deleted(customer):
+    # other processes drop their local entry when it expires (CUSTOMER_ID_LOCAL_TTL)
+    cache.delete(CUSTOMER_ID_KEY.format(customer.user_id))
+    _local.pop(customer.user_id, None)
+
+
+class CustomerRequestMixin:
+    """Sets request.customer_id once the request is authenticated."""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        request.customer_id = customer_id_from_request(request)
@@ -0,0 +1,138 @@
+"""
+Facet counts for list endpoints: /store/products/?facets=collection,price
+
+The counts follow the same filters and ?search= as the list itself and all
+the requested facets come from ONE grouped query (GROUP BY collection and
+price bucket), the per facet totals are summed up in python. The response
+is cached with the rest of the page by CachedReadMixin.
+
+    "facets": {
+        "collection": [{"id": 3, "title": "Beauty", "count": 12}, ...],
+        "price": [{"min": 0, "max": 25, "count": 4}, ..., {"min": 500, "max": null, "count": 1}]
+    }
+
+A price bucket holds min <= effective_price < max, its edges are
+PRODUCT_PRICE_FACET_BUCKETS.
+"""
+from django.conf import settings
+from django.db.models import Case, Count, IntegerField, Value, When
+from rest_framework.exceptions import ValidationError
+
+FACETS_PARAM = 'facets'
+
+
+class Facet:
+    # values() expressions the facet groups by, name -> column or expression
+    def get_group_by(self):
+        raise NotImplementedError
+
+    def get_counts(self, rows):
+        raise NotImplementedError
+
+
+class CollectionFacet(Facet):
+    def get_group_by(self):
+        return {'collection_id': 'collection_id', 'collection__title': 'collection__title'}
+
+    def get_counts(self, rows):
+        counts = {}
+        for row in rows:
+            key = (row['collection_id'], row['collection__title'])
+            counts[key] = counts.get(key, 0) + row['count']
+        return [
+            {'id': collection_id, 'title': title, 'count': count}
+            for (collection_id, title), count in sorted(counts.items(), key=lambda item: (-item[1], item[0][0]))
+        ]
+
+
+class PriceFacet(Facet):
+    field = 'effective_price'
+
+    def get_edges(self):
+        return sorted(settings.PRODUCT_PRICE_FACET_BUCKETS)
+
+    def get_group_by(self):
+        edges = self.get_edges()
+        bucket = Case(
+            *[When(**{f'{self.field}__lt': edge}, then=Value(index)) for index, edge in enumerate(edges)],
+            default=Value(len(edges)),
+            output_field=IntegerField(),
+        )
+        return {'price_bucket': bucket}
+
+    def get_counts(self, rows):
+        edges = self.get_edges()
+        counts = [0] * (len(edges) + 1)
+        for row in rows:
+            counts[row['price_bucket']] += row['count']
+        bounds = zip([0] + edges, edges + [None])
+        return [
+            {'min': low, 'max': high, 'count': count}
+            for (low, high), count in zip(bounds, counts)
+        ]
+
+
+def get_requested_facets(request, available):
+    """The requested facet names (in the order asked), None without ?facets=."""
+    value = request.query_params.get(FACETS_PARAM) if request is not None else None
+    if not value:
+        return None
+    names = []
+    for name in value.split(','):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValidationError({FACETS_PARAM: [
+            f"Unknown facet '{name}', choose from {', '.join(available)}" for name in unknown]})
+    return names
+
+
+def count_facets(queryset, facets):
+    """{name: counts} for the given {name: Facet}, in one query."""
+    group_by = {}
+    for facet in facets.values():
+        group_by.update(facet.get_group_by())
+    columns = [name for name, expression in group_by.items() if isinstance(expression, str)]
+    expressions = {name: expression for name, expression in group_by.items() if not isinstance(expression, str)}
+
+    rows = list(
+        queryset
+        .prefetch_related(None)
+        .order_by()
+        .values(*columns, **expressions)
+        .annotate(count=Count('pk'))
+    )
+    return {name: facet.get_counts(rows) for name, facet in facets.items()}
+
+
+class FacetedListMixin:
+    """Adds "facets" to the paginated list response when ?facets= is given."""
+    facet_classes = {}
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # the facets count the queryset of the page, the filters and the search run once
+        self.filtered_queryset = queryset
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        names = get_requested_facets(request, list(self.facet_classes))
+        self.filtered_queryset = None
+        response = super().list(request, *args, **kwargs)
+        if names is None or not isinstance(response.data, dict):
+            return response
+        queryset = self.filtered_queryset
+        if queryset is None:
+            queryset = self.filter_queryset(self.get_queryset())
+        response.data['facets'] = count_facets(
+            queryset, {name: self.facet_classes[name]() for name in names})
+        return response
+
+
+class ProductFacetedListMixin(FacetedListMixin):
+    facet_classes = {
+        'collection': CollectionFacet,
+        'price': PriceFacet,
+    }
@@ -0,0 +1,145 @@
+"""
+Fast read path for list endpoints.
+
+ModelSerializer spends most of a product list in per-field dispatch, the
+SerializerMethodField and one nested ProductImageSerializer per image.
+ProductRowSerializer builds exactly the same output straight from values()
+rows: the getters are picked once per request, images come from one extra
+values_list() query. store/tests/test_products.py checks the rendered bytes
+are identical, `python manage.py bench_product_list` compares both paths.
+
+It's used by ProductViewSet.list while PRODUCT_LIST_FAST_PATH is on.
+"""
+from collections import defaultdict
+from decimal import Decimal
+from operator import itemgetter
+from django.conf import settings
+from rest_framework.response import Response
+
+from .models import Product, ProductImage, TAX_RATE
+from .serializers import ProductSerializer
+from .sparsefields import get_requested_fields
+
+
+class ProductRowSerializer:
+    model_serializer_class = ProductSerializer
+    # serializer field -> values() column
+    columns = {
+        'id': 'id',
+        'title': 'title',
+        'slug': 'slug',
+        'inventory': 'inventory',
+        'unit_price': 'unit_price',
+        'description': 'description',
+        'collection': 'collection_id',
+        'price_with_tax': 'unit_price',
+        'discount': 'discount',
+        'effective_price': 'effective_price',
+    }
+
+    def __init__(self, request=None):
+        self.request = request
+        fields = list(self.model_serializer_class.Meta.fields)
+        self.fields = get_requested_fields(request, fields) or fields
+        unit_price = Product._meta.get_field('unit_price')
+        self.quantum = Decimal(1).scaleb(-unit_price.decimal_places)
+        self.storage = ProductImage._meta.get_field('image').storage
+
+    def get_columns(self):
+        columns = ['id']
+        for name in self.fields:
+            column = self.columns.get(name)
+            if column is not None and column not in columns:
+                columns.append(column)
+        return columns
+
+    def _getters(self, images):
+        quantum = self.quantum
+
+        def quantized(column):
+            # what DecimalField.to_representation does
+            def get(row):
+                return row[column].quantize(quantum)
+            return get
+
+        def price_with_tax(row):
+            return row['unit_price'] * TAX_RATE
+
+        def row_images(row):
+            return images.get(row['id'], [])
+
+        getters = []
+        for name in self.fields:
+            if name in ('unit_price', 'effective_price'):
+                getter = quantized(name)
+            elif name == 'price_with_tax':
+                getter = price_with_tax
+            elif name == 'images':
+                getter = row_images
+            else:
+                getter = itemgetter(self.columns[name])
+            getters.append((name, getter))
+        return getters
+
+    def image_url(self, name):
+        # what ImageField.to_representation does
+        if not name:
+            return None
+        url = self.storage.url(name)
+        if self.request is not None:
+            return self.request.build_absolute_uri(url)
+        return url
+
+    def get_images(self, rows):
+        images = defaultdict(list)
+        if 'images' not in self.fields or not rows:
+            return images
+        for product_id, image_id, name in ProductImage.objects \
+                .filter(product_id__in=[row['id'] for row in rows]) \
+                .values_list('product_id', 'id', 'image'):
+            images[product_id].append({'id': image_id, 'image': self.image_url(name)})
+        return images
+
+    def to_representation(self, rows):
+        rows = list(rows)
+        getters = self._getters(self.get_images(rows))
+        return [
+            {name: getter(row) for name, getter in getters}
+            for row in rows
+        ]
+
+
+class RowListMixin:
+    """list() through a row serializer (values() rows instead of model instances)."""
+    row_serializer_class = None
+
+    def use_row_serializer(self):
+        return self.row_serializer_class is not None
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_row_serializer():
+            return super().list(request, *args, **kwargs)
+
+        row_serializer = self.row_serializer_class(request)
+        queryset = self.filter_queryset(self.get_queryset())
+        # the paginator (keyset) reads the ordering columns from the rows
+        ordering = [
+            field.lstrip('-') for field in
+            [field for field in queryset.query.order_by if isinstance(field, str)]
+            or queryset.model._meta.ordering
+        ]
+        columns = row_serializer.get_columns()
+        columns += [field for field in ordering if field not in columns and field != 'pk']
+        queryset = queryset.prefetch_related(None).values(*columns)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(row_serializer.to_representation(page))
+        return Response(row_serializer.to_representation(queryset))
+
+
+class ProductRowListMixin(RowListMixin):
+    row_serializer_class = ProductRowSerializer
+
+    def use_row_serializer(self):
+        return getattr(settings, 'PRODUCT_LIST_FAST_PATH', True)
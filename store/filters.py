@@ -1,11 +1,24 @@
-from django_filters.rest_framework import FilterSet
-from .models import Product
+from django_filters.rest_framework import FilterSet, NumberFilter
+from .models import Product, Order
 
 
 class ProductFilter(FilterSet):
+    # on the price after promotions and tax (Product.objects.with_effective_price())
+    min_price = NumberFilter(field_name='effective_price', lookup_expr='gte')
+    max_price = NumberFilter(field_name='effective_price', lookup_expr='lte')
+
     class Meta:
         model = Product
         fields = {
             'collection_id': ['exact'],
             'unit_price': ['lt', 'gt']
         }
+
+
+class OrderFilter(FilterSet):
+    class Meta:
+        model = Order
+        fields = {
+            'payment_status': ['exact'],
+            'placed_at': ['gte', 'lte']
+        }
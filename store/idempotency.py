@@ -0,0 +1,121 @@
+"""
+Idempotency-Key support for POST endpoints that must not run twice.
+
+The first request with a given key (per user, per url) takes a short lock,
+runs and its response is stored in the cache: successes for
+IDEMPOTENCY_KEY_TTL, 4xx answers only for IDEMPOTENCY_ERROR_TTL so the
+client can retry (eg after a restock), 5xx not at all. A retry with the
+same key gets the stored response back with an `Idempotent-Replayed: true`
+header instead of running again, a retry that arrives while the first one is
+still running gets a 409 with Retry-After right away. Reusing a key with a
+different body is a client bug and gets a 422.
+"""
+import hashlib
+import json
+import secrets
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+
+# KEYS[1] lock; ARGV token. django_redis stores integers as plain strings,
+# so the token compares as is with what cache.add() wrote
+RELEASE_LOCK_SCRIPT = """
+    if redis.call('GET', KEYS[1]) == ARGV[1] then
+        return redis.call('DEL', KEYS[1])
+    end
+    return 0
+"""
+
+
+def _release_lock(lock_key, token):
+    # the lock may have expired and been taken by another request since,
+    # only delete it if it still holds our token
+    try:
+        from django_redis import get_redis_connection
+
+        redis = get_redis_connection('default')
+    except NotImplementedError:
+        # not redis (eg the locmem cache of the tests), get and delete are close enough
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+        return
+    redis.eval(RELEASE_LOCK_SCRIPT, 1, cache.make_key(lock_key), token)
+
+
+def _fingerprint(request):
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.md5(f'{request.method} {request.path} {body}'.encode()).hexdigest()
+
+
+class IdempotentCreateMixin:
+    def create(self, request, *args, **kwargs):
+        return self.idempotent(super().create, request, *args, **kwargs)
+
+    def get_idempotency_cache_key(self, request, key):
+        # carts are anonymous, their url (with the cart id) is what they own
+        owner = request.user.pk if request.user and request.user.is_authenticated else 'anon'
+        digest = hashlib.md5(f'{owner}|{request.path}|{key}'.encode()).hexdigest()
+        return f'idempotency:{digest}'
+
+    def idempotent(self, handler, request, *args, **kwargs):
+        key = request.META.get(HEADER)
+        if not key:
+            return handler(request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'detail': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters'},
+                status=status.HTTP_400_BAD_REQUEST)
+
+        cache_key = self.get_idempotency_cache_key(request, key)
+        lock_key = f'{cache_key}:lock'
+        fingerprint = _fingerprint(request)
+
+        stored = cache.get(cache_key)
+        if stored is not None:
+            return self._replay(stored, fingerprint)
+
+        token = secrets.randbits(63)
+        if cache.add(lock_key, token, settings.IDEMPOTENCY_LOCK_TIMEOUT):
+            try:
+                # the first request may have stored its response and released
+                # the lock between our get() and add(), it must not run twice
+                stored = cache.get(cache_key)
+                if stored is not None:
+                    return self._replay(stored, fingerprint)
+                try:
+                    response = handler(request, *args, **kwargs)
+                except Exception as exc:
+                    # 4xx are answers too, a retry must get the same one
+                    response = self.handle_exception(exc)
+                if response.status_code < 500:
+                    timeout = settings.IDEMPOTENCY_KEY_TTL if response.status_code < 400 \
+                        else settings.IDEMPOTENCY_ERROR_TTL
+                    cache.set(cache_key, {
+                        'fingerprint': fingerprint,
+                        'status': response.status_code,
+                        'data': response.data,
+                    }, timeout)
+                return response
+            finally:
+                _release_lock(lock_key, token)
+
+        # the same key is being handled right now, waiting for it here would hold a
+        # worker per retry: the client retries after a second and gets the stored response
+        response = Response(
+            {'detail': 'A request with this Idempotency-Key is in progress, retry later'},
+            status=status.HTTP_409_CONFLICT)
+        response['Retry-After'] = '1'
+        return response
+
+    def _replay(self, stored, fingerprint):
+        if stored['fingerprint'] != fingerprint:
+            return Response(
+                {'detail': 'This Idempotency-Key was used with a different request'},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+        response = Response(stored['data'], status=stored['status'])
+        response['Idempotent-Replayed'] = 'true'
+        return response
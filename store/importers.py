@@ -0,0 +1,248 @@
+"""
+Bulk product import, shared by POST /store/products/import/ and
+`python manage.py import_products <file>`.
+
+Rows come as NDJSON (one json object per line) or CSV (with a header line)
+and are read as a stream, PRODUCT_IMPORT_BATCH_SIZE rows at a time. Every
+batch is:
+
+- validated row by row with a single ProductImportSerializer, the
+  collections of the whole batch are checked with one query
+- matched by slug against the existing products with one query: a known
+  slug updates the product (only the fields given in the row), an unknown
+  one creates a product (every field is then required)
+- written in its own transaction: one bulk_create, one bulk_update and
+  one UPDATE per collection products move to (ProductQuerySet.update keeps
+  Collection.products_count right)
+
+slug isn't unique in the table, so bulk_create(update_conflicts=True) can't
+be used: a row whose slug matches several products is reported as an
+error instead of updating one of them at random. When a slug appears
+twice in a batch the later row wins.
+
+The file has to be UTF-8: reading stops at the first line that isn't, the
+rows before it are imported and the line is reported as an error.
+
+POST the file as the request body with a `Content-Type` of
+application/x-ndjson or text/csv. The result is a report: rows read,
+products created and updated, and the errors of the rejected rows (line
+number and field errors, the first PRODUCT_IMPORT_MAX_ERRORS of them).
+"""
+import codecs
+import csv
+import json
+from collections import defaultdict
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers
+from rest_framework.decorators import action
+from rest_framework.exceptions import UnsupportedMediaType
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from .caching import invalidate_catalog
+from .models import Collection, Product
+from .search import get_search_engine
+
+
+class ProductImportSerializer(serializers.ModelSerializer):
+    # checked for the whole batch in one query, a PrimaryKeyRelatedField would query every row
+    collection = serializers.IntegerField(source='collection_id')
+
+    class Meta:
+        model = Product
+        fields = ['slug', 'title', 'description', 'unit_price', 'inventory', 'collection']
+        extra_kwargs = {
+            # it is the lookup of the upsert, the usual unique validators don't apply
+            'slug': {'validators': []},
+        }
+
+
+def read_ndjson(lines):
+    """(line number, row or None when the line isn't a json object) for every non blank line."""
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield number, row if isinstance(row, dict) else None
+
+
+def read_csv(lines):
+    # line 1 is the header, empty cells are fields that aren't given
+    for number, row in enumerate(csv.DictReader(lines), start=2):
+        yield number, {key: value for key, value in row.items() if key and value not in ('', None)}
+
+
+READERS = {
+    'ndjson': read_ndjson,
+    'csv': read_csv,
+}
+
+
+def decode_lines(stream, encoding='utf-8'):
+    """str lines of a binary stream (a file opened with 'rb', the request ...)."""
+    return codecs.iterdecode(stream, encoding)
+
+
+class ProductImporter:
+    serializer_class = ProductImportSerializer
+    # fields a new product must have
+    required_fields = ['slug', 'title', 'description', 'unit_price', 'inventory', 'collection_id']
+
+    def __init__(self, batch_size=None, max_errors=None):
+        self.batch_size = batch_size or getattr(settings, 'PRODUCT_IMPORT_BATCH_SIZE', 1000)
+        self.max_errors = max_errors if max_errors is not None else getattr(settings, 'PRODUCT_IMPORT_MAX_ERRORS', 1000)
+        self.rows = 0
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors = []
+
+    def report(self):
+        return {
+            'rows': self.rows,
+            'created': self.created,
+            'updated': self.updated,
+            'failed': self.failed,
+            'errors': self.errors,
+        }
+
+    def error(self, line, errors):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'line': line, 'errors': errors})
+
+    def run(self, lines, format='ndjson'):
+        batch = []
+        number = 0
+        try:
+            for number, row in READERS[format](lines):
+                self.rows += 1
+                if row is None:
+                    self.error(number, {'non_field_errors': ['Not a json object']})
+                    continue
+                batch.append((number, row))
+                if len(batch) >= self.batch_size:
+                    self.import_batch(batch)
+                    batch = []
+        except UnicodeDecodeError:
+            # nothing after the bad bytes can be read, what came before is imported
+            self.error(number + 1, {'non_field_errors': ['Not valid UTF-8, the rest of the file was not read']})
+        if batch:
+            self.import_batch(batch)
+        return self.report()
+
+    def validate(self, batch):
+        """{slug: (line, data)} of the valid rows, the later row wins for a repeated slug."""
+        # one serializer for the batch, its fields are built once
+        serializer = self.serializer_class(partial=True)
+        valid = {}
+        for number, row in batch:
+            try:
+                data = serializer.run_validation(row)
+            except serializers.ValidationError as exc:
+                self.error(number, exc.detail)
+                continue
+            if not data.get('slug'):
+                self.error(number, {'slug': ['This field is required.']})
+            elif data['slug'] in valid:
+                valid[data['slug']] = (number, {**valid[data['slug']][1], **data})
+            else:
+                valid[data['slug']] = (number, data)
+
+        collection_ids = {data['collection_id'] for _, data in valid.values() if 'collection_id' in data}
+        known = set(Collection.objects.filter(pk__in=collection_ids).order_by().values_list('pk', flat=True))
+        for slug, (number, data) in list(valid.items()):
+            if 'collection_id' in data and data['collection_id'] not in known:
+                self.error(number, {'collection': [f"Invalid pk \"{data['collection_id']}\" - object does not exist."]})
+                del valid[slug]
+        return valid
+
+    def import_batch(self, batch):
+        valid = self.validate(batch)
+        if not valid:
+            return
+
+        existing = defaultdict(list)
+        for product in Product.objects.filter(slug__in=valid).order_by():
+            existing[product.slug].append(product)
+
+        new, changed, moves = [], [], defaultdict(list)
+        update_fields = set()
+        for slug, (number, data) in valid.items():
+            products = existing.get(slug)
+            if products and len(products) > 1:
+                self.error(number, {'slug': [f'{len(products)} products have this slug']})
+            elif products:
+                product = products[0]
+                collection_id = data.pop('collection_id', product.collection_id)
+                if collection_id != product.collection_id:
+                    moves[collection_id].append(product.pk)
+                for field, value in data.items():
+                    setattr(product, field, value)
+                update_fields.update(data)
+                changed.append(product)
+            else:
+                missing = [field for field in self.required_fields if field not in data]
+                if missing:
+                    self.error(number, {
+                        field.replace('collection_id', 'collection'): ['This field is required.']
+                        for field in missing})
+                else:
+                    new.append(Product(**data))
+        if not new and not changed:
+            return
+
+        with transaction.atomic():
+            if new:
+                Product.objects.bulk_create(new)
+            # slug is the lookup, the rest is what the rows gave
+            update_fields.discard('slug')
+            if changed and update_fields:
+                Product.objects.bulk_update(changed, sorted(update_fields))
+            for collection_id, product_ids in moves.items():
+                Product.objects.filter(pk__in=product_ids).update(collection_id=collection_id)
+            invalidate_catalog()
+            products = self._with_pks(new) + changed
+            transaction.on_commit(lambda: self.index(products))
+        self.created += len(new)
+        self.updated += len(changed)
+
+    def _with_pks(self, products):
+        # bulk_create doesn't set the ids on MySQL
+        missing = [product for product in products if product.pk is None]
+        if missing:
+            ids = dict(Product.objects
+                       .filter(slug__in=[product.slug for product in missing])
+                       .values_list('slug', 'id'))
+            for product in missing:
+                product.pk = ids.get(product.slug)
+        return products
+
+    def index(self, products):
+        # bulk writes don't send post_save, so the search index is told here
+        engine = get_search_engine()
+        for product in products:
+            engine.index(product)
+
+
+class ProductImportMixin:
+    """Adds a staff only `import` action upserting the products of the request body."""
+    import_content_types = {
+        'application/x-ndjson': 'ndjson',
+        'application/json': 'ndjson',
+        'text/csv': 'csv',
+    }
+
+    @action(detail=False, methods=['POST'], url_path='import', permission_classes=[IsAdminUser])
+    def import_products(self, request, *args, **kwargs):
+        content_type = request.content_type.split(';')[0].strip()
+        format = self.import_content_types.get(content_type)
+        if format is None:
+            raise UnsupportedMediaType(content_type)
+        # the body is read as it arrives, request.data would load all of it
+        lines = decode_lines(request.stream) if request.stream is not None else []
+        return Response(ProductImporter().run(lines, format=format))
@@ -0,0 +1,103 @@
+import threading
+import time
+from uuid import uuid4
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.exceptions import ValidationError
+
+from store.carts import get_cart_store
+from store.models import Collection, Customer, Order, OrderItem, Product
+from store.serializers import CreateOrderSerializer
+
+
+class Command(BaseCommand):
+    help = 'Measures checkout throughput when many carts hold the same product'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8)
+        parser.add_argument('--orders', type=int, default=400,
+                            help='number of checkouts to attempt')
+        parser.add_argument('--inventory', type=int, default=300,
+                            help='starting inventory of the contended product')
+        parser.add_argument('--quantity', type=int, default=1,
+                            help='quantity of the product in every cart')
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            self.stdout.write(self.style.WARNING(
+                'SQLite serializes every writer, run this against MySQL to measure contention'))
+
+        collection = Collection.objects.create(title='bench_checkout')
+        product = Product.objects.create(
+            title='bench_checkout', slug='bench-checkout', description='-',
+            unit_price=10, inventory=options['inventory'], collection=collection)
+        User = get_user_model()
+        user = User.objects.create_user(
+            username=f'bench-{uuid4().hex[:12]}', email=f'{uuid4().hex}@bench.local')
+        customer, _ = Customer.objects.get_or_create(user=user)
+
+        # every cart is ready before the clock starts, we only time the checkouts
+        cart_store = get_cart_store()
+        carts = []
+        for _ in range(options['orders']):
+            cart = cart_store.create()
+            cart_store.add_item(cart.id, product.id, options['quantity'])
+            carts.append(cart.id)
+
+        placed, rejected, failed = [], [], []
+        lock = threading.Lock()
+
+        def worker():
+            try:
+                while True:
+                    with lock:
+                        if not carts:
+                            return
+                        cart_id = carts.pop()
+                    serializer = CreateOrderSerializer(
+                        data={'cart_id': cart_id}, context={'customer_id': customer.id})
+                    try:
+                        serializer.is_valid(raise_exception=True)
+                        serializer.save()
+                        placed.append(cart_id)
+                    except ValidationError:
+                        rejected.append(cart_id)
+                    except Exception as error:
+                        failed.append(error)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(options['workers'])]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        product.refresh_from_db()
+        sold = len(placed) * options['quantity']
+        self.stdout.write(f'workers:       {options["workers"]}')
+        self.stdout.write(f'checkouts:     {options["orders"]} in {elapsed:.2f}s '
+                          f'({options["orders"] / elapsed:.1f}/s)')
+        self.stdout.write(f'orders placed: {len(placed)} ({len(placed) / elapsed:.1f} orders/s)')
+        self.stdout.write(f'out of stock:  {len(rejected)}')
+        self.stdout.write(f'errors:        {len(failed)}')
+        for error in failed[:5]:
+            self.stdout.write(f'  {error!r}')
+        if sold + product.inventory == options['inventory'] and product.inventory >= 0:
+            self.stdout.write(self.style.SUCCESS(
+                f'inventory is consistent: {sold} sold, {product.inventory} left'))
+        else:
+            self.stdout.write(self.style.ERROR(
+                f'inventory is wrong: {sold} sold, {product.inventory} left'))
+
+        # clean up everything we created
+        for cart_id in carts:
+            cart_store.delete(cart_id)
+        OrderItem.objects.filter(product=product).delete()
+        Order.objects.filter(customer__user=user).delete()
+        product.delete()
+        collection.delete()
+        user.delete()
@@ -0,0 +1,62 @@
+import tempfile
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from store.benchmarks import BUDGETS_PATH, build_dataset, check_budgets, format_table, load_budgets, \
+    run_benchmarks, write_budgets
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Query count, SQL time and wall time of every store endpoint on synthetic data (look at store.benchmarks)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='20,400',
+                            help='products (and orders, reviews) of every dataset, comma separated')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='runs per endpoint after the warm up, the median one is reported')
+        parser.add_argument('--write-budgets', action='store_true',
+                            help=f'replace {BUDGETS_PATH} with 3x what the largest dataset measured')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(size) for size in options['sizes'].split(',')})
+        except ValueError:
+            raise CommandError('--sizes must be numbers, eg 20,400')
+        if sizes[0] < 1 or options['repeat'] < 1:
+            raise CommandError('Sizes and --repeat must be positive')
+
+        budgets = {} if options['write_budgets'] else load_budgets()
+        failures = []
+        # the database path is measured, not the response cache, uploads go to a temporary
+        # directory and the test client's host is allowed like in the test suite
+        with tempfile.TemporaryDirectory() as media, override_settings(
+                CATALOG_CACHE_TIMEOUT=0, MEDIA_ROOT=media, ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            for size in sizes:
+                # here we keep nothing, the dataset and what the endpoints wrote are rolled back
+                try:
+                    with transaction.atomic():
+                        results = run_benchmarks(build_dataset(size), repeat=options['repeat'])
+                        raise _Rollback
+                except _Rollback:
+                    pass
+                except AssertionError as exc:
+                    # an endpoint answered with an unexpected status
+                    raise CommandError(str(exc))
+                self.stdout.write(f'\n{size} products')
+                self.stdout.write(format_table(results, budgets))
+                failures += [f'{size} products, {failure}'
+                             for failure in check_budgets(results, budgets, times=size == sizes[-1])]
+
+        if options['write_budgets']:
+            write_budgets(results)
+            self.stdout.write(self.style.SUCCESS(f'budgets written to {BUDGETS_PATH}'))
+        elif failures:
+            raise CommandError('over budget:\n' + '\n'.join(failures))
+        else:
+            self.stdout.write(self.style.SUCCESS('every endpoint is within budget'))
@@ -0,0 +1,56 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from store.fastlist import ProductRowSerializer
+from store.models import Product
+from store.serializers import ProductSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compares rows/sec of ProductSerializer and the values() fast path (store.fastlist)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000,
+                            help='products per run (the first ones in the default ordering)')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='runs per path, the best one is reported')
+        parser.add_argument('--fields', default='',
+                            help='like ?fields=, eg id,title,unit_price')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        path = '/store/products/'
+        if options['fields']:
+            path += f"?fields={options['fields']}"
+        request = Request(RequestFactory().get(path))
+
+        available = Product.objects.count()
+        if not available:
+            raise CommandError('There are no products, run seed_db first')
+        rows = min(rows, available)
+
+        def model_serializer():
+            queryset = Product.objects.with_effective_price().prefetch_related('images')[:rows]
+            return ProductSerializer(queryset, many=True, context={'request': request}).data
+
+        def row_serializer():
+            serializer = ProductRowSerializer(request)
+            return serializer.to_representation(
+                Product.objects.with_effective_price().values(*serializer.get_columns())[:rows])
+
+        # queries included, both paths read the same rows
+        results = {}
+        for name, run in [('ProductSerializer', model_serializer), ('ProductRowSerializer', row_serializer)]:
+            best = None
+            for _ in range(options['repeat']):
+                started = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            results[name] = best
+            self.stdout.write(f'{name:22} {rows} rows in {best * 1000:.1f}ms ({rows / best:,.0f} rows/s)')
+
+        speedup = results['ProductSerializer'] / results['ProductRowSerializer']
+        self.stdout.write(self.style.SUCCESS(f'fast path is {speedup:.1f}x faster'))
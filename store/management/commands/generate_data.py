@@ -0,0 +1,64 @@
+import time
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from store.synthetic import generate, make_plan
+
+
+class Command(BaseCommand):
+    help = 'Adds deterministic synthetic collections, products, customers and orders (look at store.synthetic)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--collections', type=int, default=10)
+        parser.add_argument('--products', type=int, default=1000)
+        parser.add_argument('--customers', type=int, default=100,
+                            help='each one with its user (user<id>@example.com)')
+        parser.add_argument('--orders', type=int, default=1000)
+        parser.add_argument('--images-per-product', type=int, default=2, help='at most')
+        parser.add_argument('--items-per-order', type=int, default=4, help='at most')
+        parser.add_argument('--days', type=int, default=365, help='the orders are spread over the last N days')
+        parser.add_argument('--seed', type=int, default=0, help='the same seed gives the same rows')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='rows per bulk_create/transaction')
+        parser.add_argument('--workers', type=int, default=4,
+                            help='worker processes (always 1 on SQLite)')
+        parser.add_argument('--password', default=None,
+                            help='password of the generated users, they can\'t log in without it')
+
+    def handle(self, *args, **options):
+        counts = {table: options[table] for table in ['collections', 'products', 'customers', 'orders']}
+        if any(count < 0 for count in counts.values()) or options['chunk_size'] < 1:
+            raise CommandError('Counts must be positive')
+        try:
+            plan = make_plan(
+                counts,
+                seed=options['seed'],
+                chunk_size=options['chunk_size'],
+                images_per_product=options['images_per_product'],
+                items_per_order=max(1, options['items_per_order']),
+                days=options['days'],
+                # hashed once for every user, hashing is slow on purpose
+                password=make_password(options['password']),
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        workers = options['workers']
+        if connection.vendor == 'sqlite' and workers > 1:
+            self.stdout.write(self.style.WARNING('SQLite has a single writer, running in one process'))
+
+        started = time.monotonic()
+        last_report = {}
+
+        def progress(table, rows):
+            # one line per 10% of a table
+            step = max(1, plan['counts'][table] // 10)
+            if rows // step != last_report.get(table) or rows == plan['counts'][table]:
+                last_report[table] = rows // step
+                self.stdout.write(f"{table}: {rows}/{plan['counts'][table]}")
+
+        done = generate(plan, workers=workers, progress=progress)
+        elapsed = time.monotonic() - started
+        total = sum(done.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'{total} rows in {elapsed:.1f}s ({total / (elapsed or 1):,.0f} rows/s, images and order items not counted)'))
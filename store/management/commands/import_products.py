@@ -0,0 +1,41 @@
+import json
+import sys
+import time
+from django.core.management.base import BaseCommand, CommandError
+
+from store.importers import READERS, ProductImporter, decode_lines
+
+
+class Command(BaseCommand):
+    help = 'Creates or updates products (by slug) from an NDJSON or CSV file (look at store.importers)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="the file, '-' reads stdin")
+        parser.add_argument('--format', choices=list(READERS),
+                            help='ndjson or csv, by default from the file extension')
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='rows per transaction (PRODUCT_IMPORT_BATCH_SIZE by default)')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        format = options['format'] or ('csv' if path.endswith('.csv') else 'ndjson')
+        importer = ProductImporter(batch_size=options['batch_size'])
+
+        started = time.monotonic()
+        if path == '-':
+            report = importer.run(decode_lines(sys.stdin.buffer), format=format)
+        else:
+            try:
+                with open(path, 'rb') as file:
+                    report = importer.run(decode_lines(file), format=format)
+            except FileNotFoundError:
+                raise CommandError(f'{path} does not exist')
+        elapsed = time.monotonic() - started
+
+        for error in report['errors']:
+            self.stderr.write(f"line {error['line']}: {json.dumps(error['errors'])}")
+        if report['failed'] > len(report['errors']):
+            self.stderr.write(f"... and {report['failed'] - len(report['errors'])} more")
+        self.stdout.write(self.style.SUCCESS(
+            f"{report['rows']} rows in {elapsed:.2f}s ({report['rows'] / (elapsed or 1):,.0f} rows/s): "
+            f"{report['created']} created, {report['updated']} updated, {report['failed']} failed"))
@@ -0,0 +1,16 @@
+import time
+from django.core.management.base import BaseCommand
+
+from store.search import get_search_engine
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the product search index (look at PRODUCT_SEARCH_ENGINE)'
+
+    def handle(self, *args, **options):
+        engine = get_search_engine()
+        self.stdout.write(f'Rebuilding the search index with {type(engine).__name__}...')
+        started = time.monotonic()
+        count = engine.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {count} products in {time.monotonic() - started:.2f}s'))
@@ -0,0 +1,34 @@
+from django.db.models import Count, F
+from django.core.management.base import BaseCommand
+
+from store.models import Collection
+
+
+class Command(BaseCommand):
+    help = 'Recounts Collection.products_count from the products table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Only report the collections whose counter drifted')
+
+    def handle(self, *args, **options):
+        drifted = Collection.objects \
+            .annotate(actual_count=Count('products')) \
+            .exclude(products_count=F('actual_count')) \
+            .values_list('id', 'title', 'products_count', 'actual_count')
+
+        drifted = list(drifted)
+        for pk, title, stored, actual in drifted:
+            self.stdout.write(f'{pk} {title}: stored {stored}, actual {actual}')
+
+        if options['dry_run']:
+            self.stdout.write(f'{len(drifted)} collections drifted')
+            return
+
+        if drifted:
+            Collection.objects \
+                .filter(pk__in=[row[0] for row in drifted]) \
+                .reconcile_products_count()
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(drifted)} collections were reconciled'))
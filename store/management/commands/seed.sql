@@ -1,16 +1,16 @@
 insert into
-  store_collection (id, title, featured_product_id)
+  store_collection (id, title, featured_product_id, products_count, last_update)
 values
-  (1, 'Flowers', null),
-  (2, 'Grocery', null),
-  (3, 'Beauty', null),
-  (4, 'Cleaning', null),
-  (5, 'Stationary', null),
-  (6, 'Pets', null),
-  (7, 'Baking', null),
-  (8, 'Spices', null),
-  (9, 'Toys', null),
-  (10, 'Magazines', null);
+  (1, 'Flowers', null, 0, '2020-06-01 00:00:00'),
+  (2, 'Grocery', null, 0, '2020-06-01 00:00:00'),
+  (3, 'Beauty', null, 0, '2020-06-01 00:00:00'),
+  (4, 'Cleaning', null, 0, '2020-06-01 00:00:00'),
+  (5, 'Stationary', null, 0, '2020-06-01 00:00:00'),
+  (6, 'Pets', null, 0, '2020-06-01 00:00:00'),
+  (7, 'Baking', null, 0, '2020-06-01 00:00:00'),
+  (8, 'Spices', null, 0, '2020-06-01 00:00:00'),
+  (9, 'Toys', null, 0, '2020-06-01 00:00:00'),
+  (10, 'Magazines', null, 0, '2020-06-01 00:00:00');
 
 insert into
   store_product (
@@ -20,6 +20,7 @@ insert into
     unit_price,
     inventory,
     last_update,
+    updated_at,
     collection_id,
     slug
   )
@@ -31,6 +32,7 @@ values
     4.00,
     11,
     '2020-09-11 00:00:00',
+    '2020-09-11 00:00:00',
     6,
     '-'
   ),
@@ -41,6 +43,7 @@ values
     84.64,
     40,
     '2020-07-07 00:00:00',
+    '2020-07-07 00:00:00',
     3,
     '-'
   ),
@@ -51,6 +54,7 @@ values
     11.52,
     29,
     '2021-04-05 00:00:00',
+    '2021-04-05 00:00:00',
     3,
     '-'
   ),
@@ -61,6 +65,7 @@ values
     73.47,
     40,
     '2020-07-20 00:00:00',
+    '2020-07-20 00:00:00',
     5,
     '-'
   ),
@@ -71,6 +76,7 @@ values
     60.21,
     56,
     '2020-08-18 00:00:00',
+    '2020-08-18 00:00:00',
     5,
     '-'
   ),
@@ -81,6 +87,7 @@ values
     76.62,
     18,
     '2020-10-25 00:00:00',
+    '2020-10-25 00:00:00',
     6,
     '-'
   ),
@@ -91,6 +98,7 @@ values
     13.64,
     48,
     '2020-08-08 00:00:00',
+    '2020-08-08 00:00:00',
     4,
     '-'
   ),
@@ -101,6 +109,7 @@ values
     85.76,
     55,
     '2021-06-03 00:00:00',
+    '2021-06-03 00:00:00',
     6,
     '-'
   ),
@@ -111,6 +120,7 @@ values
     30.81,
     45,
     '2021-03-03 00:00:00',
+    '2021-03-03 00:00:00',
     5,
     '-'
   ),
@@ -121,6 +131,7 @@ values
     2.82,
     69,
     '2021-04-18 00:00:00',
+    '2021-04-18 00:00:00',
     5,
     '-'
   ),
@@ -131,6 +142,7 @@ values
     37.72,
     71,
     '2021-01-19 00:00:00',
+    '2021-01-19 00:00:00',
     6,
     '-'
   ),
@@ -141,6 +153,7 @@ values
     92.74,
     55,
     '2020-12-28 00:00:00',
+    '2020-12-28 00:00:00',
     3,
     '-'
   ),
@@ -151,6 +164,7 @@ values
     50.07,
     41,
     '2020-07-07 00:00:00',
+    '2020-07-07 00:00:00',
     6,
     '-'
   ),
@@ -161,6 +175,7 @@ values
     88.70,
     24,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     4,
     '-'
   ),
@@ -171,6 +186,7 @@ values
     81.81,
     35,
     '2020-07-25 00:00:00',
+    '2020-07-25 00:00:00',
     4,
     '-'
   ),
@@ -181,6 +197,7 @@ values
     9.09,
     63,
     '2020-07-16 00:00:00',
+    '2020-07-16 00:00:00',
     6,
     '-'
   ),
@@ -191,6 +208,7 @@ values
     41.53,
     60,
     '2021-03-05 00:00:00',
+    '2021-03-05 00:00:00',
     3,
     '-'
   ),
@@ -201,6 +219,7 @@ values
     80.97,
     85,
     '2020-07-26 00:00:00',
+    '2020-07-26 00:00:00',
     4,
     '-'
   ),
@@ -211,6 +230,7 @@ values
     81.97,
     10,
     '2021-05-14 00:00:00',
+    '2021-05-14 00:00:00',
     5,
     '-'
   ),
@@ -221,6 +241,7 @@ values
     32.94,
     97,
     '2020-08-12 00:00:00',
+    '2020-08-12 00:00:00',
     3,
     '-'
   ),
@@ -231,6 +252,7 @@ values
     31.93,
     49,
     '2021-01-14 00:00:00',
+    '2021-01-14 00:00:00',
     5,
     '-'
   ),
@@ -241,6 +263,7 @@ values
     76.59,
     56,
     '2020-11-13 00:00:00',
+    '2020-11-13 00:00:00',
     5,
     '-'
   ),
@@ -251,6 +274,7 @@ values
     2.95,
     63,
     '2021-01-22 00:00:00',
+    '2021-01-22 00:00:00',
     6,
     '-'
   ),
@@ -261,6 +285,7 @@ values
     86.30,
     64,
     '2020-10-31 00:00:00',
+    '2020-10-31 00:00:00',
     3,
     '-'
   ),
@@ -271,6 +296,7 @@ values
     17.53,
     96,
     '2021-05-05 00:00:00',
+    '2021-05-05 00:00:00',
     4,
     '-'
   ),
@@ -281,6 +307,7 @@ values
     18.18,
     0,
     '2021-03-24 00:00:00',
+    '2021-03-24 00:00:00',
     3,
     '-'
   ),
@@ -291,6 +318,7 @@ values
     65.01,
     84,
     '2020-10-24 00:00:00',
+    '2020-10-24 00:00:00',
     5,
     '-'
   ),
@@ -301,6 +329,7 @@ values
     86.27,
     90,
     '2021-02-11 00:00:00',
+    '2021-02-11 00:00:00',
     5,
     '-'
   ),
@@ -311,6 +340,7 @@ values
     73.48,
     82,
     '2021-02-07 00:00:00',
+    '2021-02-07 00:00:00',
     6,
     '-'
   ),
@@ -321,6 +351,7 @@ values
     83.98,
     66,
     '2021-03-01 00:00:00',
+    '2021-03-01 00:00:00',
     4,
     '-'
   ),
@@ -331,6 +362,7 @@ values
     99.48,
     79,
     '2021-05-26 00:00:00',
+    '2021-05-26 00:00:00',
     5,
     '-'
   ),
@@ -341,6 +373,7 @@ values
     29.08,
     83,
     '2021-06-03 00:00:00',
+    '2021-06-03 00:00:00',
     5,
     '-'
   ),
@@ -351,6 +384,7 @@ values
     13.93,
     8,
     '2021-03-23 00:00:00',
+    '2021-03-23 00:00:00',
     6,
     '-'
   ),
@@ -361,6 +395,7 @@ values
     20.24,
     45,
     '2020-08-23 00:00:00',
+    '2020-08-23 00:00:00',
     3,
     '-'
   ),
@@ -371,6 +406,7 @@ values
     34.71,
     76,
     '2020-10-13 00:00:00',
+    '2020-10-13 00:00:00',
     3,
     '-'
   ),
@@ -381,6 +417,7 @@ values
     11.80,
     2,
     '2021-06-07 00:00:00',
+    '2021-06-07 00:00:00',
     4,
     '-'
   ),
@@ -391,6 +428,7 @@ values
     61.87,
     12,
     '2020-11-17 00:00:00',
+    '2020-11-17 00:00:00',
     3,
     '-'
   ),
@@ -401,6 +439,7 @@ values
     81.78,
     98,
     '2021-04-29 00:00:00',
+    '2021-04-29 00:00:00',
     5,
     '-'
   ),
@@ -411,6 +450,7 @@ values
     29.81,
     61,
     '2020-09-04 00:00:00',
+    '2020-09-04 00:00:00',
     4,
     '-'
   ),
@@ -421,6 +461,7 @@ values
     51.39,
     8,
     '2021-04-07 00:00:00',
+    '2021-04-07 00:00:00',
     5,
     '-'
   ),
@@ -431,6 +472,7 @@ values
     64.20,
     54,
     '2020-12-22 00:00:00',
+    '2020-12-22 00:00:00',
     3,
     '-'
   ),
@@ -441,6 +483,7 @@ values
     71.97,
     52,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     5,
     '-'
   ),
@@ -451,6 +494,7 @@ values
     14.87,
     38,
     '2021-05-15 00:00:00',
+    '2021-05-15 00:00:00',
     6,
     '-'
   ),
@@ -461,6 +505,7 @@ values
     52.43,
     88,
     '2021-02-10 00:00:00',
+    '2021-02-10 00:00:00',
     6,
     '-'
   ),
@@ -471,6 +516,7 @@ values
     84.60,
     93,
     '2020-09-26 00:00:00',
+    '2020-09-26 00:00:00',
     3,
     '-'
   ),
@@ -481,6 +527,7 @@ values
     39.61,
     92,
     '2020-07-14 00:00:00',
+    '2020-07-14 00:00:00',
     6,
     '-'
   ),
@@ -491,6 +538,7 @@ values
     75.08,
     15,
     '2021-04-28 00:00:00',
+    '2021-04-28 00:00:00',
     3,
     '-'
   ),
@@ -501,6 +549,7 @@ values
     16.75,
     94,
     '2021-06-06 00:00:00',
+    '2021-06-06 00:00:00',
     6,
     '-'
   ),
@@ -511,6 +560,7 @@ values
     93.49,
     16,
     '2020-07-07 00:00:00',
+    '2020-07-07 00:00:00',
     3,
     '-'
   ),
@@ -521,6 +571,7 @@ values
     69.22,
     14,
     '2020-06-11 00:00:00',
+    '2020-06-11 00:00:00',
     4,
     '-'
   ),
@@ -531,6 +582,7 @@ values
     20.42,
     94,
     '2021-05-05 00:00:00',
+    '2021-05-05 00:00:00',
     3,
     '-'
   ),
@@ -541,6 +593,7 @@ values
     89.46,
     44,
     '2020-06-14 00:00:00',
+    '2020-06-14 00:00:00',
     4,
     '-'
   ),
@@ -551,6 +604,7 @@ values
     42.13,
     58,
     '2021-01-19 00:00:00',
+    '2021-01-19 00:00:00',
     3,
     '-'
   ),
@@ -561,6 +615,7 @@ values
     85.92,
     93,
     '2021-04-24 00:00:00',
+    '2021-04-24 00:00:00',
     3,
     '-'
   ),
@@ -571,6 +626,7 @@ values
     91.98,
     43,
     '2020-09-06 00:00:00',
+    '2020-09-06 00:00:00',
     4,
     '-'
   ),
@@ -581,6 +637,7 @@ values
     7.30,
     60,
     '2021-05-09 00:00:00',
+    '2021-05-09 00:00:00',
     5,
     '-'
   ),
@@ -591,6 +648,7 @@ values
     8.83,
     5,
     '2021-01-01 00:00:00',
+    '2021-01-01 00:00:00',
     3,
     '-'
   ),
@@ -601,6 +659,7 @@ values
     47.43,
     11,
     '2021-04-07 00:00:00',
+    '2021-04-07 00:00:00',
     3,
     '-'
   ),
@@ -611,6 +670,7 @@ values
     36.84,
     13,
     '2020-08-14 00:00:00',
+    '2020-08-14 00:00:00',
     6,
     '-'
   ),
@@ -621,6 +681,7 @@ values
     64.38,
     100,
     '2020-07-21 00:00:00',
+    '2020-07-21 00:00:00',
     4,
     '-'
   ),
@@ -631,6 +692,7 @@ values
     37.63,
     43,
     '2020-09-25 00:00:00',
+    '2020-09-25 00:00:00',
     6,
     '-'
   ),
@@ -641,6 +703,7 @@ values
     14.57,
     34,
     '2020-10-14 00:00:00',
+    '2020-10-14 00:00:00',
     6,
     '-'
   ),
@@ -651,6 +714,7 @@ values
     26.36,
     34,
     '2020-09-22 00:00:00',
+    '2020-09-22 00:00:00',
     5,
     '-'
   ),
@@ -661,6 +725,7 @@ values
     59.91,
     32,
     '2021-02-13 00:00:00',
+    '2021-02-13 00:00:00',
     5,
     '-'
   ),
@@ -671,6 +736,7 @@ values
     79.79,
     12,
     '2021-03-10 00:00:00',
+    '2021-03-10 00:00:00',
     4,
     '-'
   ),
@@ -681,6 +747,7 @@ values
     38.03,
     31,
     '2020-06-13 00:00:00',
+    '2020-06-13 00:00:00',
     5,
     '-'
   ),
@@ -691,6 +758,7 @@ values
     19.49,
     33,
     '2021-01-13 00:00:00',
+    '2021-01-13 00:00:00',
     5,
     '-'
   ),
@@ -701,6 +769,7 @@ values
     93.16,
     7,
     '2021-04-14 00:00:00',
+    '2021-04-14 00:00:00',
     5,
     '-'
   ),
@@ -711,6 +780,7 @@ values
     4.66,
     6,
     '2021-02-10 00:00:00',
+    '2021-02-10 00:00:00',
     4,
     '-'
   ),
@@ -721,6 +791,7 @@ values
     1.27,
     15,
     '2020-12-10 00:00:00',
+    '2020-12-10 00:00:00',
     3,
     '-'
   ),
@@ -731,6 +802,7 @@ values
     1.88,
     25,
     '2020-08-19 00:00:00',
+    '2020-08-19 00:00:00',
     5,
     '-'
   ),
@@ -741,6 +813,7 @@ values
     36.96,
     43,
     '2020-10-10 00:00:00',
+    '2020-10-10 00:00:00',
     4,
     '-'
   ),
@@ -751,6 +824,7 @@ values
     65.35,
     50,
     '2020-11-02 00:00:00',
+    '2020-11-02 00:00:00',
     4,
     '-'
   ),
@@ -761,6 +835,7 @@ values
     90.39,
     72,
     '2021-04-13 00:00:00',
+    '2021-04-13 00:00:00',
     3,
     '-'
   ),
@@ -771,6 +846,7 @@ values
     98.61,
     53,
     '2020-10-12 00:00:00',
+    '2020-10-12 00:00:00',
     4,
     '-'
   ),
@@ -781,6 +857,7 @@ values
     66.25,
     72,
     '2020-12-08 00:00:00',
+    '2020-12-08 00:00:00',
     3,
     '-'
   ),
@@ -791,6 +868,7 @@ values
     86.36,
     93,
     '2020-07-06 00:00:00',
+    '2020-07-06 00:00:00',
     3,
     '-'
   ),
@@ -801,6 +879,7 @@ values
     82.37,
     39,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     4,
     '-'
   ),
@@ -811,6 +890,7 @@ values
     85.46,
     24,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     3,
     '-'
   ),
@@ -821,6 +901,7 @@ values
     8.70,
     70,
     '2020-07-09 00:00:00',
+    '2020-07-09 00:00:00',
     4,
     '-'
   ),
@@ -831,6 +912,7 @@ values
     8.13,
     29,
     '2020-12-15 00:00:00',
+    '2020-12-15 00:00:00',
     5,
     '-'
   ),
@@ -841,6 +923,7 @@ values
     83.36,
     67,
     '2020-10-25 00:00:00',
+    '2020-10-25 00:00:00',
     5,
     '-'
   ),
@@ -851,6 +934,7 @@ values
     71.01,
     17,
     '2020-07-27 00:00:00',
+    '2020-07-27 00:00:00',
     3,
     '-'
   ),
@@ -861,6 +945,7 @@ values
     47.63,
     11,
     '2020-12-23 00:00:00',
+    '2020-12-23 00:00:00',
     6,
     '-'
   ),
@@ -871,6 +956,7 @@ values
     1.08,
     58,
     '2021-06-07 00:00:00',
+    '2021-06-07 00:00:00',
     5,
     '-'
   ),
@@ -881,6 +967,7 @@ values
     90.06,
     88,
     '2021-05-04 00:00:00',
+    '2021-05-04 00:00:00',
     3,
     '-'
   ),
@@ -891,6 +978,7 @@ values
     30.95,
     52,
     '2020-10-10 00:00:00',
+    '2020-10-10 00:00:00',
     5,
     '-'
   ),
@@ -901,6 +989,7 @@ values
     11.89,
     59,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     3,
     '-'
   ),
@@ -911,6 +1000,7 @@ values
     35.85,
     92,
     '2020-10-11 00:00:00',
+    '2020-10-11 00:00:00',
     6,
     '-'
   ),
@@ -921,6 +1011,7 @@ values
     28.87,
     48,
     '2020-12-28 00:00:00',
+    '2020-12-28 00:00:00',
     3,
     '-'
   ),
@@ -931,6 +1022,7 @@ values
     35.71,
     32,
     '2021-05-15 00:00:00',
+    '2021-05-15 00:00:00',
     5,
     '-'
   ),
@@ -941,6 +1033,7 @@ values
     33.37,
     26,
     '2020-07-16 00:00:00',
+    '2020-07-16 00:00:00',
     5,
     '-'
   ),
@@ -951,6 +1044,7 @@ values
     3.34,
     87,
     '2020-12-29 00:00:00',
+    '2020-12-29 00:00:00',
     5,
     '-'
   ),
@@ -961,6 +1055,7 @@ values
     61.59,
     71,
     '2020-07-16 00:00:00',
+    '2020-07-16 00:00:00',
     5,
     '-'
   ),
@@ -971,6 +1066,7 @@ values
     84.83,
     15,
     '2020-06-21 00:00:00',
+    '2020-06-21 00:00:00',
     3,
     '-'
   ),
@@ -981,6 +1077,7 @@ values
     28.16,
     2,
     '2020-10-19 00:00:00',
+    '2020-10-19 00:00:00',
     3,
     '-'
   ),
@@ -991,6 +1088,7 @@ values
     87.65,
     31,
     '2021-02-23 00:00:00',
+    '2021-02-23 00:00:00',
     6,
     '-'
   ),
@@ -1001,6 +1099,7 @@ values
     20.87,
     38,
     '2020-08-11 00:00:00',
+    '2020-08-11 00:00:00',
     3,
     '-'
   ),
@@ -1011,6 +1110,7 @@ values
     27.91,
     96,
     '2021-03-20 00:00:00',
+    '2021-03-20 00:00:00',
     3,
     '-'
   ),
@@ -1021,6 +1121,7 @@ values
     87.47,
     40,
     '2021-02-20 00:00:00',
+    '2021-02-20 00:00:00',
     3,
     '-'
   ),
@@ -1031,6 +1132,7 @@ values
     70.52,
     32,
     '2020-06-27 00:00:00',
+    '2020-06-27 00:00:00',
     6,
     '-'
   ),
@@ -1041,6 +1143,7 @@ values
     93.81,
     66,
     '2021-03-02 00:00:00',
+    '2021-03-02 00:00:00',
     4,
     '-'
   ),
@@ -1051,6 +1154,7 @@ values
     12.71,
     77,
     '2020-07-12 00:00:00',
+    '2020-07-12 00:00:00',
     3,
     '-'
   ),
@@ -1061,6 +1165,7 @@ values
     98.89,
     62,
     '2020-09-03 00:00:00',
+    '2020-09-03 00:00:00',
     3,
     '-'
   ),
@@ -1071,6 +1176,7 @@ values
     83.88,
     24,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     6,
     '-'
   ),
@@ -1081,6 +1187,7 @@ values
     4.88,
     22,
     '2020-07-30 00:00:00',
+    '2020-07-30 00:00:00',
     5,
     '-'
   ),
@@ -1091,6 +1198,7 @@ values
     13.89,
     10,
     '2021-04-13 00:00:00',
+    '2021-04-13 00:00:00',
     3,
     '-'
   ),
@@ -1101,6 +1209,7 @@ values
     35.65,
     13,
     '2020-10-23 00:00:00',
+    '2020-10-23 00:00:00',
     3,
     '-'
   ),
@@ -1111,6 +1220,7 @@ values
     5.07,
     95,
     '2021-01-08 00:00:00',
+    '2021-01-08 00:00:00',
     3,
     '-'
   ),
@@ -1121,6 +1231,7 @@ values
     22.63,
     7,
     '2021-04-06 00:00:00',
+    '2021-04-06 00:00:00',
     4,
     '-'
   ),
@@ -1131,6 +1242,7 @@ values
     94.11,
     94,
     '2021-04-14 00:00:00',
+    '2021-04-14 00:00:00',
     3,
     '-'
   ),
@@ -1141,6 +1253,7 @@ values
     80.67,
     59,
     '2021-02-26 00:00:00',
+    '2021-02-26 00:00:00',
     6,
     '-'
   ),
@@ -1151,6 +1264,7 @@ values
     44.29,
     80,
     '2020-08-14 00:00:00',
+    '2020-08-14 00:00:00',
     5,
     '-'
   ),
@@ -1161,6 +1275,7 @@ values
     46.60,
     66,
     '2020-08-06 00:00:00',
+    '2020-08-06 00:00:00',
     3,
     '-'
   ),
@@ -1171,6 +1286,7 @@ values
     35.53,
     45,
     '2021-02-03 00:00:00',
+    '2021-02-03 00:00:00',
     3,
     '-'
   ),
@@ -1181,6 +1297,7 @@ values
     85.57,
     59,
     '2020-12-29 00:00:00',
+    '2020-12-29 00:00:00',
     4,
     '-'
   ),
@@ -1191,6 +1308,7 @@ values
     65.52,
     97,
     '2020-11-25 00:00:00',
+    '2020-11-25 00:00:00',
     3,
     '-'
   ),
@@ -1201,6 +1319,7 @@ values
     57.27,
     3,
     '2021-04-02 00:00:00',
+    '2021-04-02 00:00:00',
     3,
     '-'
   ),
@@ -1211,6 +1330,7 @@ values
     77.83,
     79,
     '2020-11-03 00:00:00',
+    '2020-11-03 00:00:00',
     5,
     '-'
   ),
@@ -1221,6 +1341,7 @@ values
     49.77,
     44,
     '2020-06-22 00:00:00',
+    '2020-06-22 00:00:00',
     6,
     '-'
   ),
@@ -1231,6 +1352,7 @@ values
     2.20,
     84,
     '2021-01-11 00:00:00',
+    '2021-01-11 00:00:00',
     4,
     '-'
   ),
@@ -1241,6 +1363,7 @@ values
     44.58,
     96,
     '2020-09-17 00:00:00',
+    '2020-09-17 00:00:00',
     4,
     '-'
   ),
@@ -1251,6 +1374,7 @@ values
     57.94,
     55,
     '2021-04-24 00:00:00',
+    '2021-04-24 00:00:00',
     4,
     '-'
   ),
@@ -1261,6 +1385,7 @@ values
     97.81,
     72,
     '2020-11-11 00:00:00',
+    '2020-11-11 00:00:00',
     6,
     '-'
   ),
@@ -1271,6 +1396,7 @@ values
     97.58,
     74,
     '2021-03-06 00:00:00',
+    '2021-03-06 00:00:00',
     3,
     '-'
   ),
@@ -1281,6 +1407,7 @@ values
     86.27,
     5,
     '2021-01-20 00:00:00',
+    '2021-01-20 00:00:00',
     3,
     '-'
   ),
@@ -1291,6 +1418,7 @@ values
     19.96,
     45,
     '2021-01-07 00:00:00',
+    '2021-01-07 00:00:00',
     6,
     '-'
   ),
@@ -1301,6 +1429,7 @@ values
     43.45,
     74,
     '2021-04-19 00:00:00',
+    '2021-04-19 00:00:00',
     6,
     '-'
   ),
@@ -1311,6 +1440,7 @@ values
     32.31,
     42,
     '2021-01-30 00:00:00',
+    '2021-01-30 00:00:00',
     4,
     '-'
   ),
@@ -1321,6 +1451,7 @@ values
     53.31,
     27,
     '2020-07-20 00:00:00',
+    '2020-07-20 00:00:00',
     6,
     '-'
   ),
@@ -1331,6 +1462,7 @@ values
     15.76,
     26,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     4,
     '-'
   ),
@@ -1341,6 +1473,7 @@ values
     46.59,
     79,
     '2020-09-09 00:00:00',
+    '2020-09-09 00:00:00',
     6,
     '-'
   ),
@@ -1351,6 +1484,7 @@ values
     57.26,
     15,
     '2021-01-08 00:00:00',
+    '2021-01-08 00:00:00',
     6,
     '-'
   ),
@@ -1361,6 +1495,7 @@ values
     8.68,
     94,
     '2020-08-20 00:00:00',
+    '2020-08-20 00:00:00',
     3,
     '-'
   ),
@@ -1371,6 +1506,7 @@ values
     58.27,
     17,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     3,
     '-'
   ),
@@ -1381,6 +1517,7 @@ values
     94.84,
     71,
     '2021-03-22 00:00:00',
+    '2021-03-22 00:00:00',
     5,
     '-'
   ),
@@ -1391,6 +1528,7 @@ values
     50.15,
     46,
     '2020-07-03 00:00:00',
+    '2020-07-03 00:00:00',
     3,
     '-'
   ),
@@ -1401,6 +1539,7 @@ values
     86.52,
     58,
     '2020-12-29 00:00:00',
+    '2020-12-29 00:00:00',
     4,
     '-'
   ),
@@ -1411,6 +1550,7 @@ values
     42.81,
     31,
     '2020-06-21 00:00:00',
+    '2020-06-21 00:00:00',
     5,
     '-'
   ),
@@ -1421,6 +1561,7 @@ values
     39.14,
     35,
     '2021-01-13 00:00:00',
+    '2021-01-13 00:00:00',
     5,
     '-'
   ),
@@ -1431,6 +1572,7 @@ values
     24.36,
     98,
     '2021-02-08 00:00:00',
+    '2021-02-08 00:00:00',
     3,
     '-'
   ),
@@ -1441,6 +1583,7 @@ values
     4.34,
     97,
     '2020-08-11 00:00:00',
+    '2020-08-11 00:00:00',
     6,
     '-'
   ),
@@ -1451,6 +1594,7 @@ values
     15.47,
     18,
     '2021-01-03 00:00:00',
+    '2021-01-03 00:00:00',
     3,
     '-'
   ),
@@ -1461,6 +1605,7 @@ values
     61.50,
     50,
     '2021-04-14 00:00:00',
+    '2021-04-14 00:00:00',
     6,
     '-'
   ),
@@ -1471,6 +1616,7 @@ values
     73.24,
     31,
     '2020-09-08 00:00:00',
+    '2020-09-08 00:00:00',
     4,
     '-'
   ),
@@ -1481,6 +1627,7 @@ values
     20.58,
     65,
     '2020-11-27 00:00:00',
+    '2020-11-27 00:00:00',
     6,
     '-'
   ),
@@ -1491,6 +1638,7 @@ values
     49.25,
     71,
     '2020-07-14 00:00:00',
+    '2020-07-14 00:00:00',
     5,
     '-'
   ),
@@ -1501,6 +1649,7 @@ values
     55.51,
     49,
     '2020-10-17 00:00:00',
+    '2020-10-17 00:00:00',
     3,
     '-'
   ),
@@ -1511,6 +1660,7 @@ values
     56.29,
     92,
     '2020-08-21 00:00:00',
+    '2020-08-21 00:00:00',
     3,
     '-'
   ),
@@ -1521,6 +1671,7 @@ values
     70.09,
     10,
     '2020-09-16 00:00:00',
+    '2020-09-16 00:00:00',
     3,
     '-'
   ),
@@ -1531,6 +1682,7 @@ values
     60.41,
     27,
     '2021-04-19 00:00:00',
+    '2021-04-19 00:00:00',
     5,
     '-'
   ),
@@ -1541,6 +1693,7 @@ values
     8.40,
     15,
     '2020-07-17 00:00:00',
+    '2020-07-17 00:00:00',
     6,
     '-'
   ),
@@ -1551,6 +1704,7 @@ values
     80.45,
     69,
     '2021-06-07 00:00:00',
+    '2021-06-07 00:00:00',
     4,
     '-'
   ),
@@ -1561,6 +1715,7 @@ values
     47.43,
     41,
     '2020-07-31 00:00:00',
+    '2020-07-31 00:00:00',
     4,
     '-'
   ),
@@ -1571,6 +1726,7 @@ values
     62.77,
     56,
     '2020-09-05 00:00:00',
+    '2020-09-05 00:00:00',
     3,
     '-'
   ),
@@ -1581,6 +1737,7 @@ values
     27.78,
     86,
     '2020-08-18 00:00:00',
+    '2020-08-18 00:00:00',
     6,
     '-'
   ),
@@ -1591,6 +1748,7 @@ values
     69.86,
     29,
     '2020-09-25 00:00:00',
+    '2020-09-25 00:00:00',
     4,
     '-'
   ),
@@ -1601,6 +1759,7 @@ values
     40.25,
     28,
     '2021-02-06 00:00:00',
+    '2021-02-06 00:00:00',
     5,
     '-'
   ),
@@ -1611,6 +1770,7 @@ values
     7.04,
     7,
     '2020-10-02 00:00:00',
+    '2020-10-02 00:00:00',
     6,
     '-'
   ),
@@ -1621,6 +1781,7 @@ values
     37.31,
     91,
     '2021-01-25 00:00:00',
+    '2021-01-25 00:00:00',
     4,
     '-'
   ),
@@ -1631,6 +1792,7 @@ values
     25.74,
     10,
     '2020-08-10 00:00:00',
+    '2020-08-10 00:00:00',
     3,
     '-'
   ),
@@ -1641,6 +1803,7 @@ values
     72.51,
     85,
     '2021-05-19 00:00:00',
+    '2021-05-19 00:00:00',
     6,
     '-'
   ),
@@ -1651,6 +1814,7 @@ values
     14.67,
     8,
     '2021-04-23 00:00:00',
+    '2021-04-23 00:00:00',
     3,
     '-'
   ),
@@ -1661,6 +1825,7 @@ values
     74.71,
     51,
     '2021-06-08 00:00:00',
+    '2021-06-08 00:00:00',
     5,
     '-'
   ),
@@ -1671,6 +1836,7 @@ values
     85.06,
     64,
     '2021-01-18 00:00:00',
+    '2021-01-18 00:00:00',
     4,
     '-'
   ),
@@ -1681,6 +1847,7 @@ values
     70.35,
     100,
     '2020-09-27 00:00:00',
+    '2020-09-27 00:00:00',
     6,
     '-'
   ),
@@ -1691,6 +1858,7 @@ values
     35.45,
     64,
     '2021-03-02 00:00:00',
+    '2021-03-02 00:00:00',
     3,
     '-'
   ),
@@ -1701,6 +1869,7 @@ values
     73.38,
     45,
     '2020-11-28 00:00:00',
+    '2020-11-28 00:00:00',
     4,
     '-'
   ),
@@ -1711,6 +1880,7 @@ values
     80.33,
     95,
     '2020-11-09 00:00:00',
+    '2020-11-09 00:00:00',
     3,
     '-'
   ),
@@ -1721,6 +1891,7 @@ values
     46.37,
     39,
     '2020-06-17 00:00:00',
+    '2020-06-17 00:00:00',
     4,
     '-'
   ),
@@ -1731,6 +1902,7 @@ values
     30.96,
     9,
     '2021-03-07 00:00:00',
+    '2021-03-07 00:00:00',
     4,
     '-'
   ),
@@ -1741,6 +1913,7 @@ values
     84.84,
     87,
     '2021-02-25 00:00:00',
+    '2021-02-25 00:00:00',
     4,
     '-'
   ),
@@ -1751,6 +1924,7 @@ values
     89.46,
     52,
     '2020-07-20 00:00:00',
+    '2020-07-20 00:00:00',
     3,
     '-'
   ),
@@ -1761,6 +1935,7 @@ values
     68.59,
     78,
     '2021-05-24 00:00:00',
+    '2021-05-24 00:00:00',
     5,
     '-'
   ),
@@ -1771,6 +1946,7 @@ values
     87.37,
     3,
     '2021-05-06 00:00:00',
+    '2021-05-06 00:00:00',
     6,
     '-'
   ),
@@ -1781,6 +1957,7 @@ values
     43.99,
     34,
     '2020-08-03 00:00:00',
+    '2020-08-03 00:00:00',
     5,
     '-'
   ),
@@ -1791,6 +1968,7 @@ values
     59.91,
     4,
     '2020-07-23 00:00:00',
+    '2020-07-23 00:00:00',
     3,
     '-'
   ),
@@ -1801,6 +1979,7 @@ values
     25.40,
     94,
     '2021-04-14 00:00:00',
+    '2021-04-14 00:00:00',
     4,
     '-'
   ),
@@ -1811,6 +1990,7 @@ values
     11.58,
     20,
     '2021-05-25 00:00:00',
+    '2021-05-25 00:00:00',
     6,
     '-'
   ),
@@ -1821,6 +2001,7 @@ values
     9.86,
     92,
     '2021-03-14 00:00:00',
+    '2021-03-14 00:00:00',
     4,
     '-'
   ),
@@ -1831,6 +2012,7 @@ values
     98.46,
     69,
     '2020-12-29 00:00:00',
+    '2020-12-29 00:00:00',
     3,
     '-'
   ),
@@ -1841,6 +2023,7 @@ values
     87.08,
     65,
     '2021-04-24 00:00:00',
+    '2021-04-24 00:00:00',
     5,
     '-'
   ),
@@ -1851,6 +2034,7 @@ values
     65.66,
     68,
     '2021-02-25 00:00:00',
+    '2021-02-25 00:00:00',
     5,
     '-'
   ),
@@ -1861,6 +2045,7 @@ values
     6.42,
     9,
     '2021-05-09 00:00:00',
+    '2021-05-09 00:00:00',
     4,
     '-'
   ),
@@ -1871,6 +2056,7 @@ values
     85.15,
     88,
     '2021-02-20 00:00:00',
+    '2021-02-20 00:00:00',
     6,
     '-'
   ),
@@ -1881,6 +2067,7 @@ values
     80.88,
     67,
     '2021-02-06 00:00:00',
+    '2021-02-06 00:00:00',
     6,
     '-'
   ),
@@ -1891,6 +2078,7 @@ values
     12.87,
     76,
     '2021-01-01 00:00:00',
+    '2021-01-01 00:00:00',
     3,
     '-'
   ),
@@ -1901,6 +2089,7 @@ values
     19.86,
     1,
     '2020-11-12 00:00:00',
+    '2020-11-12 00:00:00',
     3,
     '-'
   ),
@@ -1911,6 +2100,7 @@ values
     65.45,
     24,
     '2020-11-01 00:00:00',
+    '2020-11-01 00:00:00',
     5,
     '-'
   ),
@@ -1921,6 +2111,7 @@ values
     91.58,
     6,
     '2021-02-17 00:00:00',
+    '2021-02-17 00:00:00',
     4,
     '-'
   ),
@@ -1931,6 +2122,7 @@ values
     68.10,
     18,
     '2020-12-12 00:00:00',
+    '2020-12-12 00:00:00',
     3,
     '-'
   ),
@@ -1941,6 +2133,7 @@ values
     39.80,
     72,
     '2020-10-04 00:00:00',
+    '2020-10-04 00:00:00',
     6,
     '-'
   ),
@@ -1951,6 +2144,7 @@ values
     35.52,
     51,
     '2021-05-31 00:00:00',
+    '2021-05-31 00:00:00',
     3,
     '-'
   ),
@@ -1961,6 +2155,7 @@ values
     6.23,
     51,
     '2020-11-29 00:00:00',
+    '2020-11-29 00:00:00',
     5,
     '-'
   ),
@@ -1971,6 +2166,7 @@ values
     80.51,
     43,
     '2020-07-18 00:00:00',
+    '2020-07-18 00:00:00',
     3,
     '-'
   ),
@@ -1981,6 +2177,7 @@ values
     94.45,
     2,
     '2020-08-07 00:00:00',
+    '2020-08-07 00:00:00',
     5,
     '-'
   ),
@@ -1991,6 +2188,7 @@ values
     18.05,
     93,
     '2021-06-07 00:00:00',
+    '2021-06-07 00:00:00',
     5,
     '-'
   ),
@@ -2001,6 +2199,7 @@ values
     74.23,
     11,
     '2021-06-06 00:00:00',
+    '2021-06-06 00:00:00',
     5,
     '-'
   ),
@@ -2011,6 +2210,7 @@ values
     37.39,
     79,
     '2021-04-17 00:00:00',
+    '2021-04-17 00:00:00',
     4,
     '-'
   ),
@@ -2021,6 +2221,7 @@ values
     9.97,
     86,
     '2021-02-14 00:00:00',
+    '2021-02-14 00:00:00',
     5,
     '-'
   ),
@@ -2031,6 +2232,7 @@ values
     34.27,
     98,
     '2021-03-05 00:00:00',
+    '2021-03-05 00:00:00',
     4,
     '-'
   ),
@@ -2041,6 +2243,7 @@ values
     74.11,
     20,
     '2021-01-31 00:00:00',
+    '2021-01-31 00:00:00',
     5,
     '-'
   ),
@@ -2051,6 +2254,7 @@ values
     2.51,
     77,
     '2020-08-02 00:00:00',
+    '2020-08-02 00:00:00',
     4,
     '-'
   ),
@@ -2061,6 +2265,7 @@ values
     26.97,
     71,
     '2020-08-27 00:00:00',
+    '2020-08-27 00:00:00',
     3,
     '-'
   ),
@@ -2071,6 +2276,7 @@ values
     88.95,
     38,
     '2021-01-20 00:00:00',
+    '2021-01-20 00:00:00',
     3,
     '-'
   ),
@@ -2081,6 +2287,7 @@ values
     64.43,
     87,
     '2020-11-21 00:00:00',
+    '2020-11-21 00:00:00',
     3,
     '-'
   ),
@@ -2091,6 +2298,7 @@ values
     68.52,
     78,
     '2021-06-09 00:00:00',
+    '2021-06-09 00:00:00',
     6,
     '-'
   ),
@@ -2101,6 +2309,7 @@ values
     17.08,
     77,
     '2020-11-08 00:00:00',
+    '2020-11-08 00:00:00',
     5,
     '-'
   ),
@@ -2111,6 +2320,7 @@ values
     95.44,
     9,
     '2021-05-06 00:00:00',
+    '2021-05-06 00:00:00',
     5,
     '-'
   ),
@@ -2121,6 +2331,7 @@ values
     52.18,
     6,
     '2021-04-09 00:00:00',
+    '2021-04-09 00:00:00',
     6,
     '-'
   ),
@@ -2131,6 +2342,7 @@ values
     78.25,
     95,
     '2020-09-06 00:00:00',
+    '2020-09-06 00:00:00',
     6,
     '-'
   ),
@@ -2141,6 +2353,7 @@ values
     49.93,
     80,
     '2020-09-11 00:00:00',
+    '2020-09-11 00:00:00',
     4,
     '-'
   ),
@@ -2151,6 +2364,7 @@ values
     19.07,
     23,
     '2020-07-19 00:00:00',
+    '2020-07-19 00:00:00',
     3,
     '-'
   ),
@@ -2161,6 +2375,7 @@ values
     85.71,
     10,
     '2021-03-31 00:00:00',
+    '2021-03-31 00:00:00',
     3,
     '-'
   ),
@@ -2171,6 +2386,7 @@ values
     36.16,
     54,
     '2020-09-25 00:00:00',
+    '2020-09-25 00:00:00',
     4,
     '-'
   ),
@@ -2181,6 +2397,7 @@ values
     68.06,
     25,
     '2020-10-31 00:00:00',
+    '2020-10-31 00:00:00',
     3,
     '-'
   ),
@@ -2191,6 +2408,7 @@ values
     11.95,
     52,
     '2020-12-31 00:00:00',
+    '2020-12-31 00:00:00',
     3,
     '-'
   ),
@@ -2201,6 +2419,7 @@ values
     24.26,
     34,
     '2021-04-07 00:00:00',
+    '2021-04-07 00:00:00',
     6,
     '-'
   ),
@@ -2211,6 +2430,7 @@ values
     85.39,
     41,
     '2020-10-28 00:00:00',
+    '2020-10-28 00:00:00',
     5,
     '-'
   ),
@@ -2221,6 +2441,7 @@ values
     40.72,
     30,
     '2020-09-23 00:00:00',
+    '2020-09-23 00:00:00',
     6,
     '-'
   ),
@@ -2231,6 +2452,7 @@ values
     55.05,
     33,
     '2021-03-08 00:00:00',
+    '2021-03-08 00:00:00',
     4,
     '-'
   ),
@@ -2241,6 +2463,7 @@ values
     94.97,
     46,
     '2020-11-13 00:00:00',
+    '2020-11-13 00:00:00',
     5,
     '-'
   ),
@@ -2251,6 +2474,7 @@ values
     36.65,
     30,
     '2021-04-14 00:00:00',
+    '2021-04-14 00:00:00',
     3,
     '-'
   ),
@@ -2261,6 +2485,7 @@ values
     99.65,
     46,
     '2021-05-24 00:00:00',
+    '2021-05-24 00:00:00',
     6,
     '-'
   ),
@@ -2271,6 +2496,7 @@ values
     37.58,
     54,
     '2021-03-19 00:00:00',
+    '2021-03-19 00:00:00',
     3,
     '-'
   ),
@@ -2281,6 +2507,7 @@ values
     57.44,
     26,
     '2021-05-15 00:00:00',
+    '2021-05-15 00:00:00',
     3,
     '-'
   ),
@@ -2291,6 +2518,7 @@ values
     99.51,
     40,
     '2020-10-26 00:00:00',
+    '2020-10-26 00:00:00',
     3,
     '-'
   ),
@@ -2301,6 +2529,7 @@ values
     11.07,
     45,
     '2021-02-14 00:00:00',
+    '2021-02-14 00:00:00',
     5,
     '-'
   ),
@@ -2311,6 +2540,7 @@ values
     6.83,
     95,
     '2021-04-06 00:00:00',
+    '2021-04-06 00:00:00',
     5,
     '-'
   ),
@@ -2321,6 +2551,7 @@ values
     56.29,
     49,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     5,
     '-'
   ),
@@ -2331,6 +2562,7 @@ values
     5.68,
     67,
     '2021-01-14 00:00:00',
+    '2021-01-14 00:00:00',
     4,
     '-'
   ),
@@ -2341,6 +2573,7 @@ values
     52.31,
     50,
     '2020-11-21 00:00:00',
+    '2020-11-21 00:00:00',
     4,
     '-'
   ),
@@ -2351,6 +2584,7 @@ values
     92.28,
     97,
     '2021-04-02 00:00:00',
+    '2021-04-02 00:00:00',
     6,
     '-'
   ),
@@ -2361,6 +2595,7 @@ values
     6.62,
     54,
     '2021-02-01 00:00:00',
+    '2021-02-01 00:00:00',
     3,
     '-'
   ),
@@ -2371,6 +2606,7 @@ values
     67.25,
     74,
     '2020-11-28 00:00:00',
+    '2020-11-28 00:00:00',
     3,
     '-'
   ),
@@ -2381,6 +2617,7 @@ values
     27.60,
     13,
     '2020-10-22 00:00:00',
+    '2020-10-22 00:00:00',
     6,
     '-'
   ),
@@ -2391,6 +2628,7 @@ values
     54.57,
     22,
     '2020-12-24 00:00:00',
+    '2020-12-24 00:00:00',
     6,
     '-'
   ),
@@ -2401,6 +2639,7 @@ values
     23.35,
     98,
     '2020-08-11 00:00:00',
+    '2020-08-11 00:00:00',
     3,
     '-'
   ),
@@ -2411,6 +2650,7 @@ values
     14.43,
     48,
     '2020-07-13 00:00:00',
+    '2020-07-13 00:00:00',
     5,
     '-'
   ),
@@ -2421,6 +2661,7 @@ values
     46.42,
     94,
     '2021-03-30 00:00:00',
+    '2021-03-30 00:00:00',
     4,
     '-'
   ),
@@ -2431,6 +2672,7 @@ values
     72.33,
     96,
     '2020-09-08 00:00:00',
+    '2020-09-08 00:00:00',
     4,
     '-'
   ),
@@ -2441,6 +2683,7 @@ values
     74.61,
     69,
     '2020-11-07 00:00:00',
+    '2020-11-07 00:00:00',
     3,
     '-'
   ),
@@ -2451,6 +2694,7 @@ values
     25.38,
     73,
     '2021-05-16 00:00:00',
+    '2021-05-16 00:00:00',
     4,
     '-'
   ),
@@ -2461,6 +2705,7 @@ values
     57.79,
     92,
     '2020-08-28 00:00:00',
+    '2020-08-28 00:00:00',
     4,
     '-'
   ),
@@ -2471,6 +2716,7 @@ values
     62.55,
     71,
     '2021-04-19 00:00:00',
+    '2021-04-19 00:00:00',
     6,
     '-'
   ),
@@ -2481,6 +2727,7 @@ values
     88.31,
     65,
     '2021-02-08 00:00:00',
+    '2021-02-08 00:00:00',
     4,
     '-'
   ),
@@ -2491,6 +2738,7 @@ values
     43.48,
     97,
     '2020-11-12 00:00:00',
+    '2020-11-12 00:00:00',
     3,
     '-'
   ),
@@ -2501,6 +2749,7 @@ values
     54.28,
     78,
     '2021-02-11 00:00:00',
+    '2021-02-11 00:00:00',
     6,
     '-'
   ),
@@ -2511,6 +2760,7 @@ values
     52.91,
     54,
     '2021-02-17 00:00:00',
+    '2021-02-17 00:00:00',
     4,
     '-'
   ),
@@ -2521,6 +2771,7 @@ values
     48.84,
     7,
     '2020-10-22 00:00:00',
+    '2020-10-22 00:00:00',
     3,
     '-'
   ),
@@ -2531,6 +2782,7 @@ values
     18.35,
     5,
     '2021-04-01 00:00:00',
+    '2021-04-01 00:00:00',
     6,
     '-'
   ),
@@ -2541,6 +2793,7 @@ values
     92.34,
     85,
     '2020-06-10 00:00:00',
+    '2020-06-10 00:00:00',
     3,
     '-'
   ),
@@ -2551,6 +2804,7 @@ values
     10.60,
     0,
     '2021-02-08 00:00:00',
+    '2021-02-08 00:00:00',
     3,
     '-'
   ),
@@ -2561,6 +2815,7 @@ values
     10.05,
     87,
     '2021-01-22 00:00:00',
+    '2021-01-22 00:00:00',
     6,
     '-'
   ),
@@ -2571,6 +2826,7 @@ values
     83.75,
     93,
     '2020-12-29 00:00:00',
+    '2020-12-29 00:00:00',
     3,
     '-'
   ),
@@ -2581,6 +2837,7 @@ values
     53.73,
     44,
     '2020-10-09 00:00:00',
+    '2020-10-09 00:00:00',
     3,
     '-'
   ),
@@ -2591,6 +2848,7 @@ values
     96.43,
     84,
     '2021-01-14 00:00:00',
+    '2021-01-14 00:00:00',
     5,
     '-'
   ),
@@ -2601,6 +2859,7 @@ values
     26.42,
     2,
     '2021-02-17 00:00:00',
+    '2021-02-17 00:00:00',
     4,
     '-'
   ),
@@ -2611,6 +2870,7 @@ values
     60.34,
     15,
     '2021-04-09 00:00:00',
+    '2021-04-09 00:00:00',
     6,
     '-'
   ),
@@ -2621,6 +2881,7 @@ values
     17.75,
     88,
     '2021-05-25 00:00:00',
+    '2021-05-25 00:00:00',
     4,
     '-'
   ),
@@ -2631,6 +2892,7 @@ values
     44.88,
     48,
     '2020-07-07 00:00:00',
+    '2020-07-07 00:00:00',
     4,
     '-'
   ),
@@ -2641,6 +2903,7 @@ values
     67.60,
     99,
     '2020-07-16 00:00:00',
+    '2020-07-16 00:00:00',
     5,
     '-'
   ),
@@ -2651,6 +2914,7 @@ values
     23.20,
     27,
     '2021-01-20 00:00:00',
+    '2021-01-20 00:00:00',
     5,
     '-'
   ),
@@ -2661,6 +2925,7 @@ values
     31.98,
     100,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     3,
     '-'
   ),
@@ -2671,6 +2936,7 @@ values
     80.89,
     86,
     '2021-03-03 00:00:00',
+    '2021-03-03 00:00:00',
     5,
     '-'
   ),
@@ -2681,6 +2947,7 @@ values
     37.42,
     5,
     '2021-05-21 00:00:00',
+    '2021-05-21 00:00:00',
     4,
     '-'
   ),
@@ -2691,6 +2958,7 @@ values
     22.84,
     26,
     '2020-12-21 00:00:00',
+    '2020-12-21 00:00:00',
     5,
     '-'
   ),
@@ -2701,6 +2969,7 @@ values
     57.02,
     86,
     '2021-04-16 00:00:00',
+    '2021-04-16 00:00:00',
     4,
     '-'
   ),
@@ -2711,6 +2980,7 @@ values
     75.55,
     59,
     '2020-08-07 00:00:00',
+    '2020-08-07 00:00:00',
     5,
     '-'
   ),
@@ -2721,6 +2991,7 @@ values
     40.14,
     56,
     '2020-12-07 00:00:00',
+    '2020-12-07 00:00:00',
     5,
     '-'
   ),
@@ -2731,6 +3002,7 @@ values
     13.36,
     84,
     '2021-05-01 00:00:00',
+    '2021-05-01 00:00:00',
     4,
     '-'
   ),
@@ -2741,6 +3013,7 @@ values
     45.15,
     81,
     '2020-11-29 00:00:00',
+    '2020-11-29 00:00:00',
     5,
     '-'
   ),
@@ -2751,6 +3024,7 @@ values
     47.77,
     92,
     '2021-03-29 00:00:00',
+    '2021-03-29 00:00:00',
     4,
     '-'
   ),
@@ -2761,6 +3035,7 @@ values
     49.72,
     80,
     '2020-10-10 00:00:00',
+    '2020-10-10 00:00:00',
     6,
     '-'
   ),
@@ -2771,6 +3046,7 @@ values
     80.59,
     50,
     '2021-05-23 00:00:00',
+    '2021-05-23 00:00:00',
     5,
     '-'
   ),
@@ -2781,6 +3057,7 @@ values
     63.84,
     93,
     '2021-05-15 00:00:00',
+    '2021-05-15 00:00:00',
     6,
     '-'
   ),
@@ -2791,6 +3068,7 @@ values
     87.59,
     70,
     '2020-12-29 00:00:00',
+    '2020-12-29 00:00:00',
     6,
     '-'
   ),
@@ -2801,6 +3079,7 @@ values
     59.28,
     16,
     '2020-08-03 00:00:00',
+    '2020-08-03 00:00:00',
     4,
     '-'
   ),
@@ -2811,6 +3090,7 @@ values
     69.37,
     87,
     '2020-06-28 00:00:00',
+    '2020-06-28 00:00:00',
     5,
     '-'
   ),
@@ -2821,6 +3101,7 @@ values
     99.19,
     24,
     '2021-05-08 00:00:00',
+    '2021-05-08 00:00:00',
     4,
     '-'
   ),
@@ -2831,6 +3112,7 @@ values
     24.32,
     34,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     3,
     '-'
   ),
@@ -2841,6 +3123,7 @@ values
     16.87,
     63,
     '2021-05-17 00:00:00',
+    '2021-05-17 00:00:00',
     5,
     '-'
   ),
@@ -2851,6 +3134,7 @@ values
     82.33,
     81,
     '2021-01-31 00:00:00',
+    '2021-01-31 00:00:00',
     3,
     '-'
   ),
@@ -2861,6 +3145,7 @@ values
     14.26,
     67,
     '2020-10-19 00:00:00',
+    '2020-10-19 00:00:00',
     4,
     '-'
   ),
@@ -2871,6 +3156,7 @@ values
     18.74,
     25,
     '2020-11-03 00:00:00',
+    '2020-11-03 00:00:00',
     4,
     '-'
   ),
@@ -2881,6 +3167,7 @@ values
     4.00,
     13,
     '2020-12-24 00:00:00',
+    '2020-12-24 00:00:00',
     5,
     '-'
   ),
@@ -2891,6 +3178,7 @@ values
     2.83,
     38,
     '2021-01-11 00:00:00',
+    '2021-01-11 00:00:00',
     5,
     '-'
   ),
@@ -2901,6 +3189,7 @@ values
     46.53,
     71,
     '2021-04-05 00:00:00',
+    '2021-04-05 00:00:00',
     4,
     '-'
   ),
@@ -2911,6 +3200,7 @@ values
     32.25,
     8,
     '2021-02-24 00:00:00',
+    '2021-02-24 00:00:00',
     5,
     '-'
   ),
@@ -2921,6 +3211,7 @@ values
     2.97,
     68,
     '2020-12-13 00:00:00',
+    '2020-12-13 00:00:00',
     6,
     '-'
   ),
@@ -2931,6 +3222,7 @@ values
     10.59,
     95,
     '2020-08-11 00:00:00',
+    '2020-08-11 00:00:00',
     5,
     '-'
   ),
@@ -2941,6 +3233,7 @@ values
     85.78,
     91,
     '2021-05-30 00:00:00',
+    '2021-05-30 00:00:00',
     3,
     '-'
   ),
@@ -2951,6 +3244,7 @@ values
     42.08,
     82,
     '2021-01-20 00:00:00',
+    '2021-01-20 00:00:00',
     6,
     '-'
   ),
@@ -2961,6 +3255,7 @@ values
     5.99,
     48,
     '2020-08-15 00:00:00',
+    '2020-08-15 00:00:00',
     3,
     '-'
   ),
@@ -2971,6 +3266,7 @@ values
     12.85,
     16,
     '2020-06-12 00:00:00',
+    '2020-06-12 00:00:00',
     6,
     '-'
   ),
@@ -2981,6 +3277,7 @@ values
     94.35,
     28,
     '2020-12-03 00:00:00',
+    '2020-12-03 00:00:00',
     3,
     '-'
   ),
@@ -2991,6 +3288,7 @@ values
     64.40,
     80,
     '2021-02-24 00:00:00',
+    '2021-02-24 00:00:00',
     5,
     '-'
   ),
@@ -3001,6 +3299,7 @@ values
     87.14,
     86,
     '2021-03-26 00:00:00',
+    '2021-03-26 00:00:00',
     4,
     '-'
   ),
@@ -3011,6 +3310,7 @@ values
     13.95,
     80,
     '2020-10-30 00:00:00',
+    '2020-10-30 00:00:00',
     5,
     '-'
   ),
@@ -3021,6 +3321,7 @@ values
     78.47,
     75,
     '2020-11-13 00:00:00',
+    '2020-11-13 00:00:00',
     6,
     '-'
   ),
@@ -3031,6 +3332,7 @@ values
     29.54,
     95,
     '2020-07-30 00:00:00',
+    '2020-07-30 00:00:00',
     4,
     '-'
   ),
@@ -3041,6 +3343,7 @@ values
     99.60,
     100,
     '2020-08-02 00:00:00',
+    '2020-08-02 00:00:00',
     3,
     '-'
   ),
@@ -3051,6 +3354,7 @@ values
     30.76,
     42,
     '2020-08-22 00:00:00',
+    '2020-08-22 00:00:00',
     5,
     '-'
   ),
@@ -3061,6 +3365,7 @@ values
     82.29,
     24,
     '2020-12-09 00:00:00',
+    '2020-12-09 00:00:00',
     5,
     '-'
   ),
@@ -3071,6 +3376,7 @@ values
     8.45,
     20,
     '2021-04-12 00:00:00',
+    '2021-04-12 00:00:00',
     5,
     '-'
   ),
@@ -3081,6 +3387,7 @@ values
     67.43,
     65,
     '2020-07-17 00:00:00',
+    '2020-07-17 00:00:00',
     4,
     '-'
   ),
@@ -3091,6 +3398,7 @@ values
     40.96,
     5,
     '2020-11-04 00:00:00',
+    '2020-11-04 00:00:00',
     5,
     '-'
   ),
@@ -3101,6 +3409,7 @@ values
     70.29,
     81,
     '2021-05-08 00:00:00',
+    '2021-05-08 00:00:00',
     4,
     '-'
   ),
@@ -3111,6 +3420,7 @@ values
     49.70,
     80,
     '2021-04-30 00:00:00',
+    '2021-04-30 00:00:00',
     4,
     '-'
   ),
@@ -3121,6 +3431,7 @@ values
     64.75,
     87,
     '2020-12-12 00:00:00',
+    '2020-12-12 00:00:00',
     5,
     '-'
   ),
@@ -3131,6 +3442,7 @@ values
     17.35,
     70,
     '2020-07-25 00:00:00',
+    '2020-07-25 00:00:00',
     6,
     '-'
   ),
@@ -3141,6 +3453,7 @@ values
     52.81,
     80,
     '2021-03-02 00:00:00',
+    '2021-03-02 00:00:00',
     5,
     '-'
   ),
@@ -3151,6 +3464,7 @@ values
     88.96,
     61,
     '2021-02-12 00:00:00',
+    '2021-02-12 00:00:00',
     3,
     '-'
   ),
@@ -3161,6 +3475,7 @@ values
     73.55,
     14,
     '2020-12-04 00:00:00',
+    '2020-12-04 00:00:00',
     3,
     '-'
   ),
@@ -3171,6 +3486,7 @@ values
     52.03,
     10,
     '2020-08-02 00:00:00',
+    '2020-08-02 00:00:00',
     3,
     '-'
   ),
@@ -3181,6 +3497,7 @@ values
     2.21,
     48,
     '2021-05-03 00:00:00',
+    '2021-05-03 00:00:00',
     6,
     '-'
   ),
@@ -3191,6 +3508,7 @@ values
     14.16,
     67,
     '2020-10-20 00:00:00',
+    '2020-10-20 00:00:00',
     3,
     '-'
   ),
@@ -3201,6 +3519,7 @@ values
     33.04,
     88,
     '2021-02-18 00:00:00',
+    '2021-02-18 00:00:00',
     3,
     '-'
   ),
@@ -3211,6 +3530,7 @@ values
     36.51,
     11,
     '2021-01-30 00:00:00',
+    '2021-01-30 00:00:00',
     6,
     '-'
   ),
@@ -3221,6 +3541,7 @@ values
     85.16,
     7,
     '2021-02-12 00:00:00',
+    '2021-02-12 00:00:00',
     3,
     '-'
   ),
@@ -3231,6 +3552,7 @@ values
     46.15,
     35,
     '2020-09-13 00:00:00',
+    '2020-09-13 00:00:00',
     5,
     '-'
   ),
@@ -3241,6 +3563,7 @@ values
     30.31,
     38,
     '2020-08-24 00:00:00',
+    '2020-08-24 00:00:00',
     5,
     '-'
   ),
@@ -3251,6 +3574,7 @@ values
     24.39,
     6,
     '2021-02-07 00:00:00',
+    '2021-02-07 00:00:00',
     4,
     '-'
   ),
@@ -3261,6 +3585,7 @@ values
     72.17,
     62,
     '2021-03-31 00:00:00',
+    '2021-03-31 00:00:00',
     6,
     '-'
   ),
@@ -3271,6 +3596,7 @@ values
     16.48,
     55,
     '2021-03-12 00:00:00',
+    '2021-03-12 00:00:00',
     3,
     '-'
   ),
@@ -3281,6 +3607,7 @@ values
     78.05,
     98,
     '2021-03-17 00:00:00',
+    '2021-03-17 00:00:00',
     5,
     '-'
   ),
@@ -3291,6 +3618,7 @@ values
     61.95,
     100,
     '2020-08-15 00:00:00',
+    '2020-08-15 00:00:00',
     6,
     '-'
   ),
@@ -3301,6 +3629,7 @@ values
     5.21,
     96,
     '2020-09-12 00:00:00',
+    '2020-09-12 00:00:00',
     4,
     '-'
   ),
@@ -3311,6 +3640,7 @@ values
     41.99,
     89,
     '2020-10-20 00:00:00',
+    '2020-10-20 00:00:00',
     6,
     '-'
   ),
@@ -3321,6 +3651,7 @@ values
     13.21,
     43,
     '2021-05-16 00:00:00',
+    '2021-05-16 00:00:00',
     6,
     '-'
   ),
@@ -3331,6 +3662,7 @@ values
     44.53,
     95,
     '2020-07-08 00:00:00',
+    '2020-07-08 00:00:00',
     6,
     '-'
   ),
@@ -3341,6 +3673,7 @@ values
     75.74,
     54,
     '2021-02-20 00:00:00',
+    '2021-02-20 00:00:00',
     3,
     '-'
   ),
@@ -3351,6 +3684,7 @@ values
     77.72,
     73,
     '2021-01-27 00:00:00',
+    '2021-01-27 00:00:00',
     4,
     '-'
   ),
@@ -3361,6 +3695,7 @@ values
     41.16,
     75,
     '2021-05-24 00:00:00',
+    '2021-05-24 00:00:00',
     5,
     '-'
   ),
@@ -3371,6 +3706,7 @@ values
     54.32,
     19,
     '2021-02-04 00:00:00',
+    '2021-02-04 00:00:00',
     3,
     '-'
   ),
@@ -3381,6 +3717,7 @@ values
     33.79,
     46,
     '2020-06-10 00:00:00',
+    '2020-06-10 00:00:00',
     6,
     '-'
   ),
@@ -3391,6 +3728,7 @@ values
     30.59,
     29,
     '2020-10-29 00:00:00',
+    '2020-10-29 00:00:00',
     5,
     '-'
   ),
@@ -3401,6 +3739,7 @@ values
     29.11,
     29,
     '2021-05-23 00:00:00',
+    '2021-05-23 00:00:00',
     4,
     '-'
   ),
@@ -3411,6 +3750,7 @@ values
     16.77,
     97,
     '2020-06-23 00:00:00',
+    '2020-06-23 00:00:00',
     6,
     '-'
   ),
@@ -3421,6 +3761,7 @@ values
     76.52,
     73,
     '2021-02-17 00:00:00',
+    '2021-02-17 00:00:00',
     4,
     '-'
   ),
@@ -3431,6 +3772,7 @@ values
     65.85,
     72,
     '2020-10-04 00:00:00',
+    '2020-10-04 00:00:00',
     4,
     '-'
   ),
@@ -3441,6 +3783,7 @@ values
     64.88,
     44,
     '2020-08-26 00:00:00',
+    '2020-08-26 00:00:00',
     3,
     '-'
   ),
@@ -3451,6 +3794,7 @@ values
     98.07,
     44,
     '2021-03-11 00:00:00',
+    '2021-03-11 00:00:00',
     4,
     '-'
   ),
@@ -3461,6 +3805,7 @@ values
     36.69,
     9,
     '2020-11-28 00:00:00',
+    '2020-11-28 00:00:00',
     4,
     '-'
   ),
@@ -3471,6 +3816,7 @@ values
     58.53,
     79,
     '2021-03-01 00:00:00',
+    '2021-03-01 00:00:00',
     6,
     '-'
   ),
@@ -3481,6 +3827,7 @@ values
     30.96,
     32,
     '2021-01-29 00:00:00',
+    '2021-01-29 00:00:00',
     6,
     '-'
   ),
@@ -3491,6 +3838,7 @@ values
     93.68,
     84,
     '2020-06-14 00:00:00',
+    '2020-06-14 00:00:00',
     5,
     '-'
   ),
@@ -3501,6 +3849,7 @@ values
     86.05,
     64,
     '2020-09-23 00:00:00',
+    '2020-09-23 00:00:00',
     3,
     '-'
   ),
@@ -3511,6 +3860,7 @@ values
     27.86,
     59,
     '2021-05-12 00:00:00',
+    '2021-05-12 00:00:00',
     4,
     '-'
   ),
@@ -3521,6 +3871,7 @@ values
     20.21,
     19,
     '2020-08-27 00:00:00',
+    '2020-08-27 00:00:00',
     5,
     '-'
   ),
@@ -3531,6 +3882,7 @@ values
     13.05,
     56,
     '2021-05-11 00:00:00',
+    '2021-05-11 00:00:00',
     5,
     '-'
   ),
@@ -3541,6 +3893,7 @@ values
     33.35,
     71,
     '2021-05-18 00:00:00',
+    '2021-05-18 00:00:00',
     3,
     '-'
   ),
@@ -3551,6 +3904,7 @@ values
     64.58,
     56,
     '2020-09-25 00:00:00',
+    '2020-09-25 00:00:00',
     5,
     '-'
   ),
@@ -3561,6 +3915,7 @@ values
     71.21,
     80,
     '2021-04-09 00:00:00',
+    '2021-04-09 00:00:00',
     4,
     '-'
   ),
@@ -3571,6 +3926,7 @@ values
     7.67,
     33,
     '2020-07-20 00:00:00',
+    '2020-07-20 00:00:00',
     6,
     '-'
   ),
@@ -3581,6 +3937,7 @@ values
     26.71,
     12,
     '2020-07-28 00:00:00',
+    '2020-07-28 00:00:00',
     5,
     '-'
   ),
@@ -3591,6 +3948,7 @@ values
     43.40,
     41,
     '2020-10-11 00:00:00',
+    '2020-10-11 00:00:00',
     5,
     '-'
   ),
@@ -3601,6 +3959,7 @@ values
     44.77,
     32,
     '2020-08-19 00:00:00',
+    '2020-08-19 00:00:00',
     4,
     '-'
   ),
@@ -3611,6 +3970,7 @@ values
     77.01,
     95,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     4,
     '-'
   ),
@@ -3621,6 +3981,7 @@ values
     6.97,
     84,
     '2020-08-05 00:00:00',
+    '2020-08-05 00:00:00',
     5,
     '-'
   ),
@@ -3631,6 +3992,7 @@ values
     28.66,
     89,
     '2020-11-30 00:00:00',
+    '2020-11-30 00:00:00',
     4,
     '-'
   ),
@@ -3641,6 +4003,7 @@ values
     84.58,
     93,
     '2020-11-20 00:00:00',
+    '2020-11-20 00:00:00',
     4,
     '-'
   ),
@@ -3651,6 +4014,7 @@ values
     98.70,
     92,
     '2020-08-10 00:00:00',
+    '2020-08-10 00:00:00',
     4,
     '-'
   ),
@@ -3661,6 +4025,7 @@ values
     19.74,
     28,
     '2021-06-03 00:00:00',
+    '2021-06-03 00:00:00',
     6,
     '-'
   ),
@@ -3671,6 +4036,7 @@ values
     32.55,
     68,
     '2021-04-02 00:00:00',
+    '2021-04-02 00:00:00',
     5,
     '-'
   ),
@@ -3681,6 +4047,7 @@ values
     95.08,
     76,
     '2020-10-24 00:00:00',
+    '2020-10-24 00:00:00',
     3,
     '-'
   ),
@@ -3691,6 +4058,7 @@ values
     41.65,
     31,
     '2021-03-17 00:00:00',
+    '2021-03-17 00:00:00',
     4,
     '-'
   ),
@@ -3701,6 +4069,7 @@ values
     3.45,
     36,
     '2020-09-08 00:00:00',
+    '2020-09-08 00:00:00',
     5,
     '-'
   ),
@@ -3711,6 +4080,7 @@ values
     75.90,
     17,
     '2020-12-27 00:00:00',
+    '2020-12-27 00:00:00',
     5,
     '-'
   ),
@@ -3721,6 +4091,7 @@ values
     15.91,
     65,
     '2020-07-21 00:00:00',
+    '2020-07-21 00:00:00',
     6,
     '-'
   ),
@@ -3731,6 +4102,7 @@ values
     45.93,
     61,
     '2020-12-06 00:00:00',
+    '2020-12-06 00:00:00',
     5,
     '-'
   ),
@@ -3741,6 +4113,7 @@ values
     52.14,
     21,
     '2021-02-18 00:00:00',
+    '2021-02-18 00:00:00',
     3,
     '-'
   ),
@@ -3751,6 +4124,7 @@ values
     20.55,
     67,
     '2021-04-18 00:00:00',
+    '2021-04-18 00:00:00',
     6,
     '-'
   ),
@@ -3761,6 +4135,7 @@ values
     58.67,
     39,
     '2020-10-20 00:00:00',
+    '2020-10-20 00:00:00',
     4,
     '-'
   ),
@@ -3771,6 +4146,7 @@ values
     42.45,
     43,
     '2020-11-02 00:00:00',
+    '2020-11-02 00:00:00',
     4,
     '-'
   ),
@@ -3781,6 +4157,7 @@ values
     38.85,
     15,
     '2020-10-31 00:00:00',
+    '2020-10-31 00:00:00',
     3,
     '-'
   ),
@@ -3791,6 +4168,7 @@ values
     76.68,
     63,
     '2020-09-21 00:00:00',
+    '2020-09-21 00:00:00',
     4,
     '-'
   ),
@@ -3801,6 +4179,7 @@ values
     52.70,
     87,
     '2020-08-17 00:00:00',
+    '2020-08-17 00:00:00',
     4,
     '-'
   ),
@@ -3811,6 +4190,7 @@ values
     1.92,
     69,
     '2021-04-02 00:00:00',
+    '2021-04-02 00:00:00',
     4,
     '-'
   ),
@@ -3821,6 +4201,7 @@ values
     8.55,
     76,
     '2020-08-03 00:00:00',
+    '2020-08-03 00:00:00',
     5,
     '-'
   ),
@@ -3831,6 +4212,7 @@ values
     31.41,
     45,
     '2020-09-04 00:00:00',
+    '2020-09-04 00:00:00',
     3,
     '-'
   ),
@@ -3841,6 +4223,7 @@ values
     54.18,
     13,
     '2020-07-09 00:00:00',
+    '2020-07-09 00:00:00',
     3,
     '-'
   ),
@@ -3851,6 +4234,7 @@ values
     76.57,
     85,
     '2021-04-17 00:00:00',
+    '2021-04-17 00:00:00',
     4,
     '-'
   ),
@@ -3861,6 +4245,7 @@ values
     11.16,
     30,
     '2020-10-26 00:00:00',
+    '2020-10-26 00:00:00',
     4,
     '-'
   ),
@@ -3871,6 +4256,7 @@ values
     68.55,
     65,
     '2020-11-14 00:00:00',
+    '2020-11-14 00:00:00',
     5,
     '-'
   ),
@@ -3881,6 +4267,7 @@ values
     50.50,
     100,
     '2021-03-27 00:00:00',
+    '2021-03-27 00:00:00',
     3,
     '-'
   ),
@@ -3891,6 +4278,7 @@ values
     20.37,
     97,
     '2020-08-19 00:00:00',
+    '2020-08-19 00:00:00',
     4,
     '-'
   ),
@@ -3901,6 +4289,7 @@ values
     11.69,
     75,
     '2021-02-04 00:00:00',
+    '2021-02-04 00:00:00',
     4,
     '-'
   ),
@@ -3911,6 +4300,7 @@ values
     70.65,
     11,
     '2020-12-27 00:00:00',
+    '2020-12-27 00:00:00',
     3,
     '-'
   ),
@@ -3921,6 +4311,7 @@ values
     17.12,
     36,
     '2020-12-24 00:00:00',
+    '2020-12-24 00:00:00',
     5,
     '-'
   ),
@@ -3931,6 +4322,7 @@ values
     9.47,
     59,
     '2021-01-21 00:00:00',
+    '2021-01-21 00:00:00',
     3,
     '-'
   ),
@@ -3941,6 +4333,7 @@ values
     72.76,
     8,
     '2021-05-06 00:00:00',
+    '2021-05-06 00:00:00',
     5,
     '-'
   ),
@@ -3951,6 +4344,7 @@ values
     85.17,
     51,
     '2021-04-10 00:00:00',
+    '2021-04-10 00:00:00',
     4,
     '-'
   ),
@@ -3961,6 +4355,7 @@ values
     32.16,
     11,
     '2020-11-08 00:00:00',
+    '2020-11-08 00:00:00',
     5,
     '-'
   ),
@@ -3971,6 +4366,7 @@ values
     68.07,
     19,
     '2020-08-08 00:00:00',
+    '2020-08-08 00:00:00',
     3,
     '-'
   ),
@@ -3981,6 +4377,7 @@ values
     36.67,
     24,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     6,
     '-'
   ),
@@ -3991,6 +4388,7 @@ values
     84.22,
     91,
     '2020-08-03 00:00:00',
+    '2020-08-03 00:00:00',
     3,
     '-'
   ),
@@ -4001,6 +4399,7 @@ values
     72.09,
     19,
     '2020-08-17 00:00:00',
+    '2020-08-17 00:00:00',
     5,
     '-'
   ),
@@ -4011,6 +4410,7 @@ values
     52.90,
     8,
     '2020-10-29 00:00:00',
+    '2020-10-29 00:00:00',
     4,
     '-'
   ),
@@ -4021,6 +4421,7 @@ values
     50.47,
     3,
     '2021-03-12 00:00:00',
+    '2021-03-12 00:00:00',
     3,
     '-'
   ),
@@ -4031,6 +4432,7 @@ values
     23.97,
     49,
     '2021-01-05 00:00:00',
+    '2021-01-05 00:00:00',
     5,
     '-'
   ),
@@ -4041,6 +4443,7 @@ values
     85.99,
     96,
     '2020-11-26 00:00:00',
+    '2020-11-26 00:00:00',
     4,
     '-'
   ),
@@ -4051,6 +4454,7 @@ values
     37.80,
     49,
     '2020-11-12 00:00:00',
+    '2020-11-12 00:00:00',
     4,
     '-'
   ),
@@ -4061,6 +4465,7 @@ values
     80.68,
     52,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     5,
     '-'
   ),
@@ -4071,6 +4476,7 @@ values
     26.62,
     14,
     '2021-04-16 00:00:00',
+    '2021-04-16 00:00:00',
     3,
     '-'
   ),
@@ -4081,6 +4487,7 @@ values
     20.69,
     46,
     '2021-04-09 00:00:00',
+    '2021-04-09 00:00:00',
     6,
     '-'
   ),
@@ -4091,6 +4498,7 @@ values
     47.08,
     11,
     '2020-11-07 00:00:00',
+    '2020-11-07 00:00:00',
     4,
     '-'
   ),
@@ -4101,6 +4509,7 @@ values
     21.07,
     14,
     '2021-04-10 00:00:00',
+    '2021-04-10 00:00:00',
     6,
     '-'
   ),
@@ -4111,6 +4520,7 @@ values
     60.39,
     59,
     '2020-09-25 00:00:00',
+    '2020-09-25 00:00:00',
     6,
     '-'
   ),
@@ -4121,6 +4531,7 @@ values
     98.40,
     58,
     '2020-11-18 00:00:00',
+    '2020-11-18 00:00:00',
     5,
     '-'
   ),
@@ -4131,6 +4542,7 @@ values
     53.53,
     91,
     '2020-11-21 00:00:00',
+    '2020-11-21 00:00:00',
     5,
     '-'
   ),
@@ -4141,6 +4553,7 @@ values
     39.73,
     44,
     '2021-03-23 00:00:00',
+    '2021-03-23 00:00:00',
     5,
     '-'
   ),
@@ -4151,6 +4564,7 @@ values
     57.26,
     35,
     '2021-01-23 00:00:00',
+    '2021-01-23 00:00:00',
     4,
     '-'
   ),
@@ -4161,6 +4575,7 @@ values
     95.30,
     68,
     '2020-12-15 00:00:00',
+    '2020-12-15 00:00:00',
     3,
     '-'
   ),
@@ -4171,6 +4586,7 @@ values
     81.11,
     48,
     '2021-05-16 00:00:00',
+    '2021-05-16 00:00:00',
     4,
     '-'
   ),
@@ -4181,6 +4597,7 @@ values
     24.05,
     62,
     '2020-08-07 00:00:00',
+    '2020-08-07 00:00:00',
     3,
     '-'
   ),
@@ -4191,6 +4608,7 @@ values
     27.91,
     95,
     '2021-04-25 00:00:00',
+    '2021-04-25 00:00:00',
     6,
     '-'
   ),
@@ -4201,6 +4619,7 @@ values
     28.83,
     92,
     '2020-12-31 00:00:00',
+    '2020-12-31 00:00:00',
     3,
     '-'
   ),
@@ -4211,6 +4630,7 @@ values
     74.76,
     96,
     '2020-12-04 00:00:00',
+    '2020-12-04 00:00:00',
     5,
     '-'
   ),
@@ -4221,6 +4641,7 @@ values
     4.22,
     42,
     '2021-02-15 00:00:00',
+    '2021-02-15 00:00:00',
     3,
     '-'
   ),
@@ -4231,6 +4652,7 @@ values
     81.91,
     12,
     '2020-10-23 00:00:00',
+    '2020-10-23 00:00:00',
     3,
     '-'
   ),
@@ -4241,6 +4663,7 @@ values
     7.39,
     34,
     '2020-09-13 00:00:00',
+    '2020-09-13 00:00:00',
     4,
     '-'
   ),
@@ -4251,6 +4674,7 @@ values
     55.25,
     83,
     '2020-07-31 00:00:00',
+    '2020-07-31 00:00:00',
     6,
     '-'
   ),
@@ -4261,6 +4685,7 @@ values
     91.43,
     95,
     '2021-01-26 00:00:00',
+    '2021-01-26 00:00:00',
     6,
     '-'
   ),
@@ -4271,6 +4696,7 @@ values
     24.65,
     65,
     '2021-01-02 00:00:00',
+    '2021-01-02 00:00:00',
     6,
     '-'
   ),
@@ -4281,6 +4707,7 @@ values
     68.49,
     30,
     '2021-04-14 00:00:00',
+    '2021-04-14 00:00:00',
     6,
     '-'
   ),
@@ -4291,6 +4718,7 @@ values
     41.85,
     30,
     '2021-01-11 00:00:00',
+    '2021-01-11 00:00:00',
     6,
     '-'
   ),
@@ -4301,6 +4729,7 @@ values
     22.56,
     65,
     '2021-05-14 00:00:00',
+    '2021-05-14 00:00:00',
     5,
     '-'
   ),
@@ -4311,6 +4740,7 @@ values
     91.52,
     79,
     '2020-12-09 00:00:00',
+    '2020-12-09 00:00:00',
     5,
     '-'
   ),
@@ -4321,6 +4751,7 @@ values
     75.55,
     30,
     '2021-05-11 00:00:00',
+    '2021-05-11 00:00:00',
     5,
     '-'
   ),
@@ -4331,6 +4762,7 @@ values
     36.17,
     73,
     '2020-09-08 00:00:00',
+    '2020-09-08 00:00:00',
     5,
     '-'
   ),
@@ -4341,6 +4773,7 @@ values
     81.10,
     48,
     '2021-04-24 00:00:00',
+    '2021-04-24 00:00:00',
     6,
     '-'
   ),
@@ -4351,6 +4784,7 @@ values
     78.54,
     9,
     '2020-12-18 00:00:00',
+    '2020-12-18 00:00:00',
     5,
     '-'
   ),
@@ -4361,6 +4795,7 @@ values
     82.59,
     76,
     '2021-02-02 00:00:00',
+    '2021-02-02 00:00:00',
     6,
     '-'
   ),
@@ -4371,6 +4806,7 @@ values
     33.55,
     86,
     '2020-10-16 00:00:00',
+    '2020-10-16 00:00:00',
     4,
     '-'
   ),
@@ -4381,6 +4817,7 @@ values
     38.94,
     77,
     '2021-04-27 00:00:00',
+    '2021-04-27 00:00:00',
     4,
     '-'
   ),
@@ -4391,6 +4828,7 @@ values
     50.05,
     11,
     '2021-01-22 00:00:00',
+    '2021-01-22 00:00:00',
     5,
     '-'
   ),
@@ -4401,6 +4839,7 @@ values
     65.45,
     30,
     '2020-12-04 00:00:00',
+    '2020-12-04 00:00:00',
     4,
     '-'
   ),
@@ -4411,6 +4850,7 @@ values
     33.57,
     93,
     '2020-09-06 00:00:00',
+    '2020-09-06 00:00:00',
     5,
     '-'
   ),
@@ -4421,6 +4861,7 @@ values
     88.40,
     29,
     '2021-05-20 00:00:00',
+    '2021-05-20 00:00:00',
     4,
     '-'
   ),
@@ -4431,6 +4872,7 @@ values
     58.80,
     99,
     '2020-10-19 00:00:00',
+    '2020-10-19 00:00:00',
     3,
     '-'
   ),
@@ -4441,6 +4883,7 @@ values
     15.47,
     51,
     '2021-01-27 00:00:00',
+    '2021-01-27 00:00:00',
     3,
     '-'
   ),
@@ -4451,6 +4894,7 @@ values
     39.69,
     35,
     '2020-10-03 00:00:00',
+    '2020-10-03 00:00:00',
     6,
     '-'
   ),
@@ -4461,6 +4905,7 @@ values
     17.95,
     19,
     '2020-11-17 00:00:00',
+    '2020-11-17 00:00:00',
     3,
     '-'
   ),
@@ -4471,6 +4916,7 @@ values
     69.96,
     83,
     '2021-01-24 00:00:00',
+    '2021-01-24 00:00:00',
     5,
     '-'
   ),
@@ -4481,6 +4927,7 @@ values
     8.73,
     8,
     '2020-07-28 00:00:00',
+    '2020-07-28 00:00:00',
     6,
     '-'
   ),
@@ -4491,6 +4938,7 @@ values
     32.29,
     16,
     '2021-01-21 00:00:00',
+    '2021-01-21 00:00:00',
     5,
     '-'
   ),
@@ -4501,6 +4949,7 @@ values
     48.58,
     76,
     '2021-01-27 00:00:00',
+    '2021-01-27 00:00:00',
     5,
     '-'
   ),
@@ -4511,6 +4960,7 @@ values
     84.19,
     65,
     '2021-04-04 00:00:00',
+    '2021-04-04 00:00:00',
     4,
     '-'
   ),
@@ -4521,6 +4971,7 @@ values
     81.03,
     90,
     '2020-09-09 00:00:00',
+    '2020-09-09 00:00:00',
     4,
     '-'
   ),
@@ -4531,6 +4982,7 @@ values
     73.11,
     71,
     '2021-02-15 00:00:00',
+    '2021-02-15 00:00:00',
     6,
     '-'
   ),
@@ -4541,6 +4993,7 @@ values
     30.55,
     11,
     '2020-10-09 00:00:00',
+    '2020-10-09 00:00:00',
     4,
     '-'
   ),
@@ -4551,6 +5004,7 @@ values
     93.75,
     23,
     '2020-10-31 00:00:00',
+    '2020-10-31 00:00:00',
     4,
     '-'
   ),
@@ -4561,6 +5015,7 @@ values
     14.14,
     29,
     '2021-06-05 00:00:00',
+    '2021-06-05 00:00:00',
     6,
     '-'
   ),
@@ -4571,6 +5026,7 @@ values
     56.18,
     92,
     '2021-03-26 00:00:00',
+    '2021-03-26 00:00:00',
     3,
     '-'
   ),
@@ -4581,6 +5037,7 @@ values
     87.44,
     25,
     '2020-08-01 00:00:00',
+    '2020-08-01 00:00:00',
     6,
     '-'
   ),
@@ -4591,6 +5048,7 @@ values
     96.03,
     34,
     '2021-01-30 00:00:00',
+    '2021-01-30 00:00:00',
     5,
     '-'
   ),
@@ -4601,6 +5059,7 @@ values
     93.87,
     87,
     '2021-04-08 00:00:00',
+    '2021-04-08 00:00:00',
     4,
     '-'
   ),
@@ -4611,6 +5070,7 @@ values
     5.80,
     5,
     '2020-09-24 00:00:00',
+    '2020-09-24 00:00:00',
     4,
     '-'
   ),
@@ -4621,6 +5081,7 @@ values
     35.38,
     32,
     '2020-09-29 00:00:00',
+    '2020-09-29 00:00:00',
     3,
     '-'
   ),
@@ -4631,6 +5092,7 @@ values
     8.77,
     35,
     '2020-07-03 00:00:00',
+    '2020-07-03 00:00:00',
     4,
     '-'
   ),
@@ -4641,6 +5103,7 @@ values
     74.58,
     100,
     '2020-12-08 00:00:00',
+    '2020-12-08 00:00:00',
     4,
     '-'
   ),
@@ -4651,6 +5114,7 @@ values
     91.78,
     85,
     '2020-06-19 00:00:00',
+    '2020-06-19 00:00:00',
     5,
     '-'
   ),
@@ -4661,6 +5125,7 @@ values
     11.88,
     55,
     '2020-08-20 00:00:00',
+    '2020-08-20 00:00:00',
     4,
     '-'
   ),
@@ -4671,6 +5136,7 @@ values
     88.85,
     93,
     '2021-05-27 00:00:00',
+    '2021-05-27 00:00:00',
     3,
     '-'
   ),
@@ -4681,6 +5147,7 @@ values
     77.72,
     82,
     '2020-08-17 00:00:00',
+    '2020-08-17 00:00:00',
     3,
     '-'
   ),
@@ -4691,6 +5158,7 @@ values
     85.88,
     22,
     '2020-10-21 00:00:00',
+    '2020-10-21 00:00:00',
     5,
     '-'
   ),
@@ -4701,6 +5169,7 @@ values
     94.29,
     51,
     '2020-12-04 00:00:00',
+    '2020-12-04 00:00:00',
     4,
     '-'
   ),
@@ -4711,6 +5180,7 @@ values
     1.13,
     8,
     '2021-02-25 00:00:00',
+    '2021-02-25 00:00:00',
     3,
     '-'
   ),
@@ -4721,6 +5191,7 @@ values
     96.62,
     34,
     '2020-07-19 00:00:00',
+    '2020-07-19 00:00:00',
     6,
     '-'
   ),
@@ -4731,6 +5202,7 @@ values
     83.52,
     51,
     '2021-01-17 00:00:00',
+    '2021-01-17 00:00:00',
     4,
     '-'
   ),
@@ -4741,6 +5213,7 @@ values
     23.04,
     81,
     '2020-07-13 00:00:00',
+    '2020-07-13 00:00:00',
     5,
     '-'
   ),
@@ -4751,6 +5224,7 @@ values
     78.97,
     70,
     '2020-06-16 00:00:00',
+    '2020-06-16 00:00:00',
     6,
     '-'
   ),
@@ -4761,6 +5235,7 @@ values
     27.92,
     79,
     '2020-11-05 00:00:00',
+    '2020-11-05 00:00:00',
     4,
     '-'
   ),
@@ -4771,6 +5246,7 @@ values
     95.20,
     61,
     '2021-01-13 00:00:00',
+    '2021-01-13 00:00:00',
     6,
     '-'
   ),
@@ -4781,6 +5257,7 @@ values
     34.41,
     16,
     '2020-12-14 00:00:00',
+    '2020-12-14 00:00:00',
     3,
     '-'
   ),
@@ -4791,6 +5268,7 @@ values
     52.89,
     80,
     '2020-08-05 00:00:00',
+    '2020-08-05 00:00:00',
     3,
     '-'
   ),
@@ -4801,6 +5279,7 @@ values
     28.28,
     35,
     '2021-04-26 00:00:00',
+    '2021-04-26 00:00:00',
     5,
     '-'
   ),
@@ -4811,6 +5290,7 @@ values
     50.07,
     25,
     '2021-02-09 00:00:00',
+    '2021-02-09 00:00:00',
     5,
     '-'
   ),
@@ -4821,6 +5301,7 @@ values
     45.11,
     41,
     '2020-08-11 00:00:00',
+    '2020-08-11 00:00:00',
     6,
     '-'
   ),
@@ -4831,6 +5312,7 @@ values
     21.42,
     93,
     '2021-05-01 00:00:00',
+    '2021-05-01 00:00:00',
     4,
     '-'
   ),
@@ -4841,6 +5323,7 @@ values
     37.30,
     87,
     '2021-04-08 00:00:00',
+    '2021-04-08 00:00:00',
     6,
     '-'
   ),
@@ -4851,6 +5334,7 @@ values
     1.59,
     42,
     '2020-06-24 00:00:00',
+    '2020-06-24 00:00:00',
     4,
     '-'
   ),
@@ -4861,6 +5345,7 @@ values
     92.54,
     75,
     '2021-01-05 00:00:00',
+    '2021-01-05 00:00:00',
     4,
     '-'
   ),
@@ -4871,6 +5356,7 @@ values
     32.67,
     17,
     '2020-09-27 00:00:00',
+    '2020-09-27 00:00:00',
     4,
     '-'
   ),
@@ -4881,6 +5367,7 @@ values
     57.24,
     21,
     '2021-03-14 00:00:00',
+    '2021-03-14 00:00:00',
     5,
     '-'
   ),
@@ -4891,6 +5378,7 @@ values
     31.03,
     75,
     '2020-12-06 00:00:00',
+    '2020-12-06 00:00:00',
     6,
     '-'
   ),
@@ -4901,6 +5389,7 @@ values
     83.12,
     20,
     '2020-07-09 00:00:00',
+    '2020-07-09 00:00:00',
     4,
     '-'
   ),
@@ -4911,6 +5400,7 @@ values
     50.37,
     18,
     '2020-08-03 00:00:00',
+    '2020-08-03 00:00:00',
     4,
     '-'
   ),
@@ -4921,6 +5411,7 @@ values
     39.47,
     64,
     '2020-12-23 00:00:00',
+    '2020-12-23 00:00:00',
     6,
     '-'
   ),
@@ -4931,6 +5422,7 @@ values
     84.54,
     43,
     '2020-11-04 00:00:00',
+    '2020-11-04 00:00:00',
     5,
     '-'
   ),
@@ -4941,6 +5433,7 @@ values
     29.71,
     13,
     '2021-02-04 00:00:00',
+    '2021-02-04 00:00:00',
     4,
     '-'
   ),
@@ -4951,6 +5444,7 @@ values
     10.79,
     86,
     '2021-05-11 00:00:00',
+    '2021-05-11 00:00:00',
     3,
     '-'
   ),
@@ -4961,6 +5455,7 @@ values
     23.61,
     39,
     '2020-09-12 00:00:00',
+    '2020-09-12 00:00:00',
     5,
     '-'
   ),
@@ -4971,6 +5466,7 @@ values
     7.39,
     82,
     '2021-03-12 00:00:00',
+    '2021-03-12 00:00:00',
     4,
     '-'
   ),
@@ -4981,6 +5477,7 @@ values
     40.96,
     59,
     '2020-09-30 00:00:00',
+    '2020-09-30 00:00:00',
     3,
     '-'
   ),
@@ -4991,6 +5488,7 @@ values
     13.53,
     97,
     '2021-02-22 00:00:00',
+    '2021-02-22 00:00:00',
     5,
     '-'
   ),
@@ -5001,6 +5499,7 @@ values
     2.19,
     3,
     '2020-08-27 00:00:00',
+    '2020-08-27 00:00:00',
     6,
     '-'
   ),
@@ -5011,6 +5510,7 @@ values
     31.52,
     77,
     '2020-09-20 00:00:00',
+    '2020-09-20 00:00:00',
     6,
     '-'
   ),
@@ -5021,6 +5521,7 @@ values
     37.41,
     75,
     '2020-10-22 00:00:00',
+    '2020-10-22 00:00:00',
     5,
     '-'
   ),
@@ -5031,6 +5532,7 @@ values
     93.42,
     51,
     '2021-06-07 00:00:00',
+    '2021-06-07 00:00:00',
     6,
     '-'
   ),
@@ -5041,6 +5543,7 @@ values
     66.30,
     29,
     '2020-07-25 00:00:00',
+    '2020-07-25 00:00:00',
     3,
     '-'
   ),
@@ -5051,6 +5554,7 @@ values
     26.06,
     15,
     '2020-11-08 00:00:00',
+    '2020-11-08 00:00:00',
     5,
     '-'
   ),
@@ -5061,6 +5565,7 @@ values
     60.11,
     46,
     '2020-09-27 00:00:00',
+    '2020-09-27 00:00:00',
     4,
     '-'
   ),
@@ -5071,6 +5576,7 @@ values
     12.44,
     67,
     '2020-07-25 00:00:00',
+    '2020-07-25 00:00:00',
     3,
     '-'
   ),
@@ -5081,6 +5587,7 @@ values
     71.19,
     52,
     '2021-05-26 00:00:00',
+    '2021-05-26 00:00:00',
     6,
     '-'
   ),
@@ -5091,6 +5598,7 @@ values
     89.05,
     58,
     '2021-03-25 00:00:00',
+    '2021-03-25 00:00:00',
     3,
     '-'
   ),
@@ -5101,6 +5609,7 @@ values
     72.89,
     40,
     '2021-02-28 00:00:00',
+    '2021-02-28 00:00:00',
     6,
     '-'
   ),
@@ -5111,6 +5620,7 @@ values
     1.44,
     80,
     '2021-04-09 00:00:00',
+    '2021-04-09 00:00:00',
     5,
     '-'
   ),
@@ -5121,6 +5631,7 @@ values
     14.96,
     77,
     '2021-04-04 00:00:00',
+    '2021-04-04 00:00:00',
     3,
     '-'
   ),
@@ -5131,6 +5642,7 @@ values
     54.87,
     44,
     '2021-02-10 00:00:00',
+    '2021-02-10 00:00:00',
     4,
     '-'
   ),
@@ -5141,6 +5653,7 @@ values
     88.21,
     100,
     '2021-04-25 00:00:00',
+    '2021-04-25 00:00:00',
     4,
     '-'
   ),
@@ -5151,6 +5664,7 @@ values
     5.78,
     30,
     '2021-03-04 00:00:00',
+    '2021-03-04 00:00:00',
     6,
     '-'
   ),
@@ -5161,6 +5675,7 @@ values
     54.45,
     65,
     '2020-10-04 00:00:00',
+    '2020-10-04 00:00:00',
     4,
     '-'
   ),
@@ -5171,6 +5686,7 @@ values
     95.18,
     44,
     '2020-12-24 00:00:00',
+    '2020-12-24 00:00:00',
     3,
     '-'
   ),
@@ -5181,6 +5697,7 @@ values
     48.75,
     64,
     '2020-08-27 00:00:00',
+    '2020-08-27 00:00:00',
     3,
     '-'
   ),
@@ -5191,6 +5708,7 @@ values
     93.85,
     21,
     '2021-03-28 00:00:00',
+    '2021-03-28 00:00:00',
     4,
     '-'
   ),
@@ -5201,6 +5719,7 @@ values
     4.75,
     43,
     '2021-04-23 00:00:00',
+    '2021-04-23 00:00:00',
     4,
     '-'
   ),
@@ -5211,6 +5730,7 @@ values
     68.34,
     87,
     '2021-04-21 00:00:00',
+    '2021-04-21 00:00:00',
     6,
     '-'
   ),
@@ -5221,6 +5741,7 @@ values
     92.58,
     47,
     '2021-03-15 00:00:00',
+    '2021-03-15 00:00:00',
     6,
     '-'
   ),
@@ -5231,6 +5752,7 @@ values
     14.00,
     1,
     '2021-05-13 00:00:00',
+    '2021-05-13 00:00:00',
     5,
     '-'
   ),
@@ -5241,6 +5763,7 @@ values
     66.15,
     38,
     '2020-09-15 00:00:00',
+    '2020-09-15 00:00:00',
     4,
     '-'
   ),
@@ -5251,6 +5774,7 @@ values
     57.35,
     37,
     '2020-11-19 00:00:00',
+    '2020-11-19 00:00:00',
     6,
     '-'
   ),
@@ -5261,6 +5785,7 @@ values
     57.76,
     82,
     '2021-01-29 00:00:00',
+    '2021-01-29 00:00:00',
     6,
     '-'
   ),
@@ -5271,6 +5796,7 @@ values
     90.39,
     64,
     '2020-07-10 00:00:00',
+    '2020-07-10 00:00:00',
     6,
     '-'
   ),
@@ -5281,6 +5807,7 @@ values
     57.03,
     54,
     '2020-10-04 00:00:00',
+    '2020-10-04 00:00:00',
     5,
     '-'
   ),
@@ -5291,6 +5818,7 @@ values
     32.99,
     89,
     '2021-02-07 00:00:00',
+    '2021-02-07 00:00:00',
     6,
     '-'
   ),
@@ -5301,6 +5829,7 @@ values
     79.68,
     71,
     '2021-03-27 00:00:00',
+    '2021-03-27 00:00:00',
     6,
     '-'
   ),
@@ -5311,6 +5840,7 @@ values
     17.39,
     29,
     '2020-07-01 00:00:00',
+    '2020-07-01 00:00:00',
     6,
     '-'
   ),
@@ -5321,6 +5851,7 @@ values
     89.73,
     57,
     '2020-12-11 00:00:00',
+    '2020-12-11 00:00:00',
     4,
     '-'
   ),
@@ -5331,6 +5862,7 @@ values
     57.33,
     6,
     '2021-05-04 00:00:00',
+    '2021-05-04 00:00:00',
     3,
     '-'
   ),
@@ -5341,6 +5873,7 @@ values
     8.17,
     88,
     '2020-08-25 00:00:00',
+    '2020-08-25 00:00:00',
     3,
     '-'
   ),
@@ -5351,6 +5884,7 @@ values
     50.50,
     69,
     '2020-12-26 00:00:00',
+    '2020-12-26 00:00:00',
     3,
     '-'
   ),
@@ -5361,6 +5895,7 @@ values
     90.41,
     61,
     '2020-11-10 00:00:00',
+    '2020-11-10 00:00:00',
     5,
     '-'
   ),
@@ -5371,6 +5906,7 @@ values
     2.94,
     82,
     '2021-02-04 00:00:00',
+    '2021-02-04 00:00:00',
     6,
     '-'
   ),
@@ -5381,6 +5917,7 @@ values
     66.22,
     90,
     '2020-11-09 00:00:00',
+    '2020-11-09 00:00:00',
     6,
     '-'
   ),
@@ -5391,6 +5928,7 @@ values
     32.21,
     65,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     3,
     '-'
   ),
@@ -5401,6 +5939,7 @@ values
     90.55,
     70,
     '2020-06-24 00:00:00',
+    '2020-06-24 00:00:00',
     6,
     '-'
   ),
@@ -5411,6 +5950,7 @@ values
     4.85,
     97,
     '2020-08-02 00:00:00',
+    '2020-08-02 00:00:00',
     3,
     '-'
   ),
@@ -5421,6 +5961,7 @@ values
     67.10,
     41,
     '2021-04-05 00:00:00',
+    '2021-04-05 00:00:00',
     6,
     '-'
   ),
@@ -5431,6 +5972,7 @@ values
     16.48,
     11,
     '2020-09-09 00:00:00',
+    '2020-09-09 00:00:00',
     3,
     '-'
   ),
@@ -5441,6 +5983,7 @@ values
     2.73,
     15,
     '2021-01-15 00:00:00',
+    '2021-01-15 00:00:00',
     4,
     '-'
   ),
@@ -5451,6 +5994,7 @@ values
     57.42,
     97,
     '2021-04-09 00:00:00',
+    '2021-04-09 00:00:00',
     6,
     '-'
   ),
@@ -5461,6 +6005,7 @@ values
     23.54,
     77,
     '2020-12-25 00:00:00',
+    '2020-12-25 00:00:00',
     6,
     '-'
   ),
@@ -5471,6 +6016,7 @@ values
     79.79,
     51,
     '2020-11-02 00:00:00',
+    '2020-11-02 00:00:00',
     3,
     '-'
   ),
@@ -5481,6 +6027,7 @@ values
     27.00,
     52,
     '2020-10-21 00:00:00',
+    '2020-10-21 00:00:00',
     3,
     '-'
   ),
@@ -5491,6 +6038,7 @@ values
     47.61,
     23,
     '2020-12-19 00:00:00',
+    '2020-12-19 00:00:00',
     6,
     '-'
   ),
@@ -5501,6 +6049,7 @@ values
     74.60,
     84,
     '2021-01-14 00:00:00',
+    '2021-01-14 00:00:00',
     5,
     '-'
   ),
@@ -5511,6 +6060,7 @@ values
     68.15,
     1,
     '2021-04-13 00:00:00',
+    '2021-04-13 00:00:00',
     3,
     '-'
   ),
@@ -5521,6 +6071,7 @@ values
     2.24,
     94,
     '2020-09-04 00:00:00',
+    '2020-09-04 00:00:00',
     6,
     '-'
   ),
@@ -5531,6 +6082,7 @@ values
     84.18,
     45,
     '2020-10-01 00:00:00',
+    '2020-10-01 00:00:00',
     5,
     '-'
   ),
@@ -5541,6 +6093,7 @@ values
     99.35,
     69,
     '2021-01-13 00:00:00',
+    '2021-01-13 00:00:00',
     3,
     '-'
   ),
@@ -5551,6 +6104,7 @@ values
     27.60,
     71,
     '2021-02-14 00:00:00',
+    '2021-02-14 00:00:00',
     5,
     '-'
   ),
@@ -5561,6 +6115,7 @@ values
     11.50,
     2,
     '2021-06-02 00:00:00',
+    '2021-06-02 00:00:00',
     4,
     '-'
   ),
@@ -5571,6 +6126,7 @@ values
     66.46,
     37,
     '2021-01-24 00:00:00',
+    '2021-01-24 00:00:00',
     6,
     '-'
   ),
@@ -5581,6 +6137,7 @@ values
     74.35,
     81,
     '2021-03-21 00:00:00',
+    '2021-03-21 00:00:00',
     3,
     '-'
   ),
@@ -5591,6 +6148,7 @@ values
     12.34,
     48,
     '2021-06-02 00:00:00',
+    '2021-06-02 00:00:00',
     5,
     '-'
   ),
@@ -5601,6 +6159,7 @@ values
     73.13,
     32,
     '2021-05-07 00:00:00',
+    '2021-05-07 00:00:00',
     6,
     '-'
   ),
@@ -5611,6 +6170,7 @@ values
     91.36,
     13,
     '2020-11-17 00:00:00',
+    '2020-11-17 00:00:00',
     4,
     '-'
   ),
@@ -5621,6 +6181,7 @@ values
     77.66,
     75,
     '2020-07-28 00:00:00',
+    '2020-07-28 00:00:00',
     4,
     '-'
   ),
@@ -5631,6 +6192,7 @@ values
     62.42,
     82,
     '2020-09-22 00:00:00',
+    '2020-09-22 00:00:00',
     5,
     '-'
   ),
@@ -5641,6 +6203,7 @@ values
     97.10,
     97,
     '2020-11-03 00:00:00',
+    '2020-11-03 00:00:00',
     4,
     '-'
   ),
@@ -5651,6 +6214,7 @@ values
     2.22,
     15,
     '2020-08-01 00:00:00',
+    '2020-08-01 00:00:00',
     6,
     '-'
   ),
@@ -5661,6 +6225,7 @@ values
     45.75,
     85,
     '2020-09-28 00:00:00',
+    '2020-09-28 00:00:00',
     5,
     '-'
   ),
@@ -5671,6 +6236,7 @@ values
     56.91,
     58,
     '2020-12-01 00:00:00',
+    '2020-12-01 00:00:00',
     3,
     '-'
   ),
@@ -5681,6 +6247,7 @@ values
     11.53,
     77,
     '2021-04-04 00:00:00',
+    '2021-04-04 00:00:00',
     5,
     '-'
   ),
@@ -5691,6 +6258,7 @@ values
     52.08,
     44,
     '2020-07-02 00:00:00',
+    '2020-07-02 00:00:00',
     6,
     '-'
   ),
@@ -5701,6 +6269,7 @@ values
     14.24,
     50,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     5,
     '-'
   ),
@@ -5711,6 +6280,7 @@ values
     60.21,
     78,
     '2021-02-22 00:00:00',
+    '2021-02-22 00:00:00',
     3,
     '-'
   ),
@@ -5721,6 +6291,7 @@ values
     48.55,
     24,
     '2021-04-15 00:00:00',
+    '2021-04-15 00:00:00',
     6,
     '-'
   ),
@@ -5731,6 +6302,7 @@ values
     1.13,
     44,
     '2021-01-19 00:00:00',
+    '2021-01-19 00:00:00',
     3,
     '-'
   ),
@@ -5741,6 +6313,7 @@ values
     34.66,
     27,
     '2020-12-06 00:00:00',
+    '2020-12-06 00:00:00',
     6,
     '-'
   ),
@@ -5751,6 +6324,7 @@ values
     36.30,
     32,
     '2020-06-12 00:00:00',
+    '2020-06-12 00:00:00',
     5,
     '-'
   ),
@@ -5761,6 +6335,7 @@ values
     5.11,
     41,
     '2021-03-28 00:00:00',
+    '2021-03-28 00:00:00',
     4,
     '-'
   ),
@@ -5771,6 +6346,7 @@ values
     24.68,
     64,
     '2021-04-24 00:00:00',
+    '2021-04-24 00:00:00',
     3,
     '-'
   ),
@@ -5781,6 +6357,7 @@ values
     10.38,
     89,
     '2020-07-05 00:00:00',
+    '2020-07-05 00:00:00',
     4,
     '-'
   ),
@@ -5791,6 +6368,7 @@ values
     24.59,
     48,
     '2020-12-10 00:00:00',
+    '2020-12-10 00:00:00',
     5,
     '-'
   ),
@@ -5801,6 +6379,7 @@ values
     98.21,
     66,
     '2020-10-11 00:00:00',
+    '2020-10-11 00:00:00',
     4,
     '-'
   ),
@@ -5811,6 +6390,7 @@ values
     79.61,
     74,
     '2020-09-16 00:00:00',
+    '2020-09-16 00:00:00',
     5,
     '-'
   ),
@@ -5821,6 +6401,7 @@ values
     23.37,
     62,
     '2021-03-02 00:00:00',
+    '2021-03-02 00:00:00',
     3,
     '-'
   ),
@@ -5831,6 +6412,7 @@ values
     12.88,
     40,
     '2020-10-05 00:00:00',
+    '2020-10-05 00:00:00',
     4,
     '-'
   ),
@@ -5841,6 +6423,7 @@ values
     99.96,
     49,
     '2021-03-18 00:00:00',
+    '2021-03-18 00:00:00',
     4,
     '-'
   ),
@@ -5851,6 +6434,7 @@ values
     92.67,
     7,
     '2021-03-20 00:00:00',
+    '2021-03-20 00:00:00',
     5,
     '-'
   ),
@@ -5861,6 +6445,7 @@ values
     52.70,
     69,
     '2020-08-17 00:00:00',
+    '2020-08-17 00:00:00',
     6,
     '-'
   ),
@@ -5871,6 +6456,7 @@ values
     97.09,
     82,
     '2020-09-17 00:00:00',
+    '2020-09-17 00:00:00',
     4,
     '-'
   ),
@@ -5881,6 +6467,7 @@ values
     80.76,
     76,
     '2021-02-01 00:00:00',
+    '2021-02-01 00:00:00',
     4,
     '-'
   ),
@@ -5891,6 +6478,7 @@ values
     68.90,
     8,
     '2021-03-12 00:00:00',
+    '2021-03-12 00:00:00',
     3,
     '-'
   ),
@@ -5901,6 +6489,7 @@ values
     52.21,
     63,
     '2020-07-31 00:00:00',
+    '2020-07-31 00:00:00',
     6,
     '-'
   ),
@@ -5911,6 +6500,7 @@ values
     32.03,
     89,
     '2021-04-15 00:00:00',
+    '2021-04-15 00:00:00',
     5,
     '-'
   ),
@@ -5921,6 +6511,7 @@ values
     6.97,
     5,
     '2021-01-12 00:00:00',
+    '2021-01-12 00:00:00',
     3,
     '-'
   ),
@@ -5931,6 +6522,7 @@ values
     42.90,
     44,
     '2021-03-09 00:00:00',
+    '2021-03-09 00:00:00',
     6,
     '-'
   ),
@@ -5941,6 +6533,7 @@ values
     41.48,
     56,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     5,
     '-'
   ),
@@ -5951,6 +6544,7 @@ values
     2.38,
     74,
     '2020-10-14 00:00:00',
+    '2020-10-14 00:00:00',
     4,
     '-'
   ),
@@ -5961,6 +6555,7 @@ values
     17.39,
     52,
     '2021-05-24 00:00:00',
+    '2021-05-24 00:00:00',
     6,
     '-'
   ),
@@ -5971,6 +6566,7 @@ values
     1.06,
     86,
     '2020-07-15 00:00:00',
+    '2020-07-15 00:00:00',
     6,
     '-'
   ),
@@ -5981,6 +6577,7 @@ values
     60.24,
     100,
     '2020-08-11 00:00:00',
+    '2020-08-11 00:00:00',
     6,
     '-'
   ),
@@ -5991,6 +6588,7 @@ values
     10.56,
     49,
     '2021-03-02 00:00:00',
+    '2021-03-02 00:00:00',
     5,
     '-'
   ),
@@ -6001,6 +6599,7 @@ values
     9.79,
     35,
     '2020-09-23 00:00:00',
+    '2020-09-23 00:00:00',
     4,
     '-'
   ),
@@ -6011,6 +6610,7 @@ values
     84.04,
     27,
     '2020-09-04 00:00:00',
+    '2020-09-04 00:00:00',
     4,
     '-'
   ),
@@ -6021,6 +6621,7 @@ values
     50.84,
     96,
     '2020-11-30 00:00:00',
+    '2020-11-30 00:00:00',
     3,
     '-'
   ),
@@ -6031,6 +6632,7 @@ values
     11.87,
     17,
     '2021-04-27 00:00:00',
+    '2021-04-27 00:00:00',
     3,
     '-'
   ),
@@ -6041,6 +6643,7 @@ values
     54.25,
     84,
     '2021-01-09 00:00:00',
+    '2021-01-09 00:00:00',
     4,
     '-'
   ),
@@ -6051,6 +6654,7 @@ values
     33.22,
     48,
     '2020-12-12 00:00:00',
+    '2020-12-12 00:00:00',
     4,
     '-'
   ),
@@ -6061,6 +6665,7 @@ values
     91.63,
     13,
     '2020-06-18 00:00:00',
+    '2020-06-18 00:00:00',
     6,
     '-'
   ),
@@ -6071,6 +6676,7 @@ values
     72.46,
     49,
     '2020-08-25 00:00:00',
+    '2020-08-25 00:00:00',
     6,
     '-'
   ),
@@ -6081,6 +6687,7 @@ values
     74.35,
     2,
     '2021-04-13 00:00:00',
+    '2021-04-13 00:00:00',
     4,
     '-'
   ),
@@ -6091,6 +6698,7 @@ values
     14.17,
     55,
     '2020-06-10 00:00:00',
+    '2020-06-10 00:00:00',
     4,
     '-'
   ),
@@ -6101,6 +6709,7 @@ values
     63.09,
     30,
     '2020-10-25 00:00:00',
+    '2020-10-25 00:00:00',
     4,
     '-'
   ),
@@ -6111,6 +6720,7 @@ values
     88.73,
     35,
     '2021-04-12 00:00:00',
+    '2021-04-12 00:00:00',
     6,
     '-'
   ),
@@ -6121,6 +6731,7 @@ values
     78.11,
     81,
     '2020-11-13 00:00:00',
+    '2020-11-13 00:00:00',
     3,
     '-'
   ),
@@ -6131,6 +6742,7 @@ values
     95.62,
     10,
     '2021-02-15 00:00:00',
+    '2021-02-15 00:00:00',
     5,
     '-'
   ),
@@ -6141,6 +6753,7 @@ values
     86.89,
     7,
     '2020-10-04 00:00:00',
+    '2020-10-04 00:00:00',
     6,
     '-'
   ),
@@ -6151,6 +6764,7 @@ values
     37.16,
     33,
     '2020-07-26 00:00:00',
+    '2020-07-26 00:00:00',
     5,
     '-'
   ),
@@ -6161,6 +6775,7 @@ values
     25.19,
     57,
     '2021-05-03 00:00:00',
+    '2021-05-03 00:00:00',
     6,
     '-'
   ),
@@ -6171,6 +6786,7 @@ values
     93.60,
     94,
     '2021-04-02 00:00:00',
+    '2021-04-02 00:00:00',
     4,
     '-'
   ),
@@ -6181,6 +6797,7 @@ values
     93.16,
     79,
     '2020-12-05 00:00:00',
+    '2020-12-05 00:00:00',
     6,
     '-'
   ),
@@ -6191,6 +6808,7 @@ values
     67.08,
     76,
     '2021-06-04 00:00:00',
+    '2021-06-04 00:00:00',
     3,
     '-'
   ),
@@ -6201,6 +6819,7 @@ values
     73.73,
     36,
     '2020-11-27 00:00:00',
+    '2020-11-27 00:00:00',
     4,
     '-'
   ),
@@ -6211,6 +6830,7 @@ values
     16.29,
     33,
     '2020-09-02 00:00:00',
+    '2020-09-02 00:00:00',
     5,
     '-'
   ),
@@ -6221,6 +6841,7 @@ values
     7.67,
     95,
     '2021-06-08 00:00:00',
+    '2021-06-08 00:00:00',
     4,
     '-'
   ),
@@ -6231,6 +6852,7 @@ values
     65.31,
     77,
     '2021-05-31 00:00:00',
+    '2021-05-31 00:00:00',
     6,
     '-'
   ),
@@ -6241,6 +6863,7 @@ values
     71.12,
     14,
     '2020-07-12 00:00:00',
+    '2020-07-12 00:00:00',
     3,
     '-'
   ),
@@ -6251,6 +6874,7 @@ values
     82.68,
     68,
     '2021-01-19 00:00:00',
+    '2021-01-19 00:00:00',
     5,
     '-'
   ),
@@ -6261,6 +6885,7 @@ values
     52.77,
     48,
     '2021-01-20 00:00:00',
+    '2021-01-20 00:00:00',
     4,
     '-'
   ),
@@ -6271,6 +6896,7 @@ values
     50.07,
     30,
     '2021-04-23 00:00:00',
+    '2021-04-23 00:00:00',
     3,
     '-'
   ),
@@ -6281,6 +6907,7 @@ values
     90.20,
     52,
     '2020-11-17 00:00:00',
+    '2020-11-17 00:00:00',
     5,
     '-'
   ),
@@ -6291,6 +6918,7 @@ values
     55.71,
     38,
     '2020-07-04 00:00:00',
+    '2020-07-04 00:00:00',
     4,
     '-'
   ),
@@ -6301,6 +6929,7 @@ values
     78.66,
     35,
     '2020-09-30 00:00:00',
+    '2020-09-30 00:00:00',
     4,
     '-'
   ),
@@ -6311,6 +6940,7 @@ values
     25.05,
     66,
     '2020-06-21 00:00:00',
+    '2020-06-21 00:00:00',
     3,
     '-'
   ),
@@ -6321,6 +6951,7 @@ values
     81.59,
     13,
     '2021-02-13 00:00:00',
+    '2021-02-13 00:00:00',
     4,
     '-'
   ),
@@ -6331,6 +6962,7 @@ values
     82.33,
     89,
     '2020-09-14 00:00:00',
+    '2020-09-14 00:00:00',
     5,
     '-'
   ),
@@ -6341,6 +6973,7 @@ values
     16.52,
     92,
     '2020-06-14 00:00:00',
+    '2020-06-14 00:00:00',
     3,
     '-'
   ),
@@ -6351,6 +6984,7 @@ values
     95.50,
     12,
     '2021-01-07 00:00:00',
+    '2021-01-07 00:00:00',
     4,
     '-'
   ),
@@ -6361,6 +6995,7 @@ values
     99.09,
     30,
     '2021-02-06 00:00:00',
+    '2021-02-06 00:00:00',
     5,
     '-'
   ),
@@ -6371,6 +7006,7 @@ values
     90.02,
     54,
     '2021-05-22 00:00:00',
+    '2021-05-22 00:00:00',
     3,
     '-'
   ),
@@ -6381,6 +7017,7 @@ values
     28.12,
     42,
     '2021-01-12 00:00:00',
+    '2021-01-12 00:00:00',
     5,
     '-'
   ),
@@ -6391,6 +7028,7 @@ values
     10.05,
     85,
     '2021-04-15 00:00:00',
+    '2021-04-15 00:00:00',
     6,
     '-'
   ),
@@ -6401,6 +7039,7 @@ values
     89.15,
     74,
     '2021-05-31 00:00:00',
+    '2021-05-31 00:00:00',
     4,
     '-'
   ),
@@ -6411,6 +7050,7 @@ values
     82.66,
     91,
     '2021-03-05 00:00:00',
+    '2021-03-05 00:00:00',
     6,
     '-'
   ),
@@ -6421,6 +7061,7 @@ values
     25.38,
     43,
     '2020-10-03 00:00:00',
+    '2020-10-03 00:00:00',
     5,
     '-'
   ),
@@ -6431,6 +7072,7 @@ values
     95.08,
     31,
     '2020-09-13 00:00:00',
+    '2020-09-13 00:00:00',
     3,
     '-'
   ),
@@ -6441,6 +7083,7 @@ values
     90.60,
     55,
     '2020-06-27 00:00:00',
+    '2020-06-27 00:00:00',
     3,
     '-'
   ),
@@ -6451,6 +7094,7 @@ values
     4.77,
     76,
     '2020-12-19 00:00:00',
+    '2020-12-19 00:00:00',
     6,
     '-'
   ),
@@ -6461,6 +7105,7 @@ values
     94.19,
     21,
     '2021-04-02 00:00:00',
+    '2021-04-02 00:00:00',
     5,
     '-'
   ),
@@ -6471,6 +7116,7 @@ values
     80.48,
     64,
     '2020-07-06 00:00:00',
+    '2020-07-06 00:00:00',
     5,
     '-'
   ),
@@ -6481,6 +7127,7 @@ values
     53.14,
     42,
     '2020-10-31 00:00:00',
+    '2020-10-31 00:00:00',
     6,
     '-'
   ),
@@ -6491,6 +7138,7 @@ values
     23.01,
     78,
     '2020-06-13 00:00:00',
+    '2020-06-13 00:00:00',
     5,
     '-'
   ),
@@ -6501,6 +7149,7 @@ values
     79.07,
     82,
     '2020-07-16 00:00:00',
+    '2020-07-16 00:00:00',
     5,
     '-'
   ),
@@ -6511,6 +7160,7 @@ values
     93.25,
     69,
     '2021-02-08 00:00:00',
+    '2021-02-08 00:00:00',
     4,
     '-'
   ),
@@ -6521,6 +7171,7 @@ values
     40.35,
     89,
     '2021-01-11 00:00:00',
+    '2021-01-11 00:00:00',
     6,
     '-'
   ),
@@ -6531,6 +7182,7 @@ values
     85.45,
     82,
     '2021-02-12 00:00:00',
+    '2021-02-12 00:00:00',
     4,
     '-'
   ),
@@ -6541,6 +7193,7 @@ values
     59.74,
     98,
     '2020-09-07 00:00:00',
+    '2020-09-07 00:00:00',
     6,
     '-'
   ),
@@ -6551,6 +7204,7 @@ values
     28.12,
     21,
     '2021-02-16 00:00:00',
+    '2021-02-16 00:00:00',
     5,
     '-'
   ),
@@ -6561,6 +7215,7 @@ values
     2.23,
     93,
     '2021-05-01 00:00:00',
+    '2021-05-01 00:00:00',
     5,
     '-'
   ),
@@ -6571,6 +7226,7 @@ values
     94.42,
     14,
     '2020-08-07 00:00:00',
+    '2020-08-07 00:00:00',
     4,
     '-'
   ),
@@ -6581,6 +7237,7 @@ values
     5.62,
     14,
     '2020-11-06 00:00:00',
+    '2020-11-06 00:00:00',
     4,
     '-'
   ),
@@ -6591,6 +7248,7 @@ values
     25.91,
     95,
     '2020-11-25 00:00:00',
+    '2020-11-25 00:00:00',
     3,
     '-'
   ),
@@ -6601,6 +7259,7 @@ values
     91.01,
     21,
     '2020-10-09 00:00:00',
+    '2020-10-09 00:00:00',
     4,
     '-'
   ),
@@ -6611,6 +7270,7 @@ values
     52.05,
     76,
     '2020-09-06 00:00:00',
+    '2020-09-06 00:00:00',
     4,
     '-'
   ),
@@ -6621,6 +7281,7 @@ values
     96.34,
     57,
     '2020-06-19 00:00:00',
+    '2020-06-19 00:00:00',
     4,
     '-'
   ),
@@ -6631,6 +7292,7 @@ values
     16.36,
     31,
     '2020-09-19 00:00:00',
+    '2020-09-19 00:00:00',
     4,
     '-'
   ),
@@ -6641,6 +7303,7 @@ values
     88.79,
     83,
     '2020-08-01 00:00:00',
+    '2020-08-01 00:00:00',
     3,
     '-'
   ),
@@ -6651,6 +7314,7 @@ values
     58.76,
     97,
     '2020-08-25 00:00:00',
+    '2020-08-25 00:00:00',
     5,
     '-'
   ),
@@ -6661,6 +7325,7 @@ values
     41.73,
     8,
     '2020-09-12 00:00:00',
+    '2020-09-12 00:00:00',
     5,
     '-'
   ),
@@ -6671,6 +7336,7 @@ values
     6.72,
     23,
     '2020-06-18 00:00:00',
+    '2020-06-18 00:00:00',
     3,
     '-'
   ),
@@ -6681,6 +7347,7 @@ values
     21.93,
     74,
     '2020-07-09 00:00:00',
+    '2020-07-09 00:00:00',
     5,
     '-'
   ),
@@ -6691,6 +7358,7 @@ values
     52.74,
     53,
     '2021-06-08 00:00:00',
+    '2021-06-08 00:00:00',
     6,
     '-'
   ),
@@ -6701,6 +7369,7 @@ values
     40.86,
     44,
     '2021-05-27 00:00:00',
+    '2021-05-27 00:00:00',
     3,
     '-'
   ),
@@ -6711,6 +7380,7 @@ values
     25.64,
     41,
     '2020-07-12 00:00:00',
+    '2020-07-12 00:00:00',
     6,
     '-'
   ),
@@ -6721,6 +7391,7 @@ values
     87.40,
     56,
     '2021-05-19 00:00:00',
+    '2021-05-19 00:00:00',
     3,
     '-'
   ),
@@ -6731,6 +7402,7 @@ values
     31.81,
     79,
     '2020-08-03 00:00:00',
+    '2020-08-03 00:00:00',
     5,
     '-'
   ),
@@ -6741,6 +7413,7 @@ values
     25.10,
     31,
     '2021-05-23 00:00:00',
+    '2021-05-23 00:00:00',
     3,
     '-'
   ),
@@ -6751,6 +7424,7 @@ values
     91.06,
     42,
     '2020-12-13 00:00:00',
+    '2020-12-13 00:00:00',
     6,
     '-'
   ),
@@ -6761,6 +7435,7 @@ values
     79.45,
     60,
     '2021-02-09 00:00:00',
+    '2021-02-09 00:00:00',
     6,
     '-'
   ),
@@ -6771,6 +7446,7 @@ values
     38.98,
     18,
     '2020-10-01 00:00:00',
+    '2020-10-01 00:00:00',
     4,
     '-'
   ),
@@ -6781,6 +7457,7 @@ values
     78.16,
     5,
     '2021-05-04 00:00:00',
+    '2021-05-04 00:00:00',
     6,
     '-'
   ),
@@ -6791,6 +7468,7 @@ values
     13.80,
     5,
     '2021-04-09 00:00:00',
+    '2021-04-09 00:00:00',
     6,
     '-'
   ),
@@ -6801,6 +7479,7 @@ values
     75.50,
     24,
     '2020-12-08 00:00:00',
+    '2020-12-08 00:00:00',
     6,
     '-'
   ),
@@ -6811,6 +7490,7 @@ values
     74.54,
     58,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     6,
     '-'
   ),
@@ -6821,6 +7501,7 @@ values
     59.18,
     88,
     '2021-04-28 00:00:00',
+    '2021-04-28 00:00:00',
     5,
     '-'
   ),
@@ -6831,6 +7512,7 @@ values
     24.33,
     13,
     '2021-06-06 00:00:00',
+    '2021-06-06 00:00:00',
     3,
     '-'
   ),
@@ -6841,6 +7523,7 @@ values
     37.22,
     97,
     '2021-05-29 00:00:00',
+    '2021-05-29 00:00:00',
     6,
     '-'
   ),
@@ -6851,6 +7534,7 @@ values
     52.08,
     13,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     5,
     '-'
   ),
@@ -6861,6 +7545,7 @@ values
     14.83,
     68,
     '2021-05-04 00:00:00',
+    '2021-05-04 00:00:00',
     6,
     '-'
   ),
@@ -6871,6 +7556,7 @@ values
     5.57,
     77,
     '2021-01-19 00:00:00',
+    '2021-01-19 00:00:00',
     5,
     '-'
   ),
@@ -6881,6 +7567,7 @@ values
     11.77,
     32,
     '2021-06-06 00:00:00',
+    '2021-06-06 00:00:00',
     6,
     '-'
   ),
@@ -6891,6 +7578,7 @@ values
     72.23,
     82,
     '2020-12-07 00:00:00',
+    '2020-12-07 00:00:00',
     6,
     '-'
   ),
@@ -6901,6 +7589,7 @@ values
     97.73,
     0,
     '2021-04-12 00:00:00',
+    '2021-04-12 00:00:00',
     4,
     '-'
   ),
@@ -6911,6 +7600,7 @@ values
     73.84,
     49,
     '2020-08-17 00:00:00',
+    '2020-08-17 00:00:00',
     3,
     '-'
   ),
@@ -6921,6 +7611,7 @@ values
     47.02,
     23,
     '2020-11-28 00:00:00',
+    '2020-11-28 00:00:00',
     4,
     '-'
   ),
@@ -6931,6 +7622,7 @@ values
     25.05,
     52,
     '2020-06-11 00:00:00',
+    '2020-06-11 00:00:00',
     3,
     '-'
   ),
@@ -6941,6 +7633,7 @@ values
     9.78,
     93,
     '2021-03-28 00:00:00',
+    '2021-03-28 00:00:00',
     3,
     '-'
   ),
@@ -6951,6 +7644,7 @@ values
     53.85,
     11,
     '2021-05-23 00:00:00',
+    '2021-05-23 00:00:00',
     6,
     '-'
   ),
@@ -6961,6 +7655,7 @@ values
     77.76,
     52,
     '2020-07-28 00:00:00',
+    '2020-07-28 00:00:00',
     5,
     '-'
   ),
@@ -6971,6 +7666,7 @@ values
     92.17,
     67,
     '2021-01-03 00:00:00',
+    '2021-01-03 00:00:00',
     3,
     '-'
   ),
@@ -6981,6 +7677,7 @@ values
     45.95,
     47,
     '2020-10-24 00:00:00',
+    '2020-10-24 00:00:00',
     4,
     '-'
   ),
@@ -6991,6 +7688,7 @@ values
     48.85,
     46,
     '2020-07-07 00:00:00',
+    '2020-07-07 00:00:00',
     3,
     '-'
   ),
@@ -7001,6 +7699,7 @@ values
     58.48,
     75,
     '2020-11-02 00:00:00',
+    '2020-11-02 00:00:00',
     5,
     '-'
   ),
@@ -7011,6 +7710,7 @@ values
     50.49,
     14,
     '2020-07-15 00:00:00',
+    '2020-07-15 00:00:00',
     6,
     '-'
   ),
@@ -7021,6 +7721,7 @@ values
     4.09,
     98,
     '2020-07-20 00:00:00',
+    '2020-07-20 00:00:00',
     5,
     '-'
   ),
@@ -7031,6 +7732,7 @@ values
     4.66,
     44,
     '2020-11-18 00:00:00',
+    '2020-11-18 00:00:00',
     4,
     '-'
   ),
@@ -7041,6 +7743,7 @@ values
     61.72,
     36,
     '2020-09-10 00:00:00',
+    '2020-09-10 00:00:00',
     5,
     '-'
   ),
@@ -7051,6 +7754,7 @@ values
     75.52,
     94,
     '2020-11-26 00:00:00',
+    '2020-11-26 00:00:00',
     3,
     '-'
   ),
@@ -7061,6 +7765,7 @@ values
     47.85,
     76,
     '2020-12-17 00:00:00',
+    '2020-12-17 00:00:00',
     3,
     '-'
   ),
@@ -7071,6 +7776,7 @@ values
     53.02,
     4,
     '2020-09-14 00:00:00',
+    '2020-09-14 00:00:00',
     5,
     '-'
   ),
@@ -7081,6 +7787,7 @@ values
     28.68,
     41,
     '2020-08-26 00:00:00',
+    '2020-08-26 00:00:00',
     4,
     '-'
   ),
@@ -7091,6 +7798,7 @@ values
     23.02,
     44,
     '2020-11-26 00:00:00',
+    '2020-11-26 00:00:00',
     3,
     '-'
   ),
@@ -7101,6 +7809,7 @@ values
     5.20,
     58,
     '2020-09-15 00:00:00',
+    '2020-09-15 00:00:00',
     6,
     '-'
   ),
@@ -7111,6 +7820,7 @@ values
     23.11,
     28,
     '2020-11-02 00:00:00',
+    '2020-11-02 00:00:00',
     6,
     '-'
   ),
@@ -7121,6 +7831,7 @@ values
     73.52,
     35,
     '2020-07-18 00:00:00',
+    '2020-07-18 00:00:00',
     4,
     '-'
   ),
@@ -7131,6 +7842,7 @@ values
     66.85,
     68,
     '2020-09-04 00:00:00',
+    '2020-09-04 00:00:00',
     6,
     '-'
   ),
@@ -7141,6 +7853,7 @@ values
     22.25,
     89,
     '2020-07-08 00:00:00',
+    '2020-07-08 00:00:00',
     5,
     '-'
   ),
@@ -7151,6 +7864,7 @@ values
     15.33,
     75,
     '2020-07-17 00:00:00',
+    '2020-07-17 00:00:00',
     6,
     '-'
   ),
@@ -7161,6 +7875,7 @@ values
     32.07,
     72,
     '2021-01-26 00:00:00',
+    '2021-01-26 00:00:00',
     3,
     '-'
   ),
@@ -7171,6 +7886,7 @@ values
     68.72,
     7,
     '2020-11-05 00:00:00',
+    '2020-11-05 00:00:00',
     5,
     '-'
   ),
@@ -7181,6 +7897,7 @@ values
     41.39,
     17,
     '2021-04-13 00:00:00',
+    '2021-04-13 00:00:00',
     6,
     '-'
   ),
@@ -7191,6 +7908,7 @@ values
     98.67,
     4,
     '2020-07-29 00:00:00',
+    '2020-07-29 00:00:00',
     6,
     '-'
   ),
@@ -7201,6 +7919,7 @@ values
     35.30,
     12,
     '2020-12-27 00:00:00',
+    '2020-12-27 00:00:00',
     4,
     '-'
   ),
@@ -7211,6 +7930,7 @@ values
     2.04,
     49,
     '2020-12-14 00:00:00',
+    '2020-12-14 00:00:00',
     4,
     '-'
   ),
@@ -7221,6 +7941,7 @@ values
     58.32,
     4,
     '2020-08-26 00:00:00',
+    '2020-08-26 00:00:00',
     3,
     '-'
   ),
@@ -7231,6 +7952,7 @@ values
     81.86,
     91,
     '2021-02-22 00:00:00',
+    '2021-02-22 00:00:00',
     6,
     '-'
   ),
@@ -7241,6 +7963,7 @@ values
     19.45,
     44,
     '2021-03-26 00:00:00',
+    '2021-03-26 00:00:00',
     4,
     '-'
   ),
@@ -7251,6 +7974,7 @@ values
     30.36,
     17,
     '2021-04-06 00:00:00',
+    '2021-04-06 00:00:00',
     4,
     '-'
   ),
@@ -7261,6 +7985,7 @@ values
     55.42,
     76,
     '2020-10-27 00:00:00',
+    '2020-10-27 00:00:00',
     6,
     '-'
   ),
@@ -7271,6 +7996,7 @@ values
     38.96,
     21,
     '2020-09-10 00:00:00',
+    '2020-09-10 00:00:00',
     6,
     '-'
   ),
@@ -7281,6 +8007,7 @@ values
     22.05,
     85,
     '2021-03-25 00:00:00',
+    '2021-03-25 00:00:00',
     4,
     '-'
   ),
@@ -7291,6 +8018,7 @@ values
     3.75,
     52,
     '2020-10-04 00:00:00',
+    '2020-10-04 00:00:00',
     5,
     '-'
   ),
@@ -7301,6 +8029,7 @@ values
     30.41,
     4,
     '2021-01-18 00:00:00',
+    '2021-01-18 00:00:00',
     3,
     '-'
   ),
@@ -7311,6 +8040,7 @@ values
     3.74,
     48,
     '2020-12-19 00:00:00',
+    '2020-12-19 00:00:00',
     5,
     '-'
   ),
@@ -7321,6 +8051,7 @@ values
     62.54,
     39,
     '2021-02-25 00:00:00',
+    '2021-02-25 00:00:00',
     4,
     '-'
   ),
@@ -7331,6 +8062,7 @@ values
     10.00,
     83,
     '2020-12-30 00:00:00',
+    '2020-12-30 00:00:00',
     3,
     '-'
   ),
@@ -7341,6 +8073,7 @@ values
     39.85,
     82,
     '2020-08-09 00:00:00',
+    '2020-08-09 00:00:00',
     6,
     '-'
   ),
@@ -7351,6 +8084,7 @@ values
     20.81,
     38,
     '2020-09-15 00:00:00',
+    '2020-09-15 00:00:00',
     4,
     '-'
   ),
@@ -7361,6 +8095,7 @@ values
     87.59,
     82,
     '2021-03-25 00:00:00',
+    '2021-03-25 00:00:00',
     5,
     '-'
   ),
@@ -7371,6 +8106,7 @@ values
     92.72,
     44,
     '2020-08-23 00:00:00',
+    '2020-08-23 00:00:00',
     6,
     '-'
   ),
@@ -7381,6 +8117,7 @@ values
     10.87,
     93,
     '2020-11-11 00:00:00',
+    '2020-11-11 00:00:00',
     6,
     '-'
   ),
@@ -7391,6 +8128,7 @@ values
     91.27,
     73,
     '2021-03-02 00:00:00',
+    '2021-03-02 00:00:00',
     6,
     '-'
   ),
@@ -7401,6 +8139,7 @@ values
     81.19,
     46,
     '2021-01-15 00:00:00',
+    '2021-01-15 00:00:00',
     5,
     '-'
   ),
@@ -7411,6 +8150,7 @@ values
     51.96,
     46,
     '2020-07-09 00:00:00',
+    '2020-07-09 00:00:00',
     4,
     '-'
   ),
@@ -7421,6 +8161,7 @@ values
     74.90,
     6,
     '2021-01-19 00:00:00',
+    '2021-01-19 00:00:00',
     6,
     '-'
   ),
@@ -7431,6 +8172,7 @@ values
     6.59,
     8,
     '2021-04-25 00:00:00',
+    '2021-04-25 00:00:00',
     6,
     '-'
   ),
@@ -7441,6 +8183,7 @@ values
     4.21,
     0,
     '2020-10-24 00:00:00',
+    '2020-10-24 00:00:00',
     5,
     '-'
   ),
@@ -7451,6 +8194,7 @@ values
     41.27,
     46,
     '2020-07-05 00:00:00',
+    '2020-07-05 00:00:00',
     6,
     '-'
   ),
@@ -7461,6 +8205,7 @@ values
     97.63,
     63,
     '2020-10-21 00:00:00',
+    '2020-10-21 00:00:00',
     5,
     '-'
   ),
@@ -7471,6 +8216,7 @@ values
     98.74,
     75,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     4,
     '-'
   ),
@@ -7481,6 +8227,7 @@ values
     17.56,
     26,
     '2020-12-02 00:00:00',
+    '2020-12-02 00:00:00',
     6,
     '-'
   ),
@@ -7491,6 +8238,7 @@ values
     53.78,
     22,
     '2020-08-26 00:00:00',
+    '2020-08-26 00:00:00',
     6,
     '-'
   ),
@@ -7501,6 +8249,7 @@ values
     23.54,
     93,
     '2020-09-13 00:00:00',
+    '2020-09-13 00:00:00',
     6,
     '-'
   ),
@@ -7511,6 +8260,7 @@ values
     85.75,
     49,
     '2021-04-09 00:00:00',
+    '2021-04-09 00:00:00',
     5,
     '-'
   ),
@@ -7521,6 +8271,7 @@ values
     38.67,
     81,
     '2021-02-06 00:00:00',
+    '2021-02-06 00:00:00',
     3,
     '-'
   ),
@@ -7531,6 +8282,7 @@ values
     24.54,
     17,
     '2020-12-27 00:00:00',
+    '2020-12-27 00:00:00',
     3,
     '-'
   ),
@@ -7541,6 +8293,7 @@ values
     34.42,
     24,
     '2021-04-20 00:00:00',
+    '2021-04-20 00:00:00',
     4,
     '-'
   ),
@@ -7551,6 +8304,7 @@ values
     42.17,
     81,
     '2020-11-25 00:00:00',
+    '2020-11-25 00:00:00',
     4,
     '-'
   ),
@@ -7561,6 +8315,7 @@ values
     58.71,
     3,
     '2020-07-23 00:00:00',
+    '2020-07-23 00:00:00',
     5,
     '-'
   ),
@@ -7571,6 +8326,7 @@ values
     53.58,
     53,
     '2020-12-12 00:00:00',
+    '2020-12-12 00:00:00',
     5,
     '-'
   ),
@@ -7581,6 +8337,7 @@ values
     39.85,
     93,
     '2021-05-06 00:00:00',
+    '2021-05-06 00:00:00',
     3,
     '-'
   ),
@@ -7591,6 +8348,7 @@ values
     89.36,
     78,
     '2020-08-03 00:00:00',
+    '2020-08-03 00:00:00',
     6,
     '-'
   ),
@@ -7601,6 +8359,7 @@ values
     8.14,
     3,
     '2020-10-04 00:00:00',
+    '2020-10-04 00:00:00',
     5,
     '-'
   ),
@@ -7611,6 +8370,7 @@ values
     62.92,
     78,
     '2021-02-19 00:00:00',
+    '2021-02-19 00:00:00',
     4,
     '-'
   ),
@@ -7621,6 +8381,7 @@ values
     67.78,
     32,
     '2020-06-25 00:00:00',
+    '2020-06-25 00:00:00',
     5,
     '-'
   ),
@@ -7631,6 +8392,7 @@ values
     7.33,
     1,
     '2020-10-26 00:00:00',
+    '2020-10-26 00:00:00',
     6,
     '-'
   ),
@@ -7641,6 +8403,7 @@ values
     97.54,
     5,
     '2021-04-24 00:00:00',
+    '2021-04-24 00:00:00',
     3,
     '-'
   ),
@@ -7651,6 +8414,7 @@ values
     25.22,
     35,
     '2021-01-27 00:00:00',
+    '2021-01-27 00:00:00',
     4,
     '-'
   ),
@@ -7661,6 +8425,7 @@ values
     82.25,
     74,
     '2021-06-01 00:00:00',
+    '2021-06-01 00:00:00',
     6,
     '-'
   ),
@@ -7671,6 +8436,7 @@ values
     21.61,
     34,
     '2020-11-17 00:00:00',
+    '2020-11-17 00:00:00',
     3,
     '-'
   ),
@@ -7681,6 +8447,7 @@ values
     72.75,
     90,
     '2021-05-26 00:00:00',
+    '2021-05-26 00:00:00',
     4,
     '-'
   ),
@@ -7691,6 +8458,7 @@ values
     59.70,
     81,
     '2021-05-18 00:00:00',
+    '2021-05-18 00:00:00',
     4,
     '-'
   ),
@@ -7701,6 +8469,7 @@ values
     22.25,
     89,
     '2020-07-21 00:00:00',
+    '2020-07-21 00:00:00',
     5,
     '-'
   ),
@@ -7711,6 +8480,7 @@ values
     20.32,
     55,
     '2021-01-27 00:00:00',
+    '2021-01-27 00:00:00',
     5,
     '-'
   ),
@@ -7721,6 +8491,7 @@ values
     32.72,
     10,
     '2021-02-28 00:00:00',
+    '2021-02-28 00:00:00',
     4,
     '-'
   ),
@@ -7731,6 +8502,7 @@ values
     55.37,
     37,
     '2020-10-27 00:00:00',
+    '2020-10-27 00:00:00',
     3,
     '-'
   ),
@@ -7741,6 +8513,7 @@ values
     84.76,
     80,
     '2021-01-08 00:00:00',
+    '2021-01-08 00:00:00',
     5,
     '-'
   ),
@@ -7751,6 +8524,7 @@ values
     20.72,
     18,
     '2020-08-09 00:00:00',
+    '2020-08-09 00:00:00',
     4,
     '-'
   ),
@@ -7761,6 +8535,7 @@ values
     70.40,
     12,
     '2021-01-13 00:00:00',
+    '2021-01-13 00:00:00',
     3,
     '-'
   ),
@@ -7771,6 +8546,7 @@ values
     40.01,
     63,
     '2020-12-07 00:00:00',
+    '2020-12-07 00:00:00',
     6,
     '-'
   ),
@@ -7781,6 +8557,7 @@ values
     14.85,
     70,
     '2021-01-10 00:00:00',
+    '2021-01-10 00:00:00',
     4,
     '-'
   ),
@@ -7791,6 +8568,7 @@ values
     94.68,
     60,
     '2020-06-13 00:00:00',
+    '2020-06-13 00:00:00',
     4,
     '-'
   ),
@@ -7801,6 +8579,7 @@ values
     63.02,
     22,
     '2021-01-18 00:00:00',
+    '2021-01-18 00:00:00',
     4,
     '-'
   ),
@@ -7811,6 +8590,7 @@ values
     88.15,
     18,
     '2020-12-13 00:00:00',
+    '2020-12-13 00:00:00',
     3,
     '-'
   ),
@@ -7821,6 +8601,7 @@ values
     89.47,
     2,
     '2020-12-25 00:00:00',
+    '2020-12-25 00:00:00',
     6,
     '-'
   ),
@@ -7831,6 +8612,7 @@ values
     62.23,
     47,
     '2021-01-16 00:00:00',
+    '2021-01-16 00:00:00',
     6,
     '-'
   ),
@@ -7841,6 +8623,7 @@ values
     84.37,
     43,
     '2021-06-07 00:00:00',
+    '2021-06-07 00:00:00',
     5,
     '-'
   ),
@@ -7851,6 +8634,7 @@ values
     28.05,
     64,
     '2021-03-20 00:00:00',
+    '2021-03-20 00:00:00',
     4,
     '-'
   ),
@@ -7861,6 +8645,7 @@ values
     24.96,
     71,
     '2020-11-28 00:00:00',
+    '2020-11-28 00:00:00',
     5,
     '-'
   ),
@@ -7871,6 +8656,7 @@ values
     4.87,
     26,
     '2020-10-15 00:00:00',
+    '2020-10-15 00:00:00',
     5,
     '-'
   ),
@@ -7881,6 +8667,7 @@ values
     40.60,
     57,
     '2020-11-03 00:00:00',
+    '2020-11-03 00:00:00',
     4,
     '-'
   ),
@@ -7891,6 +8678,7 @@ values
     99.45,
     87,
     '2020-11-30 00:00:00',
+    '2020-11-30 00:00:00',
     5,
     '-'
   ),
@@ -7901,6 +8689,7 @@ values
     25.66,
     63,
     '2021-05-25 00:00:00',
+    '2021-05-25 00:00:00',
     6,
     '-'
   ),
@@ -7911,6 +8700,7 @@ values
     95.54,
     61,
     '2021-04-21 00:00:00',
+    '2021-04-21 00:00:00',
     4,
     '-'
   ),
@@ -7921,6 +8711,7 @@ values
     40.39,
     47,
     '2020-09-02 00:00:00',
+    '2020-09-02 00:00:00',
     6,
     '-'
   ),
@@ -7931,6 +8722,7 @@ values
     84.34,
     68,
     '2020-09-12 00:00:00',
+    '2020-09-12 00:00:00',
     3,
     '-'
   ),
@@ -7941,6 +8733,7 @@ values
     63.42,
     53,
     '2021-04-23 00:00:00',
+    '2021-04-23 00:00:00',
     6,
     '-'
   ),
@@ -7951,6 +8744,7 @@ values
     7.50,
     74,
     '2021-05-20 00:00:00',
+    '2021-05-20 00:00:00',
     6,
     '-'
   ),
@@ -7961,6 +8755,7 @@ values
     20.67,
     70,
     '2020-09-26 00:00:00',
+    '2020-09-26 00:00:00',
     6,
     '-'
   ),
@@ -7971,6 +8766,7 @@ values
     93.86,
     81,
     '2021-04-24 00:00:00',
+    '2021-04-24 00:00:00',
     3,
     '-'
   ),
@@ -7981,6 +8777,7 @@ values
     95.72,
     53,
     '2020-10-24 00:00:00',
+    '2020-10-24 00:00:00',
     5,
     '-'
   ),
@@ -7991,6 +8788,7 @@ values
     38.98,
     97,
     '2020-09-04 00:00:00',
+    '2020-09-04 00:00:00',
     6,
     '-'
   ),
@@ -8001,6 +8799,7 @@ values
     95.76,
     84,
     '2021-02-17 00:00:00',
+    '2021-02-17 00:00:00',
     3,
     '-'
   ),
@@ -8011,6 +8810,7 @@ values
     26.98,
     66,
     '2020-09-15 00:00:00',
+    '2020-09-15 00:00:00',
     3,
     '-'
   ),
@@ -8021,6 +8821,7 @@ values
     4.35,
     89,
     '2020-10-28 00:00:00',
+    '2020-10-28 00:00:00',
     3,
     '-'
   ),
@@ -8031,6 +8832,7 @@ values
     4.62,
     61,
     '2020-07-25 00:00:00',
+    '2020-07-25 00:00:00',
     4,
     '-'
   ),
@@ -8041,6 +8843,7 @@ values
     50.81,
     58,
     '2020-12-23 00:00:00',
+    '2020-12-23 00:00:00',
     6,
     '-'
   ),
@@ -8051,6 +8854,7 @@ values
     63.85,
     59,
     '2020-12-09 00:00:00',
+    '2020-12-09 00:00:00',
     4,
     '-'
   ),
@@ -8061,6 +8865,7 @@ values
     15.59,
     91,
     '2021-01-02 00:00:00',
+    '2021-01-02 00:00:00',
     6,
     '-'
   ),
@@ -8071,6 +8876,7 @@ values
     96.99,
     59,
     '2021-03-23 00:00:00',
+    '2021-03-23 00:00:00',
     3,
     '-'
   ),
@@ -8081,6 +8887,7 @@ values
     60.59,
     23,
     '2020-11-23 00:00:00',
+    '2020-11-23 00:00:00',
     4,
     '-'
   ),
@@ -8091,6 +8898,7 @@ values
     57.25,
     90,
     '2021-05-04 00:00:00',
+    '2021-05-04 00:00:00',
     3,
     '-'
   ),
@@ -8101,6 +8909,7 @@ values
     88.01,
     18,
     '2021-02-03 00:00:00',
+    '2021-02-03 00:00:00',
     6,
     '-'
   ),
@@ -8111,6 +8920,7 @@ values
     97.85,
     81,
     '2020-09-11 00:00:00',
+    '2020-09-11 00:00:00',
     6,
     '-'
   ),
@@ -8121,6 +8931,7 @@ values
     47.11,
     67,
     '2021-02-20 00:00:00',
+    '2021-02-20 00:00:00',
     3,
     '-'
   ),
@@ -8131,6 +8942,7 @@ values
     94.98,
     96,
     '2021-01-17 00:00:00',
+    '2021-01-17 00:00:00',
     3,
     '-'
   ),
@@ -8141,6 +8953,7 @@ values
     15.08,
     84,
     '2021-01-19 00:00:00',
+    '2021-01-19 00:00:00',
     6,
     '-'
   ),
@@ -8151,6 +8964,7 @@ values
     88.19,
     73,
     '2021-05-26 00:00:00',
+    '2021-05-26 00:00:00',
     3,
     '-'
   ),
@@ -8161,6 +8975,7 @@ values
     60.16,
     87,
     '2021-03-05 00:00:00',
+    '2021-03-05 00:00:00',
     3,
     '-'
   ),
@@ -8171,6 +8986,7 @@ values
     70.29,
     45,
     '2020-06-22 00:00:00',
+    '2020-06-22 00:00:00',
     6,
     '-'
   ),
@@ -8181,6 +8997,7 @@ values
     52.51,
     89,
     '2020-09-05 00:00:00',
+    '2020-09-05 00:00:00',
     5,
     '-'
   ),
@@ -8191,6 +9008,7 @@ values
     24.67,
     39,
     '2021-02-14 00:00:00',
+    '2021-02-14 00:00:00',
     4,
     '-'
   ),
@@ -8201,6 +9019,7 @@ values
     99.45,
     93,
     '2020-08-20 00:00:00',
+    '2020-08-20 00:00:00',
     4,
     '-'
   ),
@@ -8211,6 +9030,7 @@ values
     53.60,
     55,
     '2021-01-16 00:00:00',
+    '2021-01-16 00:00:00',
     3,
     '-'
   ),
@@ -8221,6 +9041,7 @@ values
     56.86,
     26,
     '2021-02-25 00:00:00',
+    '2021-02-25 00:00:00',
     4,
     '-'
   ),
@@ -8231,6 +9052,7 @@ values
     3.29,
     68,
     '2021-03-20 00:00:00',
+    '2021-03-20 00:00:00',
     5,
     '-'
   ),
@@ -8241,6 +9063,7 @@ values
     82.45,
     27,
     '2021-01-28 00:00:00',
+    '2021-01-28 00:00:00',
     5,
     '-'
   ),
@@ -8251,6 +9074,7 @@ values
     47.96,
     50,
     '2021-04-02 00:00:00',
+    '2021-04-02 00:00:00',
     3,
     '-'
   ),
@@ -8261,6 +9085,7 @@ values
     76.15,
     61,
     '2021-01-17 00:00:00',
+    '2021-01-17 00:00:00',
     4,
     '-'
   ),
@@ -8271,6 +9096,7 @@ values
     46.41,
     62,
     '2020-07-28 00:00:00',
+    '2020-07-28 00:00:00',
     5,
     '-'
   ),
@@ -8281,6 +9107,7 @@ values
     65.92,
     65,
     '2020-10-29 00:00:00',
+    '2020-10-29 00:00:00',
     3,
     '-'
   ),
@@ -8291,6 +9118,7 @@ values
     2.58,
     66,
     '2020-06-30 00:00:00',
+    '2020-06-30 00:00:00',
     6,
     '-'
   ),
@@ -8301,6 +9129,7 @@ values
     72.34,
     29,
     '2021-04-27 00:00:00',
+    '2021-04-27 00:00:00',
     5,
     '-'
   ),
@@ -8311,6 +9140,7 @@ values
     74.25,
     44,
     '2020-11-05 00:00:00',
+    '2020-11-05 00:00:00',
     6,
     '-'
   ),
@@ -8321,6 +9151,7 @@ values
     93.37,
     100,
     '2020-10-04 00:00:00',
+    '2020-10-04 00:00:00',
     5,
     '-'
   ),
@@ -8331,6 +9162,7 @@ values
     7.24,
     68,
     '2020-07-25 00:00:00',
+    '2020-07-25 00:00:00',
     3,
     '-'
   ),
@@ -8341,6 +9173,7 @@ values
     9.80,
     27,
     '2020-10-01 00:00:00',
+    '2020-10-01 00:00:00',
     5,
     '-'
   ),
@@ -8351,6 +9184,7 @@ values
     49.76,
     31,
     '2021-05-31 00:00:00',
+    '2021-05-31 00:00:00',
     6,
     '-'
   ),
@@ -8361,6 +9195,7 @@ values
     88.48,
     10,
     '2020-11-18 00:00:00',
+    '2020-11-18 00:00:00',
     3,
     '-'
   ),
@@ -8371,6 +9206,7 @@ values
     54.55,
     42,
     '2020-07-22 00:00:00',
+    '2020-07-22 00:00:00',
     5,
     '-'
   ),
@@ -8381,6 +9217,7 @@ values
     35.20,
     15,
     '2021-02-16 00:00:00',
+    '2021-02-16 00:00:00',
     6,
     '-'
   ),
@@ -8391,6 +9228,7 @@ values
     24.61,
     9,
     '2020-12-17 00:00:00',
+    '2020-12-17 00:00:00',
     6,
     '-'
   ),
@@ -8401,6 +9239,7 @@ values
     57.76,
     89,
     '2020-07-24 00:00:00',
+    '2020-07-24 00:00:00',
     4,
     '-'
   ),
@@ -8411,6 +9250,7 @@ values
     43.96,
     64,
     '2020-11-13 00:00:00',
+    '2020-11-13 00:00:00',
     6,
     '-'
   ),
@@ -8421,6 +9261,7 @@ values
     47.20,
     48,
     '2020-11-23 00:00:00',
+    '2020-11-23 00:00:00',
     4,
     '-'
   ),
@@ -8431,6 +9272,7 @@ values
     81.56,
     86,
     '2020-07-17 00:00:00',
+    '2020-07-17 00:00:00',
     5,
     '-'
   ),
@@ -8441,6 +9283,7 @@ values
     53.24,
     43,
     '2021-01-16 00:00:00',
+    '2021-01-16 00:00:00',
     5,
     '-'
   ),
@@ -8451,6 +9294,7 @@ values
     15.52,
     66,
     '2021-04-07 00:00:00',
+    '2021-04-07 00:00:00',
     3,
     '-'
   ),
@@ -8461,6 +9305,7 @@ values
     62.21,
     56,
     '2021-04-29 00:00:00',
+    '2021-04-29 00:00:00',
     5,
     '-'
   ),
@@ -8471,6 +9316,7 @@ values
     8.68,
     26,
     '2020-09-06 00:00:00',
+    '2020-09-06 00:00:00',
     6,
     '-'
   ),
@@ -8481,6 +9327,7 @@ values
     30.74,
     66,
     '2021-01-12 00:00:00',
+    '2021-01-12 00:00:00',
     3,
     '-'
   ),
@@ -8491,6 +9338,7 @@ values
     64.27,
     12,
     '2020-12-22 00:00:00',
+    '2020-12-22 00:00:00',
     3,
     '-'
   ),
@@ -8501,6 +9349,7 @@ values
     32.82,
     72,
     '2021-03-25 00:00:00',
+    '2021-03-25 00:00:00',
     6,
     '-'
   ),
@@ -8511,6 +9360,7 @@ values
     69.04,
     69,
     '2021-05-03 00:00:00',
+    '2021-05-03 00:00:00',
     6,
     '-'
   ),
@@ -8521,6 +9371,7 @@ values
     59.43,
     11,
     '2020-07-11 00:00:00',
+    '2020-07-11 00:00:00',
     6,
     '-'
   ),
@@ -8531,6 +9382,7 @@ values
     55.63,
     31,
     '2020-11-26 00:00:00',
+    '2020-11-26 00:00:00',
     5,
     '-'
   ),
@@ -8541,6 +9393,7 @@ values
     4.49,
     52,
     '2020-10-27 00:00:00',
+    '2020-10-27 00:00:00',
     4,
     '-'
   ),
@@ -8551,6 +9404,7 @@ values
     98.90,
     51,
     '2020-09-02 00:00:00',
+    '2020-09-02 00:00:00',
     4,
     '-'
   ),
@@ -8561,6 +9415,7 @@ values
     37.33,
     74,
     '2021-05-03 00:00:00',
+    '2021-05-03 00:00:00',
     5,
     '-'
   ),
@@ -8571,6 +9426,7 @@ values
     9.93,
     91,
     '2021-04-03 00:00:00',
+    '2021-04-03 00:00:00',
     6,
     '-'
   ),
@@ -8581,6 +9437,7 @@ values
     47.68,
     26,
     '2021-06-07 00:00:00',
+    '2021-06-07 00:00:00',
     3,
     '-'
   ),
@@ -8591,6 +9448,7 @@ values
     78.94,
     77,
     '2021-04-02 00:00:00',
+    '2021-04-02 00:00:00',
     3,
     '-'
   ),
@@ -8601,6 +9459,7 @@ values
     3.38,
     98,
     '2021-05-23 00:00:00',
+    '2021-05-23 00:00:00',
     6,
     '-'
   ),
@@ -8611,6 +9470,7 @@ values
     61.72,
     11,
     '2021-03-24 00:00:00',
+    '2021-03-24 00:00:00',
     4,
     '-'
   ),
@@ -8621,6 +9481,7 @@ values
     7.96,
     24,
     '2020-07-21 00:00:00',
+    '2020-07-21 00:00:00',
     6,
     '-'
   ),
@@ -8631,6 +9492,7 @@ values
     83.98,
     12,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     3,
     '-'
   ),
@@ -8641,6 +9503,7 @@ values
     91.83,
     41,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     6,
     '-'
   ),
@@ -8651,6 +9514,7 @@ values
     91.88,
     60,
     '2021-04-28 00:00:00',
+    '2021-04-28 00:00:00',
     6,
     '-'
   ),
@@ -8661,6 +9525,7 @@ values
     77.29,
     94,
     '2021-04-30 00:00:00',
+    '2021-04-30 00:00:00',
     5,
     '-'
   ),
@@ -8671,6 +9536,7 @@ values
     97.70,
     6,
     '2020-07-25 00:00:00',
+    '2020-07-25 00:00:00',
     6,
     '-'
   ),
@@ -8681,6 +9547,7 @@ values
     28.21,
     6,
     '2021-01-04 00:00:00',
+    '2021-01-04 00:00:00',
     4,
     '-'
   ),
@@ -8691,6 +9558,7 @@ values
     36.20,
     74,
     '2020-07-29 00:00:00',
+    '2020-07-29 00:00:00',
     5,
     '-'
   ),
@@ -8701,6 +9569,7 @@ values
     67.34,
     34,
     '2021-05-09 00:00:00',
+    '2021-05-09 00:00:00',
     5,
     '-'
   ),
@@ -8711,6 +9580,7 @@ values
     90.88,
     63,
     '2021-02-24 00:00:00',
+    '2021-02-24 00:00:00',
     4,
     '-'
   ),
@@ -8721,6 +9591,7 @@ values
     67.41,
     96,
     '2020-10-12 00:00:00',
+    '2020-10-12 00:00:00',
     4,
     '-'
   ),
@@ -8731,6 +9602,7 @@ values
     54.74,
     84,
     '2021-05-24 00:00:00',
+    '2021-05-24 00:00:00',
     3,
     '-'
   ),
@@ -8741,6 +9613,7 @@ values
     17.58,
     50,
     '2020-12-08 00:00:00',
+    '2020-12-08 00:00:00',
     3,
     '-'
   ),
@@ -8751,6 +9624,7 @@ values
     13.34,
     60,
     '2021-01-25 00:00:00',
+    '2021-01-25 00:00:00',
     4,
     '-'
   ),
@@ -8761,6 +9635,7 @@ values
     70.75,
     42,
     '2021-04-23 00:00:00',
+    '2021-04-23 00:00:00',
     4,
     '-'
   ),
@@ -8771,6 +9646,7 @@ values
     72.56,
     57,
     '2020-06-30 00:00:00',
+    '2020-06-30 00:00:00',
     3,
     '-'
   ),
@@ -8781,6 +9657,7 @@ values
     38.07,
     31,
     '2021-05-06 00:00:00',
+    '2021-05-06 00:00:00',
     5,
     '-'
   ),
@@ -8791,6 +9668,7 @@ values
     34.94,
     59,
     '2020-07-15 00:00:00',
+    '2020-07-15 00:00:00',
     4,
     '-'
   ),
@@ -8801,6 +9679,7 @@ values
     72.29,
     78,
     '2020-06-18 00:00:00',
+    '2020-06-18 00:00:00',
     3,
     '-'
   ),
@@ -8811,6 +9690,7 @@ values
     19.22,
     42,
     '2020-11-24 00:00:00',
+    '2020-11-24 00:00:00',
     4,
     '-'
   ),
@@ -8821,6 +9701,7 @@ values
     69.17,
     36,
     '2020-09-03 00:00:00',
+    '2020-09-03 00:00:00',
     4,
     '-'
   ),
@@ -8831,6 +9712,7 @@ values
     68.17,
     14,
     '2020-07-24 00:00:00',
+    '2020-07-24 00:00:00',
     3,
     '-'
   ),
@@ -8841,6 +9723,7 @@ values
     1.41,
     95,
     '2021-01-02 00:00:00',
+    '2021-01-02 00:00:00',
     4,
     '-'
   ),
@@ -8851,6 +9734,7 @@ values
     62.32,
     8,
     '2020-12-06 00:00:00',
+    '2020-12-06 00:00:00',
     3,
     '-'
   ),
@@ -8861,6 +9745,7 @@ values
     86.10,
     88,
     '2020-12-31 00:00:00',
+    '2020-12-31 00:00:00',
     3,
     '-'
   ),
@@ -8871,6 +9756,7 @@ values
     4.77,
     79,
     '2020-09-19 00:00:00',
+    '2020-09-19 00:00:00',
     5,
     '-'
   ),
@@ -8881,6 +9767,7 @@ values
     84.08,
     81,
     '2020-09-06 00:00:00',
+    '2020-09-06 00:00:00',
     4,
     '-'
   ),
@@ -8891,6 +9778,7 @@ values
     24.20,
     32,
     '2021-03-19 00:00:00',
+    '2021-03-19 00:00:00',
     6,
     '-'
   ),
@@ -8901,6 +9789,7 @@ values
     30.54,
     31,
     '2021-01-31 00:00:00',
+    '2021-01-31 00:00:00',
     3,
     '-'
   ),
@@ -8911,6 +9800,7 @@ values
     65.63,
     63,
     '2020-07-16 00:00:00',
+    '2020-07-16 00:00:00',
     5,
     '-'
   ),
@@ -8921,6 +9811,7 @@ values
     29.75,
     8,
     '2021-01-31 00:00:00',
+    '2021-01-31 00:00:00',
     4,
     '-'
   ),
@@ -8931,6 +9822,7 @@ values
     93.01,
     99,
     '2021-05-05 00:00:00',
+    '2021-05-05 00:00:00',
     5,
     '-'
   ),
@@ -8941,6 +9833,7 @@ values
     39.56,
     27,
     '2021-01-25 00:00:00',
+    '2021-01-25 00:00:00',
     6,
     '-'
   ),
@@ -8951,6 +9844,7 @@ values
     63.49,
     73,
     '2021-02-23 00:00:00',
+    '2021-02-23 00:00:00',
     5,
     '-'
   ),
@@ -8961,6 +9855,7 @@ values
     87.53,
     17,
     '2020-07-29 00:00:00',
+    '2020-07-29 00:00:00',
     5,
     '-'
   ),
@@ -8971,6 +9866,7 @@ values
     4.99,
     51,
     '2021-03-24 00:00:00',
+    '2021-03-24 00:00:00',
     5,
     '-'
   ),
@@ -8981,6 +9877,7 @@ values
     28.30,
     60,
     '2021-01-09 00:00:00',
+    '2021-01-09 00:00:00',
     5,
     '-'
   ),
@@ -8991,6 +9888,7 @@ values
     2.28,
     23,
     '2021-03-14 00:00:00',
+    '2021-03-14 00:00:00',
     4,
     '-'
   ),
@@ -9001,6 +9899,7 @@ values
     93.69,
     5,
     '2020-07-03 00:00:00',
+    '2020-07-03 00:00:00',
     4,
     '-'
   ),
@@ -9011,6 +9910,7 @@ values
     74.10,
     70,
     '2020-09-23 00:00:00',
+    '2020-09-23 00:00:00',
     6,
     '-'
   ),
@@ -9021,6 +9921,7 @@ values
     74.87,
     40,
     '2020-11-21 00:00:00',
+    '2020-11-21 00:00:00',
     4,
     '-'
   ),
@@ -9031,6 +9932,7 @@ values
     55.42,
     40,
     '2021-03-10 00:00:00',
+    '2021-03-10 00:00:00',
     5,
     '-'
   ),
@@ -9041,6 +9943,7 @@ values
     8.37,
     22,
     '2020-12-20 00:00:00',
+    '2020-12-20 00:00:00',
     5,
     '-'
   ),
@@ -9051,6 +9954,7 @@ values
     45.92,
     93,
     '2021-02-24 00:00:00',
+    '2021-02-24 00:00:00',
     3,
     '-'
   ),
@@ -9061,6 +9965,7 @@ values
     13.74,
     97,
     '2020-07-16 00:00:00',
+    '2020-07-16 00:00:00',
     4,
     '-'
   ),
@@ -9071,6 +9976,7 @@ values
     88.20,
     32,
     '2020-10-23 00:00:00',
+    '2020-10-23 00:00:00',
     4,
     '-'
   ),
@@ -9081,6 +9987,7 @@ values
     56.77,
     62,
     '2020-07-17 00:00:00',
+    '2020-07-17 00:00:00',
     5,
     '-'
   ),
@@ -9091,6 +9998,7 @@ values
     16.64,
     39,
     '2020-11-10 00:00:00',
+    '2020-11-10 00:00:00',
     5,
     '-'
   ),
@@ -9101,6 +10009,7 @@ values
     58.28,
     78,
     '2020-12-13 00:00:00',
+    '2020-12-13 00:00:00',
     4,
     '-'
   ),
@@ -9111,6 +10020,7 @@ values
     3.98,
     56,
     '2021-05-10 00:00:00',
+    '2021-05-10 00:00:00',
     4,
     '-'
   ),
@@ -9121,6 +10031,7 @@ values
     70.60,
     93,
     '2020-10-23 00:00:00',
+    '2020-10-23 00:00:00',
     5,
     '-'
   ),
@@ -9131,6 +10042,7 @@ values
     81.50,
     97,
     '2020-11-28 00:00:00',
+    '2020-11-28 00:00:00',
     3,
     '-'
   ),
@@ -9141,6 +10053,7 @@ values
     77.05,
     87,
     '2021-03-31 00:00:00',
+    '2021-03-31 00:00:00',
     6,
     '-'
   ),
@@ -9151,6 +10064,7 @@ values
     16.96,
     32,
     '2020-12-05 00:00:00',
+    '2020-12-05 00:00:00',
     5,
     '-'
   ),
@@ -9161,6 +10075,7 @@ values
     64.01,
     90,
     '2020-06-21 00:00:00',
+    '2020-06-21 00:00:00',
     4,
     '-'
   ),
@@ -9171,6 +10086,7 @@ values
     73.04,
     92,
     '2020-11-07 00:00:00',
+    '2020-11-07 00:00:00',
     3,
     '-'
   ),
@@ -9181,6 +10097,7 @@ values
     59.71,
     1,
     '2021-05-21 00:00:00',
+    '2021-05-21 00:00:00',
     4,
     '-'
   ),
@@ -9191,6 +10108,7 @@ values
     80.01,
     96,
     '2020-12-21 00:00:00',
+    '2020-12-21 00:00:00',
     4,
     '-'
   ),
@@ -9201,6 +10119,7 @@ values
     1.82,
     45,
     '2020-08-03 00:00:00',
+    '2020-08-03 00:00:00',
     4,
     '-'
   ),
@@ -9211,6 +10130,7 @@ values
     62.49,
     73,
     '2020-09-18 00:00:00',
+    '2020-09-18 00:00:00',
     4,
     '-'
   ),
@@ -9221,6 +10141,7 @@ values
     43.91,
     63,
     '2021-05-30 00:00:00',
+    '2021-05-30 00:00:00',
     5,
     '-'
   ),
@@ -9231,6 +10152,7 @@ values
     25.44,
     16,
     '2020-12-17 00:00:00',
+    '2020-12-17 00:00:00',
     5,
     '-'
   ),
@@ -9241,6 +10163,7 @@ values
     92.30,
     49,
     '2020-12-06 00:00:00',
+    '2020-12-06 00:00:00',
     6,
     '-'
   ),
@@ -9251,6 +10174,7 @@ values
     93.91,
     46,
     '2020-11-12 00:00:00',
+    '2020-11-12 00:00:00',
     3,
     '-'
   ),
@@ -9261,6 +10185,7 @@ values
     82.27,
     22,
     '2020-12-08 00:00:00',
+    '2020-12-08 00:00:00',
     6,
     '-'
   ),
@@ -9271,6 +10196,7 @@ values
     11.68,
     87,
     '2020-09-05 00:00:00',
+    '2020-09-05 00:00:00',
     5,
     '-'
   ),
@@ -9281,6 +10207,7 @@ values
     57.01,
     16,
     '2021-02-10 00:00:00',
+    '2021-02-10 00:00:00',
     4,
     '-'
   ),
@@ -9291,6 +10218,7 @@ values
     22.24,
     17,
     '2020-07-21 00:00:00',
+    '2020-07-21 00:00:00',
     4,
     '-'
   ),
@@ -9301,6 +10229,7 @@ values
     99.83,
     15,
     '2021-06-09 00:00:00',
+    '2021-06-09 00:00:00',
     3,
     '-'
   ),
@@ -9311,6 +10240,7 @@ values
     38.36,
     28,
     '2020-08-18 00:00:00',
+    '2020-08-18 00:00:00',
     5,
     '-'
   ),
@@ -9321,6 +10251,7 @@ values
     15.51,
     7,
     '2021-04-03 00:00:00',
+    '2021-04-03 00:00:00',
     4,
     '-'
   ),
@@ -9331,6 +10262,7 @@ values
     29.51,
     43,
     '2020-09-09 00:00:00',
+    '2020-09-09 00:00:00',
     4,
     '-'
   ),
@@ -9341,6 +10273,7 @@ values
     67.65,
     26,
     '2021-03-16 00:00:00',
+    '2021-03-16 00:00:00',
     4,
     '-'
   ),
@@ -9351,6 +10284,7 @@ values
     93.57,
     8,
     '2020-09-07 00:00:00',
+    '2020-09-07 00:00:00',
     5,
     '-'
   ),
@@ -9361,6 +10295,7 @@ values
     24.33,
     63,
     '2020-07-20 00:00:00',
+    '2020-07-20 00:00:00',
     4,
     '-'
   ),
@@ -9371,6 +10306,7 @@ values
     80.37,
     45,
     '2020-08-19 00:00:00',
+    '2020-08-19 00:00:00',
     4,
     '-'
   ),
@@ -9381,6 +10317,7 @@ values
     59.14,
     59,
     '2021-01-09 00:00:00',
+    '2021-01-09 00:00:00',
     3,
     '-'
   ),
@@ -9391,6 +10328,7 @@ values
     56.34,
     88,
     '2020-10-06 00:00:00',
+    '2020-10-06 00:00:00',
     6,
     '-'
   ),
@@ -9401,6 +10339,7 @@ values
     85.67,
     27,
     '2021-01-16 00:00:00',
+    '2021-01-16 00:00:00',
     6,
     '-'
   ),
@@ -9411,6 +10350,7 @@ values
     77.92,
     68,
     '2020-09-30 00:00:00',
+    '2020-09-30 00:00:00',
     4,
     '-'
   ),
@@ -9421,6 +10361,7 @@ values
     50.45,
     87,
     '2020-08-14 00:00:00',
+    '2020-08-14 00:00:00',
     5,
     '-'
   ),
@@ -9431,6 +10372,7 @@ values
     72.18,
     84,
     '2021-03-04 00:00:00',
+    '2021-03-04 00:00:00',
     5,
     '-'
   ),
@@ -9441,6 +10383,7 @@ values
     12.90,
     47,
     '2021-05-30 00:00:00',
+    '2021-05-30 00:00:00',
     6,
     '-'
   ),
@@ -9451,6 +10394,7 @@ values
     85.47,
     95,
     '2020-09-05 00:00:00',
+    '2020-09-05 00:00:00',
     6,
     '-'
   ),
@@ -9461,6 +10405,7 @@ values
     19.88,
     88,
     '2021-01-06 00:00:00',
+    '2021-01-06 00:00:00',
     3,
     '-'
   ),
@@ -9471,6 +10416,7 @@ values
     29.59,
     7,
     '2020-12-22 00:00:00',
+    '2020-12-22 00:00:00',
     3,
     '-'
   ),
@@ -9481,6 +10427,7 @@ values
     46.23,
     46,
     '2021-05-26 00:00:00',
+    '2021-05-26 00:00:00',
     5,
     '-'
   ),
@@ -9491,6 +10438,7 @@ values
     7.48,
     100,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     4,
     '-'
   ),
@@ -9501,6 +10449,7 @@ values
     48.37,
     3,
     '2020-08-19 00:00:00',
+    '2020-08-19 00:00:00',
     3,
     '-'
   ),
@@ -9511,6 +10460,7 @@ values
     76.76,
     82,
     '2021-02-02 00:00:00',
+    '2021-02-02 00:00:00',
     3,
     '-'
   ),
@@ -9521,6 +10471,7 @@ values
     97.98,
     34,
     '2020-10-01 00:00:00',
+    '2020-10-01 00:00:00',
     4,
     '-'
   ),
@@ -9531,6 +10482,7 @@ values
     49.31,
     56,
     '2020-06-28 00:00:00',
+    '2020-06-28 00:00:00',
     4,
     '-'
   ),
@@ -9541,6 +10493,7 @@ values
     16.26,
     35,
     '2020-06-18 00:00:00',
+    '2020-06-18 00:00:00',
     3,
     '-'
   ),
@@ -9551,6 +10504,7 @@ values
     31.72,
     85,
     '2020-08-29 00:00:00',
+    '2020-08-29 00:00:00',
     5,
     '-'
   ),
@@ -9561,6 +10515,7 @@ values
     64.81,
     65,
     '2021-02-08 00:00:00',
+    '2021-02-08 00:00:00',
     3,
     '-'
   ),
@@ -9571,6 +10526,7 @@ values
     21.70,
     7,
     '2021-03-09 00:00:00',
+    '2021-03-09 00:00:00',
     4,
     '-'
   ),
@@ -9581,6 +10537,7 @@ values
     94.14,
     36,
     '2021-06-03 00:00:00',
+    '2021-06-03 00:00:00',
     6,
     '-'
   ),
@@ -9591,6 +10548,7 @@ values
     30.80,
     88,
     '2020-11-29 00:00:00',
+    '2020-11-29 00:00:00',
     4,
     '-'
   ),
@@ -9601,6 +10559,7 @@ values
     33.25,
     93,
     '2020-06-14 00:00:00',
+    '2020-06-14 00:00:00',
     6,
     '-'
   ),
@@ -9611,6 +10570,7 @@ values
     87.22,
     46,
     '2020-07-29 00:00:00',
+    '2020-07-29 00:00:00',
     4,
     '-'
   ),
@@ -9621,6 +10581,7 @@ values
     78.05,
     45,
     '2021-05-28 00:00:00',
+    '2021-05-28 00:00:00',
     3,
     '-'
   ),
@@ -9631,6 +10592,7 @@ values
     1.16,
     46,
     '2020-10-25 00:00:00',
+    '2020-10-25 00:00:00',
     4,
     '-'
   ),
@@ -9641,6 +10603,7 @@ values
     37.26,
     91,
     '2021-03-16 00:00:00',
+    '2021-03-16 00:00:00',
     4,
     '-'
   ),
@@ -9651,6 +10614,7 @@ values
     48.87,
     53,
     '2021-04-20 00:00:00',
+    '2021-04-20 00:00:00',
     4,
     '-'
   ),
@@ -9661,6 +10625,7 @@ values
     42.69,
     72,
     '2020-09-11 00:00:00',
+    '2020-09-11 00:00:00',
     5,
     '-'
   ),
@@ -9671,6 +10636,7 @@ values
     41.69,
     0,
     '2021-04-29 00:00:00',
+    '2021-04-29 00:00:00',
     3,
     '-'
   ),
@@ -9681,6 +10647,7 @@ values
     30.31,
     74,
     '2021-01-03 00:00:00',
+    '2021-01-03 00:00:00',
     6,
     '-'
   ),
@@ -9691,6 +10658,7 @@ values
     30.25,
     62,
     '2020-09-07 00:00:00',
+    '2020-09-07 00:00:00',
     4,
     '-'
   ),
@@ -9701,6 +10669,7 @@ values
     71.71,
     98,
     '2020-10-16 00:00:00',
+    '2020-10-16 00:00:00',
     6,
     '-'
   ),
@@ -9711,6 +10680,7 @@ values
     62.44,
     94,
     '2021-04-21 00:00:00',
+    '2021-04-21 00:00:00',
     5,
     '-'
   ),
@@ -9721,6 +10691,7 @@ values
     35.58,
     28,
     '2020-08-21 00:00:00',
+    '2020-08-21 00:00:00',
     3,
     '-'
   ),
@@ -9731,6 +10702,7 @@ values
     1.38,
     46,
     '2020-12-01 00:00:00',
+    '2020-12-01 00:00:00',
     5,
     '-'
   ),
@@ -9741,6 +10713,7 @@ values
     61.63,
     19,
     '2020-09-26 00:00:00',
+    '2020-09-26 00:00:00',
     3,
     '-'
   ),
@@ -9751,6 +10724,7 @@ values
     14.67,
     3,
     '2021-03-24 00:00:00',
+    '2021-03-24 00:00:00',
     4,
     '-'
   ),
@@ -9761,6 +10735,7 @@ values
     56.63,
     66,
     '2020-08-07 00:00:00',
+    '2020-08-07 00:00:00',
     3,
     '-'
   ),
@@ -9771,6 +10746,7 @@ values
     93.29,
     90,
     '2021-01-29 00:00:00',
+    '2021-01-29 00:00:00',
     5,
     '-'
   ),
@@ -9781,6 +10757,7 @@ values
     64.48,
     35,
     '2020-11-27 00:00:00',
+    '2020-11-27 00:00:00',
     4,
     '-'
   ),
@@ -9791,6 +10768,7 @@ values
     90.31,
     100,
     '2020-07-14 00:00:00',
+    '2020-07-14 00:00:00',
     6,
     '-'
   ),
@@ -9801,6 +10779,7 @@ values
     87.45,
     0,
     '2021-02-17 00:00:00',
+    '2021-02-17 00:00:00',
     6,
     '-'
   ),
@@ -9811,6 +10790,7 @@ values
     53.35,
     82,
     '2020-09-17 00:00:00',
+    '2020-09-17 00:00:00',
     3,
     '-'
   ),
@@ -9821,6 +10801,7 @@ values
     74.18,
     91,
     '2020-11-19 00:00:00',
+    '2020-11-19 00:00:00',
     5,
     '-'
   ),
@@ -9831,6 +10812,7 @@ values
     54.26,
     65,
     '2020-08-12 00:00:00',
+    '2020-08-12 00:00:00',
     3,
     '-'
   ),
@@ -9841,6 +10823,7 @@ values
     75.97,
     42,
     '2020-09-08 00:00:00',
+    '2020-09-08 00:00:00',
     3,
     '-'
   ),
@@ -9851,6 +10834,7 @@ values
     86.92,
     81,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     5,
     '-'
   ),
@@ -9861,6 +10845,7 @@ values
     79.46,
     99,
     '2021-02-24 00:00:00',
+    '2021-02-24 00:00:00',
     6,
     '-'
   ),
@@ -9871,6 +10856,7 @@ values
     48.16,
     77,
     '2021-03-12 00:00:00',
+    '2021-03-12 00:00:00',
     3,
     '-'
   ),
@@ -9881,6 +10867,7 @@ values
     9.64,
     57,
     '2021-01-20 00:00:00',
+    '2021-01-20 00:00:00',
     3,
     '-'
   ),
@@ -9891,6 +10878,7 @@ values
     62.10,
     1,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     3,
     '-'
   ),
@@ -9901,6 +10889,7 @@ values
     15.77,
     64,
     '2020-07-16 00:00:00',
+    '2020-07-16 00:00:00',
     5,
     '-'
   ),
@@ -9911,6 +10900,7 @@ values
     22.70,
     30,
     '2021-01-06 00:00:00',
+    '2021-01-06 00:00:00',
     3,
     '-'
   ),
@@ -9921,6 +10911,7 @@ values
     71.17,
     53,
     '2021-01-05 00:00:00',
+    '2021-01-05 00:00:00',
     5,
     '-'
   ),
@@ -9931,6 +10922,7 @@ values
     41.43,
     36,
     '2020-07-08 00:00:00',
+    '2020-07-08 00:00:00',
     4,
     '-'
   ),
@@ -9941,6 +10933,7 @@ values
     53.99,
     59,
     '2020-10-27 00:00:00',
+    '2020-10-27 00:00:00',
     6,
     '-'
   ),
@@ -9951,6 +10944,7 @@ values
     32.22,
     51,
     '2021-04-20 00:00:00',
+    '2021-04-20 00:00:00',
     3,
     '-'
   ),
@@ -9961,6 +10955,7 @@ values
     35.22,
     44,
     '2020-08-31 00:00:00',
+    '2020-08-31 00:00:00',
     4,
     '-'
   ),
@@ -9971,6 +10966,7 @@ values
     8.32,
     61,
     '2021-03-19 00:00:00',
+    '2021-03-19 00:00:00',
     3,
     '-'
   ),
@@ -9981,6 +10977,7 @@ values
     52.90,
     68,
     '2020-06-20 00:00:00',
+    '2020-06-20 00:00:00',
     6,
     '-'
   ),
@@ -9991,6 +10988,7 @@ values
     37.51,
     7,
     '2021-05-02 00:00:00',
+    '2021-05-02 00:00:00',
     6,
     '-'
   ),
@@ -10001,6 +10999,7 @@ values
     59.84,
     98,
     '2020-06-29 00:00:00',
+    '2020-06-29 00:00:00',
     3,
     '-'
   ),
@@ -10011,6 +11010,7 @@ values
     58.57,
     5,
     '2020-08-16 00:00:00',
+    '2020-08-16 00:00:00',
     6,
     '-'
   ),
@@ -10021,6 +11021,7 @@ values
     41.22,
     39,
     '2020-12-12 00:00:00',
+    '2020-12-12 00:00:00',
     4,
     '-'
   );
\ No newline at end of file
@@ -1,18 +1,38 @@
 import os
-from pathlib import Path
-from django.core.management.base import BaseCommand
-from django.db import connection
+from django.core.management.base import BaseCommand, CommandError
+
+from store.seeding import SeedLoader
 
 
 class Command(BaseCommand):
-    help = 'Populates database with collections and products'
+    help = 'Populates database with collections and products (streams seed.sql, look at store.seeding)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--file', default=os.path.join(os.path.dirname(__file__), 'seed.sql'),
+                            help='the .sql file to load, seed.sql next to this command by default')
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='statements per transaction')
+        parser.add_argument('--checkpoint', default='.seed_db.checkpoint',
+                            help='where the number of committed statements is kept')
+        parser.add_argument('--resume', action='store_true',
+                            help='skip the statements an interrupted run already committed')
 
     def handle(self, *args, **options):
-        print('Populating the database...')
-        current_dir = os.path.dirname(__file__)
-        file_path = os.path.join(current_dir, 'seed.sql')
-        sql = Path(file_path).read_text()
-        print('finished')
+        path = options['file']
+        if not os.path.exists(path):
+            raise CommandError(f'{path} does not exist')
+
+        def progress(statements, percent, rate):
+            self.stdout.write(f'{statements} statements ({percent:.0f}% of the file, {rate:,.1f}/s)')
 
-        with connection.cursor() as cursor:
-            cursor.execute(sql)
+        self.stdout.write(f'Populating the database from {path}...')
+        loader = SeedLoader(
+            path,
+            batch_size=options['batch_size'],
+            checkpoint_path=options['checkpoint'],
+            progress=progress,
+        )
+        executed, skipped = loader.load(resume=options['resume'])
+        if skipped:
+            self.stdout.write(f'{skipped} statements were already loaded by a previous run')
+        self.stdout.write(self.style.SUCCESS(f'finished, {executed} statements executed'))
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.3 on 2026-10-18 12:34
+
+from django.db import migrations
+from django.db.models import Count, Min, Sum
+
+
+def merge_duplicate_items(apps, schema_editor):
+    # without the constraint the same product could end up twice in a cart,
+    # we keep the first row with the summed quantity
+    CartItem = apps.get_model('store', 'CartItem')
+    duplicates = CartItem.objects \
+        .values('cart_id', 'product_id') \
+        .annotate(rows=Count('id'), first_id=Min('id'), quantity=Sum('quantity')) \
+        .filter(rows__gt=1) \
+        .order_by()
+    for duplicate in duplicates:
+        items = CartItem.objects.filter(
+            cart_id=duplicate['cart_id'], product_id=duplicate['product_id'])
+        items.exclude(id=duplicate['first_id']).delete()
+        items.update(quantity=min(duplicate['quantity'], 32767))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0005_collection_products_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_items, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='cartitem',
+            unique_together={('cart', 'product')},
+        ),
+    ]
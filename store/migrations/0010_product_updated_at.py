@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_last_update(apps, schema_editor):
+    # nothing better is known about the existing products than when they were created
+    Product = apps.get_model('store', 'Product')
+    Product.objects.update(updated_at=F('last_update'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0009_order_placed_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collection',
+            name='last_update',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='last_update',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(copy_last_update, migrations.RunPython.noop),
+    ]
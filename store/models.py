@@ -1,6 +1,10 @@
 from django.contrib import admin
 from django.conf import settings
-from django.db import models
+from collections import Counter
+from django.db import models, transaction, connections
+from django.db.models import Case, When, Value, F, Count, OuterRef, Subquery
+from django.db.models.functions import Cast, Coalesce, Greatest, Least, Now, Round
+from decimal import Decimal
 from django.core.validators import MinValueValidator, FileExtensionValidator
 from uuid import uuid4
 from .validators import validate_file_size
@@ -13,8 +17,13 @@ Cart - Item  cart can have multiple items as well
 """
 
 
+# price_with_tax = unit_price * TAX_RATE, an exact Decimal (Decimal(1.1) is the float 1.1000000000000000888...)
+TAX_RATE = Decimal('1.1')
+
+
 class Promotion(models.Model):
     description = models.CharField(max_length=255)
+    # percent off the unit price, the best promotion of a product wins (ProductQuerySet.with_effective_price)
     discount = models.FloatField()
     # products
 
@@ -22,10 +31,45 @@ class Promotion(models.Model):
         return self.description
 
 
+class CollectionQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        # auto_now only works on save(), queryset updates (the counters) touch last_update here
+        kwargs.setdefault('last_update', Now())
+        return super().update(**kwargs)
+
+    def adjust_products_count(self, deltas):
+        # deltas is {collection_id: +n/-n}, applied in a single UPDATE with F()
+        deltas = {pk: delta for pk, delta in deltas.items() if delta and pk is not None}
+        if not deltas:
+            return 0
+        return self.filter(pk__in=deltas).update(products_count=F('products_count') + Case(
+            *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+            default=Value(0)
+        ))
+
+    def reconcile_products_count(self):
+        # recount from the products table, fixes any drift of the stored counter
+        products = Product.objects \
+            .filter(collection=OuterRef('pk')) \
+            .order_by() \
+            .values('collection') \
+            .annotate(count=Count('id')) \
+            .values('count')
+        return self.update(products_count=Coalesce(Subquery(products), 0))
+
+
 class Collection(models.Model):
     title = models.CharField(max_length=225)
     featured_product = models.ForeignKey(
         'Product', on_delete=models.SET_NULL, null=True, related_name='+', blank=True)
+    # stored counter instead of annotating Count('products') on every read,
+    # it is kept up to date by store.signals.handlers and ProductQuerySet (bulk paths)
+    # and `python manage.py reconcile_products_count` repairs it if it ever drifts
+    products_count = models.IntegerField(default=0, editable=False)
+    # drives ETag/Last-Modified of the collection endpoints (look at store.conditional)
+    last_update = models.DateTimeField(auto_now=True)
+
+    objects = CollectionQuerySet.as_manager()
 
     def __str__(self):
         return self.title
@@ -34,6 +78,174 @@ class Collection(models.Model):
         ordering = ['title']
 
 
+class ProductQuerySet(models.QuerySet):
+    """
+    bulk_create() and update() don't send post_save, so they maintain
+    Collection.products_count themselves. delete() sends post_delete for every row.
+    """
+
+    def with_effective_price(self):
+        """
+        Annotates `discount` (the best discount of the product's promotions,
+        0 without any) and `effective_price` (unit price minus the discount,
+        plus tax, rounded to cents) in SQL: a correlated subquery on the
+        promotions through table, no query per row. Every attached promotion
+        counts as active.
+        """
+        best_discount = Product.promotions.through.objects \
+            .filter(product_id=OuterRef('pk')) \
+            .order_by('-promotion__discount') \
+            .values('promotion__discount')[:1]
+        discount = Least(Greatest(Coalesce(Subquery(best_discount), Value(0.0)), Value(0.0)), Value(100.0))
+        price = models.DecimalField(max_digits=8, decimal_places=2)
+        # decimal arithmetic: unit_price * (100 - discount) / 100 * TAX_RATE
+        effective_price = F('unit_price') \
+            * (Value(Decimal(100)) - Cast(F('discount'), models.DecimalField(max_digits=5, decimal_places=2))) \
+            * Value(TAX_RATE) / Value(Decimal(100))
+        return self.annotate(discount=discount) \
+            .annotate(effective_price=Cast(Round(effective_price, 2, output_field=price), price))
+
+    def bulk_create(self, objs, batch_size=None, ignore_conflicts=False, update_conflicts=False, update_fields=None, unique_fields=None):
+        objs = super().bulk_create(
+            objs,
+            batch_size=batch_size,
+            ignore_conflicts=ignore_conflicts,
+            update_conflicts=update_conflicts,
+            update_fields=update_fields,
+            unique_fields=unique_fields,
+        )
+        # with conflicts we can't know which rows were inserted,
+        # callers reconcile the collections they touched
+        if not ignore_conflicts and not update_conflicts:
+            Collection.objects.adjust_products_count(
+                Counter(obj.collection_id for obj in objs))
+        for obj in objs:
+            obj._loaded_collection_id = obj.collection_id
+        return objs
+
+    def update(self, **kwargs):
+        # auto_now only works on save(), every queryset update (inventory
+        # reservations, admin actions, bulk_update ...) touches updated_at here
+        kwargs.setdefault('updated_at', Now())
+        if 'collection' not in kwargs and 'collection_id' not in kwargs:
+            return super().update(**kwargs)
+
+        new_collection = kwargs.get('collection', kwargs.get('collection_id'))
+        new_collection_id = getattr(new_collection, 'pk', new_collection)
+        with transaction.atomic(using=self.db):
+            moved = self.order_by() \
+                .values_list('collection_id') \
+                .annotate(count=Count('id'))
+            deltas = Counter()
+            for collection_id, count in moved:
+                deltas[collection_id] -= count
+                deltas[new_collection_id] += count
+            rows = super().update(**kwargs)
+            Collection.objects.adjust_products_count(deltas)
+        return rows
+
+    def delete(self):
+        # one UPDATE for all the collections instead of one per deleted product,
+        # post_delete skips the products deleted from a queryset (look at count_deleted_product)
+        with transaction.atomic(using=self.db):
+            deltas = Counter()
+            for collection_id, count in self.order_by().values_list('collection_id').annotate(count=Count('id')):
+                deltas[collection_id] -= count
+            deleted = super().delete()
+            Collection.objects.adjust_products_count(deltas)
+        return deleted
+
+    def reserve_inventory(self, quantities):
+        """
+        Takes `quantities` ({product_id: quantity}) out of the inventory. The
+        rows are locked first with SELECT ... FOR UPDATE in primary key order,
+        so concurrent checkouts wait for each other instead of deadlocking,
+        then a single UPDATE ... SET inventory = inventory - q takes them all.
+        Either every product is reserved or none is: the shortages are
+        returned as {product_id: available} (0 for missing products).
+        """
+        if not quantities:
+            return {}
+        with transaction.atomic(using=self.db):
+            available = dict(self.filter(pk__in=quantities)
+                             .order_by('pk')
+                             .select_for_update()
+                             .values_list('pk', 'inventory'))
+            shortages = {
+                pk: available.get(pk, 0)
+                for pk, quantity in quantities.items()
+                if available.get(pk, 0) < quantity
+            }
+            if shortages:
+                return shortages
+            requested = Case(
+                *[When(pk=pk, then=Value(quantity)) for pk, quantity in sorted(quantities.items())],
+                output_field=models.IntegerField()
+            )
+            self.filter(pk__in=quantities).update(inventory=F('inventory') - requested)
+        return {}
+
+    def apply_stock_changes(self, changes, chunk_size=500):
+        """
+        Applies `changes` ({product_id: {'inventory': n} or {'inventory_delta': +-n},
+        optionally 'unit_price'}) with one UPDATE ... SET inventory = CASE WHEN id = 1
+        THEN inventory + 5 ... END per chunk of products, in one transaction and
+        in primary key order like reserve_inventory(). Returns (applied ids, shortages):
+        the ids missing from applied don't exist, and like reserve_inventory() nothing
+        is written when a delta would take an inventory below 0, the shortages are
+        returned as {product_id: inventory}.
+        """
+        applied = []
+        shortages = {}
+        ids = sorted(changes)
+        try:
+            with transaction.atomic(using=self.db):
+                for start in range(0, len(ids), chunk_size):
+                    # here we lock the rows we read, the deltas are checked against these values
+                    current = dict(self.filter(pk__in=ids[start:start + chunk_size])
+                                   .order_by('pk')
+                                   .select_for_update()
+                                   .values_list('pk', 'inventory'))
+                    shortages.update({
+                        pk: inventory for pk, inventory in current.items()
+                        if inventory + changes[pk].get('inventory_delta', 0) < 0
+                    })
+                    if not current or shortages:
+                        # the batch is rolled back anyway, only look for the other shortages
+                        continue
+                    chunk = list(current)
+                    inventory = [
+                        When(pk=pk, then=F('inventory') + changes[pk]['inventory_delta'])
+                        if 'inventory_delta' in changes[pk] else
+                        When(pk=pk, then=Value(changes[pk]['inventory']))
+                        for pk in chunk
+                        if 'inventory_delta' in changes[pk] or 'inventory' in changes[pk]
+                    ]
+                    unit_price = [
+                        When(pk=pk, then=Value(changes[pk]['unit_price']))
+                        for pk in chunk if 'unit_price' in changes[pk]
+                    ]
+                    fields = {}
+                    if inventory:
+                        fields['inventory'] = Case(*inventory, default=F('inventory'),
+                                                   output_field=models.IntegerField())
+                    if unit_price:
+                        fields['unit_price'] = Case(*unit_price, default=F('unit_price'),
+                                                    output_field=models.DecimalField(max_digits=6, decimal_places=2))
+                    self.filter(pk__in=chunk).update(**fields)
+                    applied += chunk
+                if shortages:
+                    raise _NotEnoughInventory
+        except _NotEnoughInventory:
+            return [], shortages
+        return applied, {}
+
+
+class _NotEnoughInventory(Exception):
+    # only used to roll back the savepoint in apply_stock_changes()
+    pass
+
+
 class Product(models.Model):
     title = models.CharField(max_length=50)
     slug = models.SlugField()
@@ -44,15 +256,31 @@ class Product(models.Model):
         validators=[MinValueValidator(1)]
     )
     inventory = models.IntegerField()
-    last_update = models.DateTimeField(auto_now_add=True)
+    # set once when the product is created: the default ordering and the
+    # keyset cursor (look at KeysetPagination) must not move when a product changes
+    last_update = models.DateTimeField(auto_now_add=True, db_index=True)
+    # changes with every write (ProductQuerySet.update and the image/promotion signals
+    # touch it too), it drives ETag/Last-Modified (look at store.conditional)
+    updated_at = models.DateTimeField(auto_now=True)
 
     collection = models.ForeignKey(
         Collection, on_delete=models.PROTECT, related_name='products')
     promotions = models.ManyToManyField(Promotion, blank=True)
 
+    objects = ProductQuerySet.as_manager()
+
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remember the collection we were loaded with so signal handlers can
+        # tell when a product moves to another collection
+        if 'collection_id' in instance.__dict__:
+            instance._loaded_collection_id = instance.collection_id
+        return instance
+
     class Meta:
         ordering = ['last_update',]
 
@@ -149,6 +377,11 @@ class Order(models.Model):
         permissions = [
             ('cancel_order', 'Can Cancel Order')
         ]
+        # OrderViewSet lists a customer's orders (or all of them for staff) newest first
+        indexes = [
+            models.Index(fields=['customer', 'placed_at']),
+            models.Index(fields=['placed_at']),
+        ]
 
 
 class OrderItem(models.Model):
@@ -160,14 +393,89 @@ class OrderItem(models.Model):
     unit_price = models.DecimalField(max_digits=6, decimal_places=2)
 
 
+class CartQuerySet(models.QuerySet):
+    def delete_with_items(self, cart_ids):
+        """
+        Deletes the carts and their items with two plain DELETE ... WHERE
+        ... IN (...) and returns (carts, items). delete() would first select
+        the carts to collect the cascade, nothing listens to the deletes of
+        carts or items so there is nothing to collect.
+        """
+        if not cart_ids:
+            return 0, 0
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        cart_ids = [Cart._meta.pk.get_db_prep_value(cart_id, connection) for cart_id in cart_ids]
+        placeholders = ', '.join(['%s'] * len(cart_ids))
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {qn(CartItem._meta.db_table)} WHERE cart_id IN ({placeholders})', cart_ids)
+            items = cursor.rowcount
+            cursor.execute(
+                f'DELETE FROM {qn(Cart._meta.db_table)} WHERE id IN ({placeholders})', cart_ids)
+            carts = cursor.rowcount
+        return carts, items
+
+
 class Cart(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # indexed for store.tasks.purge_abandoned_carts
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    objects = CartQuerySet.as_manager()
 
     def __str__(self):
         return str(self.id)
 
 
+class CartItemQuerySet(models.QuerySet):
+    def add_quantity(self, cart_id, product_id, quantity):
+        """
+        Adds `quantity` of a product to a cart in one atomic upsert
+        (INSERT ... ON CONFLICT/ON DUPLICATE KEY UPDATE quantity = quantity + n).
+        The insert selects from the cart and product tables, so nothing is
+        inserted (and None is returned) when one of them doesn't exist.
+        """
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        item_table = qn(CartItem._meta.db_table)
+        cart_table = qn(Cart._meta.db_table)
+        product_table = qn(Product._meta.db_table)
+        cart_id = CartItem._meta.get_field('cart').get_db_prep_value(cart_id, connection)
+
+        insert = f"""
+            INSERT INTO {item_table} (cart_id, product_id, quantity)
+            SELECT c.id, p.id, %s FROM {cart_table} c, {product_table} p
+            WHERE c.id = %s AND p.id = %s
+        """
+        params = [quantity, cart_id, product_id]
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'mysql':
+                # LAST_INSERT_ID(id) makes lastrowid point at the updated row too
+                cursor.execute(insert + f"""
+                    ON DUPLICATE KEY UPDATE
+                    {item_table}.id = LAST_INSERT_ID({item_table}.id),
+                    {item_table}.quantity = {item_table}.quantity + VALUES(quantity)
+                """, params)
+                if not cursor.rowcount:
+                    return None
+                return self.only('id', 'cart_id', 'product_id', 'quantity') \
+                    .get(pk=cursor.lastrowid)
+
+            cursor.execute(insert + f"""
+                ON CONFLICT (cart_id, product_id) DO UPDATE
+                SET quantity = {item_table}.quantity + excluded.quantity
+                RETURNING id, quantity
+            """, params)
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return self.model(
+                id=row[0], cart_id=cart_id, product_id=product_id, quantity=row[1])
+
+
 class CartItem(models.Model):
     cart = models.ForeignKey(
         Cart, on_delete=models.CASCADE, related_name='items')
@@ -175,7 +483,37 @@ class CartItem(models.Model):
         Product, on_delete=models.CASCADE)
     quantity = models.PositiveSmallIntegerField()
 
-    # for no duplicated products we use unique_together on Meta class
+    objects = CartItemQuerySet.as_manager()
+
+    # for no duplicated products we use unique_together on Meta class,
+    # it is also the conflict target of CartItem.objects.add_quantity()
+
+    class Meta:
+        unique_together = [['cart', 'product']]
+
+
+class OutboxEvent(models.Model):
+    """
+    An event written in the same transaction as the change it is about,
+    store.tasks.relay_outbox sends it to the signal handlers afterwards
+    (look at store/outbox.py).
+    """
+    ORDER_CREATED = 'order_created'
+    TOPIC_CHOICES = [
+        (ORDER_CREATED, 'Order created'),
+    ]
+    topic = models.CharField(max_length=50, choices=TOPIC_CHOICES)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
 
-    # class Meta:
-    #     unique_together = [['cart', 'product'], []]
+    def __str__(self):
+        return f'{self.topic} #{self.id}'
+
+    class Meta:
+        # the relay reads pending events (processed_at IS NULL) in id order
+        indexes = [
+            models.Index(fields=['processed_at', 'id']),
+        ]
@@ -0,0 +1,121 @@
+"""
+Transactional outbox for the store signals.
+
+publish() writes an OutboxEvent in the caller's transaction, so the event
+exists if and only if the order (or whatever it is about) was committed.
+After the commit a background thread asks celery to run
+store.tasks.relay_outbox (the request doesn't wait on the broker), which sends
+the signal (order_created ...) to its handlers (email, analytics, inventory
+sync ...) outside of the request. The beat schedule runs the relay too, so
+events also go out when the broker was down or a worker died mid-batch.
+
+Delivery is at least once: a failed event is retried and every handler gets
+it again, so handlers have to be idempotent.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Order, OutboxEvent
+from .signals import order_created
+
+logger = logging.getLogger(__name__)
+
+
+def _load_orders(payloads):
+    order_ids = [payload['order_id'] for payload in payloads]
+    return Order.objects \
+        .select_related('customer__user') \
+        .prefetch_related('items__product') \
+        .in_bulk(order_ids)
+
+
+# topic -> (signal, argument name, payload key, loader), the loader fetches the
+# objects of a whole batch at once by id and the signal is sent with each of them
+TOPICS = {
+    OutboxEvent.ORDER_CREATED: (order_created, 'order', 'order_id', _load_orders),
+}
+
+
+def publish(topic, **payload):
+    event = OutboxEvent.objects.create(topic=topic, payload=payload)
+    transaction.on_commit(_kick)
+    return event
+
+
+# one thread sends the kicks, a kick already waiting for it relays the new events too
+_kicker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='outbox-kick')
+_kick_queued = threading.Event()
+
+
+def _kick():
+    # checkout must not wait on (or fail because of) the broker
+    if _kick_queued.is_set():
+        return
+    _kick_queued.set()
+    _kicker.submit(_send_kick)
+
+
+def _send_kick():
+    from .tasks import relay_outbox
+
+    # cleared first, events committed while we are sending get their own kick
+    _kick_queued.clear()
+    # if this doesn't go through the beat schedule picks the event up
+    try:
+        relay_outbox.apply_async(retry=False)
+    except Exception:
+        logger.warning('could not queue relay_outbox', exc_info=True)
+
+
+def relay_batch(batch_size):
+    """
+    Sends one batch of pending events in id order and returns how many were
+    handled. The rows stay locked until the batch is committed, with
+    SKIP LOCKED concurrent relays take the next events instead of waiting.
+    """
+    max_attempts = settings.OUTBOX_MAX_ATTEMPTS
+    with transaction.atomic():
+        events = list(OutboxEvent.objects
+                      .select_for_update(skip_locked=True)
+                      .filter(processed_at__isnull=True, attempts__lt=max_attempts)
+                      .order_by('id')[:batch_size])
+        if not events:
+            return 0
+
+        objects = {}
+        for topic in {event.topic for event in events}:
+            _, _, key, loader = TOPICS[topic]
+            objects[topic] = loader([
+                event.payload for event in events if event.topic == topic])
+
+        now = timezone.now()
+        for event in events:
+            signal, name, key, _ = TOPICS[event.topic]
+            event.attempts += 1
+            instance = objects[event.topic].get(event.payload[key])
+            if instance is None:
+                # the object was deleted since, there is nobody to tell
+                event.processed_at = now
+                event.last_error = f'{key} {event.payload[key]} not found'
+                continue
+
+            errors = [
+                f'{receiver.__module__}.{receiver.__qualname__}: {response!r}'
+                for receiver, response in signal.send_robust(sender=OutboxEvent, **{name: instance})
+                if isinstance(response, Exception)
+            ]
+            if errors:
+                event.last_error = '\n'.join(errors)
+                logger.warning('outbox event %s failed (attempt %s): %s',
+                               event.id, event.attempts, event.last_error)
+            else:
+                event.processed_at = now
+                event.last_error = ''
+
+        OutboxEvent.objects.bulk_update(
+            events, ['processed_at', 'attempts', 'last_error'])
+    return len(events)
@@ -1,4 +1,17 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 # because we remove this line below from the Setting of REST_FRAMEWORK we got a warning
 # ? 'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
@@ -7,3 +20,222 @@ from rest_framework.pagination import PageNumberPagination
 
 class DefaultPagination(PageNumberPagination):
     page_size = 10
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset (seek) pagination: every page is `WHERE (ordering) > (last row) LIMIT n`,
+    so page N costs the same as page 1 and we never run COUNT(*) unless asked.
+
+    The ordering comes from the queryset (OrderingFilter, search ranking or
+    Model.Meta.ordering) and the primary key is always appended as tie-breaker,
+    eg (last_update, id) for products.
+    """
+    page_size = 10
+    ordering = ('-pk',)
+    invalid_cursor_message = 'Invalid cursor'
+
+    # ?count=estimate adds an approximate total taken from the query planner
+    count_query_param = 'count'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.count = None
+        if request.query_params.get(self.count_query_param) == 'estimate':
+            self.count = self.get_estimated_count(queryset)
+
+        self.cursor = self.decode_cursor(request, queryset)
+        if self.cursor is None:
+            reverse, current_position = False, None
+        else:
+            reverse, current_position = self.cursor
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if current_position is not None:
+            queryset = queryset.filter(
+                self._keyset_filter(ordering, current_position))
+
+        # we fetch one extra row to know if there is a page after this one
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_following_position = len(results) > len(self.page)
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = current_position is not None
+            self.has_previous = has_following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None
+
+        if self.page:
+            self.next_position = self._get_position_from_instance(
+                self.page[-1], self.ordering)
+            self.previous_position = self._get_position_from_instance(
+                self.page[0], self.ordering)
+        else:
+            self.next_position = self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        ordering = [
+            field for field in queryset.query.order_by if isinstance(field, str)
+        ] or list(queryset.model._meta.ordering) or list(self.ordering)
+
+        pk_name = queryset.model._meta.pk.name
+        ordering = [
+            ('-' if field.startswith('-') else '') + pk_name
+            if field.lstrip('-') == 'pk' else field
+            for field in ordering
+        ]
+        names = [field.lstrip('-') for field in ordering]
+        if pk_name not in names:
+            direction = '-' if ordering[0].startswith('-') else ''
+            ordering.append(direction + pk_name)
+        return tuple(ordering)
+
+    def get_estimated_count(self, queryset):
+        """
+        Ask the planner how many rows the filtered queryset has instead of
+        running COUNT(*). Returns None when the database can't tell us.
+        """
+        connection = connections[queryset.db]
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            if connection.vendor == 'mysql':
+                cursor.execute(f'EXPLAIN {sql}', params)
+                columns = [column[0] for column in cursor.description]
+                row = cursor.fetchone()
+                return int(row[columns.index('rows')] or 0) if row else 0
+            if connection.vendor == 'postgresql':
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]['Plan']['Plan Rows'])
+        return None
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor((False, self.next_position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor((True, self.previous_position))
+
+    def decode_cursor(self, request, queryset=None):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            reverse, values = bool(payload['r']), payload['p']
+            if len(values) != len(self.ordering):
+                raise ValueError
+            position = tuple(
+                self._to_python(queryset, field.lstrip('-'), value)
+                for field, value in zip(self.ordering, values)
+            )
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return reverse, position
+
+    def encode_cursor(self, cursor):
+        reverse, position = cursor
+        payload = json.dumps(
+            {'r': int(reverse), 'p': [_to_json(value) for value in position]},
+            separators=(',', ':')
+        )
+        encoded = urlsafe_b64encode(payload.encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _get_position_from_instance(self, instance, ordering):
+        # values() querysets give us dicts, model querysets give us instances
+        if isinstance(instance, dict):
+            return tuple(instance[field.lstrip('-')] for field in ordering)
+        return tuple(getattr(instance, field.lstrip('-')) for field in ordering)
+
+    def _keyset_filter(self, ordering, position):
+        # (a, b, c) > (x, y, z) becomes
+        # a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+        condition = Q()
+        for index, field in enumerate(ordering):
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            branch = {
+                previous.lstrip('-'): value
+                for previous, value in zip(ordering[:index], position)
+            }
+            branch[f'{field.lstrip("-")}__{lookup}'] = position[index]
+            condition |= Q(**branch)
+        return condition
+
+    def _to_python(self, queryset, name, value):
+        if value is None or queryset is None:
+            return value
+        try:
+            field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            annotation = queryset.query.annotations.get(name)
+            if annotation is None:
+                raise ValueError(name)
+            field = annotation.output_field
+        return field.to_python(value)
+
+    def get_paginated_response(self, data):
+        content = [
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]
+        if self.count is not None:
+            content.insert(0, ('count', self.count))
+        return Response(OrderedDict(content))
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count'] = {
+            'type': 'integer',
+            'nullable': True,
+            'description': 'Only present with ?count=estimate.',
+        }
+        return response_schema
+
+
+class OrderPagination(KeysetPagination):
+    """
+    Orders are always listed newest first, whatever the query string says,
+    so every page is an index range scan on (customer_id, placed_at) or placed_at.
+    """
+    page_size = 20
+
+    def get_ordering(self, request, queryset, view):
+        return ('-placed_at', '-id')
+
+
+def _reverse_ordering(ordering):
+    return tuple(
+        field[1:] if field.startswith('-') else '-' + field
+        for field in ordering
+    )
+
+
+def _to_json(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
@@ -0,0 +1,300 @@
+"""
+Search engines behind ProductViewSet's ?search= parameter.
+
+Every engine takes the (already filtered) product queryset and the search
+terms, and returns the queryset restricted to the matches and annotated with
+`search_rank`. The engine is picked with the PRODUCT_SEARCH_ENGINE setting,
+by default the FULLTEXT index on MySQL and the in-process index elsewhere.
+One-character tokens aren't indexed, ProductSearchFilter matches the terms
+made only of those with icontains.
+"""
+import math
+import operator
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from functools import reduce
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Case, When, Value, FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from rest_framework.filters import SearchFilter
+
+from .models import Product
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall(text.lower()) if len(token) > 1]
+
+
+class SearchEngine:
+    def search(self, queryset, terms):
+        raise NotImplementedError
+
+    def index(self, product):
+        pass
+
+    def remove(self, product_id):
+        pass
+
+    def rebuild(self):
+        """Returns the number of indexed products."""
+        raise NotImplementedError
+
+
+class MySQLFullTextSearchEngine(SearchEngine):
+    """
+    Uses the FULLTEXT index on (title, description) added in migration 0004,
+    MySQL keeps it up to date by itself so index() and remove() do nothing.
+
+    The query runs in boolean mode as +term* for every token, so like the
+    inverted index every term has to match and terms match by prefix
+    (natural language mode would OR them). MySQL still skips its stopwords
+    and the tokens shorter than innodb_ft_min_token_size, the ranking differs too.
+    """
+    match = 'MATCH (store_product.title, store_product.description) AGAINST (%s IN BOOLEAN MODE)'
+
+    def search(self, queryset, terms):
+        tokens = {token for term in terms for token in tokenize(term)}
+        if not tokens:
+            return queryset.none()
+        query = ' '.join(f'+{token}*' for token in sorted(tokens))
+        rank = RawSQL(self.match, [query], output_field=FloatField())
+        return queryset \
+            .annotate(search_rank=rank) \
+            .filter(search_rank__gt=0) \
+            .order_by('-search_rank')
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute('OPTIMIZE TABLE store_product')
+        return Product.objects.count()
+
+
+class InvertedIndexSearchEngine(SearchEngine):
+    """
+    In-process inverted index (token -> {product_id: weight}) ranked by tf-idf,
+    title tokens weigh more than description tokens. Terms match tokens by
+    prefix so 'choc' finds 'chocolate' like icontains used to.
+
+    Every web process keeps its own copy. Changes are published in the cache
+    as a version number plus the id of the product that changed, so other
+    processes re-index only those products, or rebuild everything when they
+    fell too far behind.
+
+    The first search of every process loads the whole product table: the
+    title and description tokens of every product stay in the memory of each
+    worker, count on a few times the size of that text per process. Catalogs
+    that don't fit go on MySQLFullTextSearchEngine.
+    """
+    title_weight = 3
+    version_key = 'search:index:version'
+    change_key = 'search:index:change:{}'
+    change_timeout = 60 * 60 * 24
+    max_replay = 1000
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.version = None
+        self.postings = defaultdict(dict)
+        self.documents = {}
+        self.vocabulary = []
+        self.vocabulary_dirty = False
+
+    def search(self, queryset, terms):
+        scores = self.rank(terms)
+        max_results = getattr(settings, 'PRODUCT_SEARCH_MAX_RESULTS', 1000)
+        if len(scores) > max_results and queryset.query.where:
+            # here we cut to the top N after the filters, the top N of the whole
+            # index could all be in other collections and the filtered list empty
+            candidates = queryset.order_by().values_list('pk', flat=True)
+            scores = {product_id: scores[product_id]
+                      for product_id in candidates.iterator(chunk_size=2000)
+                      if product_id in scores}
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:max_results]
+        if not best:
+            return queryset.none()
+
+        rank = Case(
+            *[When(pk=product_id, then=Value(score)) for product_id, score in best],
+            default=Value(0.0),
+            output_field=FloatField()
+        )
+        return queryset \
+            .filter(pk__in=[product_id for product_id, _ in best]) \
+            .annotate(search_rank=rank) \
+            .order_by('-search_rank')
+
+    def rank(self, terms):
+        self.sync()
+        with self.lock:
+            if self.vocabulary_dirty:
+                self.vocabulary = sorted(self.postings)
+                self.vocabulary_dirty = False
+            total = len(self.documents) or 1
+            scores = None
+            for term in {token for term in terms for token in tokenize(term)}:
+                term_scores = defaultdict(float)
+                for token in self._expand(term):
+                    postings = self.postings.get(token)
+                    if not postings:
+                        continue
+                    idf = math.log(1 + total / len(postings))
+                    for product_id, weight in postings.items():
+                        term_scores[product_id] += weight * idf
+                # every term has to match, like SearchFilter does
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {
+                        product_id: score + term_scores[product_id]
+                        for product_id, score in scores.items()
+                        if product_id in term_scores
+                    }
+                if not scores:
+                    return {}
+            return scores or {}
+
+    def _expand(self, term):
+        tokens = []
+        position = bisect_left(self.vocabulary, term)
+        while position < len(self.vocabulary) and self.vocabulary[position].startswith(term):
+            tokens.append(self.vocabulary[position])
+            position += 1
+        return tokens
+
+    def _add(self, product_id, title, description):
+        weights = defaultdict(int)
+        for token in tokenize(title):
+            weights[token] += self.title_weight
+        for token in tokenize(description):
+            weights[token] += 1
+        for token, weight in weights.items():
+            if token not in self.postings:
+                self.vocabulary_dirty = True
+            self.postings[token][product_id] = weight
+        self.documents[product_id] = set(weights)
+
+    def _discard(self, product_id):
+        for token in self.documents.pop(product_id, ()):
+            postings = self.postings[token]
+            postings.pop(product_id, None)
+            if not postings:
+                del self.postings[token]
+                self.vocabulary_dirty = True
+
+    def _load(self, queryset):
+        for product_id, title, description in queryset \
+                .values_list('id', 'title', 'description') \
+                .iterator(chunk_size=2000):
+            self._discard(product_id)
+            self._add(product_id, title, description)
+
+    def _build(self, version):
+        self.postings = defaultdict(dict)
+        self.documents = {}
+        self._load(Product.objects.all())
+        self.vocabulary_dirty = True
+        self.version = version
+
+    def sync(self):
+        version = cache.get(self.version_key)
+        if version is None:
+            self._reset_version()
+            version = cache.get(self.version_key)
+        with self.lock:
+            if self.version == version:
+                return
+            if self.version is None or not 0 < version - self.version <= self.max_replay:
+                return self._build(version)
+
+            keys = [self.change_key.format(number) for number in range(self.version + 1, version + 1)]
+            changes = cache.get_many(keys)
+            if len(changes) != len(keys):
+                return self._build(version)
+
+            product_ids = set(changes.values())
+            for product_id in product_ids:
+                self._discard(product_id)
+            self._load(Product.objects.filter(pk__in=product_ids))
+            self.version = version
+
+    def _reset_version(self):
+        # a timestamp, so an evicted version never comes back with an old value
+        cache.add(self.version_key, int(time.time() * 1000), timeout=None)
+
+    def _publish(self, product_id):
+        try:
+            version = cache.incr(self.version_key)
+        except ValueError:
+            # nobody has built an index yet, the next search will
+            return
+        cache.set(self.change_key.format(version), product_id, self.change_timeout)
+        with self.lock:
+            # only skip the replay if we were up to date before this change
+            if self.version == version - 1:
+                self.version = version
+                return True
+        return False
+
+    def index(self, product):
+        if self._publish(product.pk):
+            with self.lock:
+                self._discard(product.pk)
+                self._add(product.pk, product.title, product.description)
+
+    def remove(self, product_id):
+        if self._publish(product_id):
+            with self.lock:
+                self._discard(product_id)
+
+    def rebuild(self):
+        try:
+            version = cache.incr(self.version_key)
+        except ValueError:
+            self._reset_version()
+            version = cache.get(self.version_key)
+        # without change records every other process rebuilds on its next search
+        with self.lock:
+            self._build(version)
+            return len(self.documents)
+
+
+_engine = None
+
+
+def get_search_engine():
+    global _engine
+    if _engine is None:
+        engine_path = getattr(settings, 'PRODUCT_SEARCH_ENGINE', None)
+        if engine_path is None:
+            # MySQL has the FULLTEXT index of migration 0004, elsewhere the index is built in process
+            engine_path = 'store.search.MySQLFullTextSearchEngine' if connection.vendor == 'mysql' \
+                else 'store.search.InvertedIndexSearchEngine'
+        _engine = import_string(engine_path)()
+    return _engine
+
+
+class ProductSearchFilter(SearchFilter):
+    """Same ?search= parameter as SearchFilter, answered by the search engine."""
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        # the engines have nothing for 'a' or '5', those terms are filtered like SearchFilter does
+        for term in [term for term in terms if not tokenize(term)]:
+            queryset = queryset.filter(reduce(operator.or_, [
+                Q(**{f'{field}__icontains': term}) for field in self.get_search_fields(view, request)
+            ]))
+        terms = [term for term in terms if tokenize(term)]
+        if not terms:
+            return queryset
+        return get_search_engine().search(queryset, terms)
@@ -0,0 +1,181 @@
+"""
+Streaming loader for .sql seed files (`python manage.py seed_db`).
+
+The file is read line by line and split into single statements (quotes and
+comments are respected), so nothing depends on the driver running several
+statements in one execute() and memory doesn't grow with the file. The
+statements are committed in batches and after every batch a checkpoint
+records how many are done, an interrupted load continues from there with
+--resume.
+
+Raw inserts don't send signals, so once the file is loaded the collection
+counters are recounted, the catalog cache is invalidated and the search
+index is rebuilt.
+"""
+import json
+import os
+import re
+import time
+from django.db import connection, transaction
+
+from .caching import invalidate_catalog
+from .models import Collection
+from .search import get_search_engine
+
+# the characters that can start or end a string, a comment or a statement
+_SPECIAL = re.compile(r"['\"`;\\/*#-]")
+
+
+def split_statements(lines, mysql=False):
+    """
+    Yields the statements (without the trailing ;) of an iterable of sql lines.
+    mysql: \\ escapes the next character in strings and # starts a comment, like MySQL does.
+    """
+    buffer = []
+    quote = None
+    block_comment = False
+    for line in lines:
+        position = 0
+        end = len(line)
+        while position < end:
+            if block_comment:
+                close = line.find('*/', position)
+                if close == -1:
+                    position = end
+                else:
+                    block_comment = False
+                    position = close + 2
+                continue
+
+            match = _SPECIAL.search(line, position)
+            if match is None:
+                buffer.append(line[position:])
+                break
+            start = match.start()
+            char = line[start]
+            buffer.append(line[position:start])
+            position = start + 1
+
+            if quote:
+                buffer.append(char)
+                if char == '\\' and mysql and position < end:
+                    buffer.append(line[position])
+                    position += 1
+                elif char == quote:
+                    # '' inside a string closes and opens it again, same result
+                    quote = None
+            elif char in '\'"`':
+                quote = char
+                buffer.append(char)
+            elif char == ';':
+                statement = ''.join(buffer).strip()
+                if statement:
+                    yield statement
+                buffer = []
+            elif line.startswith('--', start) or (char == '#' and mysql):
+                buffer.append('\n')
+                break
+            elif line.startswith('/*', start):
+                block_comment = True
+                position = start + 2
+            else:
+                buffer.append(char)
+
+    statement = ''.join(buffer).strip()
+    if statement:
+        yield statement
+
+
+class Checkpoint:
+    """How many statements of a file were committed, kept in a small json file."""
+
+    def __init__(self, path, source):
+        self.path = path
+        stat = os.stat(source)
+        self.source = {'file': os.path.abspath(source), 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    def load(self):
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return 0
+        # a changed file starts over
+        if data.get('source') != self.source:
+            return 0
+        return data.get('statements', 0)
+
+    def save(self, statements):
+        temporary = f'{self.path}.tmp'
+        with open(temporary, 'w') as file:
+            json.dump({'source': self.source, 'statements': statements}, file)
+        os.replace(temporary, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class SeedLoader:
+    def __init__(self, path, batch_size=100, checkpoint_path=None, progress=None):
+        self.path = path
+        self.batch_size = batch_size
+        self.checkpoint = Checkpoint(checkpoint_path, path) if checkpoint_path else None
+        self.progress = progress or (lambda **status: None)
+        self.size = os.path.getsize(path)
+        self.bytes_read = 0
+
+    def _lines(self, file):
+        for line in file:
+            self.bytes_read += len(line.encode())
+            yield line
+
+    def load(self, resume=False):
+        """Returns (statements executed, statements skipped because a previous run did them)."""
+        skip = self.checkpoint.load() if self.checkpoint and resume else 0
+        self.done = 0
+        self.executed = 0
+        self.started = time.monotonic()
+
+        with open(self.path, encoding='utf-8') as file:
+            batch = []
+            for statement in split_statements(
+                    self._lines(file), mysql=connection.vendor == 'mysql'):
+                if self.done < skip:
+                    self.done += 1
+                    continue
+                batch.append(statement)
+                if len(batch) >= self.batch_size:
+                    self._execute(batch)
+                    batch = []
+            if batch:
+                self._execute(batch)
+
+        self.finish()
+        if self.checkpoint:
+            self.checkpoint.clear()
+        return self.executed, skip
+
+    def _execute(self, batch):
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for statement in batch:
+                    cursor.execute(statement)
+        self.done += len(batch)
+        self.executed += len(batch)
+        if self.checkpoint:
+            self.checkpoint.save(self.done)
+
+        elapsed = time.monotonic() - self.started
+        self.progress(
+            statements=self.done,
+            percent=100 * self.bytes_read / self.size if self.size else 100,
+            rate=self.executed / elapsed if elapsed else 0,
+        )
+
+    def finish(self):
+        Collection.objects.reconcile_products_count()
+        invalidate_catalog()
+        get_search_engine().rebuild()
@@ -1,7 +1,13 @@
-from decimal import Decimal
+from collections import Counter
+from django.conf import settings
 from django.db import transaction
 from rest_framework import serializers
-from .models import Product, Collection, Review, Cart, CartItem, Customer, Order, OrderItem, ProductImage
+from rest_framework.exceptions import NotFound
+from .caching import invalidate
+from .carts import get_cart_store
+from .outbox import publish
+from .sparsefields import SparseFieldsSerializerMixin
+from .models import Product, Collection, Review, Cart, CartItem, Customer, Order, OrderItem, OutboxEvent, ProductImage, TAX_RATE
 # from django.db.models import Count
 
 
@@ -26,24 +32,39 @@ class CreateOrderSerializer(serializers.Serializer):
     cart_id = serializers.UUIDField()
 
     def validate_cart_id(self, cart_id):
-        if not Cart.objects.filter(pk=cart_id).exists():
-            raise serializers.ValidationError(
-                'No cart with given id was found')
-        if CartItem.objects.filter(cart_id=cart_id).count() == 0:
+        cart_store = get_cart_store()
+        # save() reuses these items, the cart is only read once per checkout
+        self.cart_items = cart_store.get_items(cart_id)
+        if not self.cart_items:
+            # only the error path needs to know which of the two it is
+            if not cart_store.exists(cart_id):
+                raise serializers.ValidationError(
+                    'No cart with given id was found')
             raise serializers.ValidationError('The cart is empty')
         return cart_id
 
     def save(self, **kwargs):
         with transaction.atomic():
             cart_id = self.validated_data['cart_id']
-            customer = Customer.objects.get(
-                user_id=self.context.get('user_id'))
-            order = Order.objects.create(customer=customer)
-            cart_items = CartItem.objects \
-                .select_related('product') \
-                .filter(
-                    cart_id=cart_id
-                )
+            cart_store = get_cart_store()
+            # database or redis cart, this is the moment it becomes rows
+            cart_items = self.cart_items
+
+            # take the items out of the inventory first, nothing is written if one is short
+            quantities = Counter()
+            for item in cart_items:
+                quantities[item.product_id] += item.quantity
+            shortages = Product.objects.reserve_inventory(quantities)
+            if shortages:
+                # one error per line item, keyed by product id
+                raise serializers.ValidationError({'items': {
+                    product_id: [f'Only {available} left in stock, {quantities[product_id]} requested']
+                    for product_id, available in sorted(shortages.items())
+                }})
+            invalidate('products', *[f'product:{product_id}' for product_id in quantities])
+
+            # resolved by the view (look at store.customers), no query here
+            order = Order.objects.create(customer_id=self.context['customer_id'])
             # we use here list comprehension check docs if you dont understand it
             order_items = [
                 OrderItem(
@@ -54,9 +75,22 @@ class CreateOrderSerializer(serializers.Serializer):
                 ) for item in cart_items
             ]
             OrderItem.objects.bulk_create(order_items)
-
-            Cart.objects.filter(pk=cart_id).delete()
-
+            if order_items and order_items[0].pk is None:
+                # MySQL doesn't return the ids of a bulk insert, a cart has
+                # one line per product so we can match them on product_id
+                ids = dict(OrderItem.objects
+                           .filter(order=order)
+                           .values_list('product_id', 'id'))
+                for order_item in order_items:
+                    order_item.pk = ids[order_item.product_id]
+
+            cart_store.checked_out(cart_id)
+            # handlers run in celery once this commits (look at store.outbox)
+            publish(OutboxEvent.ORDER_CREATED, order_id=order.id)
+
+            # OrderSerializer reads order.items.all(), we already have them
+            # (with their products) so the response needs no extra query
+            order._prefetched_objects_cache = {'items': order_items}
             return order
 
 
@@ -109,13 +143,39 @@ class CollectionSerializer(serializers.ModelSerializer):
 #     title = serializers.CharField(max_length=255)
 
 
-class ProductSerializer(serializers.ModelSerializer):
+class AnnotationField(serializers.Field):
+    """Read-only value of a queryset annotation, left out when the instance wasn't annotated."""
+
+    def __init__(self, field, **kwargs):
+        self.field = field
+        super().__init__(read_only=True, **kwargs)
+
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        self.field.bind(field_name, parent)
+
+    def get_attribute(self, instance):
+        if not hasattr(instance, self.source):
+            raise serializers.SkipField()
+        return super().get_attribute(instance)
+
+    def to_representation(self, value):
+        return self.field.to_representation(value)
+
+
+class ProductSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     images = ProductImageSerializer(many=True, read_only=True)
+    # annotated by Product.objects.with_effective_price()
+    discount = AnnotationField(serializers.FloatField())
+    effective_price = AnnotationField(serializers.DecimalField(max_digits=8, decimal_places=2))
+    # ?fields= / ?omit= (look at store.sparsefields)
+    sparse_field_sources = {'price_with_tax': ['unit_price']}
 
     class Meta:
         model = Product
         fields = [
-            'id', 'title', 'slug', 'inventory', 'unit_price', 'description', 'price_with_tax', 'collection', 'images'
+            'id', 'title', 'slug', 'inventory', 'unit_price', 'description', 'price_with_tax',
+            'discount', 'effective_price', 'collection', 'images'
         ]
 
     # collection = CollectionSerializer()
@@ -126,7 +186,7 @@ class ProductSerializer(serializers.ModelSerializer):
 
     def calculate_tax(self, product):
 
-        return product.unit_price * Decimal(1.1)
+        return product.unit_price * TAX_RATE
 
     def create(self, validated_data):
         product = Product(**validated_data)
@@ -140,6 +200,35 @@ class ProductSerializer(serializers.ModelSerializer):
     #     return instance
 
 
+class StockChangeSerializer(serializers.Serializer):
+    """One entry of PATCH /store/products/stock/ (look at ProductQuerySet.apply_stock_changes)"""
+    id = serializers.IntegerField()
+    inventory = serializers.IntegerField(min_value=0, required=False)
+    inventory_delta = serializers.IntegerField(required=False)
+    unit_price = serializers.DecimalField(max_digits=6, decimal_places=2, min_value=1, required=False)
+
+    def validate(self, attrs):
+        if 'inventory' in attrs and 'inventory_delta' in attrs:
+            raise serializers.ValidationError('Give either inventory or inventory_delta, not both')
+        if not {'inventory', 'inventory_delta', 'unit_price'} & set(attrs):
+            raise serializers.ValidationError('Nothing to change, give inventory, inventory_delta or unit_price')
+        return attrs
+
+
+class StockChangeListSerializer(serializers.Serializer):
+    changes = StockChangeSerializer(many=True, allow_empty=False)
+
+    def validate_changes(self, changes):
+        ids = Counter(change['id'] for change in changes)
+        repeated = sorted(pk for pk, count in ids.items() if count > 1)
+        if repeated:
+            raise serializers.ValidationError(f'Products can only appear once per batch: {repeated}')
+        max_changes = settings.PRODUCT_STOCK_MAX_CHANGES
+        if len(changes) > max_changes:
+            raise serializers.ValidationError(f'At most {max_changes} changes per batch')
+        return changes
+
+
 # here we need to get items of specific cart
 class CartItemSerializer(serializers.ModelSerializer):
     product = SimpleProductSerializer()
@@ -169,30 +258,24 @@ class UpdateCartItemSerializer(serializers.ModelSerializer):
 class AddCartItemSerializer(serializers.ModelSerializer):
     product_id = serializers.IntegerField()
 
-    # validate_(field) in our case is product_id
-    def validate_product_id(self, value):
-        if not Product.objects.filter(id=value).exists():
-            raise serializers.ValidationError(
-                'No Product with given product_id was found')
-        return value
-
+    # there is no validate_product_id anymore, the upsert below only inserts
+    # when the product exists so we don't need an extra exists() query
     def save(self, **kwargs):
         cart_id = self.context['cart_id']
         product_id = self.validated_data['product_id']
         quantity = self.validated_data['quantity']
 
-        try:
-            # updating an existing item
-            cart_item = CartItem.objects.get(
-                cart_id=cart_id, product_id=product_id)
-            cart_item.quantity += quantity
-            cart_item.save()
-
-            self.instance = cart_item
-        except CartItem.DoesNotExist:
-            # creating a new item
-            self.instance = CartItem.objects.create(
-                cart_id=cart_id, **self.validated_data)
+        # database carts: one statement that creates the item or adds to the quantity
+        # of the existing one, redis carts: one HINCRBY (look at store.carts)
+        self.instance = get_cart_store().add_item(
+            cart_id, product_id, quantity)
+
+        if self.instance is None:
+            # we only pay for these queries when something is wrong
+            if not Product.objects.filter(id=product_id).exists():
+                raise serializers.ValidationError(
+                    {'product_id': ['No Product with given product_id was found']})
+            raise NotFound('No cart with given id was found')
 
         return self.instance
 
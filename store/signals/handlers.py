@@ -1,8 +1,13 @@
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db import models, transaction
+from django.db.models.functions import Now
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
 from django.dispatch import receiver
 
-from ..models import Customer
+from ..caching import invalidate
+from ..customers import customer_created, customer_deleted
+from ..search import get_search_engine
+from ..models import Customer, Product, ProductImage, Collection, Promotion
 
 
 # here we wanna tell django execute function when user is save
@@ -10,10 +15,110 @@ from ..models import Customer
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_customer_for_new_user(sender, **kwargs):
     if kwargs['created']:
-        Customer.objects.create(user=kwargs['instance'])
+        customer = Customer.objects.create(user=kwargs['instance'])
+        # the user -> customer mapping every authenticated request needs (look at store.customers)
+        transaction.on_commit(lambda: customer_created(customer))
+
+
+@receiver(post_delete, sender=Customer)
+def forget_customer(sender, instance, **kwargs):
+    transaction.on_commit(lambda: customer_deleted(instance))
 
 
 """
 #! This code above  is not called directly we need to override function (ready) in apps model apps.py
 then  we import  `store.signals` , it will be called 
 """
+
+
+# Collection.products_count, bulk paths are handled in ProductQuerySet
+
+@receiver(pre_save, sender=Product)
+def remember_product_collection(sender, instance, **kwargs):
+    # products loaded with only()/defer() don't know which collection they were in
+    if instance.pk is not None and not hasattr(instance, '_loaded_collection_id'):
+        instance._loaded_collection_id = Product.objects \
+            .filter(pk=instance.pk) \
+            .values_list('collection_id', flat=True) \
+            .first()
+
+
+@receiver(post_save, sender=Product)
+def count_saved_product(sender, instance, created, **kwargs):
+    old_collection_id = None if created else getattr(instance, '_loaded_collection_id', None)
+    if old_collection_id != instance.collection_id:
+        Collection.objects.adjust_products_count(
+            {old_collection_id: -1, instance.collection_id: 1})
+    instance._loaded_collection_id = instance.collection_id
+
+
+@receiver(post_delete, sender=Product)
+def count_deleted_product(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, models.QuerySet):
+        # ProductQuerySet.delete() counted the whole queryset at once
+        return
+    collection_id = getattr(instance, '_loaded_collection_id', instance.collection_id)
+    Collection.objects.adjust_products_count({collection_id: -1})
+
+
+# catalog cache invalidation, look at store.caching for the namespaces
+
+@receiver([post_save, post_delete], sender=Product)
+def invalidate_product(sender, instance, **kwargs):
+    # collections are in there because of products_count
+    invalidate('products', f'product:{instance.pk}', 'collections')
+
+
+@receiver([post_save, post_delete], sender=ProductImage)
+def invalidate_product_image(sender, instance, **kwargs):
+    invalidate('products', f'product:{instance.product_id}')
+    # images are part of the product representation, its ETag has to change
+    Product.objects.filter(pk=instance.product_id).update(updated_at=Now())
+
+
+@receiver([post_save, post_delete], sender=Collection)
+def invalidate_collection(sender, instance, **kwargs):
+    invalidate('collections')
+
+
+@receiver([post_save, post_delete], sender=Promotion)
+def invalidate_promotion(sender, instance, **kwargs):
+    # a promotion can be attached to any number of products
+    invalidate('products', 'catalog')
+    if kwargs.get('created') is False:
+        Product.objects.filter(promotions=instance).update(updated_at=Now())
+
+
+@receiver(pre_delete, sender=Promotion)
+def touch_promotion_products(sender, instance, **kwargs):
+    # before the cascade removes the links
+    Product.objects.filter(promotions=instance).update(updated_at=Now())
+
+
+@receiver(m2m_changed, sender=Product.promotions.through)
+def invalidate_product_promotions(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        # afterwards we can't tell which products had the promotion
+        Product.objects.filter(promotions=instance).update(updated_at=Now())
+    if not action.startswith('post_'):
+        return
+    if reverse:
+        invalidate('products', 'catalog')
+        if pk_set:
+            Product.objects.filter(pk__in=pk_set).update(updated_at=Now())
+    else:
+        invalidate('products', f'product:{instance.pk}')
+        Product.objects.filter(pk=instance.pk).update(updated_at=Now())
+
+
+# keep the search index in sync, look at store.search
+
+@receiver(post_save, sender=Product)
+def index_product(sender, instance, **kwargs):
+    transaction.on_commit(lambda: get_search_engine().index(instance))
+
+
+@receiver(post_delete, sender=Product)
+def unindex_product(sender, instance, **kwargs):
+    product_id = instance.pk
+    transaction.on_commit(lambda: get_search_engine().remove(product_id))
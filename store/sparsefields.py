@@ -0,0 +1,100 @@
+"""
+Sparse fieldsets: ?fields=id,title,unit_price or ?omit=description,images
+on GET requests.
+
+SparseFieldsSerializerMixin drops the fields from the output and
+SparseFieldsViewMixin drops them from the SQL as well: the queryset only()
+loads the columns the remaining fields need and prefetches of relations
+that aren't requested (eg product images) are skipped.
+
+Fields computed from other columns (SerializerMethodField ...) say what they
+need in the serializer's `sparse_field_sources`, eg {'price_with_tax': ['unit_price']}.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.serializers import ListSerializer
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def _split(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def get_requested_fields(request, available):
+    """The field names to keep (in serializer order), None when all of them are wanted."""
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    fields = request.query_params.get(FIELDS_PARAM)
+    omit = request.query_params.get(OMIT_PARAM)
+    if not fields and not omit:
+        return None
+
+    selected = set(_split(fields)) if fields else set(available)
+    selected -= set(_split(omit or ''))
+    return [name for name in available if name in selected]
+
+
+class SparseFieldsSerializerMixin:
+    sparse_field_sources = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # only the serializer the view renders, not when it is nested in another one
+        top_level = self.parent is None or (
+            isinstance(self.parent, ListSerializer) and self.parent.parent is None)
+        if not top_level:
+            return fields
+        requested = get_requested_fields(self.context.get('request'), list(fields))
+        if requested is None:
+            return fields
+        return {name: fields[name] for name in requested}
+
+
+class SparseFieldsViewMixin:
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        available = serializer_class().fields
+        requested = get_requested_fields(self.request, list(available))
+        if requested is None:
+            return queryset
+        return self.trim_queryset(queryset, serializer_class, available, requested)
+
+    def trim_queryset(self, queryset, serializer_class, available, requested):
+        model = queryset.model
+        sources = getattr(serializer_class, 'sparse_field_sources', {})
+        # ordering can't be on a deferred column or every row is read again
+        ordering_fields = getattr(self, 'ordering_fields', None)
+        if not isinstance(ordering_fields, (list, tuple)):
+            ordering_fields = []
+        annotations = queryset.query.annotations
+        columns = {model._meta.pk.name, *ordering_fields, *model._meta.ordering}
+        relations = set()
+
+        for name in requested:
+            for source in sources.get(name) or [available[name].source]:
+                source = source.split('.')[0]
+                if source == '*' or source in annotations:
+                    continue
+                try:
+                    model_field = model._meta.get_field(source)
+                except FieldDoesNotExist:
+                    # a property or method of the model, we can't tell what it reads
+                    return queryset
+                if model_field.concrete:
+                    columns.add(source)
+                else:
+                    relations.add(source)
+
+        lookups = [
+            lookup for lookup in queryset._prefetch_related_lookups
+            if getattr(lookup, 'prefetch_to', lookup).split('__')[0] in relations
+        ]
+        # annotations are computed in the select, there's nothing to load for them
+        columns = {column.lstrip('-') for column in columns} - set(annotations)
+        return queryset \
+            .prefetch_related(None) \
+            .prefetch_related(*lookups) \
+            .only(*columns)
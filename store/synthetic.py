@@ -0,0 +1,232 @@
+"""
+Deterministic synthetic data (`python manage.py generate_data`): collections,
+products with images, users with their customers, orders with items, up
+to millions of rows for load tests and benchmarks.
+
+The rows are made in chunks of `chunk_size`. Every chunk has its own random
+generator seeded with (seed, table, chunk number) and its own primary keys
+(the current max id + the position of the row), so the same seed gives the
+same rows whatever the number of workers and the order the chunks run in.
+A chunk is one bulk_create per table in one transaction.
+
+Chunks run in worker processes: collections first, then products and
+customers, then orders, every stage waits for the previous one because of
+the foreign keys. SQLite has a single writer, so there it all runs in this
+process. The products skip the Collection.products_count updates, the
+counters are recounted once after their stage.
+"""
+import multiprocessing
+import random
+from datetime import timedelta
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.db.models import Max, QuerySet
+from django.utils import timezone
+
+from .caching import invalidate_catalog
+from .models import Collection, Customer, Order, OrderItem, Product, ProductImage
+from .search import get_search_engine
+
+WORDS = [
+    'organic', 'fresh', 'classic', 'premium', 'mini', 'family', 'spicy', 'sweet', 'green', 'red',
+    'golden', 'smoked', 'roasted', 'wild', 'dark', 'light', 'crispy', 'soft', 'large', 'small',
+    'coffee', 'tea', 'bread', 'cheese', 'apple', 'pepper', 'rice', 'pasta', 'honey', 'salt',
+    'soap', 'brush', 'candle', 'notebook', 'pencil', 'towel', 'basket', 'flower', 'toy', 'magazine',
+]
+FIRST_NAMES = ['Alex', 'Sam', 'Noor', 'Lina', 'Omar', 'Maya', 'Yuki', 'Ines', 'Karim', 'Eva']
+LAST_NAMES = ['Smith', 'Haddad', 'Garcia', 'Chen', 'Martin', 'Novak', 'Silva', 'Khan', 'Dubois', 'Rossi']
+
+# the plan being generated, the worker processes get it from _init_worker
+_plan = None
+
+
+def rng(plan, table, chunk):
+    return random.Random(f"{plan['seed']}:{table}:{chunk}")
+
+
+def unit_price(plan, product_id):
+    # a function of the id, order items copy it without reading the product
+    return Decimal(random.Random(f"{plan['seed']}:price:{product_id}").randint(100, 99999)) / 100
+
+
+def chunk_range(plan, table, chunk):
+    """(first id, last id + 1) of a chunk"""
+    start = plan['bases'][table] + 1 + chunk * plan['chunk_size']
+    stop = min(start + plan['chunk_size'], plan['bases'][table] + 1 + plan['counts'][table])
+    return start, stop
+
+
+def make_collections(plan, chunk):
+    rand = rng(plan, 'collections', chunk)
+    Collection.objects.bulk_create([
+        Collection(id=pk, title=f'{rand.choice(WORDS).title()} {pk}')
+        for pk in range(*chunk_range(plan, 'collections', chunk))
+    ])
+
+
+def make_products(plan, chunk):
+    rand = rng(plan, 'products', chunk)
+    first_collection = plan['bases']['collections'] + 1
+    products, images = [], []
+    for pk in range(*chunk_range(plan, 'products', chunk)):
+        title = ' '.join(rand.choice(WORDS) for _ in range(3)).title()
+        products.append(Product(
+            id=pk,
+            title=title,
+            slug=f"{title.lower().replace(' ', '-')}-{pk}",
+            description=' '.join(rand.choice(WORDS) for _ in range(rand.randint(8, 30))),
+            unit_price=unit_price(plan, pk),
+            inventory=rand.randint(0, 500),
+            collection_id=rand.randrange(first_collection, first_collection + plan['counts']['collections']),
+        ))
+        for number in range(rand.randint(0, plan['images_per_product'])):
+            images.append(ProductImage(product_id=pk, image=f'store/images/synthetic-{pk}-{number}.jpg'))
+    # a plain queryset: ProductQuerySet.bulk_create would update the counters of the
+    # collections, and parallel chunks updating the same collection rows deadlock
+    # on MySQL. generate() recounts them once the products are in.
+    QuerySet(Product).bulk_create(products)
+    ProductImage.objects.bulk_create(images)
+
+
+def make_customers(plan, chunk):
+    rand = rng(plan, 'customers', chunk)
+    User = get_user_model()
+    user_offset = plan['bases']['users'] - plan['bases']['customers']
+    users, customers = [], []
+    for pk in range(*chunk_range(plan, 'customers', chunk)):
+        user_id = pk + user_offset
+        users.append(User(
+            id=user_id,
+            username=f'user{user_id}',
+            email=f'user{user_id}@example.com',
+            first_name=rand.choice(FIRST_NAMES),
+            last_name=rand.choice(LAST_NAMES),
+            password=plan['password'],
+        ))
+        customers.append(Customer(
+            id=pk,
+            user_id=user_id,
+            phone=f'+1{rand.randint(2000000000, 9999999999)}',
+            membership=rand.choice('BBBSG'),
+        ))
+    # bulk_create sends no post_save, the customers are made here instead of by the signal
+    User.objects.bulk_create(users)
+    Customer.objects.bulk_create(customers)
+
+
+def make_orders(plan, chunk):
+    rand = rng(plan, 'orders', chunk)
+    first_customer = plan['bases']['customers'] + 1
+    first_product = plan['bases']['products'] + 1
+    start, stop = chunk_range(plan, 'orders', chunk)
+    orders, items = [], []
+    for pk in range(start, stop):
+        orders.append(Order(
+            id=pk,
+            customer_id=rand.randrange(first_customer, first_customer + plan['counts']['customers']),
+            payment_status=rand.choice('CCCCCCCPPF'),
+        ))
+        for _ in range(rand.randint(1, plan['items_per_order'])):
+            product_id = rand.randrange(first_product, first_product + plan['counts']['products'])
+            items.append(OrderItem(
+                order_id=pk,
+                product_id=product_id,
+                quantity=rand.randint(1, 5),
+                unit_price=unit_price(plan, product_id),
+            ))
+    Order.objects.bulk_create(orders)
+    OrderItem.objects.bulk_create(items)
+    # placed_at is auto_now_add, bulk_create always sets it to now: the orders
+    # are spread over `days` afterwards, older ids first, one timestamp per chunk
+    chunks = max(1, -(-plan['counts']['orders'] // plan['chunk_size']))
+    placed_at = plan['until'] - timedelta(days=plan['days']) * (1 - chunk / chunks)
+    Order.objects.filter(pk__gte=start, pk__lt=stop).update(placed_at=placed_at)
+
+
+STAGES = [
+    [('collections', make_collections)],
+    [('products', make_products), ('customers', make_customers)],
+    [('orders', make_orders)],
+]
+GENERATORS = {table: generate for stage in STAGES for table, generate in stage}
+
+
+def run_chunk(task):
+    table, chunk = task
+    with transaction.atomic():
+        GENERATORS[table](_plan, chunk)
+    start, stop = chunk_range(_plan, table, chunk)
+    return table, stop - start
+
+
+def _init_worker(plan):
+    global _plan
+    _plan = plan
+
+
+def make_plan(counts, seed=0, chunk_size=1000, images_per_product=2, items_per_order=4,
+              days=365, password='!'):
+    """Everything the chunks need, the id bases are read once here."""
+    User = get_user_model()
+    bases = {
+        table: model.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+        for table, model in [
+            ('collections', Collection), ('products', Product), ('customers', Customer),
+            ('orders', Order), ('users', User)]
+    }
+    for child, parents in [('products', ['collections']), ('orders', ['customers', 'products'])]:
+        for parent in parents:
+            if counts.get(child) and not counts.get(parent):
+                raise ValueError(f'{child} need {parent}, generate at least one')
+    return {
+        'seed': seed,
+        'chunk_size': chunk_size,
+        'counts': {table: counts.get(table, 0) for table in GENERATORS},
+        'bases': bases,
+        'images_per_product': images_per_product,
+        'items_per_order': items_per_order,
+        'days': days,
+        'until': timezone.now(),
+        'password': password,
+    }
+
+
+def generate(plan, workers=1, progress=None):
+    """Runs every chunk of the plan, returns {table: rows}."""
+    global _plan
+    progress = progress or (lambda table, rows: None)
+    done = {table: 0 for table in GENERATORS}
+    if connections['default'].vendor == 'sqlite' or 'fork' not in multiprocessing.get_all_start_methods():
+        workers = 1
+
+    pool = None
+    if workers > 1:
+        # the children open their own connections, a shared socket would be used by all of them
+        connections.close_all()
+        pool = multiprocessing.get_context('fork').Pool(workers, initializer=_init_worker, initargs=(plan,))
+    else:
+        _plan = plan
+
+    try:
+        for stage in STAGES:
+            tasks = [
+                (table, chunk)
+                for table, _ in stage
+                for chunk in range(-(-plan['counts'][table] // plan['chunk_size']))
+            ]
+            results = pool.imap_unordered(run_chunk, tasks) if pool else map(run_chunk, tasks)
+            for table, rows in results:
+                done[table] += rows
+                progress(table, done[table])
+            if 'products' in dict(stage) and plan['counts']['products']:
+                Collection.objects.reconcile_products_count()
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    if plan['counts']['collections'] or plan['counts']['products']:
+        invalidate_catalog()
+        get_search_engine().rebuild()
+    return done
@@ -0,0 +1,71 @@
+import logging
+import time
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Cart
+from .outbox import relay_batch
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def purge_abandoned_carts():
+    """
+    Deletes carts older than CART_EXPIRY_AGE (and their items) in batches.
+    Every batch is its own short transaction and we sleep between batches,
+    so the tables are never locked for long.
+    """
+    cutoff = timezone.now() - settings.CART_EXPIRY_AGE
+    batch_size = settings.CART_PURGE_BATCH_SIZE
+    started = time.monotonic()
+    purged_carts = purged_items = 0
+
+    for batch in range(settings.CART_PURGE_MAX_BATCHES):
+        batch_started = time.monotonic()
+        with transaction.atomic():
+            # uses the index on created_at, we only load ids
+            cart_ids = list(Cart.objects
+                            .filter(created_at__lt=cutoff)
+                            .order_by('created_at')
+                            .values_list('id', flat=True)[:batch_size])
+            if not cart_ids:
+                break
+            # plain DELETEs, delete() would load every cart into python to collect the cascade
+            carts, items = Cart.objects.delete_with_items(cart_ids)
+
+        purged_carts += carts
+        purged_items += items
+        logger.info(
+            'purge_abandoned_carts batch %s: %s carts, %s items in %.3fs',
+            batch, carts, items, time.monotonic() - batch_started)
+
+        if len(cart_ids) < batch_size:
+            break
+        time.sleep(settings.CART_PURGE_BATCH_PAUSE)
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        'purge_abandoned_carts: %s carts, %s items in %.3fs',
+        purged_carts, purged_items, elapsed)
+    return {'carts': purged_carts, 'items': purged_items, 'seconds': round(elapsed, 3)}
+
+
+@shared_task
+def relay_outbox():
+    """
+    Sends the pending OutboxEvents to their signal handlers, one batch
+    (one transaction) at a time. Queued after every checkout commit and
+    run by beat as well, in case a kick got lost.
+    """
+    relayed = 0
+    for _ in range(settings.OUTBOX_MAX_BATCHES):
+        handled = relay_batch(settings.OUTBOX_BATCH_SIZE)
+        relayed += handled
+        if handled < settings.OUTBOX_BATCH_SIZE:
+            break
+    if relayed:
+        logger.info('relay_outbox: %s events', relayed)
+    return relayed
@@ -1,6 +1,11 @@
 import pytest
 from rest_framework.test import APIClient
+from django.conf import settings
 from django.contrib.auth.models import User
+from model_bakery import baker
+from django.core.cache import cache
+from core import authentication, throttling
+from store import carts, customers
 
 # now this function is reusable piece of code we can add it to each test as parameter
 
@@ -15,3 +20,55 @@ def user_authenticate(api_client):
     def do_authenticate_user(is_staff=False):
         return api_client.force_authenticate(user=User(is_staff=is_staff))
     return do_authenticate_user
+
+
+@pytest.fixture
+def authenticate(api_client):
+    def do_authenticate(is_staff=False):
+        # a saved user, the create_customer_for_new_user signal gives it a customer
+        user = baker.make(settings.AUTH_USER_MODEL, is_staff=is_staff)
+        api_client.force_authenticate(user=user)
+        return user
+    return do_authenticate
+
+
+# every test gets an empty in-memory cache so cached responses never leak between tests
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'revocations': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'revocations'},
+    }
+    cache.clear()
+    authentication.get_revocation_cache().clear()
+    customers._local.clear()
+    authentication._users.clear()
+
+
+# a redis in memory (fakeredis, it runs the Lua scripts too) behind the 'redis' cache alias,
+# for the code that needs real redis commands: RedisCartStore and the throttles
+@pytest.fixture
+def fake_redis(settings):
+    import fakeredis
+    from django_redis import get_redis_connection
+
+    settings.CACHES = {
+        **settings.CACHES,
+        'redis': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': 'redis://fakeredis:6379/0',
+            'OPTIONS': {
+                'CONNECTION_POOL_KWARGS': {'connection_class': fakeredis.FakeConnection},
+            },
+        },
+    }
+    settings.CART_STORE_REDIS_ALIAS = 'redis'
+    settings.THROTTLE_REDIS_ALIAS = 'redis'
+    redis = get_redis_connection('redis')
+    redis.flushall()
+    # the store and the throttle script hold on to the connection they were made with
+    carts._store = None
+    throttling._script = None
+    yield redis
+    carts._store = None
+    throttling._script = None
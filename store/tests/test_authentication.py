@@ -0,0 +1,96 @@
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from model_bakery import baker
+
+
+@pytest.fixture
+def login(api_client):
+    def do_login(is_staff=False):
+        user = baker.make(settings.AUTH_USER_MODEL, is_staff=is_staff)
+        user.set_password('secret-password')
+        user.save()
+        response = api_client.post('/auth/jwt/create/', {'username': user.username, 'password': 'secret-password'})
+        api_client.credentials(HTTP_AUTHORIZATION=f"JWT {response.data['access']}")
+        return user, response.data
+    return do_login
+
+
+@pytest.mark.django_db
+class TestStatelessAuthentication:
+    def test_if_user_is_not_loaded(self, api_client, login, django_assert_num_queries):
+        login()
+
+        # only the orders, no user and no customer
+        with django_assert_num_queries(1):
+            response = api_client.get('/store/orders/')
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_if_is_staff_comes_from_the_token(self, api_client, login):
+        login(is_staff=True)
+
+        response = api_client.get('/store/customers/')
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_if_permissions_are_checked_on_the_real_user(self, api_client, login):
+        user, _ = login(is_staff=True)
+
+        response = api_client.get(f'/store/customers/{user.customer.id}/history/')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestTokenRevocation:
+    def test_if_revoked_token_returns_401(self, api_client, login):
+        _, tokens = login()
+
+        response = api_client.post('/auth/jwt/revoke/', {'refresh': tokens['refresh']})
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert api_client.get('/store/orders/').status_code == status.HTTP_401_UNAUTHORIZED
+        api_client.credentials()
+        response = api_client.post('/auth/jwt/refresh/', {'refresh': tokens['refresh']})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_revocation_survives_a_cleared_response_cache(self, api_client, login):
+        _, tokens = login()
+        api_client.post('/auth/jwt/revoke/')
+
+        # the catalog responses can be evicted, the denylist is in its own cache
+        cache.clear()
+
+        assert api_client.get('/store/orders/').status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_password_change_revokes_older_tokens(self, api_client, login, django_capture_on_commit_callbacks):
+        user, _ = login()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            user.set_password('new-password')
+            user.save()
+
+        assert api_client.get('/store/orders/').status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_login_right_after_password_change_is_accepted(self, api_client, login, django_capture_on_commit_callbacks):
+        user, _ = login()
+        with django_capture_on_commit_callbacks(execute=True):
+            user.set_password('new-password')
+            user.save()
+
+        # same second as the revocation, the generation claim tells them apart
+        response = api_client.post('/auth/jwt/create/', {'username': user.username, 'password': 'new-password'})
+        api_client.credentials(HTTP_AUTHORIZATION=f"JWT {response.data['access']}")
+
+        assert api_client.get('/store/orders/').status_code == status.HTTP_200_OK
+
+    def test_if_saving_a_loaded_user_does_not_read_it_again(self, login, django_assert_num_queries):
+        user, _ = login()
+        user = type(user).objects.get(pk=user.pk)
+
+        # only the UPDATE, the revoking fields are compared with what was loaded
+        with django_assert_num_queries(1):
+            user.first_name = 'Changed'
+            user.save()
@@ -0,0 +1,45 @@
+import json
+import os
+import pytest
+from store import urls
+from store.benchmarks import ENDPOINTS, SIZES, build_dataset, check_budgets, format_table, load_budgets, run_benchmarks
+
+
+@pytest.fixture
+def benchmark_settings(settings, tmp_path):
+    # the database path is measured, not the response cache
+    settings.CATALOG_CACHE_TIMEOUT = 0
+    # uploaded images go away with the test
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+class TestEndpoints:
+    def test_if_every_route_is_benchmarked(self):
+        routes = {pattern.name for pattern in urls.urlpatterns} - {'api-root'}
+
+        assert routes - {endpoint.route for endpoint in ENDPOINTS} == set()
+
+    def test_if_every_endpoint_has_a_budget(self):
+        assert {endpoint.name for endpoint in ENDPOINTS} == set(load_budgets())
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('benchmark_settings')
+class TestBudgets:
+    # queries must not grow with the dataset, times are only checked on the largest
+    # one and when BENCHMARK_TIME_FACTOR is set (bench_endpoints always checks them)
+    results = {}
+
+    @pytest.mark.parametrize('size', SIZES)
+    def test_if_endpoints_are_within_budget(self, size):
+        results = run_benchmarks(build_dataset(size), repeat=3)
+        TestBudgets.results[size] = results
+        report = os.environ.get('BENCHMARK_REPORT')
+        if report:
+            with open(report, 'w') as file:
+                json.dump({str(size): result for size, result in TestBudgets.results.items()}, file, indent=2)
+
+        budgets = load_budgets()
+        times = size == max(SIZES) and 'BENCHMARK_TIME_FACTOR' in os.environ
+        failures = check_budgets(results, budgets, times=times)
+        assert not failures, '\n'.join(failures) + '\n\n' + format_table(results, budgets)
@@ -0,0 +1,58 @@
+import pytest
+from rest_framework import status
+from model_bakery import baker
+from store.models import Product, Collection
+
+
+@pytest.mark.django_db
+class TestCatalogCache:
+    def test_if_second_request_is_a_hit(self, api_client, django_assert_num_queries):
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection, _quantity=3)
+
+        first = api_client.get('/store/products/?ordering=unit_price')
+        with django_assert_num_queries(0):
+            second = api_client.get('/store/products/?ordering=unit_price')
+
+        assert first['X-Cache'] == 'MISS'
+        assert second['X-Cache'] == 'HIT'
+        assert second.data == first.data
+
+    def test_if_query_string_is_part_of_the_key(self, api_client):
+        api_client.get('/store/products/?ordering=unit_price')
+        response = api_client.get('/store/products/?ordering=-unit_price')
+
+        assert response['X-Cache'] == 'MISS'
+
+    def test_if_product_save_invalidates_list_and_detail(self, api_client, django_capture_on_commit_callbacks):
+        collection = baker.make(Collection)
+        product = baker.make(Product, collection=collection, title='a')
+        api_client.get('/store/products/')
+        api_client.get(f'/store/products/{product.id}/')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            product.title = 'b'
+            product.save()
+
+        listing = api_client.get('/store/products/')
+        detail = api_client.get(f'/store/products/{product.id}/')
+        assert listing['X-Cache'] == 'MISS'
+        assert detail['X-Cache'] == 'MISS'
+        assert detail.data['title'] == 'b'
+
+    def test_if_other_product_detail_stays_cached(self, api_client, django_capture_on_commit_callbacks):
+        collection = baker.make(Collection)
+        product, other = baker.make(Product, collection=collection, _quantity=2)
+        api_client.get(f'/store/products/{other.id}/')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            product.save()
+
+        response = api_client.get(f'/store/products/{other.id}/')
+        assert response['X-Cache'] == 'HIT'
+
+    def test_if_stats_need_admin(self, api_client, user_authenticate):
+        user_authenticate()
+        response = api_client.get('/store/cache-stats/')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,169 @@
+import pytest
+from rest_framework import status
+from django.conf import settings as django_settings
+from model_bakery import baker
+from store.models import Product, Collection, CartItem, Order
+
+
+@pytest.fixture
+def cart_id(api_client):
+    return api_client.post('/store/carts/').data['id']
+
+
+@pytest.fixture
+def add_item(api_client):
+    def do_add_item(cart_id, item):
+        return api_client.post(f'/store/carts/{cart_id}/items/', item)
+    return do_add_item
+
+
+@pytest.mark.django_db
+class TestAddCartItem:
+    def test_if_product_is_new_returns_201(self, cart_id, add_item):
+        product = baker.make(Product, collection=baker.make(Collection))
+
+        response = add_item(cart_id, {'product_id': product.id, 'quantity': 2})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['id'] > 0
+        assert response.data['quantity'] == 2
+
+    def test_if_product_is_added_twice_quantities_are_merged(self, cart_id, add_item):
+        product = baker.make(Product, collection=baker.make(Collection))
+
+        first = add_item(cart_id, {'product_id': product.id, 'quantity': 2})
+        second = add_item(cart_id, {'product_id': product.id, 'quantity': 3})
+
+        assert second.data['id'] == first.data['id']
+        assert second.data['quantity'] == 5
+        assert CartItem.objects.filter(cart_id=cart_id).count() == 1
+
+    def test_if_add_is_a_single_query(self, cart_id, add_item, django_assert_max_num_queries):
+        product = baker.make(Product, collection=baker.make(Collection))
+
+        # the upsert, plus a primary key lookup on MySQL (no RETURNING there)
+        with django_assert_max_num_queries(2):
+            add_item(cart_id, {'product_id': product.id, 'quantity': 1})
+
+    def test_if_product_does_not_exist_returns_400(self, cart_id, add_item):
+        response = add_item(cart_id, {'product_id': 0, 'quantity': 1})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['product_id'] is not None
+
+    def test_if_cart_does_not_exist_returns_404(self, add_item):
+        product = baker.make(Product, collection=baker.make(Collection))
+
+        response = add_item('9d5a1f3e-6a53-4c49-9d2e-1e6f3b7c2a10',
+                            {'product_id': product.id, 'quantity': 1})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestCartItems:
+    def test_if_cart_lists_its_items(self, api_client, cart_id, add_item):
+        product = baker.make(Product, collection=baker.make(Collection), unit_price=2)
+        add_item(cart_id, {'product_id': product.id, 'quantity': 3})
+
+        response = api_client.get(f'/store/carts/{cart_id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['items'][0]['product']['id'] == product.id
+        assert response.data['total_amount'] == 6
+
+    def test_if_item_quantity_is_updated(self, api_client, cart_id, add_item):
+        product = baker.make(Product, collection=baker.make(Collection))
+        item_id = add_item(cart_id, {'product_id': product.id, 'quantity': 3}).data['id']
+
+        response = api_client.patch(f'/store/carts/{cart_id}/items/{item_id}/', {'quantity': 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'quantity': 1}
+
+    def test_if_item_is_removed_returns_204(self, api_client, cart_id, add_item):
+        product = baker.make(Product, collection=baker.make(Collection))
+        item_id = add_item(cart_id, {'product_id': product.id, 'quantity': 3}).data['id']
+
+        response = api_client.delete(f'/store/carts/{cart_id}/items/{item_id}/')
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert api_client.get(f'/store/carts/{cart_id}/items/').data == []
+
+    def test_if_cart_does_not_exist_returns_404(self, api_client):
+        response = api_client.get('/store/carts/not-a-uuid/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.fixture
+def redis_carts(fake_redis, settings):
+    settings.CART_STORE = 'store.carts.RedisCartStore'
+    settings.CART_STORE_TTL = 100
+    return fake_redis
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('redis_carts')
+class TestRedisCartStore:
+    def test_if_added_quantities_are_merged(self, api_client, cart_id, add_item):
+        product = baker.make(Product, collection=baker.make(Collection), unit_price=2)
+
+        first = add_item(cart_id, {'product_id': product.id, 'quantity': 2})
+        second = add_item(cart_id, {'product_id': product.id, 'quantity': 3})
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.data['id'] == first.data['id'] == product.id
+        assert second.data['quantity'] == 5
+        cart = api_client.get(f'/store/carts/{cart_id}/').data
+        assert [item['quantity'] for item in cart['items']] == [5]
+        assert cart['total_amount'] == 10
+        # nothing is written to the database carts
+        assert not CartItem.objects.exists()
+
+    def test_if_item_quantity_is_updated(self, api_client, cart_id, add_item):
+        product = baker.make(Product, collection=baker.make(Collection))
+        item_id = add_item(cart_id, {'product_id': product.id, 'quantity': 3}).data['id']
+
+        response = api_client.patch(f'/store/carts/{cart_id}/items/{item_id}/', {'quantity': 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert api_client.get(f'/store/carts/{cart_id}/items/{item_id}/').data['quantity'] == 1
+
+    def test_if_missing_item_update_returns_404(self, api_client, cart_id):
+        response = api_client.patch(f'/store/carts/{cart_id}/items/1/', {'quantity': 1})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_if_product_does_not_exist_returns_400(self, cart_id, add_item):
+        response = add_item(cart_id, {'product_id': 0, 'quantity': 1})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_if_writes_refresh_the_ttl(self, redis_carts, cart_id, add_item):
+        product = baker.make(Product, collection=baker.make(Collection))
+        key = f'cart:{cart_id}'
+        redis_carts.expire(key, 10)
+
+        add_item(cart_id, {'product_id': product.id, 'quantity': 1})
+
+        assert 10 < redis_carts.ttl(key) <= 100
+
+    def test_if_cart_is_deleted_once_the_order_is_committed(
+            self, api_client, redis_carts, cart_id, add_item, django_capture_on_commit_callbacks):
+        product = baker.make(Product, collection=baker.make(Collection), inventory=5)
+        add_item(cart_id, {'product_id': product.id, 'quantity': 2})
+        api_client.force_authenticate(user=baker.make(django_settings.AUTH_USER_MODEL))
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = api_client.post('/store/orders/', {'cart_id': cart_id})
+            # the order isn't committed yet, the cart is still there
+            assert redis_carts.exists(f'cart:{cart_id}')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert Order.objects.get().items.get().quantity == 2
+        # only the cart store's callback, the outbox one would go looking for the celery broker
+        for callback in callbacks:
+            if callback.__qualname__.startswith('RedisCartStore.'):
+                callback()
+        assert not redis_carts.exists(f'cart:{cart_id}')
@@ -1,4 +1,6 @@
 import pytest
+from io import StringIO
+from django.core.management import call_command
 from rest_framework import status
 from model_bakery import baker
 from store.models import Product, Collection
@@ -63,3 +65,68 @@ class TestRetrieveCollection:
 # this is eg how to use backer with Product
 # collection = baker.make(Collection)
 # baker.make(Product, collection=collection, _quantity=10)
+
+
+@pytest.mark.django_db
+class TestCollectionProductsCount:
+    def test_if_count_follows_creates_moves_and_deletes(self):
+        collection, other = baker.make(Collection, _quantity=2)
+        products = baker.make(Product, collection=collection, _quantity=3)
+
+        products[0].collection = other
+        products[0].save()
+        products[1].delete()
+
+        collection.refresh_from_db()
+        other.refresh_from_db()
+        assert collection.products_count == 1
+        assert other.products_count == 1
+
+    def test_if_bulk_paths_keep_count(self):
+        collection, other = baker.make(Collection, _quantity=2)
+        Product.objects.bulk_create(
+            baker.prepare(Product, collection=collection, _quantity=4))
+
+        moved = list(Product.objects.values_list('pk', flat=True)[:3])
+        Product.objects.filter(pk__in=moved).update(collection=other)
+
+        collection.refresh_from_db()
+        other.refresh_from_db()
+        assert collection.products_count == 1
+        assert other.products_count == 3
+
+    def test_if_queryset_delete_counts_in_one_update(self, django_assert_max_num_queries):
+        collection, other = baker.make(Collection, _quantity=2)
+        kept = baker.make(Product, collection=collection)
+        baker.make(Product, collection=collection, _quantity=3)
+        baker.make(Product, collection=other, _quantity=2)
+
+        with django_assert_max_num_queries(20) as captured:
+            Product.objects.exclude(pk=kept.pk).delete()
+
+        counters = [query for query in captured.captured_queries if 'products_count' in query['sql']]
+        assert len(counters) == 1
+        collection.refresh_from_db()
+        other.refresh_from_db()
+        assert collection.products_count == 1
+        assert other.products_count == 0
+
+    def test_if_reconcile_repairs_drift(self):
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection, _quantity=2)
+        Collection.objects.update(products_count=10)
+
+        call_command('reconcile_products_count', stdout=StringIO())
+
+        collection.refresh_from_db()
+        assert collection.products_count == 2
+
+    def test_if_list_reads_a_single_table(self, api_client, django_assert_num_queries):
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection, _quantity=2)
+
+        with django_assert_num_queries(1) as captured:
+            response = api_client.get('/store/collections/')
+
+        assert 'JOIN' not in captured.captured_queries[0]['sql']
+        assert response.data[0]['products_count'] == 2
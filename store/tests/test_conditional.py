@@ -0,0 +1,86 @@
+import pytest
+from rest_framework import status
+from model_bakery import baker
+from store.models import Product, Collection, ProductImage
+
+
+@pytest.fixture
+def product():
+    return baker.make(Product, collection=baker.make(Collection))
+
+
+@pytest.mark.django_db
+class TestConditionalRetrieveProduct:
+    def test_if_unchanged_returns_304_after_one_query(self, api_client, product, django_assert_num_queries):
+        first = api_client.get(f'/store/products/{product.id}/')
+
+        with django_assert_num_queries(1):
+            second = api_client.get(f'/store/products/{product.id}/', HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second['ETag'] == first['ETag']
+        assert not second.content
+
+    def test_if_last_modified_is_honored(self, api_client, product):
+        first = api_client.get(f'/store/products/{product.id}/')
+
+        second = api_client.get(f'/store/products/{product.id}/', HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_queryset_update_changes_etag(self, api_client, product):
+        first = api_client.get(f'/store/products/{product.id}/')
+
+        Product.objects.filter(pk=product.id).update(inventory=0)
+        second = api_client.get(f'/store/products/{product.id}/', HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second['ETag'] != first['ETag']
+
+    def test_if_reservation_changes_etag_but_not_the_order(self, api_client):
+        collection = baker.make(Collection)
+        # one more than a page
+        products = baker.make(Product, collection=collection, inventory=5, _quantity=11)
+        first = api_client.get(f'/store/products/{products[0].id}/')
+        page = api_client.get('/store/products/?pagination=cursor')
+
+        Product.objects.reserve_inventory({products[0].id: 1})
+        second = api_client.get(f'/store/products/{products[0].id}/', HTTP_IF_NONE_MATCH=first['ETag'])
+        next_page = api_client.get(page.data['next'])
+
+        assert second.status_code == status.HTTP_200_OK
+        # the default order and the cursors follow the creation time
+        assert [item['id'] for item in page.data['results'] + next_page.data['results']] == \
+            [product.id for product in products]
+
+    def test_if_new_image_changes_etag(self, api_client, product):
+        first = api_client.get(f'/store/products/{product.id}/')
+
+        baker.make(ProductImage, product=product, image='store/images/x.jpg')
+        second = api_client.get(f'/store/products/{product.id}/', HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert second.status_code == status.HTTP_200_OK
+
+    def test_if_product_does_not_exist_returns_404(self, api_client):
+        assert api_client.get('/store/products/0/').status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestConditionalList:
+    def test_if_unchanged_returns_304_without_query(self, api_client, product, django_assert_num_queries):
+        first = api_client.get('/store/products/')
+
+        with django_assert_num_queries(0):
+            second = api_client.get('/store/products/', HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_change_returns_200(self, api_client, product, django_capture_on_commit_callbacks):
+        first = api_client.get('/store/collections/')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            baker.make(Product, collection=product.collection)
+        second = api_client.get('/store/collections/', HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data[0]['products_count'] == 2
@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+import pytest
+from decimal import Decimal
+from model_bakery import baker
+from rest_framework import status
+from store.models import Product, Collection, ProductImage
+
+
+@pytest.fixture
+def products():
+    collection = baker.make(Collection)
+    return [
+        baker.make(Product, collection=collection, unit_price=Decimal(price))
+        for price in ['5.00', '15.00', '25.00', '35.00', '45.00', '55.00', '65.00']
+    ]
+
+
+def read(response):
+    return b''.join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+class TestExportProducts:
+    def test_if_user_is_anonymous_returns_401(self, api_client):
+        response = api_client.get('/store/products/export/')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_user_is_not_staff_returns_403(self, api_client, authenticate):
+        authenticate()
+
+        response = api_client.get('/store/products/export/')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_ndjson_streams_every_product_across_chunks(self, api_client, authenticate, products, settings):
+        settings.PRODUCT_EXPORT_CHUNK_SIZE = 3
+        authenticate(is_staff=True)
+
+        response = api_client.get('/store/products/export/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'] == 'application/x-ndjson'
+        lines = [json.loads(line) for line in read(response).splitlines()]
+        assert [line['id'] for line in lines] == [product.id for product in products]
+        assert lines[0]['effective_price'] == 5.5
+
+    def test_if_csv_has_header_and_image_urls(self, api_client, authenticate, products):
+        baker.make(ProductImage, product=products[0], image='store/images/a.jpg')
+        baker.make(ProductImage, product=products[0], image='store/images/b.jpg')
+        authenticate(is_staff=True)
+
+        response = api_client.get('/store/products/export/', {'output': 'csv', 'fields': 'id,unit_price,images'})
+
+        rows = list(csv.reader(io.StringIO(read(response))))
+        assert rows[0] == ['id', 'unit_price', 'images']
+        assert rows[1] == [
+            str(products[0].id), '5.00',
+            'http://testserver/media/store/images/a.jpg http://testserver/media/store/images/b.jpg',
+        ]
+        assert len(rows) == len(products) + 1
+
+    def test_if_list_filters_apply(self, api_client, authenticate, products):
+        authenticate(is_staff=True)
+
+        response = api_client.get('/store/products/export/', {'unit_price__gt': 30, 'max_price': 55})
+
+        ids = [json.loads(line)['id'] for line in read(response).splitlines()]
+        assert ids == [products[3].id, products[4].id]
+
+    def test_if_each_chunk_is_two_queries(self, api_client, authenticate, products, settings,
+                                          django_assert_num_queries):
+        settings.PRODUCT_EXPORT_CHUNK_SIZE = 3
+        authenticate(is_staff=True)
+
+        # 3 chunks of rows and their images, the last one is short so nothing comes after it
+        with django_assert_num_queries(6):
+            read(api_client.get('/store/products/export/'))
+
+    def test_if_output_is_unknown_returns_400(self, api_client, authenticate):
+        authenticate(is_staff=True)
+
+        response = api_client.get('/store/products/export/', {'output': 'xml'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,95 @@
+import pytest
+from decimal import Decimal
+from model_bakery import baker
+from rest_framework import status
+from store.models import Product, Collection, Promotion
+from store.search import get_search_engine
+
+
+@pytest.fixture
+def catalog():
+    shoes = baker.make(Collection, title='Shoes')
+    hats = baker.make(Collection, title='Hats')
+    # effective prices (+10% tax): 11.00, 33.00, 44.00 / 110.00, 660.00
+    for collection, prices in [(shoes, ['10.00', '30.00', '40.00']), (hats, ['100.00', '600.00'])]:
+        for price in prices:
+            baker.make(Product, collection=collection, unit_price=Decimal(price))
+    return shoes, hats
+
+
+@pytest.mark.django_db
+class TestProductFacets:
+    def test_if_counts_per_collection_and_price_bucket_are_returned(self, api_client, settings, catalog):
+        settings.PRODUCT_PRICE_FACET_BUCKETS = [25, 50, 500]
+        shoes, hats = catalog
+
+        response = api_client.get('/store/products/', {'facets': 'collection,price'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['facets']['collection'] == [
+            {'id': shoes.id, 'title': 'Shoes', 'count': 3},
+            {'id': hats.id, 'title': 'Hats', 'count': 2},
+        ]
+        assert response.data['facets']['price'] == [
+            {'min': 0, 'max': 25, 'count': 1},
+            {'min': 25, 'max': 50, 'count': 2},
+            {'min': 50, 'max': 500, 'count': 1},
+            {'min': 500, 'max': None, 'count': 1},
+        ]
+
+    def test_if_counts_follow_the_filters(self, api_client, catalog):
+        shoes, hats = catalog
+        discounted = Product.objects.get(unit_price=Decimal('600.00'))
+        discounted.promotions.add(baker.make(Promotion, discount=95))
+
+        response = api_client.get('/store/products/', {'facets': 'collection', 'max_price': 50})
+
+        # 600.00 - 95% is 33.00 with tax
+        assert response.data['facets']['collection'] == [
+            {'id': shoes.id, 'title': 'Shoes', 'count': 3},
+            {'id': hats.id, 'title': 'Hats', 'count': 1},
+        ]
+
+    def test_if_all_facets_are_one_query(self, api_client, catalog, django_assert_num_queries):
+        # count, products, images, facets
+        with django_assert_num_queries(4):
+            api_client.get('/store/products/', {'facets': 'collection,price'})
+
+    def test_if_facets_are_left_out_when_not_asked(self, api_client, catalog):
+        response = api_client.get('/store/products/')
+
+        assert 'facets' not in response.data
+
+    def test_if_unknown_facet_returns_400(self, api_client):
+        response = api_client.get('/store/products/', {'facets': 'collection,colour'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_if_filters_and_search_run_once(self, api_client, catalog, monkeypatch):
+        engine = get_search_engine()
+        searches = []
+        search = engine.search
+
+        def counting_search(queryset, terms):
+            searches.append(terms)
+            return search(queryset, terms)
+        monkeypatch.setattr(engine, 'search', counting_search)
+
+        response = api_client.get('/store/products/', {'facets': 'collection', 'search': 'nothing'})
+
+        assert response.data['facets']['collection'] == []
+        assert len(searches) == 1
+
+    def test_if_renamed_collection_is_not_served_from_the_cache(
+            self, api_client, catalog, django_capture_on_commit_callbacks):
+        shoes, _ = catalog
+        first = api_client.get('/store/products/', {'facets': 'collection'})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            shoes.title = 'Sneakers'
+            shoes.save()
+        second = api_client.get('/store/products/', {'facets': 'collection'})
+
+        assert second['X-Cache'] == 'MISS'
+        assert second['ETag'] != first['ETag']
+        assert second.data['facets']['collection'][0]['title'] == 'Sneakers'
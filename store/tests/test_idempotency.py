@@ -0,0 +1,155 @@
+import time
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from model_bakery import baker
+from store.models import Product, Collection, Cart, CartItem, Order
+from store import idempotency
+from store.views import ItemViewSet
+
+
+@pytest.fixture
+def cart_id():
+    return baker.make(Cart).id
+
+
+@pytest.fixture
+def product():
+    return baker.make(Product, collection=baker.make(Collection), inventory=10)
+
+
+@pytest.mark.django_db
+class TestIdempotentCartItems:
+    def test_if_retry_is_replayed(self, api_client, cart_id, product):
+        url = f'/store/carts/{cart_id}/items/'
+        data = {'product_id': product.id, 'quantity': 2}
+
+        first = api_client.post(url, data, HTTP_IDEMPOTENCY_KEY='abc')
+        second = api_client.post(url, data, HTTP_IDEMPOTENCY_KEY='abc')
+
+        assert first.status_code == second.status_code == status.HTTP_201_CREATED
+        assert second.data == first.data
+        assert second['Idempotent-Replayed'] == 'true'
+        assert CartItem.objects.get(cart_id=cart_id).quantity == 2
+
+    def test_if_new_key_runs_again(self, api_client, cart_id, product):
+        url = f'/store/carts/{cart_id}/items/'
+        data = {'product_id': product.id, 'quantity': 2}
+
+        api_client.post(url, data, HTTP_IDEMPOTENCY_KEY='abc')
+        api_client.post(url, data, HTTP_IDEMPOTENCY_KEY='def')
+
+        assert CartItem.objects.get(cart_id=cart_id).quantity == 4
+
+    def test_if_key_reused_with_other_body_returns_422(self, api_client, cart_id, product):
+        url = f'/store/carts/{cart_id}/items/'
+
+        api_client.post(url, {'product_id': product.id, 'quantity': 2}, HTTP_IDEMPOTENCY_KEY='abc')
+        response = api_client.post(url, {'product_id': product.id, 'quantity': 3}, HTTP_IDEMPOTENCY_KEY='abc')
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_if_key_in_progress_returns_409(self, api_client, cart_id, product, rf):
+        url = f'/store/carts/{cart_id}/items/'
+        view = ItemViewSet()
+        request = rf.post(url)
+        request.user = None
+        cache.add(view.get_idempotency_cache_key(request, 'abc') + ':lock', 'x')
+
+        response = api_client.post(url, {'product_id': product.id, 'quantity': 2}, HTTP_IDEMPOTENCY_KEY='abc')
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert not CartItem.objects.filter(cart_id=cart_id).exists()
+
+    def test_if_response_stored_before_the_lock_is_taken_is_replayed(
+            self, api_client, cart_id, product, rf, monkeypatch):
+        url = f'/store/carts/{cart_id}/items/'
+        data = {'product_id': product.id, 'quantity': 2}
+        request = rf.post(url)
+        request.user = None
+        cache_key = ItemViewSet().get_idempotency_cache_key(request, 'abc')
+        api_client.post(url, data, HTTP_IDEMPOTENCY_KEY='abc')
+        stored = cache.get(cache_key)
+        cache.delete(cache_key)
+
+        class RacingCache:
+            # the first request stores its response and releases the lock
+            # between the retry's get() and add()
+            def __getattr__(self, name):
+                return getattr(cache, name)
+
+            def add(self, key, *args, **kwargs):
+                cache.set(cache_key, stored)
+                return cache.add(key, *args, **kwargs)
+
+        monkeypatch.setattr(idempotency, 'cache', RacingCache())
+        response = api_client.post(url, data, HTTP_IDEMPOTENCY_KEY='abc')
+
+        assert response['Idempotent-Replayed'] == 'true'
+        assert CartItem.objects.get(cart_id=cart_id).quantity == 2
+
+
+@pytest.mark.django_db
+class TestIdempotentOrders:
+    def test_if_retried_checkout_places_one_order(self, api_client, product):
+        user = baker.make(settings.AUTH_USER_MODEL)
+        api_client.force_authenticate(user=user)
+        cart = baker.make(Cart)
+        baker.make(CartItem, cart=cart, product=product, quantity=1)
+
+        first = api_client.post('/store/orders/', {'cart_id': cart.id}, HTTP_IDEMPOTENCY_KEY='order-1')
+        second = api_client.post('/store/orders/', {'cart_id': cart.id}, HTTP_IDEMPOTENCY_KEY='order-1')
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert second.data['id'] == first.data['id']
+        assert Order.objects.count() == 1
+
+    def test_if_shortage_is_only_replayed_for_a_short_time(self, api_client, product, settings):
+        settings.IDEMPOTENCY_ERROR_TTL = 1
+        api_client.force_authenticate(user=baker.make(settings.AUTH_USER_MODEL))
+        cart = baker.make(Cart)
+        baker.make(CartItem, cart=cart, product=product, quantity=20)
+
+        first = api_client.post('/store/orders/', {'cart_id': cart.id}, HTTP_IDEMPOTENCY_KEY='order-1')
+        replayed = api_client.post('/store/orders/', {'cart_id': cart.id}, HTTP_IDEMPOTENCY_KEY='order-1')
+        Product.objects.filter(pk=product.pk).update(inventory=50)
+        time.sleep(1.1)
+        after_restock = api_client.post('/store/orders/', {'cart_id': cart.id}, HTTP_IDEMPOTENCY_KEY='order-1')
+
+        assert first.status_code == replayed.status_code == status.HTTP_400_BAD_REQUEST
+        assert replayed['Idempotent-Replayed'] == 'true'
+        assert after_restock.status_code == status.HTTP_200_OK
+        assert Order.objects.count() == 1
+
+
+@pytest.fixture
+def redis_default_cache(settings):
+    import fakeredis
+
+    settings.CACHES = {
+        **settings.CACHES,
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': 'redis://fakeredis:6379/0',
+            'OPTIONS': {
+                'CONNECTION_POOL_KWARGS': {'connection_class': fakeredis.FakeConnection},
+            },
+        },
+    }
+    cache.clear()
+
+
+class TestReleaseLock:
+    @pytest.mark.parametrize('backend', ['locmem', 'redis'])
+    def test_if_only_our_lock_is_deleted(self, backend, request):
+        if backend == 'redis':
+            request.getfixturevalue('redis_default_cache')
+        # ours expired, another request took the key
+        cache.add('idempotency:x:lock', 2, 30)
+
+        idempotency._release_lock('idempotency:x:lock', 1)
+        assert cache.get('idempotency:x:lock') == 2
+
+        idempotency._release_lock('idempotency:x:lock', 2)
+        assert cache.get('idempotency:x:lock') is None
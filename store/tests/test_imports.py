@@ -0,0 +1,142 @@
+import json
+import pytest
+from decimal import Decimal
+from django.conf import settings
+from django.core.management import call_command
+from model_bakery import baker
+from rest_framework import status
+from store.models import Product, Collection
+
+
+@pytest.fixture
+def import_products(api_client):
+    def do_import(body, content_type='application/x-ndjson', is_staff=True):
+        api_client.force_authenticate(user=baker.make(settings.AUTH_USER_MODEL, is_staff=is_staff))
+        if isinstance(body, list):
+            body = ''.join(json.dumps(row) + '\n' for row in body)
+        return api_client.generic('POST', '/store/products/import/', body, content_type)
+    return do_import
+
+
+def new_row(slug, collection, **fields):
+    return {
+        'slug': slug, 'title': slug.title(), 'description': 'imported',
+        'unit_price': '10.00', 'inventory': 5, 'collection': collection.id, **fields,
+    }
+
+
+@pytest.mark.django_db
+class TestImportProducts:
+    def test_if_user_is_not_staff_returns_403(self, import_products):
+        response = import_products([], is_staff=False)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_content_type_is_unknown_returns_415(self, import_products):
+        response = import_products('<products/>', content_type='application/xml')
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    def test_if_new_slugs_are_created_and_known_ones_updated(self, import_products, settings):
+        settings.PRODUCT_IMPORT_BATCH_SIZE = 2
+        collection = baker.make(Collection)
+        existing = baker.make(Product, slug='shoe', collection=collection, unit_price=Decimal('5.00'), inventory=1)
+
+        response = import_products([
+            new_row('hat', collection),
+            {'slug': 'shoe', 'unit_price': '7.50'},
+            new_row('scarf', collection),
+        ])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'rows': 3, 'created': 2, 'updated': 1, 'failed': 0, 'errors': []}
+        existing.refresh_from_db()
+        assert existing.unit_price == Decimal('7.50')
+        # fields the row didn't give are kept
+        assert existing.inventory == 1
+        assert set(Product.objects.values_list('slug', flat=True)) == {'hat', 'shoe', 'scarf'}
+        collection.refresh_from_db()
+        assert collection.products_count == 3
+
+    def test_if_csv_is_accepted(self, import_products):
+        collection = baker.make(Collection)
+        body = 'slug,title,description,unit_price,inventory,collection\n' \
+               f'hat,Hat,A hat,12.00,3,{collection.id}\n'
+
+        response = import_products(body, content_type='text/csv')
+
+        assert response.data['created'] == 1
+        assert Product.objects.get(slug='hat').unit_price == Decimal('12.00')
+
+    def test_if_bad_rows_are_reported_and_the_rest_imported(self, import_products):
+        collection = baker.make(Collection)
+        baker.make(Product, slug='twin', collection=collection, _quantity=2)
+
+        response = import_products(
+            json.dumps(new_row('ok', collection)) + '\n'
+            'not json\n'
+            + json.dumps(new_row('cheap', collection, unit_price='0.10')) + '\n'
+            + json.dumps({'slug': 'partial', 'title': 'Partial'}) + '\n'
+            + json.dumps({**new_row('lost', collection), 'collection': collection.id + 100}) + '\n'
+            + json.dumps({'slug': 'twin', 'inventory': 1}) + '\n'
+        )
+
+        assert response.data['created'] == 1
+        assert response.data['failed'] == 5
+        errors = {error['line']: error['errors'] for error in response.data['errors']}
+        assert set(errors) == {2, 3, 4, 5, 6}
+        assert 'unit_price' in errors[3]
+        assert 'collection' in errors[4] and 'inventory' in errors[4]
+        assert 'collection' in errors[5]
+        assert 'slug' in errors[6]
+
+    def test_if_body_that_isnt_utf8_is_reported(self, import_products):
+        collection = baker.make(Collection)
+
+        response = import_products(
+            json.dumps(new_row('ok', collection)).encode() + b'\n'
+            + b'{"slug": "caf\xe9"}\n'
+            + json.dumps(new_row('unread', collection)).encode() + b'\n'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['created'] == 1
+        assert response.data['errors'] == [
+            {'line': 2, 'errors': {'non_field_errors': ['Not valid UTF-8, the rest of the file was not read']}}]
+        assert list(Product.objects.values_list('slug', flat=True)) == ['ok']
+
+    def test_if_product_moves_between_collections(self, import_products):
+        old, new = baker.make(Collection), baker.make(Collection)
+        product = baker.make(Product, slug='hat', collection=old)
+
+        import_products([{'slug': 'hat', 'collection': new.id}])
+
+        product.refresh_from_db()
+        old.refresh_from_db()
+        new.refresh_from_db()
+        assert product.collection_id == new.id
+        assert (old.products_count, new.products_count) == (0, 1)
+
+    def test_if_queries_dont_grow_with_rows(self, import_products, django_assert_max_num_queries):
+        collection = baker.make(Collection)
+        baker.make(Product, slug='existing-0', collection=collection)
+        rows = [new_row(f'new-{n}', collection) for n in range(50)] + [{'slug': 'existing-0', 'inventory': 9}]
+
+        # the staff user and its customer, then for the batch: collections, slugs,
+        # savepoint, insert, collection counter, update, release
+        with django_assert_max_num_queries(9):
+            response = import_products(rows)
+
+        assert response.data['created'] == 50
+
+
+@pytest.mark.django_db
+class TestImportProductsCommand:
+    def test_if_file_is_imported(self, tmp_path):
+        collection = baker.make(Collection)
+        path = tmp_path / 'products.ndjson'
+        path.write_text(json.dumps(new_row('hat', collection)) + '\n')
+
+        call_command('import_products', str(path))
+
+        assert Product.objects.filter(slug='hat', collection=collection).exists()
@@ -0,0 +1,170 @@
+import pytest
+from django.conf import settings
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from model_bakery import baker
+from store.customers import resolve_customer_id
+from store.models import Product, Collection, Cart, CartItem, Order, OrderItem, OutboxEvent
+
+
+@pytest.fixture
+def make_cart():
+    def do_make_cart(*lines):
+        cart = baker.make(Cart)
+        for product, quantity in lines:
+            baker.make(CartItem, cart=cart, product=product, quantity=quantity)
+        return cart
+    return do_make_cart
+
+
+@pytest.mark.django_db
+class TestCreateOrder:
+    def test_if_inventory_is_reserved(self, api_client, authenticate, make_cart):
+        authenticate()
+        product = baker.make(Product, collection=baker.make(Collection), inventory=5)
+        cart = make_cart((product, 2))
+
+        response = api_client.post('/store/orders/', {'cart_id': cart.id})
+
+        assert response.status_code == status.HTTP_200_OK
+        product.refresh_from_db()
+        assert product.inventory == 3
+        assert not Cart.objects.filter(pk=cart.id).exists()
+
+    def test_if_order_created_event_is_written_with_the_order(self, api_client, authenticate, make_cart):
+        authenticate()
+        cart = make_cart((baker.make(Product, collection=baker.make(Collection), inventory=5), 1))
+
+        response = api_client.post('/store/orders/', {'cart_id': cart.id})
+
+        event = OutboxEvent.objects.get()
+        assert event.topic == OutboxEvent.ORDER_CREATED
+        assert event.payload == {'order_id': response.data['id']}
+        assert event.processed_at is None
+
+    def test_if_inventory_is_short_returns_400_and_nothing_is_written(self, api_client, authenticate, make_cart):
+        authenticate()
+        collection = baker.make(Collection)
+        in_stock = baker.make(Product, collection=collection, inventory=5)
+        short = baker.make(Product, collection=collection, inventory=1)
+        cart = make_cart((in_stock, 2), (short, 3))
+
+        response = api_client.post('/store/orders/', {'cart_id': cart.id})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data['items']) == [short.id]
+        in_stock.refresh_from_db()
+        assert in_stock.inventory == 5
+        assert not Order.objects.exists()
+        assert not OutboxEvent.objects.exists()
+        assert Cart.objects.filter(pk=cart.id).exists()
+
+    @pytest.mark.parametrize('lines', [1, 5])
+    def test_if_query_count_does_not_depend_on_cart_size(self, api_client, authenticate, make_cart, django_assert_num_queries, lines):
+        user = authenticate()
+        # like any request after the first one (or with a customer_id claim in the token)
+        resolve_customer_id(user.id)
+        collection = baker.make(Collection)
+        cart = make_cart(*[
+            (baker.make(Product, collection=collection, inventory=10), 1)
+            for _ in range(lines)
+        ])
+
+        # items, order, order items, 2 cart deletes, outbox event, the reserve
+        # SELECT FOR UPDATE and UPDATE, the savepoints (+ release) of the checkout and of the reservation
+        with django_assert_num_queries(12):
+            response = api_client.post('/store/orders/', {'cart_id': cart.id})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['items']) == lines
+        assert all(item['id'] for item in response.data['items'])
+        assert response.data['items'][0]['product']['title']
+
+
+@pytest.fixture
+def make_orders():
+    def do_make_orders(customer, count, **kwargs):
+        orders = baker.make(Order, customer=customer, _quantity=count, **kwargs)
+        product = baker.make(Product, collection=baker.make(Collection))
+        for order in orders:
+            baker.make(OrderItem, order=order, product=product, quantity=1, unit_price=1, _quantity=2)
+        return orders
+    return do_make_orders
+
+
+@pytest.mark.django_db
+class TestListOrders:
+    def test_if_orders_are_paginated_newest_first(self, api_client, authenticate, make_orders):
+        user = authenticate()
+        orders = make_orders(user.customer, 25)
+
+        first = api_client.get('/store/orders/')
+        second = api_client.get(first.data['next'])
+
+        assert first.status_code == status.HTTP_200_OK
+        ids = [order['id'] for order in first.data['results'] + second.data['results']]
+        assert ids == sorted([order.id for order in orders], reverse=True)
+        assert len(first.data['results']) == 20
+        assert second.data['next'] is None
+
+    def test_if_customer_sees_only_own_orders(self, api_client, authenticate, make_orders):
+        make_orders(baker.make(settings.AUTH_USER_MODEL).customer, 2)
+        user = authenticate()
+        own = make_orders(user.customer, 1)
+
+        response = api_client.get('/store/orders/')
+
+        assert [order['id'] for order in response.data['results']] == [own[0].id]
+
+    def test_if_query_count_does_not_depend_on_page_size(self, api_client, authenticate, make_orders, django_assert_num_queries):
+        user = authenticate(is_staff=True)
+        make_orders(user.customer, 15)
+        resolve_customer_id(user.id)
+
+        # orders, their items with products
+        with django_assert_num_queries(2):
+            response = api_client.get('/store/orders/')
+
+        assert len(response.data['results']) == 15
+        assert response.data['results'][0]['items'][0]['product']['title']
+
+    def test_if_orders_are_filtered_by_payment_status(self, api_client, authenticate, make_orders):
+        user = authenticate()
+        make_orders(user.customer, 2)
+        paid = make_orders(user.customer, 1, payment_status=Order.PAYMENT_COMPLETE)
+
+        response = api_client.get('/store/orders/', {'payment_status': Order.PAYMENT_COMPLETE})
+
+        assert [order['id'] for order in response.data['results']] == [paid[0].id]
+
+
+@pytest.mark.django_db
+class TestCustomerId:
+    def test_if_access_token_has_customer_id_claim(self, api_client):
+        user = baker.make(settings.AUTH_USER_MODEL)
+        user.set_password('secret-password')
+        user.save()
+
+        response = api_client.post('/auth/jwt/create/', {'username': user.username, 'password': 'secret-password'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert AccessToken(response.data['access'])['customer_id'] == user.customer.id
+
+    def test_if_claim_is_used_without_a_query(self, api_client, django_assert_num_queries):
+        user = baker.make(settings.AUTH_USER_MODEL)
+        token = AccessToken.for_user(user)
+        token['customer_id'] = user.customer.id
+        api_client.credentials(HTTP_AUTHORIZATION=f'JWT {token}')
+
+        # the user (JWTAuthentication), the orders
+        with django_assert_num_queries(2):
+            response = api_client.get('/store/orders/')
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_if_customer_id_is_cached(self, django_assert_num_queries):
+        user = baker.make(settings.AUTH_USER_MODEL)
+
+        assert resolve_customer_id(user.id) == user.customer.id
+        with django_assert_num_queries(0):
+            assert resolve_customer_id(user.id) == user.customer.id
@@ -1,7 +1,11 @@
 import pytest
+from django.conf import settings
 from rest_framework import status
 from model_bakery import baker
-from store.models import Product, Collection
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from decimal import Decimal
+from store.models import Product, Collection, ProductImage, Promotion
 
 
 @pytest.fixture
@@ -25,3 +29,177 @@ class TestCreateProduct:
         user_authenticate()
         response = create_product()
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestListProductsWithCursor:
+    def test_if_pages_cover_all_products_once(self, api_client):
+        collection = baker.make(Collection)
+        products = baker.make(Product, collection=collection, _quantity=25)
+
+        seen = []
+        url = '/store/products/?pagination=cursor'
+        while url:
+            response = api_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert 'count' not in response.data
+            seen += [product['id'] for product in response.data['results']]
+            url = response.data['next']
+
+        assert sorted(seen) == sorted(product.id for product in products)
+
+    def test_if_previous_link_returns_the_previous_page(self, api_client):
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection, _quantity=25)
+
+        first = api_client.get('/store/products/?pagination=cursor&ordering=-unit_price')
+        second = api_client.get(first.data['next'])
+        previous = api_client.get(second.data['previous'])
+
+        assert previous.data['results'] == first.data['results']
+        assert previous.data['previous'] is None
+
+    def test_if_cursor_is_invalid_returns_404(self, api_client):
+        response = api_client.get('/store/products/?pagination=cursor&cursor=abc')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_if_no_count_query_is_run(self, api_client, django_assert_max_num_queries):
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection, _quantity=15)
+
+        # one query for the page and one for the images prefetch
+        with django_assert_max_num_queries(2) as captured:
+            api_client.get('/store/products/?pagination=cursor')
+
+        assert not any('COUNT' in query['sql'] for query in captured.captured_queries)
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    def test_if_fields_trims_output_and_sql(self, api_client):
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection, _quantity=3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get('/store/products/', {'fields': 'id,title,unit_price'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(set(product) == {'id', 'title', 'unit_price'} for product in response.data['results'])
+        sql = ' '.join(query['sql'] for query in queries.captured_queries)
+        assert 'description' not in sql
+        assert 'store_productimage' not in sql
+
+    def test_if_omit_drops_fields(self, api_client):
+        product = baker.make(Product, collection=baker.make(Collection))
+
+        response = api_client.get(f'/store/products/{product.id}/', {'omit': 'description,images'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'description' not in response.data
+        assert 'images' not in response.data
+        assert response.data['price_with_tax'] > 0
+
+    def test_if_computed_field_loads_its_column(self, api_client):
+        product = baker.make(Product, collection=baker.make(Collection))
+
+        response = api_client.get(f'/store/products/{product.id}/', {'fields': 'id,price_with_tax'})
+
+        assert set(response.data) == {'id', 'price_with_tax'}
+
+
+@pytest.mark.django_db
+class TestEffectivePrice:
+    def test_if_best_promotion_is_applied(self, api_client):
+        product = baker.make(Product, collection=baker.make(Collection), unit_price=Decimal('50.00'))
+        product.promotions.add(baker.make(Promotion, discount=10), baker.make(Promotion, discount=20))
+
+        response = api_client.get(f'/store/products/{product.id}/')
+
+        assert response.data['discount'] == 20
+        # 50 - 20% + 10% tax
+        assert response.data['effective_price'] == Decimal('44.00')
+
+    def test_if_product_without_promotion_pays_the_price_with_tax(self, api_client):
+        product = baker.make(Product, collection=baker.make(Collection), unit_price=Decimal('33.33'))
+
+        response = api_client.get(f'/store/products/{product.id}/')
+
+        assert response.data['discount'] == 0
+        assert response.data['effective_price'] == Decimal('36.66')
+
+    def test_if_list_is_filtered_and_ordered_by_effective_price(self, api_client):
+        collection = baker.make(Collection)
+        cheap = baker.make(Product, collection=collection, unit_price=Decimal('10.00'))
+        discounted = baker.make(Product, collection=collection, unit_price=Decimal('100.00'))
+        expensive = baker.make(Product, collection=collection, unit_price=Decimal('60.00'))
+        discounted.promotions.add(baker.make(Promotion, discount=50))
+
+        response = api_client.get('/store/products/', {'min_price': 20, 'ordering': 'effective_price'})
+
+        # 55.00 then 66.00, 11.00 is filtered out
+        assert [product['id'] for product in response.data['results']] == [discounted.id, expensive.id]
+        assert cheap.id not in [product['id'] for product in response.data['results']]
+
+    def test_if_discounts_are_not_a_query_per_product(self, api_client, django_assert_num_queries):
+        collection = baker.make(Collection)
+        promotion = baker.make(Promotion, discount=5)
+        for product in baker.make(Product, collection=collection, _quantity=8):
+            product.promotions.add(promotion)
+
+        # count, products, images
+        with django_assert_num_queries(3):
+            api_client.get('/store/products/')
+
+    def test_if_update_returns_the_new_effective_price(self, api_client):
+        product = baker.make(Product, collection=baker.make(Collection), unit_price=Decimal('50.00'))
+        product.promotions.add(baker.make(Promotion, discount=50))
+        api_client.force_authenticate(user=baker.make(settings.AUTH_USER_MODEL, is_staff=True))
+
+        response = api_client.patch(f'/store/products/{product.id}/', {'unit_price': '20.00'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['effective_price'] == Decimal('11.00')
+
+
+@pytest.mark.django_db
+class TestProductListFastPath:
+    @pytest.mark.parametrize('params', [
+        {},
+        {'page': 2},
+        {'fields': 'id,price_with_tax,images'},
+        {'omit': 'description'},
+        {'ordering': '-unit_price'},
+        {'pagination': 'cursor'},
+        {'unit_price__gt': 20},
+        {'ordering': '-effective_price', 'pagination': 'cursor'},
+        {'min_price': 20, 'fields': 'id,discount,effective_price'},
+    ])
+    def test_if_output_is_identical_to_product_serializer(self, api_client, settings, params):
+        settings.CATALOG_CACHE_TIMEOUT = 0
+        collection = baker.make(Collection)
+        products = [
+            baker.make(Product, collection=collection, unit_price=Decimal(price))
+            for price in ['1.00', '10.10', '33.33', '999.99', '12.35'] * 3
+        ]
+        baker.make(ProductImage, product=products[0], image='store/images/a.jpg')
+        baker.make(ProductImage, product=products[0], image='store/images/b.jpg')
+        baker.make(ProductImage, product=products[3], image='store/images/c.jpg')
+        products[1].promotions.add(baker.make(Promotion, discount=12.5))
+
+        settings.PRODUCT_LIST_FAST_PATH = False
+        expected = api_client.get('/store/products/', params)
+        settings.PRODUCT_LIST_FAST_PATH = True
+        actual = api_client.get('/store/products/', params)
+
+        assert actual.status_code == expected.status_code == status.HTTP_200_OK
+        assert actual.content == expected.content
+
+    def test_if_images_are_one_query(self, api_client, django_assert_num_queries):
+        collection = baker.make(Collection)
+        for product in baker.make(Product, collection=collection, _quantity=5):
+            baker.make(ProductImage, product=product, image='store/images/a.jpg')
+
+        # count, products, images
+        with django_assert_num_queries(3):
+            api_client.get('/store/products/')
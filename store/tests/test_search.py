@@ -0,0 +1,87 @@
+import pytest
+from rest_framework import status
+from model_bakery import baker
+from django.db import connection
+from store import search
+from store.models import Product, Collection
+
+
+@pytest.mark.django_db
+class TestSearchProducts:
+    def test_if_title_matches_rank_first(self, api_client):
+        collection = baker.make(Collection)
+        in_description = baker.make(
+            Product, collection=collection, title='Soap', description='smells like chocolate')
+        in_title = baker.make(
+            Product, collection=collection, title='Dark Chocolate', description='bar')
+        baker.make(Product, collection=collection, title='Bread', description='ww')
+
+        response = api_client.get('/store/products/?search=choc')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [product['id'] for product in response.data['results']] == [in_title.id, in_description.id]
+
+    def test_if_every_term_has_to_match(self, api_client):
+        collection = baker.make(Collection)
+        both = baker.make(Product, collection=collection, title='Red Apple', description='fresh')
+        baker.make(Product, collection=collection, title='Red Pepper', description='hot')
+
+        response = api_client.get('/store/products/?search=red apple')
+
+        assert [product['id'] for product in response.data['results']] == [both.id]
+
+    def test_if_search_composes_with_filters(self, api_client):
+        fruits, other = baker.make(Collection, _quantity=2)
+        apple = baker.make(Product, collection=fruits, title='Apple', description='a')
+        baker.make(Product, collection=other, title='Apple Juice', description='a')
+
+        response = api_client.get(f'/store/products/?search=apple&collection_id={fruits.id}')
+
+        assert response.data['count'] == 1
+        assert response.data['results'][0]['id'] == apple.id
+
+    def test_if_filtered_matches_survive_the_max_results_cut(self, api_client, settings):
+        settings.PRODUCT_SEARCH_MAX_RESULTS = 5
+        crowded, quiet = baker.make(Collection, _quantity=2)
+        baker.make(Product, collection=crowded, title='Coffee Coffee', description='coffee', _quantity=10)
+        beans = baker.make(Product, collection=quiet, title='Beans', description='coffee')
+
+        response = api_client.get(f'/store/products/?search=coffee&collection_id={quiet.id}')
+
+        assert response.data['count'] == 1
+        assert response.data['results'][0]['id'] == beans.id
+
+    def test_if_search_works_with_cursor_pagination(self, api_client):
+        collection = baker.make(Collection)
+        products = baker.make(
+            Product, collection=collection, title='Tea', description='green', _quantity=15)
+
+        first = api_client.get('/store/products/?search=tea&pagination=cursor')
+        second = api_client.get(first.data['next'])
+
+        ids = [product['id'] for product in first.data['results'] + second.data['results']]
+        assert sorted(ids) == sorted(product.id for product in products)
+
+    def test_if_one_character_terms_fall_back_to_icontains(self, api_client):
+        collection = baker.make(Collection)
+        vitamin = baker.make(Product, collection=collection, title='Vitamin C', description='tablets')
+        baker.make(Product, collection=collection, title='Vitamin D', description='drops')
+
+        alone = api_client.get('/store/products/?search=c')
+        with_other_terms = api_client.get('/store/products/?search=vitamin c')
+
+        assert [product['id'] for product in alone.data['results']] == [vitamin.id]
+        assert [product['id'] for product in with_other_terms.data['results']] == [vitamin.id]
+
+
+class TestSearchEngineChoice:
+    @pytest.mark.parametrize('vendor, engine_class', [
+        ('mysql', search.MySQLFullTextSearchEngine),
+        ('sqlite', search.InvertedIndexSearchEngine),
+    ])
+    def test_if_default_engine_follows_the_database(self, vendor, engine_class, settings, monkeypatch):
+        settings.PRODUCT_SEARCH_ENGINE = None
+        monkeypatch.setattr(search, '_engine', None)
+        monkeypatch.setattr(connection, 'vendor', vendor)
+
+        assert type(search.get_search_engine()) is engine_class
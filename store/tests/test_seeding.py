@@ -0,0 +1,97 @@
+import pytest
+from django.core.management import call_command
+from django.db import DatabaseError
+from store.models import Collection, Customer, Order, OrderItem, Product
+from store.seeding import Checkpoint, split_statements
+from store import synthetic
+from store.synthetic import generate, make_plan
+
+
+COLLECTION_SQL = "insert into store_collection (id, title, products_count, last_update) " \
+                 "values ({}, '{}', 0, '2020-06-01 00:00:00');\n"
+
+
+class TestSplitStatements:
+    def test_if_quotes_and_comments_are_respected(self):
+        sql = "-- a comment; not a statement\n" \
+              "insert into t values ('a;b', 'it''s', \"x;y\"); /* block ;\n" \
+              " comment */ update t set a = 1\n" \
+              ";\n" \
+              "select 1"
+
+        assert list(split_statements(sql.splitlines(True))) == [
+            "insert into t values ('a;b', 'it''s', \"x;y\")",
+            'update t set a = 1',
+            'select 1',
+        ]
+
+    def test_if_backslash_escapes_only_with_mysql(self):
+        sql = ["select 'a\\';b';\n"]
+
+        assert list(split_statements(sql, mysql=True)) == ["select 'a\\';b'"]
+        assert list(split_statements(sql)) == ["select 'a\\'", "b';"]
+
+
+@pytest.mark.django_db
+class TestSeedDb:
+    def test_if_seed_file_is_loaded(self, tmp_path):
+        call_command('seed_db', checkpoint=str(tmp_path / 'checkpoint'))
+
+        assert Collection.objects.count() == 10
+        assert Product.objects.count() == 1000
+        # raw inserts send no signals, the counters are recounted at the end
+        assert sum(Collection.objects.values_list('products_count', flat=True)) == 1000
+        assert not (tmp_path / 'checkpoint').exists()
+
+    def test_if_resume_skips_committed_statements(self, tmp_path):
+        path = tmp_path / 'seed.sql'
+        path.write_text(''.join(COLLECTION_SQL.format(pk, f'C{pk}') for pk in [1, 2, 3]))
+        Checkpoint(str(tmp_path / 'checkpoint'), str(path)).save(2)
+
+        call_command('seed_db', file=str(path), checkpoint=str(tmp_path / 'checkpoint'), resume=True)
+
+        assert list(Collection.objects.values_list('id', flat=True)) == [3]
+
+    def test_if_checkpoint_has_the_last_committed_batch(self, tmp_path):
+        path = tmp_path / 'seed.sql'
+        path.write_text(COLLECTION_SQL.format(1, 'C1') + 'insert into nowhere values (1);\n')
+        checkpoint = tmp_path / 'checkpoint'
+
+        with pytest.raises(DatabaseError):
+            call_command('seed_db', file=str(path), checkpoint=str(checkpoint), batch_size=1)
+
+        assert Checkpoint(str(checkpoint), str(path)).load() == 1
+
+
+@pytest.mark.django_db
+class TestGenerateData:
+    counts = {'collections': 3, 'products': 25, 'customers': 4, 'orders': 10}
+
+    def test_if_every_table_gets_its_rows(self):
+        generate(make_plan(self.counts, chunk_size=7))
+
+        assert Collection.objects.count() == 3
+        assert Product.objects.count() == 25
+        assert Customer.objects.count() == 4
+        assert Order.objects.count() == 10
+        assert OrderItem.objects.filter(order__in=Order.objects.all()).exists()
+        assert sum(Collection.objects.values_list('products_count', flat=True)) == 25
+
+    def test_if_same_seed_gives_same_rows_whatever_the_chunk_order(self):
+        plan = make_plan({'collections': 2, 'products': 12}, seed=3, chunk_size=5)
+        generate(plan)
+        first = list(Product.objects.order_by('id').values_list('id', 'title', 'unit_price', 'collection_id'))
+        Product.objects.all().delete()
+        Collection.objects.all().delete()
+
+        # another process could run the chunks in any order
+        synthetic._init_worker(plan)
+        synthetic.run_chunk(('collections', 0))
+        for chunk in [2, 0, 1]:
+            synthetic.run_chunk(('products', chunk))
+
+        assert list(Product.objects.order_by('id').values_list('id', 'title', 'unit_price', 'collection_id')) == first
+
+    def test_if_orders_without_customers_are_refused(self):
+        with pytest.raises(ValueError):
+            make_plan({'collections': 1, 'products': 1, 'orders': 1})
@@ -0,0 +1,116 @@
+import pytest
+from decimal import Decimal
+from model_bakery import baker
+from rest_framework import status
+from store.models import Product, Collection
+
+
+@pytest.fixture
+def patch_stock(api_client):
+    def do_patch(changes, **headers):
+        return api_client.patch('/store/products/stock/', {'changes': changes}, format='json', **headers)
+    return do_patch
+
+
+@pytest.fixture
+def products():
+    collection = baker.make(Collection)
+    return [
+        baker.make(Product, collection=collection, inventory=10, unit_price=Decimal('20.00'))
+        for _ in range(3)
+    ]
+
+
+@pytest.mark.django_db
+class TestPatchStock:
+    def test_if_user_is_not_staff_returns_403(self, authenticate, patch_stock, products):
+        authenticate()
+
+        response = patch_stock([{'id': products[0].id, 'inventory': 1}])
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_deltas_prices_and_inventories_are_applied(self, authenticate, patch_stock, products):
+        authenticate(is_staff=True)
+        first, second, third = products
+
+        response = patch_stock([
+            {'id': first.id, 'inventory_delta': -3},
+            {'id': second.id, 'inventory': 50, 'unit_price': '9.99'},
+            {'id': third.id, 'unit_price': '30.00'},
+            {'id': third.id + 100, 'inventory_delta': 1},
+        ])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'applied': [first.id, second.id, third.id], 'not_found': [third.id + 100]}
+        values = dict(Product.objects.values_list('id', 'inventory'))
+        assert [values[product.id] for product in products] == [7, 50, 10]
+        prices = dict(Product.objects.values_list('id', 'unit_price'))
+        assert [prices[product.id] for product in products] == [Decimal('20.00'), Decimal('9.99'), Decimal('30.00')]
+
+    def test_if_invalid_entry_rejects_the_batch(self, authenticate, patch_stock, products):
+        authenticate(is_staff=True)
+
+        response = patch_stock([
+            {'id': products[0].id, 'inventory_delta': 5},
+            {'id': products[1].id, 'inventory': 1, 'inventory_delta': 1},
+            {'id': products[2].id},
+        ])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Product.objects.get(pk=products[0].id).inventory == 10
+
+    def test_if_repeated_id_returns_400(self, authenticate, patch_stock, products):
+        authenticate(is_staff=True)
+
+        response = patch_stock([
+            {'id': products[0].id, 'inventory_delta': 5},
+            {'id': products[0].id, 'inventory_delta': 5},
+        ])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_if_delta_below_zero_rejects_the_batch(self, authenticate, patch_stock, products):
+        authenticate(is_staff=True)
+
+        response = patch_stock([
+            {'id': products[0].id, 'inventory_delta': 5},
+            {'id': products[1].id, 'inventory_delta': -11},
+        ])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data['changes']) == [products[1].id]
+        assert set(Product.objects.values_list('inventory', flat=True)) == {10}
+
+    def test_if_negative_inventory_returns_400(self, authenticate, patch_stock, products):
+        authenticate(is_staff=True)
+
+        response = patch_stock([{'id': products[0].id, 'inventory': -1}])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Product.objects.get(pk=products[0].id).inventory == 10
+
+    def test_if_chunks_are_one_select_and_one_update(self, authenticate, patch_stock, settings,
+                                                     django_assert_num_queries):
+        settings.PRODUCT_STOCK_CHUNK_SIZE = 5
+        authenticate(is_staff=True)
+        collection = baker.make(Collection)
+        products = baker.make(Product, collection=collection, inventory=10, _quantity=12)
+
+        # savepoint, 3 chunks of select + update, release
+        with django_assert_num_queries(8):
+            response = patch_stock([{'id': product.id, 'inventory_delta': 1} for product in products])
+
+        assert len(response.data['applied']) == 12
+        assert set(Product.objects.values_list('inventory', flat=True)) == {11}
+
+    def test_if_retried_batch_is_applied_once(self, authenticate, patch_stock, products):
+        authenticate(is_staff=True)
+        changes = [{'id': products[0].id, 'inventory_delta': 5}]
+
+        first = patch_stock(changes, HTTP_IDEMPOTENCY_KEY='sync-1')
+        retry = patch_stock(changes, HTTP_IDEMPOTENCY_KEY='sync-1')
+
+        assert retry.data == first.data
+        assert retry['Idempotent-Replayed'] == 'true'
+        assert Product.objects.get(pk=products[0].id).inventory == 15
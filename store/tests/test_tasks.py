@@ -0,0 +1,103 @@
+import threading
+import pytest
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from model_bakery import baker
+from store.models import Product, Collection, Cart, CartItem, Order, OutboxEvent
+from store.signals import order_created
+from store import outbox
+from store.tasks import purge_abandoned_carts, relay_outbox
+
+
+@pytest.mark.django_db
+class TestPurgeAbandonedCarts:
+    def test_if_old_carts_and_their_items_are_deleted_in_batches(self, settings):
+        settings.CART_PURGE_BATCH_SIZE = 2
+        settings.CART_PURGE_BATCH_PAUSE = 0
+        product = baker.make(Product, collection=baker.make(Collection))
+        old_carts = baker.make(Cart, _quantity=3)
+        for cart in old_carts:
+            baker.make(CartItem, cart=cart, product=product, quantity=1)
+        Cart.objects.update(created_at=timezone.now() - settings.CART_EXPIRY_AGE - timedelta(days=1))
+        fresh_cart = baker.make(Cart)
+
+        result = purge_abandoned_carts()
+
+        assert result['carts'] == 3
+        assert result['items'] == 3
+        assert list(Cart.objects.values_list('id', flat=True)) == [fresh_cart.id]
+        assert not CartItem.objects.exists()
+
+
+@pytest.fixture
+def customer():
+    # the create_customer_for_new_user signal gives the user its customer
+    return baker.make(get_user_model()).customer
+
+
+@pytest.fixture
+def order_created_receiver():
+    received = []
+
+    def receiver(sender, order, **kwargs):
+        received.append(order.id)
+    order_created.connect(receiver, weak=False)
+    yield received
+    order_created.disconnect(receiver)
+
+
+@pytest.mark.django_db
+class TestRelayOutbox:
+    def test_if_pending_events_are_sent_once(self, settings, customer, order_created_receiver):
+        settings.OUTBOX_BATCH_SIZE = 2
+        orders = baker.make(Order, customer=customer, _quantity=3)
+        for order in orders:
+            OutboxEvent.objects.create(topic=OutboxEvent.ORDER_CREATED, payload={'order_id': order.id})
+
+        assert relay_outbox() == 3
+        assert relay_outbox() == 0
+
+        assert order_created_receiver == [order.id for order in orders]
+        assert not OutboxEvent.objects.filter(processed_at__isnull=True).exists()
+
+    def test_if_failed_event_is_kept_for_retry(self, customer):
+        def failing_receiver(sender, **kwargs):
+            raise RuntimeError('smtp is down')
+        order_created.connect(failing_receiver, weak=False)
+        order = baker.make(Order, customer=customer)
+        event = OutboxEvent.objects.create(topic=OutboxEvent.ORDER_CREATED, payload={'order_id': order.id})
+
+        try:
+            relay_outbox()
+        finally:
+            order_created.disconnect(failing_receiver)
+
+        event.refresh_from_db()
+        assert event.processed_at is None
+        assert event.attempts == 1
+        assert 'smtp is down' in event.last_error
+
+
+class TestKick:
+    def test_if_checkout_does_not_wait_on_the_broker(self, monkeypatch):
+        sending, broker_up = threading.Event(), threading.Event()
+        sent = []
+
+        def apply_async(**options):
+            sending.set()
+            broker_up.wait(5)
+            sent.append(options)
+        monkeypatch.setattr(relay_outbox, 'apply_async', apply_async)
+
+        outbox._kick()
+        assert sending.wait(5)
+        # the kick is stuck on the broker, these return right away:
+        # the first one queues another kick, the second one shares it
+        outbox._kick()
+        outbox._kick()
+        assert sent == []
+
+        broker_up.set()
+        outbox._kicker.submit(lambda: None).result(5)
+        assert len(sent) == 2
@@ -0,0 +1,93 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser, User
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from core.throttling import TieredRateThrottle, ScopedRateThrottle, parse_rate, _get_script
+from store.views import ItemViewSet, OrderViewSet
+
+
+def make_request(user):
+    request = Request(APIRequestFactory().get('/'))
+    request.user = user
+    return request
+
+
+class TestThrottleScopes:
+    @pytest.mark.parametrize('user, scope', [
+        (AnonymousUser(), 'anon'),
+        (User(id=1), 'user'),
+        (User(id=1, is_staff=True), 'staff'),
+    ])
+    def test_if_tier_follows_the_user(self, user, scope):
+        assert TieredRateThrottle().get_scope(make_request(user), None) == scope
+
+    def test_if_viewsets_have_their_scope(self):
+        throttle = ScopedRateThrottle()
+
+        assert throttle.get_scope(None, ItemViewSet()) == 'cart_items'
+        assert throttle.get_scope(None, OrderViewSet()) == 'orders'
+
+    def test_if_rate_becomes_capacity_and_refill(self):
+        assert parse_rate('120/min') == (120, 2)
+
+
+@pytest.fixture
+def auth_rate(settings):
+    def do_set_rate(rate):
+        rest_framework = dict(settings.REST_FRAMEWORK)
+        rest_framework['DEFAULT_THROTTLE_RATES'] = {**rest_framework['DEFAULT_THROTTLE_RATES'], 'auth': rate}
+        settings.REST_FRAMEWORK = rest_framework
+    return do_set_rate
+
+
+@pytest.fixture
+def obtain_token(api_client):
+    def do_obtain_token():
+        return api_client.post('/auth/jwt/create/', {'username': 'nobody', 'password': 'wrong'})
+    return do_obtain_token
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('fake_redis')
+class TestTokenBucket:
+    def test_if_empty_bucket_returns_429(self, auth_rate, obtain_token):
+        auth_rate('2/min')
+
+        statuses = [obtain_token().status_code for _ in range(4)]
+
+        assert statuses == [401, 401, 429, 429]
+
+    def test_if_retry_after_is_the_time_to_the_next_token(self, auth_rate, obtain_token):
+        auth_rate('2/min')
+        obtain_token()
+        obtain_token()
+
+        response = obtain_token()
+
+        # one token every 30 seconds
+        assert response.status_code == 429
+        assert response['Retry-After'] == '30'
+
+    def test_if_bucket_refills_over_time(self, fake_redis):
+        # the script straight away, no logins: their password hashing takes longer than a refill
+        def take():
+            allowed, wait = _get_script()(keys=['throttle:test'], args=[2, 2 / 60])
+            return int(allowed)
+
+        assert [take(), take(), take()] == [1, 1, 0]
+
+        # moving the last take 30 seconds back is 30 seconds passing, one token at 2/min
+        at = float(fake_redis.hget('throttle:test', 'at'))
+        fake_redis.hset('throttle:test', 'at', str(at - 30))
+
+        assert [take(), take()] == [1, 0]
+
+
+@pytest.mark.django_db
+class TestThrottleWithoutRedis:
+    def test_if_requests_are_allowed(self, auth_rate, obtain_token):
+        auth_rate('1/min')
+
+        # the tests run on the locmem cache, there is no bucket to take from
+        for _ in range(3):
+            assert obtain_token().status_code == 401
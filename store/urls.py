@@ -39,7 +39,9 @@ carts_router.register(
 # URLConf
 
 
-urlpatterns = router.urls + products_router.urls + carts_router.urls
+urlpatterns = router.urls + products_router.urls + carts_router.urls + [
+    path('cache-stats/', views.CatalogCacheStatsView.as_view(), name='cache-stats'),
+]
 
 
 # urlpatterns = [
@@ -1,12 +1,14 @@
+from django.conf import settings
 from django.shortcuts import get_object_or_404
-from django.db.models import Count
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser, DjangoModelPermissions
 from rest_framework.decorators import action
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 # from rest_framework.pagination import PageNumberPagination
 from .permissions import IsAdminReadOnly, ViewCustomerHistoryPermissions
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework import status
@@ -15,16 +17,34 @@ from rest_framework.mixins import CreateModelMixin, RetrieveModelMixin, DestroyM
 
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
-from .models import Product, ProductImage, Collection, OrderItem, Review, Cart, CartItem, Customer, Order
-from .serializers import ProductSerializer, CartItemSerializer, CollectionSerializer, ReviewSerializer, CartSerializer, UpdateCartItemSerializer, AddCartItemSerializer, CustomerSerializer, OrderSerializer, CreateOrderSerializer, UpdateOrderSerializer, ProductImageSerializer
-from .filters import ProductFilter
-from .pagination import DefaultPagination
+from .models import Product, ProductImage, Collection, OrderItem, Review, Customer, Order
+from .serializers import ProductSerializer, CartItemSerializer, CollectionSerializer, ReviewSerializer, CartSerializer, UpdateCartItemSerializer, AddCartItemSerializer, CustomerSerializer, OrderSerializer, CreateOrderSerializer, UpdateOrderSerializer, ProductImageSerializer, StockChangeListSerializer
+from .filters import ProductFilter, OrderFilter
+from .pagination import DefaultPagination, KeysetPagination, OrderPagination
+from .caching import CachedReadMixin, get_stats, invalidate_catalog
+from .conditional import ConditionalGetMixin
+from .sparsefields import SparseFieldsViewMixin
+from .fastlist import ProductRowListMixin
+from .facets import FACETS_PARAM, ProductFacetedListMixin
+from .exports import ExportMixin
+from .importers import ProductImportMixin
+from .search import ProductSearchFilter
+from .carts import get_cart_store
+from .customers import CustomerRequestMixin
+from .idempotency import IdempotentCreateMixin
+from core.authentication import StatelessAuthenticationMixin
 # Create your views here.
 
+# the store endpoints trust the claims of the access token instead of loading
+# the user on every request (look at core.authentication.StatelessAuthenticationMixin)
 
-class ProductImageViewSet(ModelViewSet):
+
+class ProductImageViewSet(StatelessAuthenticationMixin, CachedReadMixin, ModelViewSet):
     serializer_class = ProductImageSerializer
 
+    def get_cache_namespaces(self):
+        return [f"product:{self.kwargs['product_pk']}", 'catalog']
+
     def get_serializer_context(self):
         return {'product_id': self.kwargs['product_pk']}
 
@@ -32,8 +52,13 @@ class ProductImageViewSet(ModelViewSet):
         return ProductImage.objects.filter(product_id=self.kwargs['product_pk'])
 
 
-class OrderViewSet(ModelViewSet):
+class OrderViewSet(StatelessAuthenticationMixin, IdempotentCreateMixin, CustomerRequestMixin, ModelViewSet):
+    throttle_scope = 'orders'
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    # always paginated, a page is bounded however many orders there are
+    pagination_class = OrderPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = OrderFilter
 
     # lock when use function to override permissions we use object called 'IsAdminUser()' ,
     def get_permissions(self):
@@ -42,9 +67,13 @@ class OrderViewSet(ModelViewSet):
         return [IsAuthenticated()]
 
     def create(self, request, *args, **kwargs):
+        # a retried checkout gets the first response back (look at store.idempotency)
+        return self.idempotent(self.place_order, request, *args, **kwargs)
+
+    def place_order(self, request, *args, **kwargs):
         serializer = CreateOrderSerializer(
             data=request.data,
-            context={'user_id': self.request.user.id}
+            context={'customer_id': request.customer_id}
         )
         serializer.is_valid(raise_exception=True)
         order = serializer.save()
@@ -59,16 +88,21 @@ class OrderViewSet(ModelViewSet):
         return OrderSerializer
 
     def get_queryset(self):
+        # one query for the items (and their products) of the whole page
+        items = OrderItem.objects \
+            .select_related('product') \
+            .only('id', 'order', 'quantity', 'unit_price',
+                  'product__id', 'product__title', 'product__unit_price')
+        queryset = Order.objects.prefetch_related(Prefetch('items', queryset=items))
+
         user = self.request.user
         if user.is_staff:
-            return Order.objects.all()
+            return queryset
 
-        customer_id = Customer.objects.only(
-            'id').get(user_id=user.id)
-        return Order.objects.filter(customer_id=customer_id)
+        return queryset.filter(customer_id=self.request.customer_id)
 
 
-class CustomerViewSet(ModelViewSet):
+class CustomerViewSet(StatelessAuthenticationMixin, CustomerRequestMixin, ModelViewSet):
     queryset = Customer.objects.all()
     serializer_class = CustomerSerializer
     permission_classes = [IsAdminUser]
@@ -86,8 +120,7 @@ class CustomerViewSet(ModelViewSet):
     def me(self, request):
         # like destructuring in js
         # get_or_create return tuple we unpack for get first value below
-        customer = Customer.objects.get(
-            user_id=request.user.id)
+        customer = Customer.objects.get(pk=request.customer_id)
 
         if request.method == 'GET':
             serializer = CustomerSerializer(customer)
@@ -104,16 +137,24 @@ class CustomerViewSet(ModelViewSet):
 # * We use ProductViewSet and CollectionsViewSet to combine multiple classes into one like ProductViewSet = ProductList + ProductDetail same thing with CollectionViewSet
 
 
-class ProductViewSet(ModelViewSet):
-    queryset = Product.objects.prefetch_related('images').all()
+class ProductViewSet(StatelessAuthenticationMixin, ConditionalGetMixin, CachedReadMixin, ProductFacetedListMixin, ProductRowListMixin, ExportMixin, ProductImportMixin, IdempotentCreateMixin, SparseFieldsViewMixin, ModelViewSet):
+    queryset = Product.objects.with_effective_price().prefetch_related('images')
     serializer_class = ProductSerializer
     permission_classes = [IsAdminReadOnly]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, ProductSearchFilter, OrderingFilter]
     filterset_class = ProductFilter
     pagination_class = DefaultPagination
-
+    # ?pagination=cursor switches to keyset pages (no COUNT, no OFFSET)
+    keyset_pagination_class = KeysetPagination
+    # /store/products/export/ (look at store.exports)
+    export_name = 'products'
+    # ETag/Last-Modified of a product (look at store.conditional), last_update is its creation time
+    last_modified_field = 'updated_at'
+
+    # the search itself is done by the engine in PRODUCT_SEARCH_ENGINE (look at store.search),
+    # search_fields is still needed for the search box of the browsable api
     search_fields = ['title', 'description', ]
-    ordering_fields = ['unit_price', 'last_update']
+    ordering_fields = ['unit_price', 'effective_price', 'last_update']
     # ? filterset_fields = ['collection_id']
     # ? instead of using filterset_fields we use filterset_class
 
@@ -124,9 +165,66 @@ class ProductViewSet(ModelViewSet):
     #         queryset = queryset.filter(collection_id=collection_id)
     #     return queryset
 
+    def get_cache_namespaces(self):
+        if self.action == 'retrieve':
+            return [f"product:{self.kwargs['pk']}", 'catalog']
+        if self.request is not None and self.request.query_params.get(FACETS_PARAM):
+            # the collection facet has the collection titles
+            return ['products', 'collections']
+        return ['products']
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self.request is not None and self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = self.keyset_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_serializer_context(self):
         return {'request': self.request}
 
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.reload_effective_price(serializer)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.reload_effective_price(serializer)
+
+    def reload_effective_price(self, serializer):
+        # here we read the annotations again, the saved unit_price changed them
+        serializer.instance = Product.objects.with_effective_price().get(pk=serializer.instance.pk)
+
+    @action(detail=False, methods=['PATCH'], url_path='stock', permission_classes=[IsAdminUser])
+    def stock(self, request, *args, **kwargs):
+        # a retried batch of deltas must not be applied twice, send an Idempotency-Key
+        return self.idempotent(self.apply_stock_changes, request, *args, **kwargs)
+
+    def apply_stock_changes(self, request, *args, **kwargs):
+        serializer = StockChangeListSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        changes = {change.pop('id'): change for change in serializer.validated_data['changes']}
+
+        applied, shortages = Product.objects.apply_stock_changes(
+            changes, chunk_size=settings.PRODUCT_STOCK_CHUNK_SIZE)
+        if shortages:
+            # one error per product, nothing was written
+            raise ValidationError({'changes': {
+                pk: [f'Only {inventory} left in stock, cannot take {-changes[pk]["inventory_delta"]}']
+                for pk, inventory in sorted(shortages.items())
+            }})
+        # here we invalidate once for the whole batch, queryset updates send no signals
+        if applied:
+            invalidate_catalog()
+
+        applied_ids = set(applied)
+        return Response({
+            'applied': sorted(applied_ids),
+            'not_found': sorted(pk for pk in changes if pk not in applied_ids),
+        })
+
     def destroy(self, request, *args, **kwargs):
         if OrderItem.objects.filter(product_id=kwargs['pk']).count() > 0:
             return Response({'error': 'Product cannot be deleted because it is associated with an order item'}, status=status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -134,35 +232,60 @@ class ProductViewSet(ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
 
-class CollectionViewSet(ModelViewSet):
-    queryset = Collection.objects.annotate(
-        products_count=Count('products')).all()
+class CollectionViewSet(StatelessAuthenticationMixin, ConditionalGetMixin, CachedReadMixin, ModelViewSet):
+    # products_count is a column now, listing is a single-table read
+    queryset = Collection.objects.all()
     serializer_class = CollectionSerializer
     permission_classes = [IsAdminReadOnly]
+    cache_namespaces = ['collections']
 
     def destroy(self, request, *args, **kwargs):
-        collection = get_object_or_404(Collection.objects.annotate(
-            products_count=Count('products')), pk=kwargs['pk'])
-        if collection.products.count() > 0:
+        if Product.objects.filter(collection_id=kwargs['pk']).exists():
             return Response({'error': 'Collection cannot be deleted because it has more than one product'})
         return super().destroy(request, *args, **kwargs)
 
 
-class ReviewViewSet(ModelViewSet):
+class CatalogCacheStatsView(StatelessAuthenticationMixin, APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_stats())
+
+
+class ReviewViewSet(StatelessAuthenticationMixin, ModelViewSet):
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
 
 
-class CartViewSet(CreateModelMixin,
+class CartViewSet(StatelessAuthenticationMixin,
+                  CreateModelMixin,
                   RetrieveModelMixin,
                   DestroyModelMixin,
                   GenericViewSet):
-
-    queryset = Cart.objects.prefetch_related('items__product').all()
+    # carts live in the store picked by the CART_STORE setting (database or redis),
+    # look at store.carts
     serializer_class = CartSerializer
 
+    def create(self, request, *args, **kwargs):
+        cart = get_cart_store().create()
+        serializer = CartSerializer(cart)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def retrieve(self, request, pk):
+        cart = get_cart_store().get(pk)
+        if cart is None:
+            raise NotFound()
+        serializer = CartSerializer(cart)
+        return Response(serializer.data)
+
+    def destroy(self, request, pk):
+        if not get_cart_store().delete(pk):
+            raise NotFound()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
 
-class ItemViewSet(ModelViewSet):
+class ItemViewSet(StatelessAuthenticationMixin, IdempotentCreateMixin, ModelViewSet):
+    throttle_scope = 'cart_items'
     # queryset = CartItem.objects.all()
     # serializer_class = CartItemSerializer
     http_method_names = ['get', 'post', 'patch', 'delete']
@@ -178,11 +301,34 @@ class ItemViewSet(ModelViewSet):
     def get_serializer_context(self):
         return {'cart_id': self.kwargs['cart_pk']}
 
-    def get_queryset(self):
-        # * by this way we return only cartitems that has relationship with cart
-        return CartItem.objects \
-            .filter(cart_id=self.kwargs['cart_pk']) \
-            .select_related('product')
+    # * by this way we return only cartitems that has relationship with cart,
+    # * the items come from the cart store so the same code works for database and redis carts
+
+    def list(self, request, cart_pk):
+        items = get_cart_store().get_items(cart_pk)
+        serializer = CartItemSerializer(items, many=True)
+        return Response(serializer.data)
+
+    def retrieve(self, request, cart_pk, pk):
+        item = get_cart_store().get_item(cart_pk, pk)
+        if item is None:
+            raise NotFound()
+        serializer = CartItemSerializer(item)
+        return Response(serializer.data)
+
+    def partial_update(self, request, cart_pk, pk):
+        serializer = UpdateCartItemSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        item = get_cart_store().update_item(
+            cart_pk, pk, serializer.validated_data['quantity'])
+        if item is None:
+            raise NotFound()
+        return Response(UpdateCartItemSerializer(item).data)
+
+    def destroy(self, request, cart_pk, pk):
+        if not get_cart_store().remove_item(cart_pk, pk):
+            raise NotFound()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 # we dont need ModelViewSet here because we dont need all request (get,post,put,delete ...) we need only post and  so we get mixin classes here
@@ -257,8 +403,7 @@ class ProductDetail(RetrieveUpdateDestroyAPIView):
 
 
 class CollectionList(ListCreateAPIView):
-    queryset = Collection.objects.annotate(
-        products_count=Count('products')).all()
+    queryset = Collection.objects.all()
     serializer_class = CollectionSerializer
 
     def get_serializer_context(self):
@@ -280,13 +425,11 @@ class CollectionList(ListCreateAPIView):
 
 
 class CollectionDetail(RetrieveUpdateDestroyAPIView):
-    queryset = Collection.objects.annotate(
-        products_count=Count('products')).all()
+    queryset = Collection.objects.all()
     serializer_class = CollectionSerializer
 
     def delete(self, request, pk):
-        collection = get_object_or_404(Collection.objects.annotate(
-            products_count=Count('products')), pk=pk)
+        collection = get_object_or_404(Collection, pk=pk)
         if collection.products.count() > 0:
             return Response({'error': 'Collection cannot be deleted because it has more than one product'})
         collection.delete()
@@ -363,9 +506,7 @@ def product_detail(request, id):
 
 @api_view(['GET', 'PUT', 'DELETE'])
 def collection_detail(request, pk):
-    collection = get_object_or_404(
-        Collection.objects.annotate(products_count=Count('products')),
-        pk=pk)
+    collection = get_object_or_404(Collection, pk=pk)
     if request.method == 'GET':
         serializer = CollectionSerializer(
             collection, context={'request': request})
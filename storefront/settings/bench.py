@@ -0,0 +1,23 @@
+import os
+from .dev import *
+
+
+# offline settings of the endpoint benchmarks (look at store.benchmarks):
+# SQLite and an in-process cache, no MySQL or redis to start
+# pytest --ds=storefront.settings.bench store/tests/test_benchmarks.py
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'bench.sqlite3'),
+    }
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'revocations': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'revocations',
+    },
+}
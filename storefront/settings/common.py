@@ -155,13 +155,54 @@ REST_FRAMEWORK = {
         'rest_framework_simplejwt.authentication.JWTAuthentication',
 
     ),
+
+    # token buckets in redis (look at core.throttling)
+    'DEFAULT_THROTTLE_CLASSES': (
+        'core.throttling.TieredRateThrottle',
+        'core.throttling.ScopedRateThrottle',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        # every request
+        'anon': '120/min',
+        'user': '600/min',
+        'staff': '3000/min',
+        # views with a throttle_scope, on top of the above
+        'cart_items': '120/min',
+        'orders': '30/min',
+        'auth': '10/min',  # password hashing is expensive
+    },
 }
 
+# redis connection (a django_redis cache alias) of the throttle buckets
+THROTTLE_REDIS_ALIAS = 'default'
+
+# Idempotency-Key on order and cart item POSTs (look at store.idempotency)
+IDEMPOTENCY_KEY_TTL = 60 * 60 * 24  # how long a response is replayed
+IDEMPOTENCY_ERROR_TTL = 60  # 4xx answers (eg not enough inventory), short so a retry can succeed later
+IDEMPOTENCY_LOCK_TIMEOUT = 30  # longer than any checkout takes
+
 SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('JWT',),
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
+    # adds the customer_id, is_staff and is_superuser claims
+    "TOKEN_OBTAIN_SERIALIZER": "core.serializers.TokenObtainPairSerializer",
+    # refuses revoked refresh tokens (look at core.authentication)
+    "TOKEN_REFRESH_SERIALIZER": "core.serializers.TokenRefreshSerializer",
 }
 
+# cache alias of the token denylist (look at core.authentication), entries have to
+# survive their whole timeout: at least ACCESS_TOKEN_LIFETIME, REFRESH_TOKEN_LIFETIME for
+# the revoked generations of a user
+AUTH_REVOCATION_CACHE = 'revocations'
+
+# users loaded by core.authentication.TokenUser.full_user (permission checks)
+AUTH_USER_CACHE_TTL = 60  # seconds
+AUTH_USER_CACHE_MAX_SIZE = 10000
+
+# user id -> customer id (look at store.customers)
+CUSTOMER_ID_LOCAL_TTL = 60  # seconds a process trusts its own copy
+CUSTOMER_ID_LOCAL_MAX_SIZE = 10000
+
 AUTH_USER_MODEL = 'core.User'
 
 
@@ -184,9 +225,28 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'playground.tasks.notify_customers',  # path of the task
         'schedule': 5,  # meaning every 5 seconds
         'args': ['Hello World'],
-    }
+    },
+    'purge_abandoned_carts': {
+        'task': 'store.tasks.purge_abandoned_carts',
+        'schedule': 60 * 60,  # every hour
+    },
+    'relay_outbox': {
+        'task': 'store.tasks.relay_outbox',
+        'schedule': 60,  # checkouts queue it right away, this is the safety net
+    },
 }
 
+# abandoned carts (look at store.tasks.purge_abandoned_carts)
+CART_EXPIRY_AGE = timedelta(days=7)
+CART_PURGE_BATCH_SIZE = 1000
+CART_PURGE_BATCH_PAUSE = 0.5  # seconds to sleep between batches so we don't starve foreground queries
+CART_PURGE_MAX_BATCHES = 200  # per run, the next run picks up the rest
+
+# order events (look at store.outbox)
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_MAX_BATCHES = 50  # per run
+OUTBOX_MAX_ATTEMPTS = 10  # after that the event stays in the table with its last_error
+
 
 # Caching configuration
 
@@ -198,9 +258,52 @@ CACHES = {
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
         }
+    },
+    # revoked tokens (look at core.authentication), apart from the responses above:
+    # run this redis with maxmemory-policy noeviction, an evicted entry un-revokes a token
+    "revocations": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://127.0.0.1:6379/3",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        }
     }
 }
 
+# product lists are built from values() rows instead of ProductSerializer (look at store.fastlist)
+PRODUCT_LIST_FAST_PATH = True
+
+# edges of the ?facets=price buckets on the effective price (look at store.facets)
+PRODUCT_PRICE_FACET_BUCKETS = [25, 50, 100, 250, 500]
+
+# rows per query of /store/products/export/ (look at store.exports)
+PRODUCT_EXPORT_CHUNK_SIZE = 2000
+
+# /store/products/import/ and `python manage.py import_products` (look at store.importers)
+PRODUCT_IMPORT_BATCH_SIZE = 1000  # rows per query/transaction
+PRODUCT_IMPORT_MAX_ERRORS = 1000  # row errors listed in the report, the rest are only counted
+
+# PATCH /store/products/stock/ (look at ProductQuerySet.apply_stock_changes)
+PRODUCT_STOCK_CHUNK_SIZE = 500  # products per UPDATE
+PRODUCT_STOCK_MAX_CHANGES = 10000  # per request
+
+# how long catalog responses (products, collections, images) stay in the cache,
+# entries are invalidated by signals long before that (look at store.caching)
+CATALOG_CACHE_TIMEOUT = 60 * 15
+
+# engine behind /store/products/?search= (look at store.search), None picks it from the
+# database: 'store.search.MySQLFullTextSearchEngine' (the FULLTEXT index) on MySQL,
+# 'store.search.InvertedIndexSearchEngine' (an index in every web process) elsewhere
+PRODUCT_SEARCH_ENGINE = None
+PRODUCT_SEARCH_MAX_RESULTS = 1000
+
+# where carts live (look at store.carts):
+# 'store.carts.DatabaseCartStore' (store_cart/store_cartitem tables) or
+# 'store.carts.RedisCartStore' (redis hashes that expire after CART_STORE_TTL seconds)
+CART_STORE = 'store.carts.DatabaseCartStore'
+CART_STORE_REDIS_ALIAS = 'default'
+CART_STORE_TTL = 60 * 60 * 24 * 7
+
 
 # Logging configuration
 
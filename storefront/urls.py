@@ -17,8 +17,9 @@ Including another URLconf
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 import debug_toolbar
+from core.views import TokenObtainPairView, TokenRefreshView, TokenRevokeView
 
 
 admin.site.site_header = 'Storefront Admin'
@@ -28,6 +29,10 @@ urlpatterns = [
     path('', include('core.urls')),
     path('playground/', include('playground.urls')),
     path('store/', include('store.urls')),
+    # before djoser.urls.jwt so these win (throttled, see core.views)
+    re_path(r'^auth/jwt/create/?$', TokenObtainPairView.as_view(), name='jwt-create'),
+    re_path(r'^auth/jwt/refresh/?$', TokenRefreshView.as_view(), name='jwt-refresh'),
+    path('auth/jwt/revoke/', TokenRevokeView.as_view(), name='jwt-revoke'),
     path('auth/', include('djoser.urls')),
     path('auth/', include('djoser.urls.jwt')),
     path('__debug__/', include('debug_toolbar.urls')),